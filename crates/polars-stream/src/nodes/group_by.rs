@@ -8,12 +8,12 @@ use polars_expr::groups::Grouper;
 use polars_expr::hash_keys::HashKeys;
 use polars_expr::hot_groups::{HotGrouper, new_hash_hot_grouper};
 use polars_expr::reduce::GroupedReduction;
-use polars_utils::IdxSize;
 use polars_utils::cardinality_sketch::CardinalitySketch;
 use polars_utils::hashing::HashPartitioner;
 use polars_utils::itertools::Itertools;
 use polars_utils::pl_str::PlSmallStr;
 use polars_utils::sparse_init_vec::SparseInitVec;
+use polars_utils::{IdxSize, format_pl_smallstr};
 use rayon::prelude::*;
 
 use super::compute_node_prelude::*;
@@ -22,6 +22,7 @@ use crate::async_primitives::connector::Receiver;
 use crate::expression::StreamExpr;
 use crate::morsel::get_ideal_morsel_size;
 use crate::nodes::in_memory_source::InMemorySourceNode;
+use crate::utils::spill::{SpillDir, SpillFile};
 
 #[cfg(debug_assertions)]
 const DEFAULT_HOT_TABLE_SIZE: usize = 4;
@@ -47,6 +48,14 @@ struct LocalGroupBySinkState {
     pre_aggs: Vec<(HashKeys, Vec<Box<dyn GroupedReduction>>)>,
     pre_agg_idxs_values_per_p: Vec<Vec<IdxSize>>,
     pre_agg_idxs_offsets_per_p: Vec<usize>,
+
+    // If we have a memory limit the cold morsels also contain the key columns
+    // (in front), and are spilled per partition once they grow too large.
+    // spilled_per_p[p] contains the spilled files for partition p, together
+    // with the sequence id of each record batch in the file.
+    cold_size: usize,
+    spill_dir: Option<SpillDir>,
+    spilled_per_p: Vec<Vec<(SpillFile, Vec<u64>)>>,
 }
 
 impl LocalGroupBySinkState {
@@ -70,9 +79,57 @@ impl LocalGroupBySinkState {
             pre_aggs: Vec::new(),
             pre_agg_idxs_values_per_p: vec![Vec::new(); num_partitions],
             pre_agg_idxs_offsets_per_p: vec![0; num_partitions],
+
+            cold_size: 0,
+            spill_dir: None,
+            spilled_per_p: (0..num_partitions).map(|_| Vec::new()).collect(),
         }
     }
 
+    /// Writes all cold morsels to disk, one file per partition.
+    fn spill_cold_morsels(&mut self) -> PolarsResult<()> {
+        let Some((_, _, first)) = self.cold_morsels.first() else {
+            return Ok(());
+        };
+        let schema = first.schema().clone();
+        let num_partitions = self.spilled_per_p.len();
+        let spill_dir = match &mut self.spill_dir {
+            Some(dir) => dir,
+            None => self.spill_dir.insert(SpillDir::new("group-by")?),
+        };
+
+        for p in 0..num_partitions {
+            let mut seqs = Vec::new();
+            let mut dfs = Vec::new();
+            for (i, (seq, _keys, df)) in self.cold_morsels.iter().enumerate() {
+                let start = self.morsel_idxs_offsets_per_p[i * num_partitions + p];
+                let stop = self.morsel_idxs_offsets_per_p[(i + 1) * num_partitions + p];
+                if start == stop {
+                    continue;
+                }
+                let idxs = &self.morsel_idxs_values_per_p[p][start..stop];
+                // Every frame must become exactly one record batch.
+                let mut p_df = unsafe { df.take_slice_unchecked_impl(idxs, false) };
+                p_df.rechunk_mut();
+                seqs.push(*seq);
+                dfs.push(p_df);
+            }
+            if !dfs.is_empty() {
+                let file = spill_dir.write(&schema, dfs)?;
+                self.spilled_per_p[p].push((file, seqs));
+            }
+        }
+
+        self.cold_morsels.clear();
+        for idxs in &mut self.morsel_idxs_values_per_p {
+            idxs.clear();
+        }
+        self.morsel_idxs_offsets_per_p.clear();
+        self.morsel_idxs_offsets_per_p.resize(num_partitions, 0);
+        self.cold_size = 0;
+        Ok(())
+    }
+
     fn flush_evictions(&mut self, partitioner: &HashPartitioner) {
         let hash_keys = self.hot_grouper.take_evicted_keys();
         let reductions = self
@@ -110,6 +167,8 @@ struct GroupBySinkState {
     locals: Vec<LocalGroupBySinkState>,
     random_state: PlRandomState,
     partitioner: HashPartitioner,
+    spill_key_names: Vec<PlSmallStr>,
+    memory_limit: Option<usize>,
 }
 
 impl GroupBySinkState {
@@ -120,12 +179,15 @@ impl GroupBySinkState {
         state: &'s StreamingExecutionState,
         join_handles: &mut Vec<JoinHandle<PolarsResult<()>>>,
     ) {
+        let receivers_len = receivers.len();
         for (mut recv, local) in receivers.into_iter().zip(&mut self.locals) {
             let key_selectors = &self.key_selectors;
             let uniq_grouped_reduction_cols = &self.uniq_grouped_reduction_cols;
             let grouped_reduction_cols = &self.grouped_reduction_cols;
             let random_state = &self.random_state;
             let partitioner = self.partitioner.clone();
+            let spill_key_names = &self.spill_key_names;
+            let local_memory_limit = self.memory_limit.map(|l| l / receivers_len);
             join_handles.push(scope.spawn_task(TaskPriority::High, async move {
                 let mut hot_idxs = Vec::new();
                 let mut hot_group_idxs = Vec::new();
@@ -180,7 +242,20 @@ impl GroupBySinkState {
                     if !cold_idxs.is_empty() {
                         unsafe {
                             let cold_keys = hash_keys.gather_unchecked(&cold_idxs);
-                            let cold_df = df.take_slice_unchecked_impl(&cold_idxs, false);
+                            let mut cold_df = df.take_slice_unchecked_impl(&cold_idxs, false);
+                            if local_memory_limit.is_some() {
+                                // Keep the keys around in a form we can spill.
+                                let cold_key_df = keys.take_slice_unchecked_impl(&cold_idxs, false);
+                                let mut columns = cold_key_df
+                                    .take_columns()
+                                    .into_iter()
+                                    .zip(spill_key_names)
+                                    .map(|(c, name)| c.with_name(name.clone()))
+                                    .collect_vec();
+                                columns.extend_from_slice(cold_df.get_columns());
+                                cold_df = DataFrame::new_no_checks(cold_idxs.len(), columns);
+                                local.cold_size += cold_df.estimated_size();
+                            }
 
                             cold_keys.gen_idxs_per_partition(
                                 &partitioner,
@@ -193,6 +268,10 @@ impl GroupBySinkState {
                                 .extend(local.morsel_idxs_values_per_p.iter().map(|vp| vp.len()));
                             local.cold_morsels.push((seq, cold_keys, cold_df));
                         }
+
+                        if local_memory_limit.is_some_and(|l| local.cold_size > l) {
+                            local.spill_cold_morsels()?;
+                        }
                     }
 
                     // If we have too many evicted rows, flush them.
@@ -248,6 +327,8 @@ impl GroupBySinkState {
         let grouper_template = &self.grouper;
         let grouped_reductions_template = &self.grouped_reductions;
         let grouped_reduction_cols = &self.grouped_reduction_cols;
+        let spill_key_names = &self.spill_key_names;
+        let random_state = &self.random_state;
 
         async_executor::task_scope(|s| {
             // Wrap in outer Arc to move to each thread, performing the
@@ -334,6 +415,42 @@ impl GroupBySinkState {
                         }
                     }
 
+                    // Insert spilled morsels, one record batch at a time.
+                    let num_keys = spill_key_names.len();
+                    let mut all_idxs = Vec::new();
+                    for l in locals {
+                        for (file, seqs) in &l.spilled_per_p[p] {
+                            let mut reader = file.reader()?;
+                            for seq_id in seqs {
+                                let df = reader.next_df()?.unwrap();
+                                let keys = df.select_by_range(..num_keys)?;
+                                let keys = HashKeys::from_df(&keys, *random_state, true, false);
+                                all_idxs.clear();
+                                all_idxs.extend(0..df.height() as IdxSize);
+                                unsafe {
+                                    group_idxs.clear();
+                                    p_grouper.insert_keys_subset(
+                                        &keys,
+                                        &all_idxs,
+                                        Some(&mut group_idxs),
+                                    );
+                                    for (c, r) in
+                                        grouped_reduction_cols.iter().zip(&mut p_reductions)
+                                    {
+                                        let values = df.column(c.as_str()).unwrap();
+                                        r.resize(p_grouper.num_groups());
+                                        r.update_groups_subset(
+                                            values,
+                                            &all_idxs,
+                                            &group_idxs,
+                                            *seq_id,
+                                        )?;
+                                    }
+                                }
+                            }
+                        }
+                    }
+
                     // Insert pre-aggregates.
                     for (l, l_pre_aggs) in locals.iter().zip(pre_aggs_per_local) {
                         // Try to help with dropping.
@@ -466,6 +583,7 @@ impl GroupByNode {
         output_schema: Arc<Schema>,
         random_state: PlRandomState,
         num_pipelines: usize,
+        memory_limit: Option<usize>,
     ) -> Self {
         let hot_table_size = std::env::var("POLARS_HOT_TABLE_SIZE")
             .map(|sz| sz.parse::<usize>().unwrap())
@@ -489,6 +607,9 @@ impl GroupByNode {
             })
             .collect();
         let partitioner = HashPartitioner::new(num_partitions, 0);
+        let spill_key_names = (0..key_schema.len())
+            .map(|i| format_pl_smallstr!("__POLARS_GROUP_BY_KEY_{i}"))
+            .collect();
         Self {
             state: GroupByState::Sink(GroupBySinkState {
                 key_selectors,
@@ -499,6 +620,8 @@ impl GroupByNode {
                 grouped_reduction_cols,
                 locals,
                 partitioner,
+                spill_key_names,
+                memory_limit,
             }),
             key_schema,
             output_schema,
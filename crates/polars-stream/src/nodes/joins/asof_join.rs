@@ -0,0 +1,314 @@
+use std::sync::Arc;
+
+use polars_core::prelude::*;
+use polars_ops::frame::AsofStrategy;
+use polars_ops::series::SeriesMethods;
+use polars_utils::pl_str::PlSmallStr;
+
+use super::InMemoryJoiner;
+use crate::DEFAULT_DISTRIBUTOR_BUFFER_SIZE;
+use crate::async_primitives::connector::Receiver;
+use crate::async_primitives::distributor_channel::distributor_channel;
+use crate::morsel::SourceToken;
+use crate::nodes::compute_node_prelude::*;
+
+/// A left morsel which could not be joined yet as the right side did not
+/// have all the rows it could match with.
+struct PendingMorsel {
+    df: DataFrame,
+    seq: MorselSeq,
+    source_token: SourceToken,
+}
+
+/// Streaming as-of join for inputs which are sorted on their key.
+///
+/// The left input is streamed through in order, whereas the right input is
+/// buffered only up until the point where it has passed the largest key of the
+/// current left morsel. Every left morsel is then joined with the in-memory
+/// engine against this window of the right input, after which all right rows
+/// that can no longer be matched by any of the following left keys are pruned.
+///
+/// For the backward and nearest strategies this keeps the last row before the
+/// window (per `by` group), the forward strategy never looks back.
+pub struct AsOfJoinNode {
+    left_key: PlSmallStr,
+    right_key: PlSmallStr,
+    right_by: Option<Vec<PlSmallStr>>,
+    strategy: AsofStrategy,
+    check_sortedness: bool,
+
+    right_input_schema: Arc<Schema>,
+    right_buffer: DataFrame,
+    right_done: bool,
+    pending_left: Option<PendingMorsel>,
+
+    left_max: Option<Column>,
+    right_max: Option<Column>,
+
+    joiners: Vec<InMemoryJoiner>,
+}
+
+impl AsOfJoinNode {
+    #[allow(clippy::too_many_arguments)]
+    pub fn new(
+        right_input_schema: Arc<Schema>,
+        left_key: PlSmallStr,
+        right_key: PlSmallStr,
+        right_by: Option<Vec<PlSmallStr>>,
+        strategy: AsofStrategy,
+        check_sortedness: bool,
+        joiners: Vec<InMemoryJoiner>,
+    ) -> Self {
+        assert!(right_by.is_none() || strategy == AsofStrategy::Backward);
+        assert!(!joiners.is_empty());
+        Self {
+            left_key,
+            right_key,
+            right_by,
+            strategy,
+            check_sortedness,
+            right_buffer: DataFrame::empty_with_schema(&right_input_schema),
+            right_input_schema,
+            right_done: false,
+            pending_left: None,
+            left_max: None,
+            right_max: None,
+            joiners,
+        }
+    }
+}
+
+/// Ensures the key of a new morsel continues the sorted order of the keys seen
+/// so far, updating the running maximum.
+///
+/// The in-memory engine only checks this within a single frame, but we rely on
+/// the global order to bound the right window. Joins with `by` groups are only
+/// streamed if both inputs are known to be sorted on their key.
+fn check_sorted_continuation(key: &Column, prev_max: &mut Option<Column>) -> PolarsResult<()> {
+    let key = key.as_materialized_series();
+    let mut is_sorted = key.is_sorted(Default::default())?;
+    if let Some(prev_max) = prev_max.as_ref() {
+        // Nulls must come first, so after a non-null key we can't see any.
+        is_sorted &= !key.has_nulls() && !prev_max.as_materialized_series().gt(key)?.any();
+    }
+    polars_ensure!(
+        is_sorted,
+        InvalidOperation: "argument in operation 'asof_join' is not sorted, please sort the \
+        'expr/series/column' first; the streaming engine requires the 'on' keys to be sorted \
+        across all rows"
+    );
+
+    let max = key.max_reduce()?;
+    if !max.is_null() {
+        *prev_max = Some(max.into_column(key.name().clone()));
+    }
+    Ok(())
+}
+
+/// Returns the number of rows at the start of the sorted `key` that are null
+/// or strictly smaller than `bound`.
+fn num_rows_below(key: &Column, bound: &Column) -> PolarsResult<usize> {
+    Ok(key.null_count() + key.lt(bound)?.sum().unwrap_or(0) as usize)
+}
+
+impl AsOfJoinNode {
+    /// Returns the largest key of the given left frame as a unit-length
+    /// column, or `None` if all its keys are null.
+    fn left_bound(&self, left: &DataFrame) -> PolarsResult<Option<Column>> {
+        let key = left.column(&self.left_key)?;
+        let max = key.max_reduce()?;
+        Ok((!max.is_null()).then(|| max.into_column(key.name().clone())))
+    }
+
+    /// Whether the buffered right rows contain all the rows that left keys up
+    /// to and including `bound` could match with.
+    fn right_window_complete(&self, bound: Option<&Column>) -> PolarsResult<bool> {
+        let Some(bound) = bound else {
+            return Ok(true);
+        };
+        if self.right_done {
+            return Ok(true);
+        }
+        // Equal keys might continue in the next morsel, so we need to have
+        // seen a strictly larger key. For the forward and nearest strategies
+        // this is also the first row that a left key equal to bound can match.
+        let key = self.right_buffer.column(&self.right_key)?;
+        Ok(key.gt(&bound.cast(key.dtype())?)?.any())
+    }
+
+    fn push_right(&mut self, df: DataFrame) -> PolarsResult<()> {
+        if self.check_sortedness {
+            check_sorted_continuation(df.column(&self.right_key)?, &mut self.right_max)?;
+        }
+        self.right_buffer.vstack_mut_owned(df)?;
+        Ok(())
+    }
+
+    /// Removes the buffered right rows that can't be matched anymore by any
+    /// left key greater than or equal to `bound`.
+    fn prune_right(&mut self, bound: &Column) -> PolarsResult<()> {
+        let key = self.right_buffer.column(&self.right_key)?;
+        let below = num_rows_below(key, &bound.cast(key.dtype())?)?;
+        let (head, tail) = self.right_buffer.split_at(below as i64);
+
+        self.right_buffer = match (&self.strategy, &self.right_by) {
+            (AsofStrategy::Forward, _) => tail,
+            (_, None) => {
+                let mut df = head.slice(-1, 1);
+                df.vstack_mut_owned(tail)?;
+                df
+            },
+            (_, Some(by)) => {
+                let mut df =
+                    head.unique_impl(true, Some(by.clone()), UniqueKeepStrategy::Last, None)?;
+                df.vstack_mut_owned(tail)?;
+                df
+            },
+        };
+        Ok(())
+    }
+}
+
+impl ComputeNode for AsOfJoinNode {
+    fn name(&self) -> &str {
+        "asof-join"
+    }
+
+    fn update_state(
+        &mut self,
+        recv: &mut [PortState],
+        send: &mut [PortState],
+        _state: &StreamingExecutionState,
+    ) -> PolarsResult<()> {
+        assert!(recv.len() == 2 && send.len() == 1);
+
+        if recv[1] == PortState::Done {
+            self.right_done = true;
+        }
+
+        let left_done = recv[0] == PortState::Done && self.pending_left.is_none();
+        if send[0] == PortState::Done || left_done {
+            recv[0] = PortState::Done;
+            recv[1] = PortState::Done;
+            send[0] = PortState::Done;
+            self.right_buffer = DataFrame::empty_with_schema(&self.right_input_schema);
+            self.pending_left = None;
+            return Ok(());
+        }
+
+        let send_blocked = send[0] == PortState::Blocked;
+        let left_blocked = recv[0] == PortState::Blocked && self.pending_left.is_none();
+        let right_blocked = recv[1] == PortState::Blocked;
+        send[0] = if left_blocked || right_blocked {
+            PortState::Blocked
+        } else {
+            PortState::Ready
+        };
+        if recv[0] != PortState::Done {
+            recv[0] = if send_blocked || right_blocked {
+                PortState::Blocked
+            } else {
+                PortState::Ready
+            };
+        }
+        if recv[1] != PortState::Done {
+            recv[1] = if send_blocked || left_blocked {
+                PortState::Blocked
+            } else {
+                PortState::Ready
+            };
+        }
+        Ok(())
+    }
+
+    fn spawn<'env, 's>(
+        &'env mut self,
+        scope: &'s TaskScope<'s, 'env>,
+        recv_ports: &mut [Option<RecvPort<'_>>],
+        send_ports: &mut [Option<SendPort<'_>>],
+        _state: &'s StreamingExecutionState,
+        join_handles: &mut Vec<JoinHandle<PolarsResult<()>>>,
+    ) {
+        assert!(recv_ports.len() == 2 && send_ports.len() == 1);
+
+        let mut left = recv_ports[0].take().map(|p| p.serial());
+        let mut right: Option<Receiver<Morsel>> = recv_ports[1].take().map(|p| p.serial());
+        let senders = send_ports[0].take().unwrap().parallel();
+
+        let (mut distributor, dist_receivers) =
+            distributor_channel(senders.len(), *DEFAULT_DISTRIBUTOR_BUFFER_SIZE);
+        let joiners = self.joiners.clone();
+
+        join_handles.push(scope.spawn_task(TaskPriority::High, async move {
+            loop {
+                let pending = match self.pending_left.take() {
+                    Some(pending) => pending,
+                    None => {
+                        let Some(Ok(morsel)) = (match left.as_mut() {
+                            Some(left) => Some(left.recv().await),
+                            None => None,
+                        }) else {
+                            break;
+                        };
+                        // Drop the consume token, we might hold on to this
+                        // morsel for longer than a single phase.
+                        let (df, seq, source_token, _) = morsel.into_inner();
+                        if self.check_sortedness {
+                            check_sorted_continuation(
+                                df.column(&self.left_key)?,
+                                &mut self.left_max,
+                            )?;
+                        }
+                        PendingMorsel {
+                            df,
+                            seq,
+                            source_token,
+                        }
+                    },
+                };
+
+                let bound = self.left_bound(&pending.df)?;
+                while !self.right_window_complete(bound.as_ref())? {
+                    let Some(Ok(morsel)) = (match right.as_mut() {
+                        Some(right) => Some(right.recv().await),
+                        None => None,
+                    }) else {
+                        // The right input is exhausted for this phase, wait
+                        // for the next phase (or for it to be done).
+                        self.pending_left = Some(pending);
+                        return Ok(());
+                    };
+                    self.push_right(morsel.into_df())?;
+                }
+
+                let morsel = Morsel::new(pending.df, pending.seq, pending.source_token);
+                if distributor
+                    .send((morsel, self.right_buffer.clone()))
+                    .await
+                    .is_err()
+                {
+                    break;
+                }
+
+                if let Some(bound) = &bound {
+                    self.prune_right(bound)?;
+                }
+            }
+
+            Ok(())
+        }));
+
+        for (i, (mut recv, mut send)) in dist_receivers.into_iter().zip(senders).enumerate() {
+            let joiner = joiners[i % joiners.len()].clone();
+            join_handles.push(scope.spawn_task(TaskPriority::High, async move {
+                while let Ok((morsel, right)) = recv.recv().await {
+                    let morsel = morsel.try_map(|left| joiner(left, right))?;
+                    if send.send(morsel).await.is_err() {
+                        break;
+                    }
+                }
+                Ok(())
+            }));
+        }
+    }
+}
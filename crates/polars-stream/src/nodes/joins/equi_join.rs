@@ -30,6 +30,7 @@ use crate::expression::StreamExpr;
 use crate::morsel::{SourceToken, get_ideal_morsel_size};
 use crate::nodes::compute_node_prelude::*;
 use crate::nodes::in_memory_source::InMemorySourceNode;
+use crate::utils::spill::{SpillDir, SpillFile};
 
 struct EquiJoinParams {
     left_is_build: Option<bool>,
@@ -46,6 +47,7 @@ struct EquiJoinParams {
     right_payload_schema: Arc<Schema>,
     args: JoinArgs,
     random_state: PlRandomState,
+    memory_limit: Option<usize>,
 }
 
 impl EquiJoinParams {
@@ -149,23 +151,30 @@ fn select_schema(schema: &Schema, selector: &[Option<PlSmallStr>]) -> Schema {
         .collect()
 }
 
-async fn select_keys(
+async fn select_key_columns(
     df: &DataFrame,
     key_selectors: &[StreamExpr],
-    params: &EquiJoinParams,
     state: &ExecutionState,
-) -> PolarsResult<HashKeys> {
+) -> PolarsResult<DataFrame> {
     let mut key_columns = Vec::new();
     for selector in key_selectors {
         key_columns.push(selector.evaluate(df, state).await?.into_column());
     }
-    let keys = DataFrame::new_with_broadcast_len(key_columns, df.height())?;
-    Ok(HashKeys::from_df(
-        &keys,
-        params.random_state,
-        params.args.nulls_equal,
-        false,
-    ))
+    DataFrame::new_with_broadcast_len(key_columns, df.height())
+}
+
+fn hash_key_columns(keys: &DataFrame, params: &EquiJoinParams) -> HashKeys {
+    HashKeys::from_df(keys, params.random_state, params.args.nulls_equal, false)
+}
+
+async fn select_keys(
+    df: &DataFrame,
+    key_selectors: &[StreamExpr],
+    params: &EquiJoinParams,
+    state: &ExecutionState,
+) -> PolarsResult<HashKeys> {
+    let keys = select_key_columns(df, key_selectors, state).await?;
+    Ok(hash_key_columns(&keys, params))
 }
 
 fn select_payload(df: DataFrame, selector: &[Option<PlSmallStr>]) -> DataFrame {
@@ -349,6 +358,7 @@ impl SampleState {
             state.num_pipelines,
             state.num_pipelines,
             sampled_probe_morsels,
+            params.memory_limit,
         );
 
         // Simulate the sample build morsels flowing into the build side.
@@ -399,6 +409,68 @@ struct LocalBuilder {
     // let stop = morsel_idxs_offsets[(i + 1) * num_partitions + p];
     morsel_idxs_values_per_p: Vec<Vec<IdxSize>>,
     morsel_idxs_offsets_per_p: Vec<usize>,
+
+    // If we have a memory limit we also keep the key columns of each morsel,
+    // and spill the morsels per partition (keys in front of the payload) once
+    // they grow beyond it.
+    memory_limit: Option<usize>,
+    morsel_keys: Vec<DataFrame>,
+    morsels_size: usize,
+    spill_dir: Option<SpillDir>,
+    spilled_per_p: Vec<Vec<SpillFile>>,
+    spilled_rows_per_p: Vec<usize>,
+}
+
+impl LocalBuilder {
+    /// Writes all buffered morsels to disk, one file per partition.
+    fn spill(&mut self) -> PolarsResult<()> {
+        let num_partitions = self.spilled_per_p.len();
+        let spill_dir = match &mut self.spill_dir {
+            Some(dir) => dir,
+            None => self.spill_dir.insert(SpillDir::new("equi-join")?),
+        };
+
+        for p in 0..num_partitions {
+            let mut schema = None;
+            let mut dfs = Vec::new();
+            for (i, ((_seq, payload, _hash_keys), keys)) in
+                self.morsels.iter().zip(&self.morsel_keys).enumerate()
+            {
+                let start = self.morsel_idxs_offsets_per_p[i * num_partitions + p];
+                let stop = self.morsel_idxs_offsets_per_p[(i + 1) * num_partitions + p];
+                if start == stop {
+                    continue;
+                }
+                let idxs = &self.morsel_idxs_values_per_p[p][start..stop];
+                let mut df = unsafe {
+                    let mut columns = keys.take_slice_unchecked_impl(idxs, false).take_columns();
+                    columns.extend(
+                        payload
+                            .take_slice_unchecked_impl(idxs, false)
+                            .take_columns(),
+                    );
+                    DataFrame::new_no_checks(idxs.len(), columns)
+                };
+                df.rechunk_mut();
+                schema.get_or_insert_with(|| df.schema().clone());
+                self.spilled_rows_per_p[p] += df.height();
+                dfs.push(df);
+            }
+            if let Some(schema) = schema {
+                self.spilled_per_p[p].push(spill_dir.write(&schema, dfs)?);
+            }
+        }
+
+        self.morsels.clear();
+        self.morsel_keys.clear();
+        for idxs in &mut self.morsel_idxs_values_per_p {
+            idxs.clear();
+        }
+        self.morsel_idxs_offsets_per_p.clear();
+        self.morsel_idxs_offsets_per_p.resize(num_partitions, 0);
+        self.morsels_size = 0;
+        Ok(())
+    }
 }
 
 struct BuildState {
@@ -411,6 +483,7 @@ impl BuildState {
         num_pipelines: usize,
         num_partitions: usize,
         sampled_probe_morsels: BufferedStream,
+        memory_limit: Option<usize>,
     ) -> Self {
         let local_builders = (0..num_pipelines)
             .map(|_| LocalBuilder {
@@ -418,6 +491,12 @@ impl BuildState {
                 sketch_per_p: vec![CardinalitySketch::default(); num_partitions],
                 morsel_idxs_values_per_p: vec![Vec::new(); num_partitions],
                 morsel_idxs_offsets_per_p: vec![0; num_partitions],
+                memory_limit: memory_limit.map(|l| l / num_pipelines),
+                morsel_keys: Vec::new(),
+                morsels_size: 0,
+                spill_dir: None,
+                spilled_per_p: (0..num_partitions).map(|_| Vec::new()).collect(),
+                spilled_rows_per_p: vec![0; num_partitions],
             })
             .collect();
         Self {
@@ -446,13 +525,9 @@ impl BuildState {
         while let Ok(morsel) = recv.recv().await {
             // Compute hashed keys and payload. We must rechunk the payload for
             // later gathers.
-            let hash_keys = select_keys(
-                morsel.df(),
-                key_selectors,
-                params,
-                &state.in_memory_exec_state,
-            )
-            .await?;
+            let keys =
+                select_key_columns(morsel.df(), key_selectors, &state.in_memory_exec_state).await?;
+            let hash_keys = hash_key_columns(&keys, params);
             let mut payload = select_payload(morsel.df().clone(), payload_selector);
             payload.rechunk_mut();
 
@@ -466,7 +541,16 @@ impl BuildState {
             local
                 .morsel_idxs_offsets_per_p
                 .extend(local.morsel_idxs_values_per_p.iter().map(|vp| vp.len()));
-            local.morsels.push((morsel.seq(), payload, hash_keys));
+            if let Some(memory_limit) = local.memory_limit {
+                local.morsels_size += keys.estimated_size() + payload.estimated_size();
+                local.morsel_keys.push(keys);
+                local.morsels.push((morsel.seq(), payload, hash_keys));
+                if local.morsels_size > memory_limit {
+                    local.spill()?;
+                }
+            } else {
+                local.morsels.push((morsel.seq(), payload, hash_keys));
+            }
         }
         Ok(())
     }
@@ -569,12 +653,19 @@ impl BuildState {
         }
     }
 
-    fn finalize_unordered(&mut self, params: &EquiJoinParams, table: &dyn IdxTable) -> ProbeState {
+    fn finalize_unordered(
+        &mut self,
+        params: &EquiJoinParams,
+        table: &dyn IdxTable,
+    ) -> PolarsResult<ProbeState> {
         let track_unmatchable = params.emit_unmatched_build();
-        let payload_schema = if params.left_is_build.unwrap() {
-            &params.left_payload_schema
+        let (payload_schema, num_keys) = if params.left_is_build.unwrap() {
+            (&params.left_payload_schema, params.left_key_selectors.len())
         } else {
-            &params.right_payload_schema
+            (
+                &params.right_payload_schema,
+                params.right_key_selectors.len(),
+            )
         };
 
         // To reduce maximum memory usage we want to drop the morsels
@@ -616,6 +707,7 @@ impl BuildState {
                         let offsets_len = l.morsel_idxs_offsets_per_p.len();
                         payload_rows +=
                             l.morsel_idxs_offsets_per_p[offsets_len - num_partitions + p];
+                        payload_rows += l.spilled_rows_per_p[p];
                     }
 
                     // Allocate hash table and payload builder.
@@ -661,6 +753,34 @@ impl BuildState {
                         }
                     }
 
+                    // Build from the spilled morsels, one record batch at a time.
+                    let mut all_idxs = Vec::new();
+                    for l in local_builders {
+                        for file in &l.spilled_per_p[p] {
+                            let mut reader = file.reader()?;
+                            while let Some(df) = reader.next_df()? {
+                                let keys =
+                                    hash_key_columns(&df.select_by_range(..num_keys)?, params);
+                                let payload = unsafe {
+                                    DataFrame::new_no_checks(
+                                        df.height(),
+                                        df.get_columns()[num_keys..].to_vec(),
+                                    )
+                                };
+                                all_idxs.clear();
+                                all_idxs.extend(0..df.height() as IdxSize);
+                                unsafe {
+                                    p_table.insert_keys_subset(&keys, &all_idxs, track_unmatchable);
+                                    p_payload.gather_extend(
+                                        &payload,
+                                        &all_idxs,
+                                        ShareStrategy::Never,
+                                    );
+                                }
+                            }
+                        }
+                    }
+
                     // We're done, help others out by doing drops.
                     drop(morsel_drop_q_send); // So we don't deadlock trying to receive from ourselves.
                     while let Ok(l_morsels) = morsel_drop_q_recv.recv().await {
@@ -678,6 +798,8 @@ impl BuildState {
                         )
                         .ok()
                         .unwrap();
+
+                    PolarsResult::Ok(())
                 }));
             }
 
@@ -690,17 +812,18 @@ impl BuildState {
 
             polars_io::pl_async::get_runtime().block_on(async move {
                 for handle in join_handles {
-                    handle.await;
+                    handle.await?;
                 }
-            });
-        });
+                PolarsResult::Ok(())
+            })
+        })?;
 
-        ProbeState {
+        Ok(ProbeState {
             table_per_partition: probe_tables.try_assume_init().ok().unwrap(),
             max_seq_sent: MorselSeq::default(),
             sampled_probe_morsels: core::mem::take(&mut self.sampled_probe_morsels),
             unordered_morsel_seq: AtomicU64::new(0),
-        }
+        })
     }
 }
 
@@ -1158,6 +1281,7 @@ impl EquiJoinNode {
         right_key_selectors: Vec<StreamExpr>,
         args: JoinArgs,
         num_pipelines: usize,
+        memory_limit: Option<usize>,
     ) -> PolarsResult<Self> {
         let left_is_build = match args.maintain_order {
             MaintainOrderJoin::None => {
@@ -1176,6 +1300,9 @@ impl EquiJoinNode {
             args.maintain_order,
             MaintainOrderJoin::LeftRight | MaintainOrderJoin::RightLeft
         );
+        // Spilled morsels lose their order, so we only spill if we don't have
+        // to preserve the order of the build side.
+        let memory_limit = memory_limit.filter(|_| !preserve_order_build);
 
         let left_payload_select = compute_payload_selector(
             &left_input_schema,
@@ -1197,6 +1324,7 @@ impl EquiJoinNode {
                 num_pipelines,
                 num_pipelines,
                 BufferedStream::default(),
+                memory_limit,
             ))
         } else {
             EquiJoinState::Sample(SampleState::default())
@@ -1221,6 +1349,7 @@ impl EquiJoinNode {
                 right_payload_schema,
                 args,
                 random_state: PlRandomState::default(),
+                memory_limit,
             },
             table: new_idx_table(unique_key_schema),
         })
@@ -1267,7 +1396,7 @@ impl ComputeNode for EquiJoinNode {
                 let probe_state = if self.params.preserve_order_build {
                     build_state.finalize_ordered(&self.params, &*self.table)
                 } else {
-                    build_state.finalize_unordered(&self.params, &*self.table)
+                    build_state.finalize_unordered(&self.params, &*self.table)?
                 };
                 self.state = EquiJoinState::Probe(probe_state);
             }
@@ -0,0 +1,480 @@
+use std::cmp::Ordering;
+use std::collections::VecDeque;
+
+use polars_core::prelude::*;
+use polars_core::utils::accumulate_dataframes_vertical_unchecked;
+use polars_ops::frame::InequalityOperator;
+
+use super::InMemoryJoiner;
+use crate::expression::StreamExpr;
+use crate::morsel::get_ideal_morsel_size;
+use crate::nodes::compute_node_prelude::*;
+use crate::utils::spill::{SpillDir, SpillFile};
+
+/// Name of the column holding the evaluated key of a spilled build block.
+const BUILD_KEY_COLUMN: &str = "__POLARS_IEJOIN_KEY";
+
+struct IEJoinParams {
+    left_key: StreamExpr,
+    right_key: StreamExpr,
+    operator: InequalityOperator,
+    memory_limit: Option<usize>,
+    /// One in-memory inequality join per pipeline, used to join a left
+    /// morsel with the matching range of a build block.
+    joiners: Vec<InMemoryJoiner>,
+}
+
+/// A streaming inequality join.
+///
+/// The right input is collected and range-partitioned on the key of the first
+/// inequality into blocks that are sorted on that key. The left input is then
+/// streamed through, and every left morsel is only joined (with the in-memory
+/// IEJoin) against the part of each block that can satisfy the first
+/// inequality given the morsel's key range. Blocks that can't match at all
+/// are skipped entirely.
+///
+/// If a memory limit is set, the right input is sorted and spilled to disk in
+/// blocks whenever its buffered size exceeds that limit, and blocks are only
+/// loaded from disk by the left morsels that overlap them. Every pipeline
+/// keeps the blocks it loaded most recently in memory (within its share of
+/// the memory limit), for the following morsels that overlap them.
+pub struct IEJoinNode {
+    params: IEJoinParams,
+    state: IEJoinState,
+}
+
+enum IEJoinState {
+    Build(IEJoinBuild),
+    Probe(IEJoinProbe),
+    Done,
+}
+
+#[derive(Default)]
+struct IEJoinBuild {
+    buffered: Vec<DataFrame>,
+    buffered_size: usize,
+    blocks: Vec<BuildBlock>,
+    spill_dir: Option<SpillDir>,
+}
+
+struct IEJoinProbe {
+    blocks: Vec<BuildBlock>,
+    key_dtype: DataType,
+    /// Owns the files of the spilled blocks.
+    _spill_dir: Option<SpillDir>,
+}
+
+struct BuildBlock {
+    min: AnyValue<'static>,
+    max: AnyValue<'static>,
+    data: BlockData,
+}
+
+enum BlockData {
+    InMemory { df: DataFrame, key: Column },
+    Spilled(SpillFile),
+}
+
+impl IEJoinNode {
+    pub fn new(
+        left_key: StreamExpr,
+        right_key: StreamExpr,
+        operator: InequalityOperator,
+        memory_limit: Option<usize>,
+        joiners: Vec<InMemoryJoiner>,
+    ) -> Self {
+        assert!(!joiners.is_empty());
+        Self {
+            params: IEJoinParams {
+                left_key,
+                right_key,
+                operator,
+                memory_limit,
+                joiners,
+            },
+            state: IEJoinState::Build(IEJoinBuild::default()),
+        }
+    }
+}
+
+/// Evaluates `expr` on `df`, broadcasting scalar results to the frame height.
+fn evaluate_key(expr: &StreamExpr, df: &DataFrame, state: &ExecutionState) -> PolarsResult<Column> {
+    let key = expr.evaluate_blocking(df, state)?;
+    Ok(if key.len() == 1 && df.height() != 1 {
+        key.new_from_index(0, df.height())
+    } else {
+        key
+    })
+}
+
+/// Sorts the given frames on the build key, dropping the rows with a null key
+/// as those never match.
+fn sort_build(
+    params: &IEJoinParams,
+    dfs: Vec<DataFrame>,
+    state: &ExecutionState,
+) -> PolarsResult<(DataFrame, Column)> {
+    let df = accumulate_dataframes_vertical_unchecked(dfs);
+    let key = evaluate_key(&params.right_key, &df, state)?;
+    let mut idx = key.arg_sort(SortOptions::default().with_nulls_last(false));
+    idx = idx.slice(key.null_count() as i64, key.len() - key.null_count());
+    unsafe { Ok((df.take_unchecked(&idx), key.take_unchecked(&idx))) }
+}
+
+impl BuildBlock {
+    fn new(data: BlockData, key: &Column) -> PolarsResult<Option<Self>> {
+        if key.is_empty() {
+            return Ok(None);
+        }
+        Ok(Some(Self {
+            min: key.get(0)?.into_static(),
+            max: key.get(key.len() - 1)?.into_static(),
+            data,
+        }))
+    }
+
+    /// Whether any row in this block can satisfy the inequality for a left key
+    /// in `[lmin, lmax]`.
+    fn may_match(
+        &self,
+        op: InequalityOperator,
+        lmin: &AnyValue,
+        lmax: &AnyValue,
+    ) -> PolarsResult<bool> {
+        use InequalityOperator as Op;
+        Ok(match op {
+            Op::Lt => compare_keys(lmin, &self.max)?.is_lt(),
+            Op::LtEq => compare_keys(lmin, &self.max)?.is_le(),
+            Op::Gt => compare_keys(lmax, &self.min)?.is_gt(),
+            Op::GtEq => compare_keys(lmax, &self.min)?.is_ge(),
+        })
+    }
+
+    fn load(&self) -> PolarsResult<(DataFrame, Column)> {
+        match &self.data {
+            BlockData::InMemory { df, key } => Ok((df.clone(), key.clone())),
+            BlockData::Spilled(file) => load_spilled(file),
+        }
+    }
+}
+
+fn load_spilled(file: &SpillFile) -> PolarsResult<(DataFrame, Column)> {
+    let mut reader = file.reader()?;
+    let mut df = reader.next_df()?.unwrap();
+    let key = df.drop_in_place(BUILD_KEY_COLUMN)?;
+    Ok((df, key))
+}
+
+/// The size of a loaded build block, for the memory budget of a [`BlockCache`].
+fn block_size(df: &DataFrame, key: &Column) -> usize {
+    df.estimated_size() + key.as_materialized_series().estimated_size()
+}
+
+/// The spilled build blocks that a single pipeline loaded most recently, kept
+/// in memory up to a budget so that consecutive left morsels overlapping the
+/// same blocks don't each read them from disk again.
+struct BlockCache {
+    budget: usize,
+    size: usize,
+    /// Entries of (block index, size, data, key), least recently used first.
+    entries: VecDeque<(usize, usize, DataFrame, Column)>,
+}
+
+impl BlockCache {
+    fn new(budget: usize) -> Self {
+        Self {
+            budget,
+            size: 0,
+            entries: VecDeque::new(),
+        }
+    }
+
+    fn get(&mut self, idx: usize, block: &BuildBlock) -> PolarsResult<(DataFrame, Column)> {
+        let BlockData::Spilled(file) = &block.data else {
+            return block.load();
+        };
+
+        if let Some(pos) = self.entries.iter().position(|e| e.0 == idx) {
+            let entry = self.entries.remove(pos).unwrap();
+            let out = (entry.2.clone(), entry.3.clone());
+            self.entries.push_back(entry);
+            return Ok(out);
+        }
+
+        let (df, key) = load_spilled(file)?;
+        let size = block_size(&df, &key);
+        if size <= self.budget {
+            while self.size + size > self.budget {
+                let (_, evicted, _, _) = self.entries.pop_front().unwrap();
+                self.size -= evicted;
+            }
+            self.size += size;
+            self.entries.push_back((idx, size, df.clone(), key.clone()));
+        }
+        Ok((df, key))
+    }
+}
+
+/// Compares two non-null key values of the same type, in the order of the
+/// sorted build keys: NaN is greater than all other values.
+fn compare_keys(a: &AnyValue, b: &AnyValue) -> PolarsResult<Ordering> {
+    polars_ensure!(
+        !a.is_null() && !b.is_null(),
+        ComputeError: "unexpected null key in streaming inequality join"
+    );
+    Ok(match (a.is_nan(), b.is_nan()) {
+        (true, true) => Ordering::Equal,
+        (true, false) => Ordering::Greater,
+        (false, true) => Ordering::Less,
+        (false, false) => match a.partial_cmp(b) {
+            Some(ord) => ord,
+            None => polars_bail!(
+                ComputeError: "cannot compare keys of type {} and {} in streaming inequality join",
+                a.dtype(), b.dtype()
+            ),
+        },
+    })
+}
+
+/// Returns the first index in the sorted `key` for which `pred` is false.
+fn partition_point(
+    key: &Column,
+    mut pred: impl FnMut(Ordering) -> bool,
+    bound: &AnyValue,
+) -> PolarsResult<usize> {
+    let mut lo = 0;
+    let mut hi = key.len();
+    while lo < hi {
+        let mid = lo + (hi - lo) / 2;
+        let ord = compare_keys(&key.get(mid)?, bound)?;
+        if pred(ord) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+    Ok(lo)
+}
+
+/// Returns the range of rows in the sorted build `key` that satisfy the
+/// inequality for some left key in `[lmin, lmax]`.
+fn matching_range(
+    key: &Column,
+    op: InequalityOperator,
+    lmin: &AnyValue,
+    lmax: &AnyValue,
+) -> PolarsResult<(usize, usize)> {
+    use InequalityOperator as Op;
+    Ok(match op {
+        Op::Lt => (partition_point(key, |o| o.is_le(), lmin)?, key.len()),
+        Op::LtEq => (partition_point(key, |o| o.is_lt(), lmin)?, key.len()),
+        Op::Gt => (0, partition_point(key, |o| o.is_lt(), lmax)?),
+        Op::GtEq => (0, partition_point(key, |o| o.is_le(), lmax)?),
+    })
+}
+
+impl IEJoinBuild {
+    fn spill(&mut self, params: &IEJoinParams, state: &ExecutionState) -> PolarsResult<()> {
+        self.buffered_size = 0;
+        let dfs = std::mem::take(&mut self.buffered);
+        let (mut df, key) = sort_build(params, dfs, state)?;
+        df.with_column(
+            key.clone()
+                .with_name(PlSmallStr::from_static(BUILD_KEY_COLUMN)),
+        )?;
+
+        if self.spill_dir.is_none() {
+            self.spill_dir = Some(SpillDir::new("iejoin")?);
+        }
+        let spill_dir = self.spill_dir.as_mut().unwrap();
+        let block_size = get_ideal_morsel_size().max(1);
+        for offset in (0..df.height()).step_by(block_size) {
+            let block_df = df.slice(offset as i64, block_size);
+            let block_key = key.slice(offset as i64, block_size);
+            let file = spill_dir.write(&block_df.schema(), [block_df])?;
+            self.blocks
+                .extend(BuildBlock::new(BlockData::Spilled(file), &block_key)?);
+        }
+        Ok(())
+    }
+
+    /// Turns the remaining buffered frames into a final in-memory block.
+    /// Returns `None` if no row of the right input can ever match.
+    fn finish(
+        mut self,
+        params: &IEJoinParams,
+        state: &ExecutionState,
+    ) -> PolarsResult<Option<IEJoinProbe>> {
+        let dfs = std::mem::take(&mut self.buffered);
+        if !dfs.is_empty() {
+            let (df, key) = sort_build(params, dfs, state)?;
+            let block = BuildBlock::new(
+                BlockData::InMemory {
+                    df,
+                    key: key.clone(),
+                },
+                &key,
+            )?;
+            self.blocks.extend(block);
+        }
+        let Some(first) = self.blocks.first() else {
+            return Ok(None);
+        };
+        Ok(Some(IEJoinProbe {
+            key_dtype: first.min.dtype(),
+            blocks: self.blocks,
+            _spill_dir: self.spill_dir,
+        }))
+    }
+}
+
+impl ComputeNode for IEJoinNode {
+    fn name(&self) -> &str {
+        "iejoin"
+    }
+
+    fn is_memory_intensive_pipeline_blocker(&self) -> bool {
+        matches!(self.state, IEJoinState::Build(_))
+    }
+
+    fn update_state(
+        &mut self,
+        recv: &mut [PortState],
+        send: &mut [PortState],
+        state: &StreamingExecutionState,
+    ) -> PolarsResult<()> {
+        assert!(recv.len() == 2 && send.len() == 1);
+
+        // Are we done?
+        if send[0] == PortState::Done || recv[0] == PortState::Done {
+            self.state = IEJoinState::Done;
+        }
+
+        // Transition to probe?
+        if recv[1] == PortState::Done {
+            if let IEJoinState::Build(build) = &mut self.state {
+                let build = std::mem::take(build);
+                self.state = match build.finish(&self.params, &state.in_memory_exec_state)? {
+                    Some(probe) => IEJoinState::Probe(probe),
+                    None => IEJoinState::Done,
+                };
+            }
+        }
+
+        match &self.state {
+            IEJoinState::Build(_) => {
+                recv[0] = PortState::Blocked;
+                recv[1] = PortState::Ready;
+                send[0] = PortState::Blocked;
+            },
+            IEJoinState::Probe(_) => {
+                recv[1] = PortState::Done;
+                core::mem::swap(&mut recv[0], &mut send[0]);
+            },
+            IEJoinState::Done => {
+                recv[0] = PortState::Done;
+                recv[1] = PortState::Done;
+                send[0] = PortState::Done;
+            },
+        }
+        Ok(())
+    }
+
+    fn spawn<'env, 's>(
+        &'env mut self,
+        scope: &'s TaskScope<'s, 'env>,
+        recv_ports: &mut [Option<RecvPort<'_>>],
+        send_ports: &mut [Option<SendPort<'_>>],
+        state: &'s StreamingExecutionState,
+        join_handles: &mut Vec<JoinHandle<PolarsResult<()>>>,
+    ) {
+        assert!(recv_ports.len() == 2 && send_ports.len() == 1);
+
+        let params = &self.params;
+        match &mut self.state {
+            IEJoinState::Build(build) => {
+                assert!(send_ports[0].is_none());
+                assert!(recv_ports[0].is_none());
+                let mut recv = recv_ports[1].take().unwrap().serial();
+                join_handles.push(scope.spawn_task(TaskPriority::High, async move {
+                    while let Ok(morsel) = recv.recv().await {
+                        let df = morsel.into_df();
+                        build.buffered_size += df.estimated_size();
+                        build.buffered.push(df);
+                        if params
+                            .memory_limit
+                            .is_some_and(|limit| build.buffered_size > limit)
+                        {
+                            build.spill(params, &state.in_memory_exec_state)?;
+                        }
+                    }
+                    Ok(())
+                }));
+            },
+            IEJoinState::Probe(probe) => {
+                assert!(recv_ports[1].is_none());
+                let receivers = recv_ports[0].take().unwrap().parallel();
+                let senders = send_ports[0].take().unwrap().parallel();
+                let probe = &*probe;
+                let cache_budget = params.memory_limit.unwrap_or(0) / receivers.len().max(1);
+
+                for (i, (mut recv, mut send)) in receivers.into_iter().zip(senders).enumerate() {
+                    let joiner = params.joiners[i % params.joiners.len()].clone();
+                    let mut cache = BlockCache::new(cache_budget);
+                    join_handles.push(scope.spawn_task(TaskPriority::High, async move {
+                        while let Ok(morsel) = recv.recv().await {
+                            let left = morsel.df();
+                            let left_key = params
+                                .left_key
+                                .evaluate(left, &state.in_memory_exec_state)
+                                .await?
+                                .cast(&probe.key_dtype)?;
+
+                            // Null keys never match, so a left morsel without
+                            // any non-null key has no output.
+                            let lmin = left_key.min_reduce()?;
+                            let lmax = left_key.max_reduce()?;
+                            if lmin.is_null() || lmax.is_null() {
+                                continue;
+                            }
+                            let (lmin, lmax) = (lmin.value(), lmax.value());
+
+                            // The min/max of a float key don't account for NaN
+                            // keys, so we can't prune for a morsel with those.
+                            let prune = !(left_key.dtype().is_float() && left_key.is_nan()?.any());
+
+                            for (idx, block) in probe.blocks.iter().enumerate() {
+                                if prune && !block.may_match(params.operator, lmin, lmax)? {
+                                    continue;
+                                }
+
+                                let (right, right_key) = cache.get(idx, block)?;
+                                let (start, end) = if prune {
+                                    matching_range(&right_key, params.operator, lmin, lmax)?
+                                } else {
+                                    (0, right_key.len())
+                                };
+                                if start >= end {
+                                    continue;
+                                }
+                                let right = right.slice(start as i64, end - start);
+
+                                let out = joiner(left.clone(), right)?;
+                                if out.is_empty() {
+                                    continue;
+                                }
+                                let out =
+                                    Morsel::new(out, morsel.seq(), morsel.source_token().clone());
+                                if send.send(out).await.is_err() {
+                                    return Ok(());
+                                }
+                            }
+                        }
+                        Ok(())
+                    }));
+                }
+            },
+            IEJoinState::Done => unreachable!(),
+        }
+    }
+}
@@ -2,6 +2,7 @@ use std::sync::Arc;
 
 use polars_core::schema::Schema;
 
+use super::InMemoryJoiner;
 use crate::nodes::compute_node_prelude::*;
 use crate::nodes::in_memory_sink::InMemorySinkNode;
 use crate::nodes::in_memory_source::InMemorySourceNode;
@@ -17,14 +18,14 @@ enum InMemoryJoinState {
 
 pub struct InMemoryJoinNode {
     state: InMemoryJoinState,
-    joiner: Arc<dyn Fn(DataFrame, DataFrame) -> PolarsResult<DataFrame> + Send + Sync>,
+    joiner: InMemoryJoiner,
 }
 
 impl InMemoryJoinNode {
     pub fn new(
         left_input_schema: Arc<Schema>,
         right_input_schema: Arc<Schema>,
-        joiner: Arc<dyn Fn(DataFrame, DataFrame) -> PolarsResult<DataFrame> + Send + Sync>,
+        joiner: InMemoryJoiner,
     ) -> Self {
         Self {
             state: InMemoryJoinState::Sink {
@@ -1,7 +1,8 @@
-use std::sync::LazyLock;
+use std::sync::{Arc, LazyLock};
 
 use crossbeam_queue::ArrayQueue;
 use polars_core::POOL;
+use polars_core::frame::DataFrame;
 use polars_error::PolarsResult;
 use polars_utils::itertools::Itertools;
 use rayon::prelude::*;
@@ -12,8 +13,12 @@ use crate::async_primitives::wait_group::WaitGroup;
 use crate::morsel::{Morsel, MorselSeq, SourceToken};
 use crate::pipe::RecvPort;
 
+#[cfg(feature = "asof_join")]
+pub mod asof_join;
 pub mod cross_join;
 pub mod equi_join;
+#[cfg(feature = "iejoin")]
+pub mod iejoin;
 pub mod in_memory;
 #[cfg(feature = "semi_anti_join")]
 pub mod semi_anti_join;
@@ -24,6 +29,10 @@ static JOIN_SAMPLE_LIMIT: LazyLock<usize> = LazyLock::new(|| {
         .unwrap_or(10_000_000)
 });
 
+/// Joins a left and right frame with the in-memory engine.
+pub type InMemoryJoiner =
+    Arc<dyn Fn(DataFrame, DataFrame) -> PolarsResult<DataFrame> + Send + Sync>;
+
 // If one side is this much bigger than the other side we'll always use the
 // smaller side as the build side without checking cardinalities.
 const LOPSIDED_SAMPLE_FACTOR: usize = 10;
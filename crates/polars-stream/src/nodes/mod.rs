@@ -16,6 +16,8 @@ pub mod ordered_union;
 pub mod reduce;
 pub mod select;
 pub mod simple_projection;
+#[cfg(feature = "merge_sorted")]
+pub mod sort;
 pub mod streaming_slice;
 pub mod with_row_index;
 pub mod zip;
@@ -0,0 +1,467 @@
+use std::collections::VecDeque;
+use std::sync::Arc;
+
+use polars_core::POOL;
+use polars_core::chunked_array::ops::row_encode::_get_rows_encoded_ca;
+use polars_core::prelude::{BinaryChunked, ChunkCast, DataType, SortMultipleOptions};
+use polars_core::schema::Schema;
+use polars_core::utils::accumulate_dataframes_vertical_unchecked;
+use polars_ops::frame::_merge_sorted_dfs;
+use polars_plan::plans::DataFrameUdf;
+use polars_utils::pl_str::PlSmallStr;
+use rayon::prelude::*;
+
+use super::compute_node_prelude::*;
+use super::in_memory_source::InMemorySourceNode;
+use crate::async_primitives::wait_group::WaitGroup;
+use crate::expression::StreamExpr;
+use crate::morsel::{SourceToken, get_ideal_morsel_size};
+use crate::utils::spill::{SpillDir, SpillFile, SpillReader};
+
+/// Name of the column that holds the row-encoded sort key of a sorted run.
+const SORT_KEY_COLUMN: &str = "__POLARS_SORT_KEY";
+
+struct SortParams {
+    input_schema: Arc<Schema>,
+    by: Vec<StreamExpr>,
+    descending: Vec<bool>,
+    nulls_last: Vec<bool>,
+    maintain_order: bool,
+    memory_limit: usize,
+    /// The regular in-memory sort, used if everything fits in memory.
+    in_memory_sort: Arc<dyn DataFrameUdf>,
+}
+
+/// An out-of-core sort.
+///
+/// The input is buffered until it exceeds the memory limit, at which point the
+/// buffered data is sorted and spilled to disk as a sorted run. Once the input
+/// is exhausted the runs are streamed back from disk and k-way merged on their
+/// row-encoded sort key. If no run was ever spilled this is equivalent to the
+/// in-memory sort.
+pub struct SortNode {
+    params: SortParams,
+    state: SortState,
+}
+
+enum SortState {
+    Sink(SortSink),
+    Source(InMemorySourceNode),
+    Merge(SortMerge),
+    Done,
+}
+
+#[derive(Default)]
+struct SortSink {
+    buffered: Vec<DataFrame>,
+    buffered_size: usize,
+    spill_dir: Option<SpillDir>,
+    runs: Vec<SpillFile>,
+}
+
+impl SortNode {
+    pub fn new(
+        input_schema: Arc<Schema>,
+        by: Vec<StreamExpr>,
+        sort_options: &SortMultipleOptions,
+        memory_limit: usize,
+        in_memory_sort: Arc<dyn DataFrameUdf>,
+    ) -> Self {
+        let broadcast = |v: &[bool]| {
+            if v.len() == 1 {
+                vec![v[0]; by.len()]
+            } else {
+                v.to_vec()
+            }
+        };
+        let descending = broadcast(&sort_options.descending);
+        let nulls_last = broadcast(&sort_options.nulls_last);
+
+        Self {
+            params: SortParams {
+                input_schema,
+                by,
+                descending,
+                nulls_last,
+                maintain_order: sort_options.maintain_order,
+                memory_limit,
+                in_memory_sort,
+            },
+            state: SortState::Sink(SortSink::default()),
+        }
+    }
+}
+
+/// Sorts the given frames on their row-encoded sort key, which is added as the
+/// last column.
+fn sort_run(
+    params: &SortParams,
+    dfs: Vec<DataFrame>,
+    state: &ExecutionState,
+) -> PolarsResult<DataFrame> {
+    let mut df = accumulate_dataframes_vertical_unchecked(dfs);
+    let keys = params
+        .by
+        .iter()
+        .map(|e| {
+            let key = e.evaluate_blocking(&df, state)?;
+            Ok(if key.len() == 1 && df.height() != 1 {
+                key.new_from_index(0, df.height())
+            } else {
+                key
+            })
+        })
+        .collect::<PolarsResult<Vec<_>>>()?;
+    let key = _get_rows_encoded_ca(
+        PlSmallStr::from_static(SORT_KEY_COLUMN),
+        &keys,
+        &params.descending,
+        &params.nulls_last,
+    )?
+    .cast(&DataType::Binary)?;
+    df.with_column(key)?;
+    df.sort(
+        [SORT_KEY_COLUMN],
+        SortMultipleOptions::default().with_maintain_order(params.maintain_order),
+    )
+}
+
+fn split_into_morsels(df: &DataFrame) -> impl Iterator<Item = DataFrame> + '_ {
+    let morsel_size = get_ideal_morsel_size().max(1);
+    (0..df.height())
+        .step_by(morsel_size)
+        .map(move |offset| df.slice(offset as i64, morsel_size))
+}
+
+impl SortSink {
+    fn spill(&mut self, params: &SortParams, state: &ExecutionState) -> PolarsResult<()> {
+        self.buffered_size = 0;
+        let dfs = std::mem::take(&mut self.buffered);
+        let run = sort_run(params, dfs, state)?;
+
+        if self.spill_dir.is_none() {
+            self.spill_dir = Some(SpillDir::new("sort")?);
+        }
+        let spill_dir = self.spill_dir.as_mut().unwrap();
+        let file = spill_dir.write(&run.schema(), split_into_morsels(&run))?;
+        self.runs.push(file);
+        Ok(())
+    }
+}
+
+/// A sorted run that is being merged.
+struct MergeRun {
+    /// The part of the run that is in memory but not yet merged.
+    buffered: DataFrame,
+    reader: Option<SpillReader>,
+}
+
+impl MergeRun {
+    /// Ensures the buffer is non-empty, unless the run is exhausted.
+    fn fill(&mut self) -> PolarsResult<()> {
+        while self.buffered.height() == 0 {
+            let Some(reader) = &mut self.reader else {
+                break;
+            };
+            match reader.next_df()? {
+                Some(df) => self.buffered = df,
+                None => self.reader = None,
+            }
+        }
+        Ok(())
+    }
+
+    fn keys(&self) -> &BinaryChunked {
+        self.buffered
+            .get_columns()
+            .last()
+            .unwrap()
+            .as_materialized_series()
+            .binary()
+            .unwrap()
+    }
+
+    /// Splits off the buffered rows for which `pred` holds on the sort key.
+    fn split_off_while(&mut self, mut pred: impl FnMut(&[u8]) -> bool) -> DataFrame {
+        let keys = self.keys();
+
+        // The keys are sorted, so this is a partition point.
+        let mut lo = 0;
+        let mut hi = keys.len();
+        while lo < hi {
+            let mid = lo + (hi - lo) / 2;
+            if pred(keys.get(mid).unwrap()) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+
+        let head;
+        (head, self.buffered) = self.buffered.split_at(lo as i64);
+        head
+    }
+}
+
+struct SortMerge {
+    runs: Vec<MergeRun>,
+    /// Merged but not yet sent data.
+    pending: VecDeque<DataFrame>,
+    seq: MorselSeq,
+    done: bool,
+    // Keeps the spilled runs alive until the merge is done.
+    _spill_dir: Option<SpillDir>,
+}
+
+impl SortMerge {
+    fn new(sink: SortSink, params: &SortParams, state: &ExecutionState) -> PolarsResult<Self> {
+        let SortSink {
+            buffered,
+            buffered_size: _,
+            spill_dir,
+            runs,
+        } = sink;
+
+        let mut merge_runs = runs
+            .iter()
+            .map(|file| {
+                Ok(MergeRun {
+                    buffered: DataFrame::empty(),
+                    reader: Some(file.reader()?),
+                })
+            })
+            .collect::<PolarsResult<Vec<_>>>()?;
+
+        // The data that was still buffered becomes the last run, we don't need
+        // to spill it.
+        if !buffered.is_empty() {
+            merge_runs.push(MergeRun {
+                buffered: sort_run(params, buffered, state)?,
+                reader: None,
+            });
+        }
+
+        Ok(Self {
+            runs: merge_runs,
+            pending: VecDeque::new(),
+            seq: MorselSeq::default(),
+            done: false,
+            _spill_dir: spill_dir,
+        })
+    }
+
+    /// Merges the next part of the runs, returns `None` if all runs are
+    /// exhausted.
+    fn next_merged(&mut self) -> PolarsResult<Option<DataFrame>> {
+        for run in self.runs.iter_mut() {
+            run.fill()?;
+        }
+        self.runs.retain(|run| run.buffered.height() > 0);
+        if self.runs.is_empty() {
+            return Ok(None);
+        }
+
+        // Everything up to the smallest of the last buffered keys can be
+        // merged, as no run can produce anything smaller than that anymore.
+        let mut bound_idx = 0;
+        for (i, run) in self.runs.iter().enumerate() {
+            let keys = run.keys();
+            let bound_keys = self.runs[bound_idx].keys();
+            if keys.get(keys.len() - 1) < bound_keys.get(bound_keys.len() - 1) {
+                bound_idx = i;
+            }
+        }
+        let bound_keys = self.runs[bound_idx].keys();
+        let bound = bound_keys.get(bound_keys.len() - 1).unwrap().to_vec();
+
+        // Runs after the bounding run might still produce keys equal to the
+        // bound, so only take their equal keys once the bounding run has moved
+        // on. This keeps the merge stable with respect to the run order.
+        let parts = self
+            .runs
+            .iter_mut()
+            .enumerate()
+            .map(|(i, run)| {
+                if i <= bound_idx {
+                    run.split_off_while(|k| k <= bound.as_slice())
+                } else {
+                    run.split_off_while(|k| k < bound.as_slice())
+                }
+            })
+            .filter(|df| df.height() > 0)
+            .collect::<Vec<_>>();
+
+        let mut merged = merge_parts(parts)?;
+        merged.drop_in_place(SORT_KEY_COLUMN)?;
+        Ok(Some(merged))
+    }
+}
+
+/// Merges the sorted parts pairwise. Earlier parts win ties.
+fn merge_parts(mut parts: Vec<DataFrame>) -> PolarsResult<DataFrame> {
+    while parts.len() > 1 {
+        parts = POOL.install(|| {
+            parts
+                .par_chunks(2)
+                .map(|pair| match pair {
+                    [left, right] => {
+                        let key_idx = left.width() - 1;
+                        _merge_sorted_dfs(
+                            left,
+                            right,
+                            left[key_idx].as_materialized_series(),
+                            right[key_idx].as_materialized_series(),
+                            false,
+                        )
+                    },
+                    [single] => Ok(single.clone()),
+                    _ => unreachable!(),
+                })
+                .collect::<PolarsResult<Vec<_>>>()
+        })?;
+    }
+    Ok(parts.pop().unwrap())
+}
+
+impl ComputeNode for SortNode {
+    fn name(&self) -> &str {
+        "sort"
+    }
+
+    fn update_state(
+        &mut self,
+        recv: &mut [PortState],
+        send: &mut [PortState],
+        state: &StreamingExecutionState,
+    ) -> PolarsResult<()> {
+        assert!(recv.len() == 1 && send.len() == 1);
+
+        // If the output doesn't want any more data, transition to being done.
+        if send[0] == PortState::Done && !matches!(self.state, SortState::Done) {
+            self.state = SortState::Done;
+        }
+
+        // If the input is done, transition to being a source.
+        if let SortState::Sink(sink) = &mut self.state {
+            if recv[0] == PortState::Done {
+                let sink = std::mem::take(sink);
+                self.state = if sink.runs.is_empty() {
+                    let df = if sink.buffered.is_empty() {
+                        DataFrame::empty_with_schema(&self.params.input_schema)
+                    } else {
+                        accumulate_dataframes_vertical_unchecked(sink.buffered)
+                    };
+                    let df = self.params.in_memory_sort.call_udf(df)?;
+                    SortState::Source(InMemorySourceNode::new(Arc::new(df), MorselSeq::default()))
+                } else {
+                    if polars_core::config::verbose() {
+                        eprintln!("[sort]: merging {} spilled runs", sink.runs.len());
+                    }
+                    SortState::Merge(SortMerge::new(
+                        sink,
+                        &self.params,
+                        &state.in_memory_exec_state,
+                    )?)
+                };
+            }
+        }
+
+        match &mut self.state {
+            SortState::Sink(_) => {
+                if recv[0] != PortState::Done {
+                    recv[0] = PortState::Ready;
+                }
+                send[0] = PortState::Blocked;
+            },
+            SortState::Source(source_node) => {
+                recv[0] = PortState::Done;
+                source_node.update_state(&mut [], send, state)?;
+            },
+            SortState::Merge(merge) => {
+                recv[0] = PortState::Done;
+                send[0] = if merge.done {
+                    PortState::Done
+                } else {
+                    PortState::Ready
+                };
+            },
+            SortState::Done => {
+                recv[0] = PortState::Done;
+                send[0] = PortState::Done;
+            },
+        }
+        Ok(())
+    }
+
+    fn is_memory_intensive_pipeline_blocker(&self) -> bool {
+        matches!(self.state, SortState::Sink(_))
+    }
+
+    fn spawn<'env, 's>(
+        &'env mut self,
+        scope: &'s TaskScope<'s, 'env>,
+        recv_ports: &mut [Option<RecvPort<'_>>],
+        send_ports: &mut [Option<SendPort<'_>>],
+        state: &'s StreamingExecutionState,
+        join_handles: &mut Vec<JoinHandle<PolarsResult<()>>>,
+    ) {
+        assert!(recv_ports.len() == 1 && send_ports.len() == 1);
+
+        let params = &self.params;
+        match &mut self.state {
+            SortState::Sink(sink) => {
+                assert!(send_ports[0].is_none());
+                let mut recv = recv_ports[0].take().unwrap().serial();
+                join_handles.push(scope.spawn_task(TaskPriority::High, async move {
+                    while let Ok(morsel) = recv.recv().await {
+                        let df = morsel.into_df();
+                        sink.buffered_size += df.estimated_size();
+                        sink.buffered.push(df);
+                        if sink.buffered_size > params.memory_limit {
+                            sink.spill(params, &state.in_memory_exec_state)?;
+                        }
+                    }
+                    Ok(())
+                }));
+            },
+            SortState::Source(source) => {
+                source.spawn(scope, &mut [], send_ports, state, join_handles)
+            },
+            SortState::Merge(merge) => {
+                assert!(recv_ports[0].is_none());
+                let mut send = send_ports[0].take().unwrap().serial();
+                join_handles.push(scope.spawn_task(TaskPriority::Low, async move {
+                    let source_token = SourceToken::new();
+                    let wait_group = WaitGroup::default();
+                    loop {
+                        let Some(df) = merge.pending.pop_front() else {
+                            match merge.next_merged()? {
+                                Some(merged) => merge.pending.extend(split_into_morsels(&merged)),
+                                None => {
+                                    merge.done = true;
+                                    break;
+                                },
+                            }
+                            continue;
+                        };
+
+                        let mut morsel = Morsel::new(df, merge.seq, source_token.clone());
+                        merge.seq = merge.seq.successor();
+                        morsel.set_consume_token(wait_group.token());
+                        if send.send(morsel).await.is_err() {
+                            break;
+                        }
+
+                        wait_group.wait().await;
+                        if source_token.stop_requested() {
+                            break;
+                        }
+                    }
+
+                    Ok(())
+                }));
+            },
+            SortState::Done => unreachable!(),
+        }
+    }
+}
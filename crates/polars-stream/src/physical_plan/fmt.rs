@@ -1,5 +1,7 @@
 use std::fmt::Write;
 
+#[cfg(feature = "asof_join")]
+use polars_ops::frame::JoinType;
 use polars_plan::dsl::PartitionVariantIR;
 use polars_plan::plans::expr_ir::ExprIR;
 use polars_plan::plans::{AExpr, EscapeLabel};
@@ -36,6 +38,8 @@ impl NodeStyle {
             | K::SemiAntiJoin { .. }
             | K::InMemoryJoin { .. }
             | K::Multiplexer { .. } => Self::MemoryIntensive,
+            #[cfg(feature = "iejoin")]
+            K::IEJoin { .. } => Self::MemoryIntensive,
             #[cfg(feature = "merge_sorted")]
             K::MergeSorted { .. } => Self::MemoryIntensive,
             _ => Self::Generic,
@@ -475,6 +479,70 @@ fn visualize_plan_rec(
             input_right,
             args: _,
         } => ("cross-join".to_string(), &[*input_left, *input_right][..]),
+        #[cfg(feature = "iejoin")]
+        PhysNodeKind::IEJoin {
+            input_left,
+            input_right,
+            left_on,
+            right_on,
+            args: _,
+            options,
+        } => {
+            let mut label = "iejoin".to_string();
+            write!(
+                label,
+                r"\nleft_on:\n{}",
+                fmt_exprs_to_label(left_on, expr_arena, FormatExprStyle::NoAliases)
+            )
+            .unwrap();
+            write!(
+                label,
+                r"\nright_on:\n{}",
+                fmt_exprs_to_label(right_on, expr_arena, FormatExprStyle::NoAliases)
+            )
+            .unwrap();
+            write!(
+                label,
+                r"\noperators: {}",
+                escape_graphviz(&format!("{:?} {:?}", options.operator1, options.operator2))
+            )
+            .unwrap();
+            (label, &[*input_left, *input_right][..])
+        },
+        #[cfg(feature = "asof_join")]
+        PhysNodeKind::AsOfJoin {
+            input_left,
+            input_right,
+            left_on,
+            right_on,
+            args,
+        } => {
+            let mut label = "asof-join".to_string();
+            write!(
+                label,
+                r"\nleft_on:\n{}",
+                fmt_exprs_to_label(left_on, expr_arena, FormatExprStyle::NoAliases)
+            )
+            .unwrap();
+            write!(
+                label,
+                r"\nright_on:\n{}",
+                fmt_exprs_to_label(right_on, expr_arena, FormatExprStyle::NoAliases)
+            )
+            .unwrap();
+            if let JoinType::AsOf(options) = &args.how {
+                if let Some(by) = &options.left_by {
+                    write!(label, r"\nby: {}", escape_graphviz(&format!("{by:?}"))).unwrap();
+                }
+                write!(
+                    label,
+                    r"\nstrategy: {}",
+                    escape_graphviz(&format!("{:?}", options.strategy))
+                )
+                .unwrap();
+            }
+            (label, &[*input_left, *input_right][..])
+        },
         #[cfg(feature = "merge_sorted")]
         PhysNodeKind::MergeSorted {
             input_left,
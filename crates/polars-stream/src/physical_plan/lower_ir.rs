@@ -5,9 +5,15 @@ use polars_core::config;
 use polars_core::frame::{DataFrame, UniqueKeepStrategy};
 use polars_core::prelude::{DataType, InitHashMaps, PlHashMap, PlHashSet, PlIndexMap};
 use polars_core::schema::Schema;
+#[cfg(feature = "asof_join")]
+use polars_core::series::IsSorted;
 use polars_error::{PolarsResult, polars_bail};
 use polars_expr::state::ExecutionState;
 use polars_mem_engine::create_physical_plan;
+#[cfg(feature = "asof_join")]
+use polars_ops::frame::{AsofStrategy, JoinType};
+#[cfg(feature = "iejoin")]
+use polars_plan::dsl::JoinTypeOptionsIR;
 use polars_plan::dsl::{
     ExtraColumnsPolicy, FileScan, FileSinkType, PartitionSinkTypeIR, PartitionVariantIR, SinkTypeIR,
 };
@@ -31,6 +37,8 @@ use crate::physical_plan::lower_expr::{
 };
 use crate::physical_plan::lower_group_by::build_group_by_stream;
 use crate::utils::late_materialized_df::LateMaterializedDataFrame;
+#[cfg(feature = "iejoin")]
+use crate::utils::spill::streaming_memory_limit;
 
 /// Creates a new PhysStream which outputs a slice of the input stream.
 pub fn build_slice_stream(
@@ -61,6 +69,38 @@ pub fn build_slice_stream(
     }
 }
 
+/// Whether the output of `node` is known to be sorted ascending (with any
+/// nulls first) on the column `key`, across all its rows.
+#[cfg(feature = "asof_join")]
+fn is_known_sorted_on(
+    node: Node,
+    key: &str,
+    ir_arena: &Arena<IR>,
+    expr_arena: &Arena<AExpr>,
+) -> bool {
+    match ir_arena.get(node) {
+        IR::Sort {
+            by_column,
+            sort_options,
+            ..
+        } => {
+            matches!(
+                by_column.first().map(|e| expr_arena.get(e.node())),
+                Some(AExpr::Column(name)) if name.as_str() == key
+            ) && !sort_options.descending.first().copied().unwrap_or(false)
+                && !sort_options.nulls_last.first().copied().unwrap_or(false)
+        },
+        IR::DataFrameScan { df, .. } => df
+            .column(key)
+            .is_ok_and(|c| c.null_count() == 0 && c.is_sorted_flag() == IsSorted::Ascending),
+        IR::Filter { input, .. }
+        | IR::Slice { input, .. }
+        | IR::SimpleProjection { input, .. }
+        | IR::Cache { input, .. } => is_known_sorted_on(*input, key, ir_arena, expr_arena),
+        _ => false,
+    }
+}
+
 /// Creates a new PhysStream which is filters the input stream.
 fn build_filter_stream(
     input: PhysStream,
@@ -827,8 +867,90 @@ pub fn lower_ir(
             let right_on = right_on.clone();
             let args = options.args.clone();
             let options = options.options.clone();
+            #[cfg(feature = "asof_join")]
+            let asof_keys_sorted = {
+                let sorted_on = |node: Node, e: &ExprIR| match expr_arena.get(e.node()) {
+                    AExpr::Column(name) => is_known_sorted_on(node, name, ir_arena, expr_arena),
+                    _ => false,
+                };
+                left_on.len() == 1
+                    && right_on.len() == 1
+                    && sorted_on(input_left, &left_on[0])
+                    && sorted_on(input_right, &right_on[0])
+            };
             let phys_left = lower_ir!(input_left)?;
             let phys_right = lower_ir!(input_right)?;
+
+            #[cfg(feature = "asof_join")]
+            if let JoinType::AsOf(asof_options) = &args.how {
+                // We can only stream plain key columns. Forward and nearest
+                // matches within a `by` group can be arbitrarily far ahead in
+                // the right input, so those are left to the in-memory engine.
+                //
+                // With `by` groups the in-memory engine only requires the keys
+                // to be sorted within each group, whereas the streaming node
+                // needs them sorted across all rows; so we only stream those
+                // joins if both inputs are known to be sorted on their key.
+                let is_column = |e: &ExprIR| matches!(expr_arena.get(e.node()), AExpr::Column(_));
+                if left_on.len() == 1
+                    && right_on.len() == 1
+                    && is_column(&left_on[0])
+                    && is_column(&right_on[0])
+                    && (asof_options.left_by.is_none()
+                        || (asof_options.strategy == AsofStrategy::Backward && asof_keys_sorted))
+                {
+                    let mut asof_args = args.clone();
+                    asof_args.slice = None;
+                    let node = phys_sm.insert(PhysNode::new(
+                        output_schema,
+                        PhysNodeKind::AsOfJoin {
+                            input_left: phys_left,
+                            input_right: phys_right,
+                            left_on,
+                            right_on,
+                            args: asof_args,
+                        },
+                    ));
+                    let mut stream = PhysStream::first(node);
+                    if let Some((offset, len)) = args.slice {
+                        stream = build_slice_stream(stream, offset, len, phys_sm);
+                    }
+                    return Ok(stream);
+                }
+            }
+
+            // The streaming inequality join evaluates the keys one morsel (or
+            // build block) at a time, so those have to be elementwise. It only
+            // pays off when the build side may have to be spilled, otherwise
+            // we leave the join to the in-memory engine.
+            #[cfg(feature = "iejoin")]
+            let stream_iejoin = streaming_memory_limit()?.is_some()
+                && left_on
+                    .iter()
+                    .chain(right_on.iter())
+                    .all(|e| is_elementwise_rec_cached(e.node(), expr_arena, expr_cache));
+            #[cfg(feature = "iejoin")]
+            if let (Some(JoinTypeOptionsIR::IEJoin(ie_options)), true) = (&options, stream_iejoin) {
+                let mut ie_args = args.clone();
+                ie_args.slice = None;
+                let node = phys_sm.insert(PhysNode::new(
+                    output_schema,
+                    PhysNodeKind::IEJoin {
+                        input_left: phys_left,
+                        input_right: phys_right,
+                        left_on,
+                        right_on,
+                        args: ie_args,
+                        options: ie_options.clone(),
+                    },
+                ));
+                let mut stream = PhysStream::first(node);
+                if let Some((offset, len)) = args.slice {
+                    stream = build_slice_stream(stream, offset, len, phys_sm);
+                }
+                return Ok(stream);
+            }
+
             if (args.how.is_equi() || args.how.is_semi_anti()) && !args.validation.needs_checks() {
                 // When lowering the expressions for the keys we need to ensure we keep around the
                 // payload columns, otherwise the input nodes can get replaced by input-independent
@@ -7,6 +7,8 @@ use polars_core::schema::{Schema, SchemaRef};
 use polars_error::PolarsResult;
 use polars_io::RowIndex;
 use polars_io::cloud::CloudOptions;
+#[cfg(feature = "iejoin")]
+use polars_ops::frame::IEJoinOptions;
 use polars_ops::frame::JoinArgs;
 use polars_plan::dsl::{
     CastColumnsPolicy, JoinTypeOptionsIR, MissingColumnsPolicy, PartitionTargetCallback,
@@ -260,6 +262,27 @@ pub enum PhysNodeKind {
         args: JoinArgs,
     },
 
+    /// As-of join on a single key column of inputs that are sorted on that key.
+    #[cfg(feature = "asof_join")]
+    AsOfJoin {
+        input_left: PhysStream,
+        input_right: PhysStream,
+        left_on: Vec<ExprIR>,
+        right_on: Vec<ExprIR>,
+        args: JoinArgs,
+    },
+
+    /// Inequality join on one or two inequality predicates.
+    #[cfg(feature = "iejoin")]
+    IEJoin {
+        input_left: PhysStream,
+        input_right: PhysStream,
+        left_on: Vec<ExprIR>,
+        right_on: Vec<ExprIR>,
+        args: JoinArgs,
+        options: IEJoinOptions,
+    },
+
     /// Generic fallback for (as-of-yet) unsupported streaming joins.
     /// Fully sinks all data to in-memory data frames and uses the in-memory
     /// engine to perform the join.
@@ -349,6 +372,30 @@ fn visit_node_inputs_mut(
                 visit(input_right);
             },
 
+            #[cfg(feature = "asof_join")]
+            PhysNodeKind::AsOfJoin {
+                input_left,
+                input_right,
+                ..
+            } => {
+                rec!(input_left.node);
+                rec!(input_right.node);
+                visit(input_left);
+                visit(input_right);
+            },
+
+            #[cfg(feature = "iejoin")]
+            PhysNodeKind::IEJoin {
+                input_left,
+                input_right,
+                ..
+            } => {
+                rec!(input_left.node);
+                rec!(input_right.node);
+                visit(input_left);
+                visit(input_right);
+            },
+
             #[cfg(feature = "merge_sorted")]
             PhysNodeKind::MergeSorted {
                 input_left,
@@ -3,6 +3,7 @@ use std::sync::Arc;
 use std::sync::atomic::AtomicUsize;
 
 use parking_lot::Mutex;
+use polars_core::frame::DataFrame;
 use polars_core::prelude::PlRandomState;
 use polars_core::schema::Schema;
 use polars_core::{POOL, config};
@@ -12,9 +13,10 @@ use polars_expr::planner::{ExpressionConversionState, create_physical_expr};
 use polars_expr::reduce::into_reduction;
 use polars_expr::state::ExecutionState;
 use polars_mem_engine::{create_physical_plan, create_scan_predicate};
-use polars_plan::dsl::{JoinOptions, PartitionVariantIR, ScanSources};
+use polars_ops::frame::JoinArgs;
+use polars_plan::dsl::{JoinOptions, JoinTypeOptionsIR, PartitionVariantIR, ScanSources};
 use polars_plan::plans::expr_ir::ExprIR;
-use polars_plan::plans::{AExpr, ArenaExprIter, Context, IR};
+use polars_plan::plans::{AExpr, ArenaExprIter, Context, DataFrameUdf, IR, is_elementwise_rec};
 use polars_plan::prelude::{FileType, FunctionFlags};
 use polars_utils::arena::{Arena, Node};
 use polars_utils::format_pl_smallstr;
@@ -33,8 +35,10 @@ use crate::nodes::io_sinks::SinkComputeNode;
 use crate::nodes::io_sources::multi_file_reader::MultiFileReaderConfig;
 use crate::nodes::io_sources::multi_file_reader::reader_interface::builder::FileReaderBuilder;
 use crate::nodes::io_sources::multi_file_reader::reader_interface::capabilities::ReaderCapabilities;
+use crate::nodes::joins::InMemoryJoiner;
 use crate::physical_plan::lower_expr::compute_output_schema;
 use crate::utils::late_materialized_df::LateMaterializedDataFrame;
+use crate::utils::spill::streaming_memory_limit;
 
 fn has_potential_recurring_entrance(node: Node, arena: &Arena<AExpr>) -> bool {
     arena.iter(node).any(|(_n, ae)| match ae {
@@ -91,6 +95,57 @@ pub fn physical_plan_to_graph(
     Ok((ctx.graph, ctx.phys_to_graph))
 }
 
+/// Creates a function that joins two frames with the given schemas using the
+/// in-memory engine. Each function owns its executor, so a single one can't be
+/// used by multiple tasks concurrently.
+#[allow(clippy::too_many_arguments)]
+fn create_in_memory_joiner(
+    left_input_schema: &Arc<Schema>,
+    right_input_schema: &Arc<Schema>,
+    output_schema: &Arc<Schema>,
+    left_on: &[ExprIR],
+    right_on: &[ExprIR],
+    args: &JoinArgs,
+    options: &Option<JoinTypeOptionsIR>,
+    expr_arena: &mut Arena<AExpr>,
+) -> PolarsResult<InMemoryJoiner> {
+    let mut lp_arena = Arena::default();
+    let left_lmdf = Arc::new(LateMaterializedDataFrame::default());
+    let right_lmdf = Arc::new(LateMaterializedDataFrame::default());
+
+    let left_node = lp_arena.add(left_lmdf.clone().as_ir_node(left_input_schema.clone()));
+    let right_node = lp_arena.add(right_lmdf.clone().as_ir_node(right_input_schema.clone()));
+    let join_node = lp_arena.add(IR::Join {
+        input_left: left_node,
+        input_right: right_node,
+        schema: output_schema.clone(),
+        left_on: left_on.to_vec(),
+        right_on: right_on.to_vec(),
+        options: Arc::new(JoinOptions {
+            allow_parallel: true,
+            force_parallel: false,
+            args: args.clone(),
+            options: options.clone(),
+            rows_left: (None, 0),
+            rows_right: (None, 0),
+        }),
+    });
+
+    let executor = Mutex::new(create_physical_plan(
+        join_node,
+        &mut lp_arena,
+        expr_arena,
+        None,
+    )?);
+
+    Ok(Arc::new(move |left, right| {
+        left_lmdf.set_materialized_dataframe(left);
+        right_lmdf.set_materialized_dataframe(right);
+        let mut state = ExecutionState::new();
+        executor.lock().execute(&mut state)
+    }))
+}
+
 #[recursive]
 fn to_graph_rec<'a>(
     phys_node_key: PhysNodeKey,
@@ -424,19 +479,49 @@ fn to_graph_rec<'a>(
                 ctx.expr_arena,
                 None,
             )?);
+            let in_memory_sort: Arc<dyn DataFrameUdf> = Arc::new(move |df: DataFrame| {
+                lmdf.set_materialized_dataframe(df);
+                let mut state = ExecutionState::new();
+                executor.lock().execute(&mut state)
+            });
+
+            // Only sorts that can be done in runs can spill to disk, the
+            // others are done fully in-memory.
+            let memory_limit = streaming_memory_limit()?.filter(|_| {
+                cfg!(feature = "merge_sorted")
+                    && slice.is_none()
+                    && by_column
+                        .iter()
+                        .all(|e| is_elementwise_rec(e.node(), ctx.expr_arena))
+                    && !input_schema
+                        .iter_values()
+                        .any(|dt| dt.contains_objects() || dt.contains_categoricals())
+            });
 
             let input_key = to_graph_rec(input.node, ctx)?;
-            ctx.graph.add_node(
-                nodes::in_memory_map::InMemoryMapNode::new(
-                    input_schema,
-                    Arc::new(move |df| {
-                        lmdf.set_materialized_dataframe(df);
-                        let mut state = ExecutionState::new();
-                        executor.lock().execute(&mut state)
-                    }),
+            match memory_limit {
+                #[cfg(feature = "merge_sorted")]
+                Some(memory_limit) => {
+                    let by = by_column
+                        .iter()
+                        .map(|e| create_stream_expr(e, ctx, &input_schema))
+                        .try_collect_vec()?;
+                    ctx.graph.add_node(
+                        nodes::sort::SortNode::new(
+                            input_schema,
+                            by,
+                            sort_options,
+                            memory_limit,
+                            in_memory_sort,
+                        ),
+                        [(input_key, input.port)],
+                    )
+                },
+                _ => ctx.graph.add_node(
+                    nodes::in_memory_map::InMemoryMapNode::new(input_schema, in_memory_sort),
+                    [(input_key, input.port)],
                 ),
-                [(input_key, input.port)],
-            )
+            }
         },
 
         OrderedUnion { inputs } => {
@@ -579,6 +664,15 @@ fn to_graph_rec<'a>(
                 grouped_reduction_cols.push(col.clone());
             }
 
+            // Cold morsels are spilled through IPC files, which can't
+            // round-trip objects and local categoricals.
+            let memory_limit = streaming_memory_limit()?.filter(|_| {
+                !input_schema
+                    .iter_values()
+                    .chain(key_schema.iter_values())
+                    .any(|dt| dt.contains_objects() || dt.contains_categoricals())
+            });
+
             ctx.graph.add_node(
                 nodes::group_by::GroupByNode::new(
                     key_schema,
@@ -589,6 +683,7 @@ fn to_graph_rec<'a>(
                     node.output_schema.clone(),
                     PlRandomState::default(),
                     ctx.num_pipelines,
+                    memory_limit,
                 ),
                 [(input_key, input.port)],
             )
@@ -607,46 +702,131 @@ fn to_graph_rec<'a>(
             let left_input_schema = ctx.phys_sm[input_left.node].output_schema.clone();
             let right_input_schema = ctx.phys_sm[input_right.node].output_schema.clone();
 
-            let mut lp_arena = Arena::default();
-            let left_lmdf = Arc::new(LateMaterializedDataFrame::default());
-            let right_lmdf = Arc::new(LateMaterializedDataFrame::default());
-
-            let left_node = lp_arena.add(left_lmdf.clone().as_ir_node(left_input_schema.clone()));
-            let right_node =
-                lp_arena.add(right_lmdf.clone().as_ir_node(right_input_schema.clone()));
-            let join_node = lp_arena.add(IR::Join {
-                input_left: left_node,
-                input_right: right_node,
-                schema: node.output_schema.clone(),
-                left_on: left_on.clone(),
-                right_on: right_on.clone(),
-                options: Arc::new(JoinOptions {
-                    allow_parallel: true,
-                    force_parallel: false,
-                    args: args.clone(),
-                    options: options.clone(),
-                    rows_left: (None, 0),
-                    rows_right: (None, 0),
-                }),
-            });
-
-            let executor = Mutex::new(create_physical_plan(
-                join_node,
-                &mut lp_arena,
+            let joiner = create_in_memory_joiner(
+                &left_input_schema,
+                &right_input_schema,
+                &node.output_schema,
+                left_on,
+                right_on,
+                args,
+                options,
                 ctx.expr_arena,
-                None,
-            )?);
+            )?;
 
             ctx.graph.add_node(
                 nodes::joins::in_memory::InMemoryJoinNode::new(
                     left_input_schema,
                     right_input_schema,
-                    Arc::new(move |left, right| {
-                        left_lmdf.set_materialized_dataframe(left);
-                        right_lmdf.set_materialized_dataframe(right);
-                        let mut state = ExecutionState::new();
-                        executor.lock().execute(&mut state)
-                    }),
+                    joiner,
+                ),
+                [
+                    (left_input_key, input_left.port),
+                    (right_input_key, input_right.port),
+                ],
+            )
+        },
+
+        #[cfg(feature = "asof_join")]
+        AsOfJoin {
+            input_left,
+            input_right,
+            left_on,
+            right_on,
+            args,
+        } => {
+            use polars_ops::frame::JoinType;
+
+            let left_input_key = to_graph_rec(input_left.node, ctx)?;
+            let right_input_key = to_graph_rec(input_right.node, ctx)?;
+            let left_input_schema = ctx.phys_sm[input_left.node].output_schema.clone();
+            let right_input_schema = ctx.phys_sm[input_right.node].output_schema.clone();
+
+            let key_name = |e: &ExprIR| match ctx.expr_arena.get(e.node()) {
+                AExpr::Column(name) => name.clone(),
+                _ => unreachable!(),
+            };
+            let left_key = key_name(&left_on[0]);
+            let right_key = key_name(&right_on[0]);
+            let JoinType::AsOf(asof_options) = &args.how else {
+                unreachable!()
+            };
+
+            // Every pipeline gets its own in-memory executor to join its
+            // morsels with, as those are stateful.
+            let joiners = (0..ctx.num_pipelines)
+                .map(|_| {
+                    create_in_memory_joiner(
+                        &left_input_schema,
+                        &right_input_schema,
+                        &node.output_schema,
+                        left_on,
+                        right_on,
+                        args,
+                        &None,
+                        ctx.expr_arena,
+                    )
+                })
+                .try_collect_vec()?;
+
+            ctx.graph.add_node(
+                nodes::joins::asof_join::AsOfJoinNode::new(
+                    right_input_schema,
+                    left_key,
+                    right_key,
+                    asof_options.right_by.clone(),
+                    asof_options.strategy,
+                    asof_options.check_sortedness,
+                    joiners,
+                ),
+                [
+                    (left_input_key, input_left.port),
+                    (right_input_key, input_right.port),
+                ],
+            )
+        },
+
+        #[cfg(feature = "iejoin")]
+        IEJoin {
+            input_left,
+            input_right,
+            left_on,
+            right_on,
+            args,
+            options,
+        } => {
+            let left_input_key = to_graph_rec(input_left.node, ctx)?;
+            let right_input_key = to_graph_rec(input_right.node, ctx)?;
+            let left_input_schema = ctx.phys_sm[input_left.node].output_schema.clone();
+            let right_input_schema = ctx.phys_sm[input_right.node].output_schema.clone();
+
+            let left_key = create_stream_expr(&left_on[0], ctx, &left_input_schema)?;
+            let right_key = create_stream_expr(&right_on[0], ctx, &right_input_schema)?;
+
+            // Every pipeline gets its own in-memory executor to join its
+            // morsels with, as those are stateful.
+            let join_options = Some(JoinTypeOptionsIR::IEJoin(options.clone()));
+            let joiners = (0..ctx.num_pipelines)
+                .map(|_| {
+                    create_in_memory_joiner(
+                        &left_input_schema,
+                        &right_input_schema,
+                        &node.output_schema,
+                        left_on,
+                        right_on,
+                        args,
+                        &join_options,
+                        ctx.expr_arena,
+                    )
+                })
+                .try_collect_vec()?;
+
+            ctx.graph.add_node(
+                nodes::joins::iejoin::IEJoinNode::new(
+                    left_key,
+                    right_key,
+                    options.operator1,
+                    streaming_memory_limit()?,
+                    joiners,
                 ),
                 [
                     (left_input_key, input_left.port),
@@ -734,23 +914,35 @@ fn to_graph_rec<'a>(
                         (right_input_key, input_right.port),
                     ],
                 ),
-                _ => ctx.graph.add_node(
-                    nodes::joins::equi_join::EquiJoinNode::new(
-                        left_input_schema,
-                        right_input_schema,
-                        left_key_schema,
-                        right_key_schema,
-                        unique_key_schema,
-                        left_key_selectors,
-                        right_key_selectors,
-                        args,
-                        ctx.num_pipelines,
-                    )?,
-                    [
-                        (left_input_key, input_left.port),
-                        (right_input_key, input_right.port),
-                    ],
-                ),
+                _ => {
+                    // The build side is spilled through IPC files, which
+                    // can't round-trip objects and local categoricals.
+                    let memory_limit = streaming_memory_limit()?.filter(|_| {
+                        !left_input_schema
+                            .iter_values()
+                            .chain(right_input_schema.iter_values())
+                            .chain(unique_key_schema.iter_values())
+                            .any(|dt| dt.contains_objects() || dt.contains_categoricals())
+                    });
+                    ctx.graph.add_node(
+                        nodes::joins::equi_join::EquiJoinNode::new(
+                            left_input_schema,
+                            right_input_schema,
+                            left_key_schema,
+                            right_key_schema,
+                            unique_key_schema,
+                            left_key_selectors,
+                            right_key_selectors,
+                            args,
+                            ctx.num_pipelines,
+                            memory_limit,
+                        )?,
+                        [
+                            (left_input_key, input_left.port),
+                            (right_input_key, input_right.port),
+                        ],
+                    )
+                },
             }
         },
 
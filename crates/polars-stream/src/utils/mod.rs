@@ -1,3 +1,4 @@
 pub mod in_memory_linearize;
 pub mod late_materialized_df;
+pub mod spill;
 pub mod task_handles_ext;
@@ -0,0 +1,117 @@
+use std::fs::File;
+use std::io::{BufReader, BufWriter};
+use std::path::PathBuf;
+use std::sync::atomic::{AtomicU64, Ordering};
+
+use arrow::io::ipc::read::{FileReader, read_file_metadata};
+use polars_core::frame::DataFrame;
+use polars_core::prelude::CompatLevel;
+use polars_core::schema::Schema;
+use polars_error::{PolarsResult, polars_err};
+use polars_io::SerWriter;
+use polars_io::ipc::IpcWriter;
+use polars_io::path_utils::POLARS_TEMP_DIR_BASE_PATH;
+
+/// The amount of bytes a single pipeline-blocking node may keep in memory
+/// before it starts spilling its state to disk. `None` means no limit.
+pub fn streaming_memory_limit() -> PolarsResult<Option<usize>> {
+    let Ok(value) = std::env::var("POLARS_STREAMING_MEMORY_LIMIT") else {
+        return Ok(None);
+    };
+    let limit: usize = value.trim().parse().map_err(|_| {
+        polars_err!(
+            InvalidOperation: "invalid value for POLARS_STREAMING_MEMORY_LIMIT: {:?} (expected a number of bytes)",
+            value
+        )
+    })?;
+    Ok(Some(limit).filter(|x| *x > 0))
+}
+
+static SPILL_DIR_COUNTER: AtomicU64 = AtomicU64::new(0);
+
+/// A directory owned by a single node that holds its spilled state. The
+/// directory and everything in it is removed when this is dropped.
+pub struct SpillDir {
+    path: PathBuf,
+    num_files: u64,
+}
+
+impl SpillDir {
+    pub fn new(operation_name: &str) -> PolarsResult<Self> {
+        let id = SPILL_DIR_COUNTER.fetch_add(1, Ordering::Relaxed);
+        let path = POLARS_TEMP_DIR_BASE_PATH.join(format!(
+            "spill/{operation_name}-{}-{id}",
+            std::process::id()
+        ));
+        std::fs::create_dir_all(&path).map_err(
+            |err| polars_err!(ComputeError: "failed to create spill directory {:?}: {}", path, err),
+        )?;
+
+        if polars_core::config::verbose() {
+            eprintln!("[{operation_name}]: spilling to {:?}", path);
+        }
+
+        Ok(Self { path, num_files: 0 })
+    }
+
+    /// Writes the given frames as consecutive record batches of a new IPC
+    /// file, which can be read back (in order) with [`SpillFile::reader`].
+    pub fn write(
+        &mut self,
+        schema: &Schema,
+        dfs: impl IntoIterator<Item = DataFrame>,
+    ) -> PolarsResult<SpillFile> {
+        let path = self.path.join(format!("{}.ipc", self.num_files));
+        self.num_files += 1;
+
+        let file = BufWriter::new(File::create(&path)?);
+        let mut writer = IpcWriter::new(file)
+            .with_compat_level(CompatLevel::newest())
+            .with_parallel(false)
+            .batched(schema)?;
+        for mut df in dfs {
+            df.align_chunks();
+            writer.write_batch(&df)?;
+        }
+        writer.finish()?;
+
+        Ok(SpillFile { path })
+    }
+}
+
+impl Drop for SpillDir {
+    fn drop(&mut self) {
+        // This can only fail if the directory was already removed, which is
+        // fine.
+        let _ = std::fs::remove_dir_all(&self.path);
+    }
+}
+
+/// A file containing spilled frames, see [`SpillDir::write`].
+pub struct SpillFile {
+    path: PathBuf,
+}
+
+impl SpillFile {
+    pub fn reader(&self) -> PolarsResult<SpillReader> {
+        let mut file = BufReader::new(File::open(&self.path)?);
+        let metadata = read_file_metadata(&mut file)?;
+        Ok(SpillReader {
+            reader: FileReader::new(file, metadata, None, None),
+        })
+    }
+}
+
+/// Reads back the frames of a [`SpillFile`] one record batch at a time.
+pub struct SpillReader {
+    reader: FileReader<BufReader<File>>,
+}
+
+impl SpillReader {
+    pub fn next_df(&mut self) -> PolarsResult<Option<DataFrame>> {
+        self.reader
+            .next()
+            .map(|batch| PolarsResult::Ok(DataFrame::from(batch?)))
+            .transpose()
+    }
+}
@@ -46,7 +46,7 @@ from polars.convert import (
     from_torch,
     json_normalize,
 )
-from polars.dataframe import DataFrame
+from polars.dataframe import DataFrame, DataFrameBuilder
 from polars.datatypes import (
     Array,
     Binary,
@@ -182,6 +182,7 @@ from polars.io import (
     read_csv,
     read_csv_batched,
     read_database,
+    read_database_async,
     read_database_uri,
     read_delta,
     read_excel,
@@ -195,7 +196,9 @@ from polars.io import (
     read_parquet_metadata,
     read_parquet_schema,
     scan_csv,
+    scan_database,
     scan_delta,
+    scan_excel,
     scan_iceberg,
     scan_ipc,
     scan_ndjson,
@@ -210,7 +213,13 @@ from polars.io.cloud import (
     CredentialProviderFunctionReturn,
     CredentialProviderGCP,
 )
-from polars.lazyframe import GPUEngine, LazyFrame, QueryOptFlags
+from polars.lazyframe import (
+    GPUEngine,
+    LazyFrame,
+    QueryMetrics,
+    QueryOptFlags,
+    ResultCache,
+)
 from polars.meta import (
     build_info,
     get_index_type,
@@ -239,6 +248,7 @@ __all__ = [
     "selectors",
     # core classes
     "DataFrame",
+    "DataFrameBuilder",
     "Expr",
     "LazyFrame",
     "Series",
@@ -291,6 +301,7 @@ __all__ = [
     "read_csv",
     "read_csv_batched",
     "read_database",
+    "read_database_async",
     "read_database_uri",
     "read_delta",
     "read_excel",
@@ -304,7 +315,9 @@ __all__ = [
     "read_parquet_metadata",
     "read_parquet_schema",
     "scan_csv",
+    "scan_database",
     "scan_delta",
+    "scan_excel",
     "scan_iceberg",
     "scan_ipc",
     "scan_ndjson",
@@ -438,7 +451,9 @@ __all__ = [
     "sql_expr",
     "CompatLevel",
     # optimization
+    "QueryMetrics",
     "QueryOptFlags",
+    "ResultCache",
 ]
 
 
@@ -21,6 +21,12 @@ if TYPE_CHECKING:
     from decimal import Decimal
 
     from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.ext.asyncio import (
+        AsyncConnection,
+        AsyncEngine,
+        AsyncSession,
+        async_sessionmaker,
+    )
     from sqlalchemy.orm import Session
 
     from polars import DataFrame, Expr, LazyFrame, Series
@@ -281,6 +287,9 @@ class Cursor(BasicCursor):
 
 
 AlchemyConnection: TypeAlias = Union["Connection", "Engine", "Session"]
+AsyncAlchemyConnection: TypeAlias = Union[
+    "AsyncConnection", "AsyncEngine", "AsyncSession", "async_sessionmaker[Any]"
+]
 ConnectionOrCursor: TypeAlias = Union[
     BasicConnection, BasicCursor, Cursor, AlchemyConnection
 ]
@@ -4,7 +4,7 @@ import contextlib
 from collections.abc import Generator, Mapping, Sequence
 from datetime import date, datetime, time, timedelta
 from functools import singledispatch
-from itertools import islice, zip_longest
+from itertools import zip_longest
 from operator import itemgetter
 from typing import (
     TYPE_CHECKING,
@@ -34,6 +34,7 @@ from polars.datatypes import (
     N_INFER_DEFAULT,
     Categorical,
     Enum,
+    Object,
     String,
     Struct,
     Unknown,
@@ -60,7 +61,7 @@ with contextlib.suppress(ImportError):  # Module not available when building doc
 if TYPE_CHECKING:
     from collections.abc import Iterable, MutableMapping
 
-    from polars import DataFrame, Series
+    from polars import DataFrame, Schema, Series
     from polars._typing import (
         Orientation,
         PolarsDataType,
@@ -995,53 +996,72 @@ def iterable_to_pydf(
             },
         )._df
 
-    def to_frame_chunk(values: list[Any], schema: SchemaDefinition | None) -> DataFrame:
-        return pl.DataFrame(
-            data=values,
-            schema=schema,
-            strict=strict,
-            orient="row",
-            infer_schema_length=infer_schema_length,
-        )
+    from polars.dataframe.builder import DataFrameBuilder
 
-    n_chunks = 0
-    n_chunk_elems = 1_000_000
+    builder = DataFrameBuilder(
+        original_schema,
+        schema_overrides=schema_overrides,
+        strict=strict,
+        infer_schema_length=infer_schema_length,
+        chunk_size=chunk_size,
+    )
+    builder.append_rows(data)
+    return builder.finish(rechunk=rechunk)._df
 
-    if chunk_size:
-        adaptive_chunk_size = chunk_size
-    elif column_names:
-        adaptive_chunk_size = n_chunk_elems // len(column_names)
-    else:
-        adaptive_chunk_size = None
 
-    df: DataFrame = None  # type: ignore[assignment]
-    chunk_size = max(
-        (infer_schema_length or 0),
-        (adaptive_chunk_size or 1000),
-    )
-    while True:
-        values = list(islice(data, chunk_size))
-        if not values:
-            break
-        frame_chunk = to_frame_chunk(values, original_schema)
-        if df is None:
-            df = frame_chunk
-            if not original_schema:
-                original_schema = list(df.schema.items())
-            if chunk_size != adaptive_chunk_size:
-                if (n_columns := df.width) > 0:
-                    chunk_size = adaptive_chunk_size = n_chunk_elems // n_columns
-        else:
-            df.vstack(frame_chunk, in_place=True)
-            n_chunks += 1
+def _rows_schema(column_names: list[str], dtypes: SchemaDict) -> Schema | None:
+    """Return the schema that rows can be loaded with, if all dtypes are known."""
+    if not column_names or any(
+        dtypes.get(col) in (None, Unknown, Object) for col in column_names
+    ):
+        return None
+    try:
+        return pl.Schema((col, dtypes[col]) for col in column_names)
+    except TypeError:
+        # dtype not fully specified (eg: `List` without an inner type)
+        return None
 
-    if df is None:
-        df = to_frame_chunk([], original_schema)
 
-    if n_chunks > 0 and rechunk:
-        df = df.rechunk()
+def _rows_to_pydf(
+    values: list[Any],
+    schema: Schema,
+    *,
+    strict: bool,
+    infer_schema_length: int | None,
+) -> PyDataFrame | None:
+    """
+    Load a chunk of rows (with known schema) straight into typed column builders.
 
-    return df._df
+    This skips the row-type dispatch, schema unpacking and inference done by the
+    DataFrame constructor; returns None if the rows are not plain tuples, lists
+    or dicts (in which case the regular constructor should be used).
+    """
+    first_element = values[0]
+    if type(first_element) in (tuple, list) and len(first_element) == len(schema):
+        pydf = PyDataFrame.from_rows(
+            values,
+            schema=pl.Schema(
+                (col, String if tp in (Categorical, Enum) else tp)
+                for col, tp in schema.items()
+            ),
+            infer_schema_length=infer_schema_length,
+        )
+    elif type(first_element) is dict:
+        pydf = PyDataFrame.from_dicts(
+            values,
+            schema,
+            schema,
+            strict=strict,
+            infer_schema_length=infer_schema_length,
+        )
+    else:
+        return None
+
+    if pydf.dtypes() != list(schema.dtypes()):
+        pydf = _post_apply_columns(
+            pydf, schema.names(), schema_overrides=dict(schema), strict=strict
+        )
+    return pydf
 
 
 def _check_pandas_columns(data: pd.DataFrame, *, include_index: bool) -> None:
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
+
+from polars.exceptions import ColumnNotFoundError
+
+if TYPE_CHECKING:
+    from polars import DataFrame
+
+__all__ = ["materialize_rows", "row_converter"]
+
+
+@lru_cache(maxsize=128)
+def _dict_factory(columns: tuple[str, ...]) -> Callable[..., dict[str, Any]]:
+    """
+    Return a function that builds a row dictionary from (positional) column values.
+
+    The function body is a single dict literal, so each row dictionary is built
+    in one step, without the intermediate `zip` object (and tuple per item)
+    that `dict(zip(columns, row))` requires.
+    """
+    args = ", ".join(f"_{idx}" for idx in range(len(columns)))
+    items = ", ".join(f"{name!r}: _{idx}" for idx, name in enumerate(columns))
+    return eval(f"lambda {args}: {{{items}}}")
+
+
+def _type_fields(row_type: type) -> tuple[str, ...] | None:
+    """
+    Return the (positional) field names of a namedtuple or dataclass type.
+
+    Raises a `TypeError` if `row_type` is not a tuple, dataclass, or mapping type,
+    as there is no well-defined way to build such a type from the row values.
+    """
+    if not (
+        issubclass(row_type, (tuple, Mapping)) or dataclasses.is_dataclass(row_type)
+    ):
+        msg = (
+            "`row_type` must be a tuple (or namedtuple), dataclass, or mapping type;"
+            f" found {row_type!r}"
+        )
+        raise TypeError(msg)
+    elif issubclass(row_type, tuple):
+        return getattr(row_type, "_fields", None)
+    elif dataclasses.is_dataclass(row_type):
+        return tuple(f.name for f in dataclasses.fields(row_type) if f.init)
+    return None
+
+
+def materialize_rows(
+    df: DataFrame, *, named: bool = False, row_type: type | None = None
+) -> list[Any]:
+    """
+    Materialize all frame rows as tuples, dicts, or instances of `row_type`.
+
+    Rows are assembled from whole-column conversions to Python values, which is
+    considerably faster than converting the frame row by row, and each row
+    object is then built in a single call.
+
+    Namedtuple and dataclass fields are matched to frame columns by name (extra
+    frame columns are ignored), other tuple types are instantiated with the row
+    tuple, and mapping types with the row values as keyword arguments.
+    """
+    if row_type is not None:
+        if (fields := _type_fields(row_type)) is not None:
+            values = [df.get_column(name).to_list() for name in fields]
+            return list(map(row_type, *values)) if values else []
+        elif issubclass(row_type, tuple):
+            return list(map(row_type, materialize_rows(df)))
+        return [row_type(**row) for row in materialize_rows(df, named=True)]
+
+    values = [s.to_list() for s in df.iter_columns()]
+    if named:
+        return list(map(_dict_factory(tuple(df.columns)), *values)) if values else []
+    return list(zip(*values))
+
+
+def row_converter(
+    columns: list[str], *, named: bool = False, row_type: type | None = None
+) -> Callable[[tuple[Any, ...]], Any]:
+    """Return a function that converts a row tuple to a dict or `row_type` instance."""
+    if row_type is not None:
+        if (fields := _type_fields(row_type)) is not None:
+            if missing := [name for name in fields if name not in columns]:
+                msg = f"{row_type.__name__!r} field(s) not found in frame: {missing}"
+                raise ColumnNotFoundError(msg)
+            idxs = [columns.index(name) for name in fields]
+            return lambda row: row_type(*(row[idx] for idx in idxs))
+        elif issubclass(row_type, tuple):
+            return row_type
+        return lambda row: row_type(**dict(zip(columns, row)))
+    elif named:
+        factory = _dict_factory(tuple(columns))
+        return lambda row: factory(*row)
+    return lambda row: row
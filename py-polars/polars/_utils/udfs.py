@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import dis
 import inspect
@@ -31,6 +32,8 @@ if TYPE_CHECKING:
     from collections.abc import Set as AbstractSet
     from dis import Instruction
 
+    from polars import Expr
+
     if sys.version_info >= (3, 10):
         from typing import TypeAlias
     else:
@@ -181,12 +184,15 @@ _PYTHON_CASTS_MAP = {"float": "Float64", "int": "Int64", "str": "String"}
 _PYTHON_BUILTINS = frozenset(_PYTHON_CASTS_MAP) | {"abs"}
 _PYTHON_METHODS_MAP = {
     # string
+    "count": "str.count_matches",
     "endswith": "str.ends_with",
+    "ljust": "str.pad_end",
     "lower": "str.to_lowercase",
     "lstrip": "str.strip_chars_start",
     "removeprefix": "str.strip_prefix",
     "removesuffix": "str.strip_suffix",
     "replace": "str.replace",
+    "rjust": "str.pad_start",
     "rstrip": "str.strip_chars_end",
     "startswith": "str.starts_with",
     "strip": "str.strip_chars",
@@ -196,8 +202,22 @@ _PYTHON_METHODS_MAP = {
     # temporal
     "date": "dt.date",
     "isoweekday": "dt.weekday",
+    "strftime": "dt.strftime",
     "time": "dt.time",
+    "weekday": "dt.weekday().sub(1)",
 }
+# conditional jumps that can open a ternary expression (`a if cond else b`)
+_CONDITIONAL_JUMPS = frozenset(
+    (
+        "POP_JUMP_FORWARD_IF_FALSE",
+        "POP_JUMP_FORWARD_IF_TRUE",
+        "POP_JUMP_IF_FALSE",
+        "POP_JUMP_IF_TRUE",
+    )
+)
+# ops that leave a boolean on the stack, and can be used as a ternary condition
+_BOOLEAN_OPS = frozenset(("COMPARE_OP", "CONTAINS_OP", "IS_OP"))
+_BOOLEAN_EXPRESSIONS = ("str.contains", "str.ends_with", "str.starts_with")
 
 _MODULE_FUNCTIONS: list[dict[str, list[AbstractSet[str]]]] = [
     # lambda x: numpy.func(x)
@@ -274,6 +294,8 @@ _MODULE_FUNC_TO_EXPR_NAME = {
 }
 _RE_IMPLICIT_BOOL = re.compile(r'pl\.col\("([^"]*)"\) & pl\.col\("\1"\)\.(.+)')
 _RE_STRIP_BOOL = re.compile(r"^bool\((.+)\)$")
+# translations that may return a non-null value for a null input
+_RE_NULL_AWARE = re.compile(r"pl\.when\(| [&|] |\.is_(not_)?null\(\)|default=")
 
 
 def _get_all_caller_variables() -> dict[str, Any]:
@@ -361,6 +383,9 @@ class BytecodeParser:
             caller_variables=self._caller_variables,
             function=function,
         )
+        self._conditional_blocks = self._split_conditional(
+            self._rewritten_instructions._original_instructions
+        )
 
     def _omit_implicit_bool(self, expr: str) -> str:
         """Drop extraneous/implied bool (eg: `pl.col("d") & pl.col("d").dt.date()`)."""
@@ -408,6 +433,109 @@ class BytecodeParser:
 
         return sorted(expression_blocks.items())
 
+    def _split_conditional(
+        self, instructions: list[Instruction]
+    ) -> tuple[RewrittenInstructions, ...] | None:
+        """
+        Split a conditional expression (`a if cond else b`) into its blocks.
+
+        Returns the rewritten condition, "true" and "false" instruction blocks,
+        or None if the function is not a single (simple) conditional expression.
+        """
+        jumps = [
+            idx
+            for idx, inst in enumerate(instructions)
+            if inst.opname in _CONDITIONAL_JUMPS
+        ]
+        if len(jumps) != 1:
+            return None
+
+        jump = instructions[jumps[0]]
+        offsets = [inst.offset for inst in instructions]
+        if jump.argval not in offsets:
+            return None
+        target = offsets.index(jump.argval)
+
+        def branch(block: list[Instruction]) -> list[Instruction]:
+            # strip the instruction(s) that return the branch value
+            if block:
+                *body, last = block
+                if last.opname == "RETURN_CONST":
+                    return [*body, last._replace(opname="LOAD_CONST")]
+                elif last.opname == "RETURN_VALUE" or (
+                    last.opname == "JUMP_FORWARD"
+                    and last.argval == instructions[-1].offset
+                    and instructions[-1].opname == "RETURN_VALUE"
+                ):
+                    return body
+            return []
+
+        blocks = [
+            RewrittenInstructions(
+                instructions=iter(block),
+                caller_variables=self._caller_variables,
+                function=self._function,
+            )
+            for block in (
+                instructions[: jumps[0]],
+                branch(instructions[jumps[0] + 1 : target]),
+                branch(instructions[target:]),
+            )
+        ]
+        if not all(
+            len(block)
+            and all(
+                inst.opname in OpNames.PARSEABLE_OPS
+                and inst.opname not in OpNames.CONTROL_FLOW
+                for inst in block
+            )
+            for block in blocks
+        ):
+            return None
+
+        # the condition must certainly evaluate to a boolean (we don't
+        # translate the truthiness of arbitrary values)
+        condition, when_true, when_false = blocks
+        last = condition[-1]
+        if not (
+            last.opname in _BOOLEAN_OPS
+            or (
+                last.opname == "POLARS_EXPRESSION"
+                and last.argval.startswith(_BOOLEAN_EXPRESSIONS)
+            )
+        ):
+            return None
+        elif jump.opname.endswith("_IF_TRUE"):
+            when_true, when_false = when_false, when_true
+        return condition, when_true, when_false
+
+    def _conditional_to_expression(self, col: str) -> str | None:
+        """Translate a conditional expression to a `when/then/otherwise` chain."""
+        try:
+            condition, when_true, when_false = (
+                InstructionTranslator(
+                    instructions=list(block),
+                    caller_variables=self._caller_variables,
+                    map_target=self._map_target,
+                    function=self._function,
+                ).to_expression(
+                    col=col,
+                    param_name=self._param_name,  # type: ignore[arg-type]
+                    depth=0,
+                )
+                for block in self._conditional_blocks  # type: ignore[union-attr]
+            )
+        except NotImplementedError:
+            return None
+
+        if "pl.col(" not in condition:
+            return None
+        when_true, when_false = (
+            value if "pl.col(" in value else f"pl.lit({value})"
+            for value in (when_true, when_false)
+        )
+        return f"pl.when({condition}).then({when_true}).otherwise({when_false})"
+
     @property
     def map_target(self) -> MapTarget:
         """The map target, eg: one of 'expr', 'frame', or 'series'."""
@@ -421,21 +549,24 @@ class BytecodeParser:
         guaranteed that using the equivalent bare constant value will return the
         same output. (Hopefully nobody is writing lambdas like that anyway...)
         """
-        return (
-            self._param_name is not None
-            # check minimum number of ops, ensuring all are parseable
-            and len(self._rewritten_instructions) >= 2
-            and all(
-                inst.opname in OpNames.PARSEABLE_OPS
-                for inst in self._rewritten_instructions
-            )
-            # exclude constructs/functions with multiple RETURN_VALUE ops
-            and sum(
-                1
-                for inst in self.original_instructions
-                if inst.opname == "RETURN_VALUE"
+        return self._param_name is not None and (
+            # conditional expressions, eg: "lambda x: 'a' if x > 0 else 'b'"
+            self._conditional_blocks is not None
+            or (
+                # check minimum number of ops, ensuring all are parseable
+                len(self._rewritten_instructions) >= 2
+                and all(
+                    inst.opname in OpNames.PARSEABLE_OPS
+                    for inst in self._rewritten_instructions
+                )
+                # exclude constructs/functions with multiple RETURN_VALUE ops
+                and sum(
+                    1
+                    for inst in self.original_instructions
+                    if inst.opname == "RETURN_VALUE"
+                )
+                == 1
             )
-            == 1
         )
 
     def dis(self) -> None:
@@ -467,6 +598,11 @@ class BytecodeParser:
         self._map_target_name = None
         if self._param_name is None:
             return None
+        elif self._conditional_blocks is not None:
+            # note: there is no Series equivalent of `when/then/otherwise`
+            if self._map_target == "series":
+                return None
+            return self._conditional_to_expression(col)
 
         # decompose bytecode into logical 'and'/'or' expression blocks (if present)
         control_flow_blocks = defaultdict(list)
@@ -836,6 +972,7 @@ class RewrittenInstructions:
                 for map_rewrite in (
                     # add any other rewrite methods here
                     self._rewrite_functions,
+                    self._rewrite_dict_lookups,
                     self._rewrite_methods,
                     self._rewrite_builtins,
                     self._rewrite_attrs,
@@ -888,6 +1025,61 @@ class RewrittenInstructions:
 
         return len(matching_instructions)
 
+    def _rewrite_dict_lookups(
+        self, idx: int, updated_instructions: list[Instruction]
+    ) -> int:
+        """Replace `dict.get` lookups with a synthetic POLARS_EXPRESSION op."""
+        LOAD_METHOD = OpNames.LOAD_ATTR if _MIN_PY312 else {"LOAD_METHOD"}
+        if matching_instructions := (
+            # lookup with a default value, eg: "d.get(x, 0)"
+            self._matches(
+                idx,
+                opnames=[
+                    {"LOAD_GLOBAL", "LOAD_DEREF"},
+                    LOAD_METHOD,
+                    {"LOAD_FAST"},
+                    {"LOAD_CONST"},
+                    OpNames.CALL,
+                ],
+                argvals=[None, {"get"}],
+            )
+            or
+            # lookup without a default value, eg: "d.get(x)"
+            self._matches(
+                idx,
+                opnames=[
+                    {"LOAD_GLOBAL", "LOAD_DEREF"},
+                    LOAD_METHOD,
+                    {"LOAD_FAST"},
+                    OpNames.CALL,
+                ],
+                argvals=[None, {"get"}],
+            )
+        ):
+            inst1, _, inst3 = matching_instructions[:3]
+            if not self._caller_variables:
+                self._caller_variables = _get_all_caller_variables()
+            if not isinstance(self._caller_variables.get(inst1.argval), dict):
+                return 0
+
+            default = (
+                matching_instructions[3].argval
+                if len(matching_instructions) == 5
+                else None
+            )
+            expr = f"replace_strict({inst1.argval}, default={default!r})"
+            px = inst1._replace(
+                opname="POLARS_EXPRESSION",
+                argval=expr,
+                argrepr=expr,
+                offset=inst3.offset,
+            )
+            # POLARS_EXPRESSION is mapped as a unary op, so switch instruction order
+            operand = inst3._replace(offset=inst1.offset)
+            updated_instructions.extend((operand, px))
+
+        return len(matching_instructions)
+
     def _rewrite_functions(
         self, idx: int, updated_instructions: list[Instruction]
     ) -> int:
@@ -1022,6 +1214,8 @@ class RewrittenInstructions:
                     rx = "|".join(re_escape(v) for v in param_value)
                     q = '"' if "'" in param_value else "'"
                     expr = f"str.contains(r{q}{starts}({rx}){ends}{q})"
+                elif expr == "str.count_matches":
+                    expr += f"({param_value!r},literal=True)"
                 else:
                     expr += f"({param_value!r})"
 
@@ -1186,4 +1380,81 @@ def warn_on_inefficient_map(
             )
 
 
-__all__ = ["BytecodeParser", "warn_on_inefficient_map"]
+def rewrite_inefficient_map(
+    function: Callable[[Any], Any], columns: list[str], input_expr: Expr
+) -> Expr | None:
+    """
+    Return the native polars expression equivalent of a `map` function, if any.
+
+    Parameters
+    ----------
+    function
+        The function passed to `map`.
+    columns
+        The column names of the original object; in the case of an `Expr` this
+        will be a list of length 1 containing the expression's root name.
+    input_expr
+        The expression that the function would be mapped over; the translated
+        expression is applied to this instead of the (root) column.
+
+    Notes
+    -----
+    The returned expression does not account for the `map` call's return dtype,
+    or the name of its output.
+    """
+    # note: we only consider simple functions with a single col/param
+    if len(columns) != 1:
+        return None
+    col = columns[0]
+
+    parser = BytecodeParser(function, map_target="expr")
+    if parser.can_attempt_rewrite():
+        expression = parser.to_expression(col)
+    else:
+        module, suggestion = _raw_function_meta(function)
+        expression = f'pl.col("{col}").{suggestion}' if module and suggestion else None
+    if expression is None:
+        return None
+
+    import math
+
+    import polars as pl
+    from polars.dependencies import _NUMPY_AVAILABLE
+    from polars.dependencies import numpy as np
+
+    # evaluate the translated expression in the scope of the function (it may
+    # reference variables such as dict mappings), binding the column to the input
+    # expression; names are resolved from the caller's scope when translating the
+    # function, so we only rewrite it if those are the very objects it uses
+    input_name = "__polars_map_input"
+    namespace: dict[str, Any] = {}
+    with contextlib.suppress(TypeError):
+        closure_vars = inspect.getclosurevars(function)
+        namespace.update(closure_vars.globals)
+        namespace.update(closure_vars.nonlocals)
+    modules = {"pl": pl, "math": math, **({"np": np} if _NUMPY_AVAILABLE else {})}
+    caller_variables = _get_all_caller_variables()
+    if any(
+        name in caller_variables and caller_variables[name] is not obj
+        for name, obj in namespace.items()
+    ) or any(namespace.get(name, obj) is not obj for name, obj in modules.items()):
+        return None
+    namespace.update(modules)
+    namespace[input_name] = input_expr
+    try:
+        native_expr = eval(
+            expression.replace(f'pl.col("{col}")', input_name), namespace
+        )
+    except Exception:
+        return None
+    if not isinstance(native_expr, pl.Expr):
+        return None
+
+    # null values are never passed to the function, so they must also map to null
+    # in the native expression (which is not the case for all translations)
+    if _RE_NULL_AWARE.search(expression):
+        native_expr = pl.when(input_expr.is_not_null()).then(native_expr)
+    return native_expr
+
+
+__all__ = ["BytecodeParser", "rewrite_inefficient_map", "warn_on_inefficient_map"]
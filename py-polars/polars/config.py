@@ -3,11 +3,12 @@ from __future__ import annotations
 import contextlib
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, TypedDict, get_args
+from typing import TYPE_CHECKING, Any, Callable, Literal, TypedDict, get_args
 
 from polars._typing import EngineType
 from polars._utils.various import normalize_filepath
 from polars.dependencies import json
+from polars.lazyframe import query_metrics
 from polars.lazyframe.engine_config import GPUEngine
 
 if TYPE_CHECKING:
@@ -15,6 +16,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from polars._typing import FloatFmt
+    from polars.lazyframe.query_metrics import QueryMetrics
 
     if sys.version_info >= (3, 10):
         from typing import TypeAlias
@@ -68,7 +70,9 @@ _POLARS_CFG_ENV_VARS = {
     "POLARS_FMT_TABLE_HIDE_DATAFRAME_SHAPE_INFORMATION",
     "POLARS_FMT_TABLE_INLINE_COLUMN_DATA_TYPE",
     "POLARS_FMT_TABLE_ROUNDED_CORNERS",
+    "POLARS_REWRITE_MAP_ELEMENTS",
     "POLARS_STREAMING_CHUNK_SIZE",
+    "POLARS_STREAMING_MEMORY_LIMIT",
     "POLARS_TABLE_WIDTH",
     "POLARS_VERBOSE",
     "POLARS_MAX_EXPR_DEPTH",
@@ -101,7 +105,10 @@ class ConfigParameters(TypedDict, total=False):
     fmt_float: FloatFmt | None
     fmt_str_lengths: int | None
     fmt_table_cell_list_len: int | None
+    query_callback: Callable[[QueryMetrics], Any] | None
+    rewrite_map_elements: bool | None
     streaming_chunk_size: int | None
+    streaming_memory_limit: int | None
     tbl_cell_alignment: Literal["LEFT", "CENTER", "RIGHT"] | None
     tbl_cell_numeric_alignment: Literal["LEFT", "CENTER", "RIGHT"] | None
     tbl_cols: int | None
@@ -126,7 +133,10 @@ class ConfigParameters(TypedDict, total=False):
     set_fmt_float: FloatFmt | None
     set_fmt_str_lengths: int | None
     set_fmt_table_cell_list_len: int | None
+    set_query_callback: Callable[[QueryMetrics], Any] | None
+    set_rewrite_map_elements: bool | None
     set_streaming_chunk_size: int | None
+    set_streaming_memory_limit: int | None
     set_tbl_cell_alignment: Literal["LEFT", "CENTER", "RIGHT"] | None
     set_tbl_cell_numeric_alignment: Literal["LEFT", "CENTER", "RIGHT"] | None
     set_tbl_cols: int | None
@@ -176,6 +186,7 @@ class Config(contextlib.ContextDecorator):
 
     _context_options: ConfigParameters | None = None
     _original_state: str = ""
+    _original_query_callback: Callable[[QueryMetrics], Any] | None = None
 
     def __init__(
         self,
@@ -252,6 +263,7 @@ class Config(contextlib.ContextDecorator):
         """
         # save original state _before_ any changes are made
         self._original_state = self.save()
+        self._original_query_callback = query_metrics.get_query_callback()
         if restore_defaults:
             self.restore_defaults()
 
@@ -265,7 +277,9 @@ class Config(contextlib.ContextDecorator):
 
     def __enter__(self) -> Self:
         """Support setting Config options that are reset on scope exit."""
-        self._original_state = self._original_state or self.save()
+        if not self._original_state:
+            self._original_state = self.save()
+            self._original_query_callback = query_metrics.get_query_callback()
         if self._context_options:
             self._set_config_params(**self._context_options)
         return self
@@ -278,7 +292,9 @@ class Config(contextlib.ContextDecorator):
     ) -> None:
         """Reset any Config options that were set within the scope."""
         self.restore_defaults().load(self._original_state)
+        query_metrics.set_query_callback(self._original_query_callback)
         self._original_state = ""
+        self._original_query_callback = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Config):
@@ -378,6 +394,8 @@ class Config(contextlib.ContextDecorator):
         for method in _POLARS_CFG_DIRECT_VARS:
             getattr(cls, method)(None)
 
+        query_metrics.set_query_callback(None)
+
         return cls
 
     @classmethod
@@ -863,6 +881,85 @@ class Config(contextlib.ContextDecorator):
             os.environ["POLARS_FMT_TABLE_CELL_LIST_LEN"] = str(n)
         return cls
 
+    @classmethod
+    def set_query_callback(
+        cls, callback: Callable[[QueryMetrics], Any] | None
+    ) -> type[Config]:
+        """
+        Register a function that receives the metrics of every completed query.
+
+        The callback is called with a :class:`QueryMetrics` object after each
+        successful `LazyFrame.collect`, `LazyFrame.collect_async` and (non-lazy)
+        sink; it is not called for the internal queries that implement most eager
+        DataFrame methods. The optimized plan is only described (and hashed) when
+        the `plan` (or `plan_hash`) of the metrics is accessed, and there is no
+        overhead at all if no callback is registered.
+
+        .. warning::
+            This functionality is considered **unstable**. It may be changed
+            at any point without it being considered a breaking change.
+
+        .. versionadded:: 1.30.0
+
+        Parameters
+        ----------
+        callback : Callable[[QueryMetrics], Any] | None
+            The function to call; set to `None` to remove the current callback.
+
+        Notes
+        -----
+        The callback is not an environment variable, so it is not included in the
+        output of `Config.save` or `Config.state`. With `collect_async` the callback
+        is invoked from the thread that ran the query. If the callback raises an
+        exception, a warning is issued instead (as the query itself succeeded).
+
+        Examples
+        --------
+        >>> def log_slow_query(metrics: pl.QueryMetrics) -> None:
+        ...     if metrics.wall_time > 1.0:
+        ...         print(f"slow query {metrics.plan_hash}: {metrics.wall_time:.2f}s")
+        >>> pl.Config.set_query_callback(log_slow_query)  # doctest: +SKIP
+        >>> with pl.Config(query_callback=log_slow_query):  # doctest: +SKIP
+        ...     do_polars_operations()
+        """
+        query_metrics.set_query_callback(callback)
+        return cls
+
+    @classmethod
+    def set_rewrite_map_elements(cls, active: bool | None = True) -> type[Config]:
+        """
+        Execute translatable `map_elements` functions as native expressions.
+
+        Functions passed to `Expr.map_elements` and `Series.map_elements` whose
+        bytecode can be translated to an equivalent native expression (these are
+        the functions that raise a `PolarsInefficientMapWarning`) are replaced by
+        that expression, instead of being called for every element. This can be
+        overridden for individual calls with their `rewrite` parameter.
+
+        .. versionadded:: 1.30.0
+
+        Examples
+        --------
+        >>> df = pl.DataFrame({"a": [1, 2, 3]})
+        >>> with pl.Config(rewrite_map_elements=True):
+        ...     df.select(pl.col("a").map_elements(lambda x: x * 2 + 1))
+        shape: (3, 1)
+        ┌─────┐
+        │ a   │
+        │ --- │
+        │ i64 │
+        ╞═════╡
+        │ 3   │
+        │ 5   │
+        │ 7   │
+        └─────┘
+        """
+        if active is None:
+            os.environ.pop("POLARS_REWRITE_MAP_ELEMENTS", None)
+        else:
+            os.environ["POLARS_REWRITE_MAP_ELEMENTS"] = str(int(active))
+        return cls
+
     @classmethod
     def set_streaming_chunk_size(cls, size: int | None) -> type[Config]:
         """
@@ -889,6 +986,42 @@ class Config(contextlib.ContextDecorator):
             os.environ["POLARS_STREAMING_CHUNK_SIZE"] = str(size)
         return cls
 
+    @classmethod
+    def set_streaming_memory_limit(cls, limit: int | None) -> type[Config]:
+        """
+        Set the memory budget of the pipeline-blocking nodes in the streaming engine.
+
+        Once the state of a sort, group-by or join exceeds this budget it is
+        partitioned and spilled to local IPC files (in the polars temporary
+        directory), which are processed one partition at a time when the input
+        is exhausted. This trades speed for the ability to process data that
+        does not fit in memory.
+
+        Parameters
+        ----------
+        limit
+            Number of bytes of state each of these nodes may keep in memory.
+            Set to `None` to disable spilling (the default).
+
+        Notes
+        -----
+        Spilling only applies to the new streaming engine, and is skipped for
+        inputs containing object or (non-global) categorical columns.
+
+        Examples
+        --------
+        >>> pl.Config.set_streaming_memory_limit(2 * 1024**3)  # doctest: +SKIP
+        """
+        if limit is None:
+            os.environ.pop("POLARS_STREAMING_MEMORY_LIMIT", None)
+        else:
+            if limit < 1:
+                msg = "streaming memory limit must be >= 1 byte"
+                raise ValueError(msg)
+
+            os.environ["POLARS_STREAMING_MEMORY_LIMIT"] = str(limit)
+        return cls
+
     @classmethod
     def set_tbl_cell_alignment(
         cls, format: Literal["LEFT", "CENTER", "RIGHT"] | None
@@ -1032,7 +1032,4 @@ def from_dataframe(
             )
     from polars.interchange.from_dataframe import from_dataframe
 
-    result = from_dataframe(df, allow_copy=allow_copy)  # type: ignore[arg-type]
-    if rechunk:
-        return result.rechunk()
-    return result
+    return from_dataframe(df, allow_copy=allow_copy, rechunk=rechunk)  # type: ignore[arg-type]
@@ -1,5 +1,8 @@
-from polars.dataframe.frame import DataFrame
+# note: the frame module must be imported first (import cycle)
+from polars.dataframe.frame import DataFrame  # noqa: I001
+from polars.dataframe.builder import DataFrameBuilder
 
 __all__ = [
     "DataFrame",
+    "DataFrameBuilder",
 ]
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+import polars._reexport as pl
+from polars._utils.construction.dataframe import (
+    _rows_schema,
+    _rows_to_pydf,
+    _unpack_schema,
+)
+from polars._utils.wrap import wrap_df
+from polars.datatypes import N_INFER_DEFAULT
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from polars import DataFrame, Schema
+    from polars._typing import SchemaDefinition, SchemaDict
+
+__all__ = ["DataFrameBuilder"]
+
+# target number of values (rows * columns) loaded per chunk
+_N_CHUNK_ELEMENTS = 1_000_000
+
+
+class DataFrameBuilder:
+    """
+    Incrementally build a DataFrame from rows.
+
+    Appended rows are buffered and loaded into typed column builders one chunk
+    at a time; the DataFrame returned by :meth:`finish` is made up of these chunks,
+    so (unless it is rechunked) row data is never copied into intermediate frames.
+
+    .. warning::
+        This functionality is considered **unstable**. It may be changed
+        at any point without it being considered a breaking change.
+
+    .. versionadded:: 1.30.0
+
+    Parameters
+    ----------
+    schema : Sequence of str, (str,DataType) pairs, or a {str:DataType,} dict
+        The schema of the resulting DataFrame. If no schema is given, or if it does
+        not define the dtype of every column, the missing dtypes are inferred from
+        the first chunk of rows and are then fixed for all subsequent rows.
+    schema_overrides : dict, default None
+        Support type specification or override of one or more columns.
+    strict : bool, default True
+        Throw an error if any row value does not exactly match the given or
+        inferred dtype for that column. If set to `False`, values that do not
+        match the data type are cast to that data type or, if casting is not
+        possible, set to null instead.
+    infer_schema_length : int or None
+        The maximum number of rows to scan for schema inference (if any dtypes are
+        not given). If set to `None`, the whole first chunk of rows is scanned.
+    chunk_size : int, optional
+        The number of rows to buffer before loading them into the column builders.
+        By default this is derived from the number of columns, targeting around one
+        million values per chunk.
+
+    Notes
+    -----
+    Rows can be given as sequences of values (in column order) or as dictionaries
+    mapping column names to values; all rows in a chunk should be of the same kind.
+
+    Examples
+    --------
+    >>> builder = pl.DataFrameBuilder({"id": pl.Int32, "value": pl.Float64})
+    >>> builder.append_row((1, 0.5))
+    >>> builder.append_rows([(2, None), (3, -1.25)])
+    >>> builder.finish()
+    shape: (3, 2)
+    ┌─────┬───────┐
+    │ id  ┆ value │
+    │ --- ┆ ---   │
+    │ i32 ┆ f64   │
+    ╞═════╪═══════╡
+    │ 1   ┆ 0.5   │
+    │ 2   ┆ null  │
+    │ 3   ┆ -1.25 │
+    └─────┴───────┘
+
+    Once finished, the builder is reset (retaining its schema), so it can be used
+    to produce a sequence of DataFrames with the same schema, such as micro-batches
+    of records received from a message queue.
+
+    >>> builder.append_row({"id": 4, "value": 2.0})
+    >>> builder.finish().rows()
+    [(4, 2.0)]
+    """
+
+    def __init__(
+        self,
+        schema: SchemaDefinition | None = None,
+        *,
+        schema_overrides: SchemaDict | None = None,
+        strict: bool = True,
+        infer_schema_length: int | None = N_INFER_DEFAULT,
+        chunk_size: int | None = None,
+    ) -> None:
+        column_names: list[str] = []
+        if schema is not None or schema_overrides:
+            column_names, schema_overrides = _unpack_schema(
+                schema, schema_overrides=schema_overrides
+            )
+        self._schema = schema
+        self._schema_overrides = schema_overrides or {}
+        self._strict = strict
+        self._infer_schema_length = infer_schema_length
+
+        # once all dtypes are known, rows are loaded without any inference
+        self._rows_schema = _rows_schema(column_names, self._schema_overrides)
+
+        if chunk_size:
+            self._adaptive_chunk_size: int | None = chunk_size
+        elif column_names:
+            self._adaptive_chunk_size = _N_CHUNK_ELEMENTS // len(column_names)
+        else:
+            self._adaptive_chunk_size = None
+
+        # note: the first chunk cannot be smaller than 'infer_schema_length'
+        self._chunk_size = max(
+            (0 if self._rows_schema else infer_schema_length or 0),
+            (self._adaptive_chunk_size or 1000),
+        )
+        self._rows: list[Any] = []
+        self._frame: DataFrame | None = None
+        self._n_chunks = 0
+        self._n_rows = 0
+
+    def __len__(self) -> int:
+        """Return the number of rows appended since the builder was last finished."""
+        return self._n_rows + len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"<DataFrameBuilder with {len(self)} rows; schema={self.schema!r}>"
+
+    @property
+    def schema(self) -> Schema | None:
+        """
+        Get the schema of the DataFrame being built.
+
+        Returns None if the schema is not yet known (eg: if the dtypes still have
+        to be inferred from rows that have not yet been loaded).
+        """
+        return self._rows_schema
+
+    def append_row(self, row: Sequence[Any] | Mapping[str, Any]) -> None:
+        """
+        Append a single row.
+
+        Parameters
+        ----------
+        row
+            A sequence of values (in column order) or a dictionary mapping column
+            names to values.
+        """
+        self._rows.append(row)
+        if len(self._rows) >= self._chunk_size:
+            self._load_rows()
+
+    def append_rows(self, rows: Iterable[Sequence[Any] | Mapping[str, Any]]) -> None:
+        """
+        Append rows from the given iterable (which may be a generator).
+
+        Parameters
+        ----------
+        rows
+            An iterable of rows; each row should be a sequence of values (in column
+            order) or a dictionary mapping column names to values.
+        """
+        rows = iter(rows)
+        while True:
+            self._rows.extend(islice(rows, self._chunk_size - len(self._rows)))
+            if len(self._rows) < self._chunk_size:
+                break
+            self._load_rows()
+
+    def finish(self, *, rechunk: bool = False) -> DataFrame:
+        """
+        Return a DataFrame containing all appended rows, and reset the builder.
+
+        The builder retains its (possibly inferred) schema, and can continue to be
+        used to build new DataFrames.
+
+        Parameters
+        ----------
+        rechunk
+            Make sure the resulting DataFrame is contiguous in memory; by default
+            it is made up of one chunk per batch of rows that was loaded.
+        """
+        if self._rows:
+            self._load_rows()
+
+        df = self._frame
+        if df is None:
+            df = self._rows_to_frame([])
+        elif self._n_chunks > 0 and rechunk:
+            df = df.rechunk()
+
+        self._frame = None
+        self._n_chunks = self._n_rows = 0
+        return df
+
+    def _rows_to_frame(self, rows: list[Any]) -> DataFrame:
+        """Load rows with the regular DataFrame constructor."""
+        return pl.DataFrame(
+            data=rows,
+            schema=self._schema,
+            schema_overrides=self._schema_overrides,
+            strict=self._strict,
+            orient="row",
+            infer_schema_length=self._infer_schema_length,
+        )
+
+    def _load_rows(self) -> None:
+        """Load the buffered rows into a new chunk of the frame being built."""
+        rows, self._rows = self._rows, []
+        pydf = (
+            _rows_to_pydf(
+                rows,
+                self._rows_schema,
+                strict=self._strict,
+                infer_schema_length=self._infer_schema_length,
+            )
+            if self._rows_schema
+            else None
+        )
+        chunk = self._rows_to_frame(rows) if pydf is None else wrap_df(pydf)
+        self._n_rows += chunk.height
+
+        if self._frame is not None:
+            self._frame.vstack(chunk, in_place=True)
+            self._n_chunks += 1
+            return
+
+        self._frame = chunk
+        if self._rows_schema is None:
+            # fix the dtypes inferred from the first chunk for all subsequent rows
+            self._schema = list(chunk.schema.items())
+            self._rows_schema = _rows_schema(chunk.columns, chunk.schema)
+        if self._chunk_size != self._adaptive_chunk_size and chunk.width > 0:
+            self._chunk_size = self._adaptive_chunk_size = (
+                _N_CHUNK_ELEMENTS // chunk.width
+            )
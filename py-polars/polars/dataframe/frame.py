@@ -13,7 +13,9 @@ from collections.abc import (
     Sequence,
     Sized,
 )
-from io import BytesIO, StringIO
+from functools import partial
+from io import BytesIO, StringIO, TextIOBase
+from itertools import islice
 from pathlib import Path
 from typing import (
     IO,
@@ -50,6 +52,7 @@ from polars._utils.getitem import get_df_item_by_key
 from polars._utils.parquet import wrap_parquet_metadata_callback
 from polars._utils.parse import parse_into_expression
 from polars._utils.pycapsule import is_pycapsule, pycapsule_to_frame
+from polars._utils.rows import materialize_rows, row_converter
 from polars._utils.serde import serialize_polars_object
 from polars._utils.unstable import issue_unstable_warning, unstable
 from polars._utils.various import (
@@ -68,6 +71,8 @@ from polars.dataframe.plotting import DataFramePlot
 from polars.datatypes import (
     N_INFER_DEFAULT,
     Boolean,
+    Date,
+    Datetime,
     Float32,
     Float64,
     Int32,
@@ -76,6 +81,7 @@ from polars.datatypes import (
     Object,
     String,
     Struct,
+    Time,
     UInt16,
     UInt32,
     UInt64,
@@ -103,6 +109,7 @@ from polars.exceptions import (
     InvalidOperationError,
     ModuleUpgradeRequiredError,
     NoRowsReturnedError,
+    ShapeError,
     TooManyRowsReturnedError,
 )
 from polars.functions import col, lit
@@ -2139,6 +2146,7 @@ class DataFrame:
         label: str | Expr | Sequence[str | Expr] | None = ...,
         features: str | Expr | Sequence[str | Expr] | None = ...,
         dtype: PolarsDataType | None = ...,
+        out: torch.Tensor | None = ...,
     ) -> torch.Tensor: ...
 
     @overload
@@ -2169,6 +2177,7 @@ class DataFrame:
         label: str | Expr | Sequence[str | Expr] | None = None,
         features: str | Expr | Sequence[str | Expr] | None = None,
         dtype: PolarsDataType | None = None,
+        out: torch.Tensor | None = None,
     ) -> torch.Tensor | dict[str, torch.Tensor] | PolarsDataset:
         """
         Convert DataFrame to a PyTorch Tensor, Dataset, or dict of Tensors.
@@ -2198,6 +2207,16 @@ class DataFrame:
             not of the required dtype before converting to Tensor. This includes
             the label column *unless* the label is an expression (such as
             `pl.col("label_column").cast(pl.Int16)`).
+        out
+            Write the data into this pre-allocated (CPU) Tensor, which is returned,
+            instead of allocating a new one; only valid when `return_type` is
+            "tensor". The Tensor must have one row per frame row, and a dtype that
+            the frame data can be cast to. This allows a buffer in pinned or shared
+            memory to be reused for each batch of data (see also
+            :class:`polars.ml.torch.TensorConverter`). Column-major Tensors (such
+            as the transpose of a contiguous Tensor) are written fastest.
+
+            .. versionadded:: 1.30.0
 
         See Also
         --------
@@ -2313,6 +2332,10 @@ class DataFrame:
             msg = "`label` is required if setting `features` when `return_type='dict'"
             raise ValueError(msg)
 
+        elif out is not None and return_type != "tensor":
+            msg = "`out` only applies when `return_type` is 'tensor'"
+            raise ValueError(msg)
+
         torch = import_optional("torch")
 
         if dtype in (UInt16, UInt32, UInt64):
@@ -2326,6 +2349,13 @@ class DataFrame:
             # note: torch tensors are not immutable, so we must consider them writable
             from polars.ml.utilities import frame_to_numpy
 
+            if out is not None:
+                if out.device.type != "cpu":
+                    msg = f"`out` must be a CPU Tensor; found device {out.device}"
+                    raise ValueError(msg)
+                frame_to_numpy(frame, writable=True, target="Tensor", out=out.numpy())
+                return out
+
             arr = frame_to_numpy(frame, writable=True, target="Tensor")
             return torch.from_numpy(arr)
 
@@ -2682,12 +2712,42 @@ class DataFrame:
         return serialize_polars_object(serializer, file, format)
 
     @overload
-    def write_json(self, file: None = ...) -> str: ...
+    def write_json(
+        self,
+        file: None = ...,
+        *,
+        orient: Literal["records", "columns"] = ...,
+        datetime_format: str | None = ...,
+        date_format: str | None = ...,
+        time_format: str | None = ...,
+        float_precision: int | None = ...,
+        batch_size: int | None = ...,
+    ) -> str: ...
 
     @overload
-    def write_json(self, file: IOBase | str | Path) -> None: ...
+    def write_json(
+        self,
+        file: IOBase | str | Path,
+        *,
+        orient: Literal["records", "columns"] = ...,
+        datetime_format: str | None = ...,
+        date_format: str | None = ...,
+        time_format: str | None = ...,
+        float_precision: int | None = ...,
+        batch_size: int | None = ...,
+    ) -> None: ...
 
-    def write_json(self, file: IOBase | str | Path | None = None) -> str | None:
+    def write_json(
+        self,
+        file: IOBase | str | Path | None = None,
+        *,
+        orient: Literal["records", "columns"] = "records",
+        datetime_format: str | None = None,
+        date_format: str | None = None,
+        time_format: str | None = None,
+        float_precision: int | None = None,
+        batch_size: int | None = None,
+    ) -> str | None:
         """
         Serialize to JSON representation.
 
@@ -2696,6 +2756,49 @@ class DataFrame:
         file
             File path or writable file-like object to which the result will be written.
             If set to `None` (default), the output is returned as a string instead.
+        orient : {'records', 'columns'}
+            The shape of the JSON output.
+
+            - "records": an array with one object per row (default).
+            - "columns": a single object mapping each column name to an array of
+              the column values.
+
+            .. versionadded:: 1.30.0
+        datetime_format
+            A format string, with the specifiers defined by the
+            `chrono <https://docs.rs/chrono/latest/chrono/format/strftime/index.html>`_
+            Rust crate, used to write `Datetime` columns. If no format is given,
+            datetimes are written in their default string representation.
+
+            .. versionadded:: 1.30.0
+        date_format
+            A format string, with the specifiers defined by the
+            `chrono <https://docs.rs/chrono/latest/chrono/format/strftime/index.html>`_
+            Rust crate, used to write `Date` columns.
+
+            .. versionadded:: 1.30.0
+        time_format
+            A format string, with the specifiers defined by the
+            `chrono <https://docs.rs/chrono/latest/chrono/format/strftime/index.html>`_
+            Rust crate, used to write `Time` columns.
+
+            .. versionadded:: 1.30.0
+        float_precision
+            Round `Float32` and `Float64` values to this number of decimal places.
+
+            .. versionadded:: 1.30.0
+        batch_size
+            Write the output to `file` in batches of (at most) this many rows,
+            flushing the file after each batch, so that the full JSON document is
+            never held in memory. With `orient="columns"` the output is written
+            one column at a time instead. Ignored if `file` is `None`.
+
+            .. versionadded:: 1.30.0
+
+        Notes
+        -----
+        The formatting options apply to top-level columns only; the values of
+        nested (List, Array and Struct) columns are written unchanged.
 
         See Also
         --------
@@ -2711,27 +2814,96 @@ class DataFrame:
         ... )
         >>> df.write_json()
         '[{"foo":1,"bar":6},{"foo":2,"bar":7},{"foo":3,"bar":8}]'
+
+        Write a column-oriented object instead:
+
+        >>> df.write_json(orient="columns")
+        '{"foo":[1,2,3],"bar":[6,7,8]}'
+
+        Format temporal values and limit the precision of floating-point values:
+
+        >>> from datetime import datetime
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "ts": [datetime(2025, 1, 31, 12, 30)],
+        ...         "value": [2 / 3],
+        ...     }
+        ... )
+        >>> df.write_json(datetime_format="%Y-%m-%dT%H:%M:%S", float_precision=3)
+        '[{"ts":"2025-01-31T12:30:00","value":0.667}]'
         """
+        if orient not in ("records", "columns"):
+            msg = f"`orient` must be one of {{'records', 'columns'}}, got {orient!r}"
+            raise ValueError(msg)
+        if batch_size is not None and batch_size <= 0:
+            msg = f"`batch_size` must be a positive integer, got {batch_size}"
+            raise ValueError(msg)
 
-        def write_json_to_string() -> str:
+        df = self
+        formats = (
+            (Datetime, datetime_format),
+            (Date, date_format),
+            (Time, time_format),
+        )
+        exprs = [F.col(tp).dt.to_string(fmt) for tp, fmt in formats if fmt]
+        if float_precision is not None:
+            exprs.append(F.col(Float32, Float64).round(float_precision))
+        if exprs:
+            df = df.with_columns(exprs)
+
+        def to_json_bytes(frame: DataFrame) -> bytes:
             with BytesIO() as buf:
-                self._df.write_json(buf)
-                json_bytes = buf.getvalue()
-            return json_bytes.decode("utf8")
+                frame._df.write_json(buf)
+                return buf.getvalue()
+
+        def columns_to_json_bytes(frame: DataFrame) -> bytes:
+            # a single row of whole-column lists, without the enclosing '[...]'
+            return to_json_bytes(frame.select(F.all().implode()))[1:-1]
+
+        def iter_json_batches() -> Iterator[bytes]:
+            if orient == "columns":
+                if batch_size is None or df.width <= 1:
+                    yield columns_to_json_bytes(df) if df.width else b"{}"
+                    return
+                for idx, s in enumerate(df.iter_columns()):
+                    data = columns_to_json_bytes(s.to_frame())[1:-1]
+                    yield (b"{" if idx == 0 else b",") + data
+                yield b"}"
+            elif batch_size is None or df.height <= batch_size:
+                yield to_json_bytes(df)
+            else:
+                for idx, frame in enumerate(df.iter_slices(batch_size)):
+                    data = to_json_bytes(frame)[1:-1]
+                    yield (b"[" if idx == 0 else b",") + data
+                yield b"]"
 
         if file is None:
-            return write_json_to_string()
-        elif isinstance(file, StringIO):
-            json_str = write_json_to_string()
-            file.write(json_str)
-            return None
-        elif isinstance(file, (str, Path)):
-            file = normalize_filepath(file)
-            self._df.write_json(file)
+            return b"".join(iter_json_batches()).decode("utf8")
+
+        if orient == "records" and batch_size is None:
+            # write straight from the native serializer
+            if isinstance(file, StringIO):
+                file.write(to_json_bytes(df).decode("utf8"))
+            elif isinstance(file, (str, Path)):
+                df._df.write_json(normalize_filepath(file))
+            else:
+                df._df.write_json(file)
             return None
+
+        def write_batches(f: Any) -> None:
+            text = isinstance(f, TextIOBase)
+            flush = getattr(f, "flush", None)
+            for data in iter_json_batches():
+                f.write(data.decode("utf8") if text else data)
+                if flush is not None:
+                    flush()
+
+        if isinstance(file, (str, Path)):
+            with Path(normalize_filepath(file)).open("wb") as f:
+                write_batches(f)
         else:
-            self._df.write_json(file)
-            return None
+            write_batches(file)
+        return None
 
     @overload
     def write_ndjson(self, file: None = None) -> str: ...
@@ -3120,6 +3292,7 @@ class DataFrame:
             | tuple[int, int, int, int]
             | None
         ) = None,
+        constant_memory: bool = False,
     ) -> Workbook:
         """
         Write frame data to a table in an Excel workbook/worksheet.
@@ -3253,6 +3426,17 @@ class DataFrame:
               the `top_row` and `top_col`. Thus, to freeze only the top row and have the
               scrolling region begin at row 10, column D (5th col), supply (1, 0, 9, 4).
               Using cell notation for (row, col), supplying ("A2", 9, 4) is equivalent.
+        constant_memory : bool
+            Write the workbook in xlsxwriter's "constant_memory" mode, flushing each
+            row to disk once written (so memory use does not grow with the number of
+            rows). Excel tables are not available in this mode; the data is written
+            as a formatted (and optionally autofiltered) cell range instead, so the
+            `table_style`, `table_name`, `column_totals`, `row_totals` and `formulas`
+            parameters are not supported. If passing an existing `Workbook` object,
+            it should have been created with the `{"constant_memory": True}` option
+            (in which case this mode is used automatically).
+
+            .. versionadded:: 1.30.0
 
         Notes
         -----
@@ -3481,11 +3665,13 @@ class DataFrame:
         from polars.io.spreadsheet._write_utils import (
             _unpack_multi_column_dict,
             _xl_apply_conditional_formats,
+            _xl_autofit_column_widths,
             _xl_inject_sparklines,
             _xl_setup_table_columns,
             _xl_setup_table_options,
             _xl_setup_workbook,
             _xl_unique_table_name,
+            _xl_write_rows,
             _XLFormatCache,
         )
 
@@ -3493,9 +3679,24 @@ class DataFrame:
         from xlsxwriter.utility import xl_cell_to_rowcol
 
         # setup workbook/worksheet
-        wb, ws, can_close = _xl_setup_workbook(workbook, worksheet)
+        wb, ws, can_close = _xl_setup_workbook(
+            workbook, worksheet, constant_memory=constant_memory
+        )
         df, is_empty = self, self.is_empty()
 
+        if ws.constant_memory:
+            # these all require an Excel table, which can't be streamed
+            for name, value in {
+                "table_style": table_style,
+                "table_name": table_name,
+                "column_totals": column_totals,
+                "row_totals": row_totals,
+                "formulas": formulas,
+            }.items():
+                if value:
+                    msg = f"cannot set {name!r} when writing in constant_memory mode"
+                    raise ValueError(msg)
+
         # note: `_xl_setup_table_columns` converts nested data (List, Struct, etc.) to
         # string, so we keep a reference to the original so that column selection with
         # selectors that target such types remains correct
@@ -3544,21 +3745,55 @@ class DataFrame:
             msg = f"writing {df.height}x{df.width} frame at {position!r} does not fit worksheet dimensions of {excel_max_valid_rows} rows and {excel_max_valid_cols} columns"
             raise InvalidOperationError(msg)
 
+        # row heights have to be set before the rows are written (if streaming)
+        if row_heights:
+            if isinstance(row_heights, int):
+                for idx in range(table_start[0], table_finish[0] + 1):
+                    ws.set_row_pixels(idx, row_heights)
+            elif isinstance(row_heights, dict):
+                for idx, height in _unpack_multi_column_dict(row_heights).items():  # type: ignore[assignment]
+                    ws.set_row_pixels(idx, height)
+
         # write table structure and formats into the target sheet
         if not is_empty or include_header:
-            ws.add_table(
-                *table_start,
-                *table_finish,
-                {
-                    "data": df.rows(),
-                    "style": table_style,
-                    "columns": table_columns,
-                    "header_row": include_header,
-                    "autofilter": autofilter,
-                    "total_row": bool(column_totals) and not is_empty,
-                    "name": table_name,
-                    **table_options,
-                },
+            if ws.constant_memory:
+                # no table; write header and autofilter for the equivalent range
+                if include_header:
+                    for col_idx, col in enumerate(table_columns, table_start[1]):
+                        ws.write_string(
+                            table_start[0],
+                            col_idx,
+                            col["header"],
+                            col.get("header_format"),
+                        )
+                    if autofilter:
+                        ws.autofilter(*table_start, *table_finish)
+            else:
+                ws.add_table(
+                    *table_start,
+                    *table_finish,
+                    {
+                        "style": table_style,
+                        "columns": table_columns,
+                        "header_row": include_header,
+                        "autofilter": autofilter,
+                        "total_row": bool(column_totals) and not is_empty,
+                        "name": table_name,
+                        **table_options,
+                    },
+                )
+
+            # stream the frame data into the sheet (formula columns are
+            # written by the table itself)
+            _xl_write_rows(
+                ws,
+                df,
+                first_row=table_start[0] + int(include_header),
+                first_col=table_start[1],
+                formats=[col.get("format") for col in table_columns],
+                skip_columns=[
+                    col["header"] for col in table_columns if "formula" in col
+                ],
             )
 
             # apply conditional formats
@@ -3580,18 +3815,23 @@ class DataFrame:
         else:
             hidden = set(_expand_selectors(df_original, hidden_columns))
 
-        # Autofit section needs to be present above column_widths section
-        # to ensure that parameters provided in the column_widths section
-        # are not overwritten by autofit
-        #
-        # table/rows all written; apply (optional) autofit
         if autofit and not is_empty:
             xlv = xlsxwriter.__version__
             if parse_version(xlv) < (3, 0, 8):
                 msg = f"`autofit=True` requires xlsxwriter 3.0.8 or higher, found {xlv}"
                 raise ModuleUpgradeRequiredError(msg)
-            ws.autofit()
 
+        # note: explicit column_widths take precedence over autofit widths
+        autofit_widths = (
+            _xl_autofit_column_widths(
+                df,
+                ws,
+                include_header=include_header,
+                autofilter=autofilter,
+            )
+            if autofit and not is_empty
+            else {}
+        )
         if isinstance(column_widths, int):
             column_widths = dict.fromkeys(df.columns, column_widths)
         else:
@@ -3603,14 +3843,9 @@ class DataFrame:
         for column in df.columns:
             options = {"hidden": True} if column in hidden else {}
             col_idx = table_start[1] + df.get_column_index(column)
-            if column in column_widths:  # type: ignore[operator]
-                ws.set_column_pixels(
-                    col_idx,
-                    col_idx,
-                    column_widths[column],  # type: ignore[index]
-                    None,
-                    options,
-                )
+            width = column_widths.get(column, autofit_widths.get(column))  # type: ignore[union-attr]
+            if width is not None:
+                ws.set_column_pixels(col_idx, col_idx, width, None, options)
             elif options:
                 ws.set_column(col_idx, col_idx, None, None, options)
 
@@ -3630,13 +3865,6 @@ class DataFrame:
             ws.hide_gridlines(2)
         if sheet_zoom:
             ws.set_zoom(sheet_zoom)
-        if row_heights:
-            if isinstance(row_heights, int):
-                for idx in range(table_start[0], table_finish[0] + 1):
-                    ws.set_row_pixels(idx, row_heights)
-            elif isinstance(row_heights, dict):
-                for idx, height in _unpack_multi_column_dict(row_heights).items():  # type: ignore[assignment]
-                    ws.set_row_pixels(idx, height)
 
         if freeze_panes:
             if isinstance(freeze_panes, str):
@@ -4139,6 +4367,7 @@ class DataFrame:
         if_table_exists: DbWriteMode = "fail",
         engine: DbWriteEngine | None = None,
         engine_options: dict[str, Any] | None = None,
+        batch_size: int | None = None,
     ) -> int:
         """
         Write the data in a Polars DataFrame to a database.
@@ -4147,6 +4376,10 @@ class DataFrame:
             Support for instantiated connection objects in addition to URI strings, and
             a new `engine_options` parameter.
 
+        .. versionchanged:: 1.30.0
+            The "sqlalchemy" engine now writes natively (without pandas), and a new
+            `batch_size` parameter was added.
+
         Parameters
         ----------
         table_name
@@ -4172,11 +4405,18 @@ class DataFrame:
             Additional options to pass to the insert method associated with the engine
             specified by the option `engine`.
 
-            * Setting `engine` to "sqlalchemy" currently inserts using Pandas' `to_sql`
-              method (though this will eventually be phased out in favor of a native
-              solution).
+            * Setting `engine` to "sqlalchemy" inserts natively, using `COPY FROM
+              STDIN` for PostgreSQL (with a psycopg driver) and batched multi-row
+              inserts otherwise. If `engine_options` are given, or the frame contains
+              nested/object columns, Pandas' `to_sql` method is used instead (and
+              is passed these options).
             * Setting `engine` to "adbc" inserts using the ADBC cursor's `adbc_ingest`
               method.
+        batch_size
+            The number of rows to send to the database at a time, which bounds the
+            memory used to convert frame data for the driver. For the "sqlalchemy"
+            engine this defaults to 100,000 rows; for the "adbc" engine the frame is
+            ingested as a stream of Arrow record batches of this size (if set).
 
         Examples
         --------
@@ -4212,6 +4452,9 @@ class DataFrame:
             allowed = ", ".join(repr(m) for m in valid_write_modes)
             msg = f"write_database `if_table_exists` must be one of {{{allowed}}}, got {if_table_exists!r}"
             raise ValueError(msg)
+        if batch_size is not None and batch_size < 1:
+            msg = f"write_database `batch_size` must be a positive integer, got {batch_size!r}"
+            raise ValueError(msg)
 
         if engine is None:
             if (
@@ -4265,6 +4508,11 @@ class DataFrame:
                 if isinstance(connection, str)
                 else (connection, False)
             )
+            data: pa.Table | pa.RecordBatchReader = self.to_arrow()
+            if batch_size is not None:
+                data = pa.RecordBatchReader.from_batches(
+                    data.schema, data.to_batches(max_chunksize=batch_size)
+                )
             with (
                 conn if can_close_conn else contextlib.nullcontext(),  # type: ignore[union-attr]
                 conn.cursor() as cursor,  # type: ignore[union-attr]
@@ -4281,7 +4529,7 @@ class DataFrame:
 
                     n_rows = cursor.adbc_ingest(
                         unpacked_table_name,
-                        data=self.to_arrow(),
+                        data=data,
                         mode=mode,
                         catalog_name=catalog,
                         db_schema_name=db_schema,
@@ -4298,7 +4546,7 @@ class DataFrame:
                 else:
                     n_rows = cursor.adbc_ingest(
                         table_name=unpacked_table_name,
-                        data=self.to_arrow(),
+                        data=data,
                         mode=mode,
                         **(engine_options or {}),
                     )
@@ -4306,20 +4554,28 @@ class DataFrame:
             return n_rows
 
         elif engine == "sqlalchemy":
-            if not _PANDAS_AVAILABLE:
-                msg = "writing with 'sqlalchemy' engine currently requires pandas.\n\nInstall with: pip install pandas"
+            from polars.io.database._write import (
+                _native_write_supported,
+                _write_sqlalchemy,
+            )
+
+            use_pandas = bool(engine_options) or not _native_write_supported(self)
+            if not use_pandas:
+                import_optional(module_name="sqlalchemy", min_version="1.4")
+            elif not _PANDAS_AVAILABLE:
+                msg = "writing with 'sqlalchemy' engine and `engine_options` (or nested columns) currently requires pandas.\n\nInstall with: pip install pandas"
                 raise ModuleNotFoundError(msg)
             elif (pd_version := parse_version(pd.__version__)) < (1, 5):
                 msg = f"writing with 'sqlalchemy' engine requires pandas >= 1.5; found {pd.__version__!r}"
                 raise ModuleUpgradeRequiredError(msg)
-
-            import_optional(
-                module_name="sqlalchemy",
-                min_version=("2.0" if pd_version >= (2, 2) else "1.4"),
-                min_err_prefix="pandas >= 2.2 requires",
-            )
+            else:
+                import_optional(
+                    module_name="sqlalchemy",
+                    min_version=("2.0" if pd_version >= (2, 2) else "1.4"),
+                    min_err_prefix="pandas >= 2.2 requires",
+                )
             # note: the catalog (database) should be a part of the connection string
-            from sqlalchemy.engine import Connectable, create_engine
+            from sqlalchemy.engine import Connectable, Engine, create_engine
             from sqlalchemy.orm import Session
 
             sa_object: Connectable
@@ -4338,8 +4594,27 @@ class DataFrame:
                 msg = f"Unexpected three-part table name; provide the database/catalog ({catalog!r}) on the connection URI"
                 raise ValueError(msg)
 
+            if not use_pandas:
+                with contextlib.ExitStack() as stack:
+                    # commit if we own the transaction, otherwise leave it to the caller
+                    if isinstance(sa_object, Engine):
+                        sa_conn = stack.enter_context(sa_object.begin())
+                    else:
+                        sa_conn = sa_object
+                        if not sa_conn.in_transaction():
+                            stack.enter_context(sa_conn.begin())
+                    return _write_sqlalchemy(
+                        self,
+                        sa_conn,
+                        table_name=unpacked_table_name,
+                        db_schema=db_schema,
+                        if_table_exists=if_table_exists,
+                        batch_size=batch_size,
+                    )
+
             # ensure conversion to pandas uses the pyarrow extension array option
             # so that we can make use of the sql/db export *without* copying data
+            to_sql_options = {"chunksize": batch_size, **(engine_options or {})}
             res: int | None = self.to_pandas(
                 use_pyarrow_extension_array=True,
             ).to_sql(
@@ -4348,7 +4623,7 @@ class DataFrame:
                 con=sa_object,
                 if_exists=if_table_exists,
                 index=False,
-                **(engine_options or {}),
+                **to_sql_options,
             )
             return -1 if res is None else res
 
@@ -7992,6 +8267,9 @@ class DataFrame:
         return_dtype: PolarsDataType | None = None,
         *,
         inference_size: int = 256,
+        batch_size: int | None = None,
+        vectorized: bool = False,
+        processes: int | None = None,
     ) -> DataFrame:
         """
         Apply a custom/user-defined function (UDF) over the rows of the DataFrame.
@@ -8023,6 +8301,22 @@ class DataFrame:
         inference_size
             Only used in the case when the custom function returns rows.
             This uses the first `n` rows to determine the output schema.
+        batch_size
+            Process the frame in batches of (at most) this many rows. If not set,
+            the frame is processed as a single batch, unless `processes` is set.
+        vectorized
+            Call the UDF once per batch instead of once per row. The UDF then
+            receives a tuple of NumPy arrays (one per column, holding the values of
+            the rows in the batch) and should return an array-like with one value
+            per row, or a tuple of these to return multiple columns.
+        processes
+            Spread the batches over a pool of this many worker processes, which can
+            speed up pure-Python UDFs that are limited by the GIL. The UDF must be
+            picklable (for example, a function defined at module level), and is
+            called in freshly spawned interpreters. If `batch_size` is not set, the
+            frame is split into one batch per process.
+
+            .. versionadded:: 1.30.0
 
         Notes
         -----
@@ -8077,16 +8371,68 @@ class DataFrame:
         In this case it is better to use the following native expression:
 
         >>> df.select(pl.col("foo") * 2 + pl.col("bar"))  # doctest: +IGNORE_RESULT
+
+        If the logic can't be expressed natively, a vectorized UDF still avoids
+        calling into Python (and creating a tuple) for every row; it receives NumPy
+        arrays holding the column values of a batch of rows:
+
+        >>> df.map_rows(lambda t: t[0] * 2 + t[1], vectorized=True)
+        shape: (3, 1)
+        ┌─────┐
+        │ map │
+        │ --- │
+        │ i64 │
+        ╞═════╡
+        │ 1   │
+        │ 9   │
+        │ 14  │
+        └─────┘
         """
         # TODO: Enable warning for inefficient map
         # from polars._utils.udfs import warn_on_inefficient_map
         # warn_on_inefficient_map(function, columns=self.columns, map_target="frame)
 
-        out, is_df = self._df.map_rows(function, return_dtype, inference_size)
-        if is_df:
-            return self._from_pydf(out)
+        if batch_size is None and processes is None and not vectorized:
+            out, is_df = self._df.map_rows(function, return_dtype, inference_size)
+            if is_df:
+                return self._from_pydf(out)
+            else:
+                return wrap_s(out).to_frame()
+
+        if batch_size is not None and batch_size < 1:
+            msg = f"`batch_size` must be a positive integer; found {batch_size}"
+            raise ValueError(msg)
+        if processes is not None and processes < 1:
+            msg = f"`processes` must be a positive integer; found {processes}"
+            raise ValueError(msg)
+
+        if batch_size is None:
+            import math
+
+            batch_size = max(1, math.ceil(self.height / (processes or 1)))
+        batches = list(self.iter_slices(batch_size)) or [self]
+        map_batch = partial(
+            _map_rows_batch,
+            function=function,
+            return_dtype=return_dtype,
+            inference_size=inference_size,
+            vectorized=vectorized,
+        )
+        if processes is None or len(batches) == 1:
+            frames = [map_batch(batch) for batch in batches]
         else:
-            return wrap_s(out).to_frame()
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # note: forking a process that uses the polars thread pool can deadlock
+            with ProcessPoolExecutor(
+                max_workers=min(processes, len(batches)),
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                frames = list(pool.map(map_batch, batches))
+
+        # the output dtype of each batch is inferred independently
+        return F.concat(frames, how="vertical_relaxed")
 
     def hstack(
         self, columns: list[Series] | DataFrame, *, in_place: bool = False
@@ -11106,14 +11452,21 @@ class DataFrame:
             raise ValueError(msg)
 
     @overload
-    def rows(self, *, named: Literal[False] = ...) -> list[tuple[Any, ...]]: ...
+    def rows(
+        self, *, named: Literal[False] = ..., row_type: None = ...
+    ) -> list[tuple[Any, ...]]: ...
 
     @overload
-    def rows(self, *, named: Literal[True]) -> list[dict[str, Any]]: ...
+    def rows(
+        self, *, named: Literal[True], row_type: None = ...
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    def rows(self, *, named: bool = ..., row_type: type[T]) -> list[T]: ...
 
     def rows(
-        self, *, named: bool = False
-    ) -> list[tuple[Any, ...]] | list[dict[str, Any]]:
+        self, *, named: bool = False, row_type: type[Any] | None = None
+    ) -> list[tuple[Any, ...]] | list[dict[str, Any]] | list[Any]:
         """
         Returns all data in the DataFrame as a list of rows of python-native values.
 
@@ -11127,6 +11480,14 @@ class DataFrame:
             Return dictionaries instead of tuples. The dictionaries are a mapping of
             column name to row value. This is more expensive than returning a regular
             tuple, but allows for accessing values by column name.
+        row_type
+            Return each row as an instance of this type, such as a namedtuple or a
+            dataclass, whose fields are matched to the frame columns by name (any
+            other frame columns are ignored). Other tuple types are instantiated
+            with the row tuple, and mapping types (such as `dict`) with the row
+            values as keyword arguments.
+
+            .. versionadded:: 1.30.0
 
         Notes
         -----
@@ -11168,13 +11529,17 @@ class DataFrame:
          {'x': 'b', 'y': 2, 'z': 3},
          {'x': 'b', 'y': 3, 'z': 6},
          {'x': 'a', 'y': 4, 'z': 9}]
+
+        Return rows as namedtuples (or dataclasses):
+
+        >>> from typing import NamedTuple
+        >>> class Point(NamedTuple):
+        ...     x: str
+        ...     z: int
+        >>> df.rows(row_type=Point)[:2]
+        [Point(x='a', z=0), Point(x='b', z=3)]
         """
-        if named:
-            # Load these into the local namespace for a minor performance boost
-            dict_, zip_, columns = dict, zip, self.columns
-            return [dict_(zip_(columns, row)) for row in self._df.row_tuples()]
-        else:
-            return self._df.row_tuples()
+        return materialize_rows(self, named=named, row_type=row_type)
 
     @overload
     def rows_by_key(
@@ -11320,9 +11685,9 @@ class DataFrame:
         key = _expand_selectors(self, key)
 
         keys = (
-            iter(self.get_column(key[0]))
+            self.get_column(key[0]).to_list()
             if len(key) == 1
-            else self.select(key).iter_rows()
+            else self.select(key).rows()
         )
 
         if include_key:
@@ -11331,7 +11696,7 @@ class DataFrame:
             data_cols = [k for k in self.schema if k not in key]
             values = self.select(data_cols)
 
-        zipped = zip(keys, values.iter_rows(named=named))  # type: ignore[call-overload]
+        zipped = zip(keys, values.rows(named=named))  # type: ignore[call-overload]
 
         # if unique, we expect to write just one entry per key; otherwise, we're
         # returning a list of rows for each key, so append into a defaultdict.
@@ -11346,17 +11711,72 @@ class DataFrame:
 
     @overload
     def iter_rows(
-        self, *, named: Literal[False] = ..., buffer_size: int = ...
+        self,
+        *,
+        named: Literal[False] = ...,
+        row_type: None = ...,
+        buffer_size: int = ...,
+        batched: Literal[False] = ...,
     ) -> Iterator[tuple[Any, ...]]: ...
 
     @overload
     def iter_rows(
-        self, *, named: Literal[True], buffer_size: int = ...
+        self,
+        *,
+        named: Literal[True],
+        row_type: None = ...,
+        buffer_size: int = ...,
+        batched: Literal[False] = ...,
     ) -> Iterator[dict[str, Any]]: ...
 
+    @overload
+    def iter_rows(
+        self,
+        *,
+        named: bool = ...,
+        row_type: type[T],
+        buffer_size: int = ...,
+        batched: Literal[False] = ...,
+    ) -> Iterator[T]: ...
+
+    @overload
+    def iter_rows(
+        self,
+        *,
+        named: Literal[False] = ...,
+        row_type: None = ...,
+        buffer_size: int = ...,
+        batched: Literal[True],
+    ) -> Iterator[list[tuple[Any, ...]]]: ...
+
+    @overload
     def iter_rows(
-        self, *, named: bool = False, buffer_size: int = 512
-    ) -> Iterator[tuple[Any, ...]] | Iterator[dict[str, Any]]:
+        self,
+        *,
+        named: Literal[True],
+        row_type: None = ...,
+        buffer_size: int = ...,
+        batched: Literal[True],
+    ) -> Iterator[list[dict[str, Any]]]: ...
+
+    @overload
+    def iter_rows(
+        self,
+        *,
+        named: bool = ...,
+        row_type: type[T],
+        buffer_size: int = ...,
+        batched: Literal[True],
+    ) -> Iterator[list[T]]: ...
+
+    def iter_rows(
+        self,
+        *,
+        named: bool = False,
+        row_type: type[Any] | None = None,
+        buffer_size: int = 512,
+        batched: bool = False,
+    ) -> Iterator[Any]:
         """
         Returns an iterator over the DataFrame of rows of python-native values.
 
@@ -11366,12 +11786,25 @@ class DataFrame:
             Return dictionaries instead of tuples. The dictionaries are a mapping of
             column name to row value. This is more expensive than returning a regular
             tuple, but allows for accessing values by column name.
+        row_type
+            Return each row as an instance of this type, such as a namedtuple or a
+            dataclass, whose fields are matched to the frame columns by name (any
+            other frame columns are ignored). Other tuple types are instantiated
+            with the row tuple, and mapping types (such as `dict`) with the row
+            values as keyword arguments.
+
+            .. versionadded:: 1.30.0
         buffer_size
             Determines the number of rows that are buffered internally while iterating
             over the data; you should only modify this in very specific cases where the
             default value is determined not to be a good fit to your access pattern, as
             the speedup from using the buffer is significant (~2-4x). Setting this
             value to zero disables row buffering (not recommended).
+        batched
+            Yield lists of (up to) `buffer_size` rows instead of individual rows,
+            which avoids the per-row iterator overhead when processing rows in bulk.
+
+            .. versionadded:: 1.30.0
 
         Notes
         -----
@@ -11407,27 +11840,37 @@ class DataFrame:
         [1, 3, 5]
         >>> [row["b"] for row in df.iter_rows(named=True)]
         [2, 4, 6]
+
+        Iterate over batches of rows:
+
+        >>> for batch in df.iter_rows(named=True, batched=True, buffer_size=2):
+        ...     print(batch)
+        [{'a': 1, 'b': 2}, {'a': 3, 'b': 4}]
+        [{'a': 5, 'b': 6}]
         """
-        # load into the local namespace for a (minor) performance boost in the hot loops
-        columns, get_row, dict_, zip_ = self.columns, self.row, dict, zip
-        has_object = Object in self.dtypes
+        if batched and buffer_size < 1:
+            msg = "`buffer_size` must be a positive integer when `batched=True`"
+            raise ValueError(msg)
 
         # note: buffering rows results in a 2-4x speedup over individual calls
         # to ".row(i)", so it should only be disabled in extremely specific cases.
-        if buffer_size and not has_object:
+        if buffer_size and Object not in self.dtypes:
             for offset in range(0, self.height, buffer_size):
-                zerocopy_slice = self.slice(offset, buffer_size)
-                if named:
-                    for row in zerocopy_slice.rows(named=False):
-                        yield dict_(zip_(columns, row))
+                rows = materialize_rows(
+                    self.slice(offset, buffer_size), named=named, row_type=row_type
+                )
+                if batched:
+                    yield rows
                 else:
-                    yield from zerocopy_slice.rows(named=False)
-        elif named:
-            for i in range(self.height):
-                yield dict_(zip_(columns, get_row(i)))
+                    yield from rows
         else:
-            for i in range(self.height):
-                yield get_row(i)
+            convert = row_converter(self.columns, named=named, row_type=row_type)
+            row_iter = (convert(self.row(idx)) for idx in range(self.height))
+            if not batched:
+                yield from row_iter
+            else:
+                while batch := list(islice(row_iter, buffer_size)):
+                    yield batch
 
     def iter_columns(self) -> Iterator[Series]:
         """
@@ -12200,6 +12643,35 @@ class DataFrame:
         return pl.Series._from_pyseries(self._df._row_encode(fields))
 
 
+def _map_rows_batch(
+    df: DataFrame,
+    *,
+    function: Callable[[tuple[Any, ...]], Any],
+    return_dtype: PolarsDataType | None,
+    inference_size: int,
+    vectorized: bool,
+) -> DataFrame:
+    """Apply a `map_rows` UDF to a single batch of rows."""
+    if not vectorized:
+        return df.map_rows(function, return_dtype, inference_size=inference_size)
+
+    out = function(tuple(s.to_numpy() for s in df.iter_columns()))
+    if isinstance(out, tuple):
+        result = pl.DataFrame(
+            {f"column_{idx}": values for idx, values in enumerate(out)}
+        )
+    else:
+        result = pl.Series("map", out).to_frame()
+
+    if result.height != df.height:
+        msg = (
+            f"vectorized `map_rows` function returned {result.height} values for a "
+            f"batch of {df.height} rows"
+        )
+        raise ShapeError(msg)
+    return result if return_dtype is None else result.cast(return_dtype)
+
+
 def _prepare_other_arg(other: Any, length: int | None = None) -> Series:
     # if not a series create singleton series such that it will broadcast
     value = other
@@ -3,6 +3,7 @@ from __future__ import annotations
 import contextlib
 import math
 import operator
+import os
 import sys
 import warnings
 from collections.abc import Collection, Mapping, Sequence
@@ -4482,6 +4483,7 @@ class Expr:
         pass_name: bool = False,
         strategy: MapElementsStrategy = "thread_local",
         returns_scalar: bool = False,
+        rewrite: bool | None = None,
     ) -> Expr:
         """
         Map a custom/user-defined function (UDF) to each element of a column.
@@ -4545,6 +4547,15 @@ class Expr:
             .. warning::
                 This functionality is considered **unstable**. It may be changed
                 at any point without it being considered a breaking change.
+        rewrite
+            If the function can be translated to an equivalent native expression
+            (this is the expression suggested by the `PolarsInefficientMapWarning`),
+            evaluate that expression instead of calling the function. If not set,
+            this follows :meth:`Config.set_rewrite_map_elements`. Only applies when
+            mapping elementwise with `skip_nulls=True` (and without `pass_name`
+            or `returns_scalar`).
+
+            .. versionadded:: 1.30.0
 
         Warnings
         --------
@@ -4553,6 +4564,10 @@ class Expr:
 
         Notes
         -----
+        * Rewritten functions follow the semantics of the native expression, which
+          can differ from those of the Python function in edge cases (for example,
+          integer arithmetic can overflow).
+
         * Using `map_elements` is strongly discouraged as you will be effectively
           running python "for" loops, which will be very slow. Wherever possible you
           should prefer the native expression API to achieve the best performance.
@@ -4682,10 +4697,28 @@ class Expr:
             )
 
         # input x: Series of type list containing the group values
-        from polars._utils.udfs import warn_on_inefficient_map
+        from polars._utils.udfs import rewrite_inefficient_map, warn_on_inefficient_map
 
         root_names = self.meta.root_names()
         if len(root_names) > 0:
+            if rewrite is None:
+                rewrite = bool(int(os.environ.get("POLARS_REWRITE_MAP_ELEMENTS", 0)))
+            if (
+                rewrite
+                and skip_nulls
+                and not (pass_name or returns_scalar)
+                and (
+                    native_expr := rewrite_inefficient_map(
+                        function, columns=root_names, input_expr=self
+                    )
+                )
+                is not None
+            ):
+                if return_dtype is not None:
+                    native_expr = native_expr.cast(return_dtype)
+                name = self.meta.output_name(raise_if_undetermined=False)
+                return native_expr if name is None else native_expr.alias(name)
+
             warn_on_inefficient_map(function, columns=root_names, map_target="expr")
 
         if pass_name:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 import polars._reexport as pl
@@ -22,7 +23,9 @@ if TYPE_CHECKING:
     from polars.interchange.protocol import DataFrame as InterchangeDataFrame
 
 
-def from_dataframe(df: SupportsInterchange, *, allow_copy: bool = True) -> DataFrame:
+def from_dataframe(
+    df: SupportsInterchange, *, allow_copy: bool = True, rechunk: bool = False
+) -> DataFrame:
     """
     Build a Polars DataFrame from any dataframe supporting the interchange protocol.
 
@@ -34,11 +37,14 @@ def from_dataframe(df: SupportsInterchange, *, allow_copy: bool = True) -> DataF
     allow_copy
         Allow memory to be copied to perform the conversion. If set to False, causes
         conversions that are not zero-copy to fail.
+    rechunk
+        Make sure that all data is in contiguous memory; if False, each chunk of
+        the interchange dataframe is kept as a separate chunk.
     """
     if isinstance(df, pl.DataFrame):
-        return df
+        return df.rechunk() if rechunk else df
     elif isinstance(df, PolarsDataFrame):
-        return df._df
+        return df._df.rechunk() if rechunk else df._df
 
     if not hasattr(df, "__dataframe__"):
         msg = f"`df` of type {qualified_type_name(df)!r} does not support the dataframe interchange protocol"
@@ -47,10 +53,13 @@ def from_dataframe(df: SupportsInterchange, *, allow_copy: bool = True) -> DataF
     return _from_dataframe(
         df.__dataframe__(allow_copy=allow_copy),  # type: ignore[arg-type]
         allow_copy=allow_copy,
+        rechunk=rechunk,
     )
 
 
-def _from_dataframe(df: InterchangeDataFrame, *, allow_copy: bool) -> DataFrame:
+def _from_dataframe(
+    df: InterchangeDataFrame, *, allow_copy: bool, rechunk: bool = False
+) -> DataFrame:
     chunks = []
     for chunk in df.get_chunks():
         polars_chunk = _protocol_df_chunk_to_polars(chunk, allow_copy=allow_copy)
@@ -61,7 +70,9 @@ def _from_dataframe(df: InterchangeDataFrame, *, allow_copy: bool) -> DataFrame:
         polars_chunk = _protocol_df_chunk_to_polars(df, allow_copy=allow_copy)
         chunks.append(polars_chunk)
 
-    return F.concat(chunks, rechunk=False)
+    if len(chunks) == 1:
+        return chunks[0].rechunk() if rechunk else chunks[0]
+    return F.concat(chunks, rechunk=rechunk)
 
 
 def _protocol_df_chunk_to_polars(
@@ -244,48 +255,50 @@ def _construct_validity_buffer(
     allow_copy: bool,
 ) -> Series | None:
     null_type, null_value = column.describe_null
-    if null_type == ColumnNullType.NON_NULLABLE or column.null_count == 0:
+    if null_type == ColumnNullType.NON_NULLABLE:
         return None
 
-    elif null_type == ColumnNullType.USE_BITMASK:
-        if validity_buffer_info is None:
-            return None
-        buffer = validity_buffer_info[0]
-        return _construct_validity_buffer_from_bitmask(
-            buffer, null_value, column.size(), offset, allow_copy=allow_copy
-        )
-
-    elif null_type == ColumnNullType.USE_BYTEMASK:
-        if validity_buffer_info is None:
+    elif null_type in (ColumnNullType.USE_BITMASK, ColumnNullType.USE_BYTEMASK):
+        if validity_buffer_info is None or column.null_count == 0:
             return None
         buffer = validity_buffer_info[0]
+        if null_type == ColumnNullType.USE_BITMASK:
+            return _construct_validity_buffer_from_bitmask(
+                buffer, null_value, column.size(), offset, allow_copy=allow_copy
+            )
         return _construct_validity_buffer_from_bytemask(
-            buffer, null_value, allow_copy=allow_copy
+            buffer, null_value, column.size(), offset, allow_copy=allow_copy
         )
 
-    elif null_type == ColumnNullType.USE_NAN:
-        if not allow_copy:
-            msg = "bitmask must be constructed"
-            raise CopyNotAllowedError(msg)
-        return data.is_not_nan()
+    elif null_type not in (ColumnNullType.USE_NAN, ColumnNullType.USE_SENTINEL):
+        msg = f"unsupported null type: {null_type!r}"
+        raise NotImplementedError(msg)
 
-    elif null_type == ColumnNullType.USE_SENTINEL:
-        if not allow_copy:
-            msg = "bitmask must be constructed"
-            raise CopyNotAllowedError(msg)
+    elif not allow_copy:
+        if column.null_count == 0:
+            return None
+        msg = "bitmask must be constructed"
+        raise CopyNotAllowedError(msg)
 
+    # note: we construct the mask *before* checking for nulls; the producer's
+    # `null_count` typically has to scan the whole column (in Python), which is
+    # far more expensive than doing so ourselves
+    if null_type == ColumnNullType.USE_NAN:
+        # (NaN propagates through a sum, which is by far the cheapest check)
+        if data.dtype.is_float() and not math.isnan(data.sum()):
+            return None
+        validity = data.is_not_nan()
+    else:
         sentinel = pl.Series([null_value])
         try:
             if column_dtype.is_temporal():
                 sentinel = sentinel.cast(column_dtype)
-            return data != sentinel  # noqa: TRY300
+            validity = data != sentinel
         except InvalidOperationError as e:
             msg = f"invalid sentinel value for column of type {column_dtype}: {null_value!r}"
             raise TypeError(msg) from e
 
-    else:
-        msg = f"unsupported null type: {null_type!r}"
-        raise NotImplementedError(msg)
+    return None if validity.all() else validity
 
 
 def _construct_validity_buffer_from_bitmask(
@@ -311,6 +324,8 @@ def _construct_validity_buffer_from_bitmask(
 def _construct_validity_buffer_from_bytemask(
     buffer: Buffer,
     null_value: int,
+    length: int | None = None,
+    offset: int = 0,
     *,
     allow_copy: bool,
 ) -> Series:
@@ -318,11 +333,10 @@ def _construct_validity_buffer_from_bytemask(
         msg = "bytemask must be converted into a bitmask"
         raise CopyNotAllowedError(msg)
 
-    buffer_info = (buffer.ptr, 0, buffer.bufsize)
+    if length is None:
+        length = buffer.bufsize - offset
+    buffer_info = (buffer.ptr, offset, length)
     s = pl.Series._from_buffer(UInt8, buffer_info, owner=buffer)
-    s = s.cast(Boolean)
 
-    if null_value != 0:
-        s = ~s
-
-    return s
+    # note: a single comparison yields the (bit-packed) validity mask
+    return (s == 0) if null_value != 0 else (s != 0)
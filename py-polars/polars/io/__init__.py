@@ -4,7 +4,12 @@ from polars.io.avro import read_avro
 from polars.io.cast_options import ScanCastOptions
 from polars.io.clipboard import read_clipboard
 from polars.io.csv import read_csv, read_csv_batched, scan_csv
-from polars.io.database import read_database, read_database_uri
+from polars.io.database import (
+    read_database,
+    read_database_async,
+    read_database_uri,
+    scan_database,
+)
 from polars.io.delta import read_delta, scan_delta
 from polars.io.iceberg import scan_iceberg
 from polars.io.ipc import read_ipc, read_ipc_schema, read_ipc_stream, scan_ipc
@@ -26,7 +31,7 @@ from polars.io.partition import (
 )
 from polars.io.plugins import _defer as defer
 from polars.io.pyarrow_dataset import scan_pyarrow_dataset
-from polars.io.spreadsheet import read_excel, read_ods
+from polars.io.spreadsheet import read_excel, read_ods, scan_excel
 
 __all__ = [
     "defer",
@@ -42,6 +47,7 @@ __all__ = [
     "read_csv",
     "read_csv_batched",
     "read_database",
+    "read_database_async",
     "read_database_uri",
     "read_delta",
     "read_excel",
@@ -55,7 +61,9 @@ __all__ = [
     "read_parquet_metadata",
     "read_parquet_schema",
     "scan_csv",
+    "scan_database",
     "scan_delta",
+    "scan_excel",
     "scan_iceberg",
     "scan_ipc",
     "scan_ndjson",
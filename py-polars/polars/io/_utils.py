@@ -3,9 +3,9 @@ from __future__ import annotations
 import glob
 import re
 from contextlib import contextmanager
-from io import BytesIO, StringIO
+from io import BufferedWriter, BytesIO, RawIOBase, StringIO
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, overload
+from typing import IO, TYPE_CHECKING, Any, Callable, overload
 
 from polars._utils.various import (
     is_int_sequence,
@@ -315,3 +315,46 @@ def is_local_file(file: str) -> bool:
         return False
     else:
         return True
+
+
+# maximum number of bytes buffered before being passed on to a sink callback
+_SINK_CALLBACK_BUFFER_SIZE = 1 << 20
+
+
+class _CallbackWriter(RawIOBase):
+    """Unbuffered binary writer that passes each block of bytes to a callback."""
+
+    def __init__(
+        self,
+        callback: Callable[[bytes], Any],
+        flush: Callable[[], Any] | None = None,
+    ) -> None:
+        self._callback = callback
+        self._flush = flush
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        data = bytes(b)
+        self._callback(data)
+        return len(data)
+
+    def flush(self) -> None:
+        if self._flush is not None:
+            self._flush()
+
+
+def writer_from_callback(target: Any) -> BufferedWriter:
+    """
+    Wrap a callable, or an object with a `write` method, as a binary file object.
+
+    Output is passed on in blocks of bytes (small writes are coalesced, up to
+    `_SINK_CALLBACK_BUFFER_SIZE`); as each block is passed on synchronously, a
+    callback that blocks also holds back the writer, which bounds memory use.
+    """
+    if callable(write := getattr(target, "write", None)):
+        raw = _CallbackWriter(write, getattr(target, "flush", None))
+    else:
+        raw = _CallbackWriter(target)
+    return BufferedWriter(raw, buffer_size=_SINK_CALLBACK_BUFFER_SIZE)
@@ -1,6 +1,13 @@
-from polars.io.database.functions import read_database, read_database_uri
+from polars.io.database.functions import (
+    read_database,
+    read_database_async,
+    read_database_uri,
+    scan_database,
+)
 
 __all__ = [
     "read_database",
+    "read_database_async",
     "read_database_uri",
+    "scan_database",
 ]
@@ -22,7 +22,7 @@ from polars.io.database._utils import _run_async
 
 if TYPE_CHECKING:
     import sys
-    from collections.abc import Iterable, Iterator
+    from collections.abc import AsyncIterator, Iterable, Iterator
     from types import TracebackType
 
     import pyarrow as pa
@@ -38,7 +38,12 @@ if TYPE_CHECKING:
     from sqlalchemy.sql.expression import Selectable
 
     from polars import DataFrame
-    from polars._typing import ConnectionOrCursor, Cursor, SchemaDict
+    from polars._typing import (
+        AsyncAlchemyConnection,
+        ConnectionOrCursor,
+        Cursor,
+        SchemaDict,
+    )
 
 _INVALID_QUERY_TYPES = {
     "ALTER",
@@ -76,7 +81,7 @@ class ConnectionExecutor:
     # should never close the underlying connection, or a user-supplied cursor.
     can_close_cursor: bool = False
 
-    def __init__(self, connection: ConnectionOrCursor) -> None:
+    def __init__(self, connection: ConnectionOrCursor | AsyncAlchemyConnection) -> None:
         self.driver_name = (
             "arrow_odbc_proxy"
             if isinstance(connection, ODBCCursorProxy)
@@ -168,6 +173,15 @@ class ConnectionExecutor:
                         break
                     yield arrow
 
+    @staticmethod
+    def _check_read_query(query: str | TextClause | Selectable) -> None:
+        """Raise if the given query is clearly not a 'read' query."""
+        if isinstance(query, str):
+            q = re.search(r"\w{3,}", re.sub(r"/\*(.|[\r\n])*?\*/", "", query))
+            if (query_type := "" if not q else q.group(0)) in _INVALID_QUERY_TYPES:
+                msg = f"{query_type} statements are not valid 'read' queries"
+                raise UnsuitableSQLError(msg)
+
     @staticmethod
     def _fetchall_rows(result: Cursor, *, is_alchemy: bool) -> Iterable[Sequence[Any]]:
         """Fetch row data in a single call, returning the complete result set."""
@@ -423,6 +437,69 @@ class ConnectionExecutor:
             result = await conn.execute(query, **options)
             return result
 
+    async def _sqlalchemy_async_frames(
+        self,
+        query: str | TextClause | Selectable,
+        *,
+        options: dict[str, Any],
+        iter_batches: bool,
+        batch_size: int | None,
+        schema_overrides: SchemaDict | None,
+        infer_schema_length: int | None,
+    ) -> AsyncIterator[DataFrame]:
+        """
+        Yield frames from an async SQLAlchemy connection without blocking the loop.
+
+        When iterating over batches the result is streamed from the server, so
+        that only a single batch is held in memory at a time.
+        """
+        from polars import DataFrame
+
+        _, options, query = self._sqlalchemy_setup(query, options)
+        is_session = self._is_alchemy_session(self.cursor)
+        if is_session and "parameters" in options and "params" not in options:
+            options = options.copy()
+            options["params"] = options.pop("parameters")
+
+        cursor = self.cursor.begin() if is_session else self.cursor  # type: ignore[attr-defined]
+        async with cursor as conn:  # type: ignore[union-attr]
+            if is_session and not hasattr(conn, "execute"):
+                conn = conn.session
+
+            def cursor_description(result: Any) -> list[tuple[str, Any]]:
+                # streamed results wrap the underlying (sync) cursor result
+                result = getattr(result, "_real_result", None) or result
+                if getattr(result, "cursor", None) is not None:
+                    return [(d[0], d[1:]) for d in result.cursor.description]
+                return [(k, None) for k in list(result.keys())]
+
+            def to_frame(
+                rows: Sequence[Any], cursor_desc: list[tuple[str, Any]]
+            ) -> DataFrame:
+                return DataFrame(
+                    data=rows,
+                    schema=[nm for nm, _ in cursor_desc] or None,
+                    schema_overrides=self._inject_type_overrides(
+                        description=cursor_desc,
+                        schema_overrides=dict(schema_overrides or {}),
+                    ),
+                    infer_schema_length=infer_schema_length,
+                    orient="row",
+                )
+
+            if iter_batches:
+                result = await conn.stream(query, **options)
+                try:
+                    cursor_desc = cursor_description(result)
+                    async for rows in result.partitions(batch_size):
+                        yield to_frame(rows, cursor_desc)
+                finally:
+                    await result.close()
+            else:
+                result = await conn.execute(query, **options)
+                cursor_desc = cursor_description(result)
+                yield to_frame(result.fetchall(), cursor_desc)
+
     def _sqlalchemy_setup(
         self, query: str | TextClause | Selectable, options: dict[str, Any]
     ) -> tuple[Any, dict[str, Any], str | TextClause | Selectable]:
@@ -474,11 +551,8 @@ class ConnectionExecutor:
         select_queries_only: bool = True,
     ) -> Self:
         """Execute a query and reference the result set."""
-        if select_queries_only and isinstance(query, str):
-            q = re.search(r"\w{3,}", re.sub(r"/\*(.|[\r\n])*?\*/", "", query))
-            if (query_type := "" if not q else q.group(0)) in _INVALID_QUERY_TYPES:
-                msg = f"{query_type} statements are not valid 'read' queries"
-                raise UnsuitableSQLError(msg)
+        if select_queries_only:
+            self._check_read_query(query)
 
         options = options or {}
 
@@ -561,3 +635,43 @@ class ConnectionExecutor:
             f"Currently no support for {self.driver_name!r} connection {self.cursor!r}"
         )
         raise NotImplementedError(msg)
+
+    async def to_polars_async(
+        self,
+        query: str | TextClause | Selectable,
+        *,
+        options: dict[str, Any] | None = None,
+        iter_batches: bool = False,
+        batch_size: int | None = None,
+        schema_overrides: SchemaDict | None = None,
+        infer_schema_length: int | None = N_INFER_DEFAULT,
+    ) -> DataFrame | AsyncIterator[DataFrame]:
+        """
+        Execute a query against an async connection and return the result set.
+
+        Unlike `execute` (and `to_polars`), this awaits the async driver directly,
+        instead of running it to completion on a nested event loop.
+        """
+        if not self._is_alchemy_async(self.cursor):
+            msg = f"Currently no async support for {self.driver_name!r} connection {self.cursor!r}"
+            raise NotImplementedError(msg)
+
+        if iter_batches and not batch_size:
+            msg = (
+                "Cannot set `iter_batches` without also setting a non-zero `batch_size`"
+            )
+            raise ValueError(msg)
+
+        self._check_read_query(query)
+        frames = self._sqlalchemy_async_frames(
+            query,
+            options=options or {},
+            iter_batches=iter_batches,
+            batch_size=batch_size,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+        )
+        if iter_batches:
+            return frames
+        (df,) = [df async for df in frames]
+        return df
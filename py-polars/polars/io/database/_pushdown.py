@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import json
+import math
+import warnings
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Callable
+
+import polars._reexport as pl
+from polars import functions as F
+from polars.datatypes import Binary, Boolean, Categorical, Enum, String
+
+if TYPE_CHECKING:
+    from polars import Expr
+    from polars._typing import SchemaDict
+
+# drivers/dialects that don't understand a trailing `LIMIT n` clause
+_NO_LIMIT_CLAUSE = {
+    "arrow_odbc_proxy",
+    "cx_oracle",
+    "mssql",
+    "oracle",
+    "oracledb",
+    "pymssql",
+    "pyodbc",
+    "turbodbc",
+}
+
+# drivers that quote identifiers with backticks by default
+_BACKTICK_QUOTED = {"mariadb", "mysql", "mysqldb", "pymysql"}
+
+_BINARY_OPERATORS = {
+    "Eq": "=",
+    "NotEq": "<>",
+    "Lt": "<",
+    "LtEq": "<=",
+    "Gt": ">",
+    "GtEq": ">=",
+    "And": "AND",
+    "Or": "OR",
+    "Plus": "+",
+    "Minus": "-",
+    "Multiply": "*",
+}
+_ARITHMETIC_OPERATORS = {"Plus", "Minus", "Multiply"}
+_LOGICAL_OPERATORS = {"And", "Or"}
+_COMPARISON_OPERATORS = {"Eq", "NotEq", "Lt", "LtEq", "Gt", "GtEq"}
+
+
+def _identifier_quoter(connection: Any, driver_name: str) -> Callable[[str], str]:
+    """Return a function that quotes identifiers for the given connection."""
+    dialect = getattr(connection, "dialect", None) or getattr(
+        getattr(connection, "bind", None), "dialect", None
+    )
+    if dialect is not None and hasattr(dialect, "identifier_preparer"):
+        return dialect.identifier_preparer.quote
+    elif driver_name in _BACKTICK_QUOTED:
+        return lambda name: "`{}`".format(name.replace("`", "``"))
+    return lambda name: '"{}"'.format(name.replace('"', '""'))
+
+
+def _supports_limit_clause(connection: Any, driver_name: str) -> bool:
+    """Check if the connection can be expected to support a `LIMIT n` clause."""
+    dialect = getattr(connection, "dialect", None) or getattr(
+        getattr(connection, "bind", None), "dialect", None
+    )
+    return (
+        driver_name not in _NO_LIMIT_CLAUSE
+        and getattr(dialect, "name", None) not in _NO_LIMIT_CLAUSE
+    )
+
+
+def _sql_literal(value: Any) -> str | None:
+    """Render a Python value as an (unparameterised) SQL literal, if possible."""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, (int, Decimal)):
+        return str(value)
+    elif isinstance(value, float):
+        return repr(value) if math.isfinite(value) else None
+    elif isinstance(value, str):
+        return "'{}'".format(value.replace("'", "''"))
+    elif isinstance(value, datetime):
+        return None if value.tzinfo is not None else f"'{value.isoformat(sep=' ')}'"
+    elif isinstance(value, date):
+        return f"'{value.isoformat()}'"
+    return None
+
+
+def _contains_column(node: Any) -> bool:
+    """Check if the serialized expression node references a column."""
+    if isinstance(node, dict):
+        return "Column" in node or any(_contains_column(v) for v in node.values())
+    elif isinstance(node, list):
+        return any(_contains_column(v) for v in node)
+    return False
+
+
+def _evaluate(node: Any) -> Any:
+    """Evaluate a serialized expression node that does not reference any column."""
+    expr = pl.Expr.deserialize(StringIO(json.dumps(node)), format="json")
+    values = F.select(expr).to_series()
+    if values.len() != 1:
+        msg = "expected a scalar literal"
+        raise ValueError(msg)
+    return values[0]
+
+
+class _PredicateTranslator:
+    """Translate (simple) serialized Polars predicates into SQL."""
+
+    def __init__(self, quote: Callable[[str], str], schema: SchemaDict) -> None:
+        self.quote = quote
+        self.schema = schema
+
+    def is_boolean(self, node: Any) -> bool:
+        """
+        Check if the node certainly evaluates to a boolean.
+
+        Polars' `~`, `&` and `|` operators are bitwise for integers, so we can only
+        translate them to their SQL counterparts for boolean operands.
+        """
+        [(kind, value)] = node.items()
+        if kind == "Column":
+            return self.schema.get(value) == Boolean
+        elif kind == "BinaryExpr":
+            op = value["op"]
+            return op in _COMPARISON_OPERATORS or (
+                op in _LOGICAL_OPERATORS
+                and self.is_boolean(value["left"])
+                and self.is_boolean(value["right"])
+            )
+        elif kind == "Function":
+            function = value["function"]
+            return isinstance(function, dict) and "Boolean" in function
+        return False
+
+    def is_numeric(self, node: Any) -> bool:
+        """
+        Check if the node certainly evaluates to a number.
+
+        Polars' `+` also concatenates strings (and `-` subtracts temporal values),
+        so we only translate arithmetic to SQL for numeric operands.
+        """
+        if not _contains_column(node):
+            try:
+                value = _evaluate(node)
+            except Exception:
+                return False
+            return isinstance(value, (int, float, Decimal)) and not isinstance(
+                value, bool
+            )
+
+        [(kind, value)] = node.items()
+        if kind == "Column":
+            dtype = self.schema.get(value)
+            return dtype is not None and dtype.is_numeric()
+        elif kind == "BinaryExpr":
+            return (
+                value["op"] in _ARITHMETIC_OPERATORS
+                and self.is_numeric(value["left"])
+                and self.is_numeric(value["right"])
+            )
+        return False
+
+    def is_string(self, node: Any) -> bool:
+        """
+        Check if the node may evaluate to a string (or binary) value.
+
+        Databases commonly compare strings case-insensitively or according to a
+        collation (eg: the MySQL and SQL Server defaults), which can select other
+        rows than Polars does, so we don't translate comparisons of strings.
+        """
+        if not _contains_column(node):
+            try:
+                value = _evaluate(node)
+            except Exception:
+                return True
+            if isinstance(value, pl.Series):
+                return value.dtype in (String, Binary, Categorical, Enum)
+            return isinstance(value, (str, bytes))
+
+        [(kind, value)] = node.items()
+        if kind == "Column":
+            dtype = self.schema.get(value)
+            return dtype is None or dtype in (String, Binary, Categorical, Enum)
+        elif kind == "BinaryExpr":
+            return value["op"] not in _COMPARISON_OPERATORS | _LOGICAL_OPERATORS and (
+                self.is_string(value["left"]) or self.is_string(value["right"])
+            )
+        return False
+
+    def literal(self, node: Any) -> str | None:
+        try:
+            value = _evaluate(node)
+        except Exception:
+            return None
+        return _sql_literal(value)
+
+    def translate(self, node: Any) -> str | None:
+        """Return the SQL equivalent of the given node, or None if unsupported."""
+        if not _contains_column(node):
+            return self.literal(node)
+
+        [(kind, value)] = node.items()
+        if kind == "Column":
+            return self.quote(value)
+
+        elif kind == "BinaryExpr":
+            if (
+                (op := _BINARY_OPERATORS.get(value["op"])) is None
+                or (
+                    value["op"] in _LOGICAL_OPERATORS
+                    and not (
+                        self.is_boolean(value["left"])
+                        and self.is_boolean(value["right"])
+                    )
+                )
+                or (
+                    value["op"] in _ARITHMETIC_OPERATORS
+                    and not (
+                        self.is_numeric(value["left"])
+                        and self.is_numeric(value["right"])
+                    )
+                )
+                or (
+                    value["op"] in _COMPARISON_OPERATORS
+                    and (
+                        self.is_string(value["left"]) or self.is_string(value["right"])
+                    )
+                )
+            ):
+                return None
+            left = self.translate(value["left"])
+            right = self.translate(value["right"])
+            if left is None or right is None:
+                return None
+            return f"({left} {op} {right})"
+
+        elif kind == "Function":
+            function = value["function"]
+            inputs = value["input"]
+            if not isinstance(function, dict) or "Boolean" not in function:
+                return None
+            function = function["Boolean"]
+
+            if function in ("IsNull", "IsNotNull", "Not"):
+                if (operand := self.translate(inputs[0])) is None or (
+                    function == "Not" and not self.is_boolean(inputs[0])
+                ):
+                    return None
+                elif function == "Not":
+                    return f"(NOT {operand})"
+                return f"({operand} IS {'NOT ' if function == 'IsNotNull' else ''}NULL)"
+
+            elif isinstance(function, dict) and "IsBetween" in function:
+                if any(self.is_string(n) for n in inputs):
+                    return None
+                operand, lower, upper = (self.translate(n) for n in inputs)
+                if operand is None or lower is None or upper is None:
+                    return None
+                closed = function["IsBetween"]["closed"]
+                lower_op = ">=" if closed in ("Both", "Left") else ">"
+                upper_op = "<=" if closed in ("Both", "Right") else "<"
+                return (
+                    f"({operand} {lower_op} {lower} AND {operand} {upper_op} {upper})"
+                )
+
+            elif isinstance(function, dict) and "IsIn" in function:
+                if (
+                    function["IsIn"].get("nulls_equal")
+                    or _contains_column(inputs[1])
+                    or any(self.is_string(n) for n in inputs)
+                ):
+                    return None
+                if (operand := self.translate(inputs[0])) is None:
+                    return None
+                try:
+                    values = _evaluate(inputs[1])
+                except Exception:
+                    return None
+                if isinstance(values, pl.Series):
+                    values = values.to_list()
+                if not isinstance(values, list) or not values:
+                    return None
+                literals = [_sql_literal(v) for v in values if v is not None]
+                if not literals or any(lit is None for lit in literals):
+                    return None
+                return f"({operand} IN ({', '.join(literals)}))"  # type: ignore[arg-type]
+
+        return None
+
+
+def _predicate_to_sql(
+    predicate: Expr, quote: Callable[[str], str], schema: SchemaDict
+) -> tuple[str | None, bool]:
+    """
+    Translate a Polars predicate into a SQL `WHERE` condition.
+
+    Top-level conjunctions are translated independently, so the returned condition
+    may only cover part of the predicate; the second element of the result tuple
+    indicates if the *whole* predicate was translated.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        tree = json.loads(predicate.meta.serialize(format="json"))
+
+    def conjuncts(node: Any) -> list[Any]:
+        if "BinaryExpr" in node and node["BinaryExpr"]["op"] == "And":
+            return conjuncts(node["BinaryExpr"]["left"]) + conjuncts(
+                node["BinaryExpr"]["right"]
+            )
+        return [node]
+
+    translator = _PredicateTranslator(quote, schema)
+    translated = [translator.translate(node) for node in conjuncts(tree)]
+    conditions = [cond for cond in translated if cond is not None]
+    return (
+        " AND ".join(conditions) if conditions else None,
+        len(conditions) == len(translated),
+    )
@@ -8,10 +8,10 @@ from polars.convert import from_arrow
 from polars.dependencies import import_optional
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import Callable, Coroutine
 
     from polars import DataFrame
-    from polars._typing import SchemaDict
+    from polars._typing import ConnectionOrCursor, SchemaDict
 
 
 def _run_async(co: Coroutine[Any, Any, Any]) -> Any:
@@ -65,6 +65,102 @@ def _read_sql_adbc(
     return from_arrow(tbl, schema_overrides=schema_overrides)  # type: ignore[return-value]
 
 
+def _partition_queries(
+    query: str,
+    partition_on: str,
+    partition_range: tuple[int, int],
+    partition_num: int,
+) -> list[str]:
+    """
+    Split a query into `partition_num` queries on ranges of the partition column.
+
+    The first and last partitions are left unbounded on the outside (and the first
+    also picks up NULL values), so no rows are lost if the given range is too narrow.
+    """
+    lower, upper = partition_range
+    partition_num = max(1, min(partition_num, upper - lower + 1))
+    if partition_num == 1:
+        return [query]
+
+    bounds = [
+        lower + (upper - lower + 1) * n // partition_num
+        for n in range(1, partition_num)
+    ]
+    conditions = [f"{partition_on} < {bounds[0]} OR {partition_on} IS NULL"]
+    conditions.extend(
+        f"{partition_on} >= {lo} AND {partition_on} < {hi}"
+        for lo, hi in zip(bounds, bounds[1:])
+    )
+    conditions.append(f"{partition_on} >= {bounds[-1]}")
+    return [f"SELECT * FROM ({query}) pl_partition WHERE {cond}" for cond in conditions]
+
+
+def _read_sql_partitioned(
+    query: str,
+    connection_factory: Callable[[], ConnectionOrCursor],
+    *,
+    partition_on: str,
+    partition_range: tuple[int, int] | None,
+    partition_num: int,
+    batch_size: int | None,
+    schema_overrides: SchemaDict | None,
+    infer_schema_length: int | None,
+    execute_options: dict[str, Any] | None,
+) -> DataFrame:
+    """
+    Read a query as range-partitioned queries, each on its own connection.
+
+    The partition queries are executed concurrently on a thread pool (drivers
+    release the GIL while waiting on the database), and the resulting frames are
+    concatenated without rechunking.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from polars import functions as F
+    from polars.io.database._executor import ConnectionExecutor
+
+    def read_query(partition_query: str) -> DataFrame:
+        conn = connection_factory()
+        try:
+            with ConnectionExecutor(conn) as cx:
+                return cx.execute(  # type: ignore[return-value]
+                    query=partition_query,
+                    options=execute_options,
+                ).to_polars(
+                    batch_size=batch_size,
+                    schema_overrides=schema_overrides,
+                    infer_schema_length=infer_schema_length,
+                )
+        finally:
+            # we created the connection, so we are responsible for closing it
+            if hasattr(conn, "close"):
+                conn.close()
+
+    if partition_range is None:
+        bounds_df = read_query(
+            f"SELECT MIN({partition_on}), MAX({partition_on}) FROM ({query}) pl_partition"
+        )
+        bounds = bounds_df.row(0)
+        if bounds[0] is None:
+            # no non-null values; nothing to partition on
+            return read_query(query)
+        elif not bounds_df.dtypes[0].is_integer():
+            msg = f"`partition_on` column {partition_on!r} must be an integer column; found {bounds_df.dtypes[0]}"
+            raise TypeError(msg)
+        partition_range = (bounds[0], bounds[1])
+
+    queries = _partition_queries(query, partition_on, partition_range, partition_num)
+    if len(queries) == 1:
+        return read_query(queries[0])
+
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        frames = list(pool.map(read_query, queries))
+
+    # row-wise inference can't determine the type of all-null columns in
+    # small/empty partitions, so allow those to be cast to the common supertype
+    return F.concat(frames, how="vertical_relaxed", rechunk=False)
+
+
 def _open_adbc_connection(connection_uri: str) -> Any:
     driver_name = connection_uri.split(":", 1)[0].lower()
 
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+from io import StringIO
+from typing import TYPE_CHECKING, Any
+
+from polars.datatypes import (
+    Binary,
+    Boolean,
+    Categorical,
+    Date,
+    Datetime,
+    Decimal,
+    Duration,
+    Enum,
+    Float32,
+    Float64,
+    Int8,
+    Int16,
+    Int32,
+    Int64,
+    Null,
+    String,
+    Time,
+    UInt8,
+    UInt16,
+    UInt32,
+    UInt64,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.schema import Table
+    from sqlalchemy.types import TypeEngine
+
+    from polars import DataFrame
+    from polars._typing import DbWriteMode, PolarsDataType
+
+# default number of rows sent to the driver in a single insert/copy call
+_DEFAULT_WRITE_BATCH_SIZE = 100_000
+
+# postgres drivers that expose `COPY FROM STDIN` on their cursor
+_COPY_DRIVERS = ("psycopg", "psycopg2")
+
+
+def _sqlalchemy_type(dtype: PolarsDataType) -> TypeEngine[Any] | None:
+    """Map a Polars dtype to the equivalent SQLAlchemy column type (if any)."""
+    from sqlalchemy import types as sqltypes
+
+    if dtype == Boolean:
+        return sqltypes.Boolean()
+    elif dtype in (Int8, Int16, UInt8):
+        return sqltypes.SmallInteger()
+    elif dtype in (Int32, UInt16):
+        return sqltypes.Integer()
+    elif dtype in (Int64, UInt32):
+        return sqltypes.BigInteger()
+    elif dtype == UInt64:
+        return sqltypes.Numeric(precision=20, scale=0)
+    elif dtype == Float32:
+        return sqltypes.Float(precision=23)
+    elif dtype == Float64:
+        return sqltypes.Float(precision=53)
+    elif dtype == Decimal:
+        return sqltypes.Numeric(precision=dtype.precision, scale=dtype.scale)  # type: ignore[union-attr]
+    elif dtype in (String, Categorical, Enum, Null):
+        return sqltypes.Text()
+    elif dtype == Binary:
+        return sqltypes.LargeBinary()
+    elif dtype == Date:
+        return sqltypes.Date()
+    elif dtype == Datetime:
+        return sqltypes.DateTime(timezone=dtype.time_zone is not None)  # type: ignore[union-attr]
+    elif dtype == Time:
+        return sqltypes.Time()
+    elif dtype == Duration:
+        return sqltypes.Interval()
+    return None
+
+
+def _native_write_supported(df: DataFrame) -> bool:
+    """Check if all frame columns can be written without going through pandas."""
+    return all(_sqlalchemy_type(dtype) is not None for dtype in df.dtypes)
+
+
+def _copy_from_stdin(
+    conn: Connection, table: Table, df: DataFrame, batch_size: int
+) -> bool:
+    """
+    Bulk-load frame data into a PostgreSQL table with `COPY ... FROM STDIN`.
+
+    Returns False (without writing anything) if the connection's driver or the
+    frame dtypes do not support this, in which case the caller should fall back
+    to a regular batched insert.
+    """
+    dialect = conn.dialect
+    if dialect.name != "postgresql" or dialect.driver not in _COPY_DRIVERS:
+        return False
+    elif any(dtype in (Binary, Duration) for dtype in df.dtypes):
+        # no unambiguous CSV representation for these
+        return False
+
+    preparer = dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(name) for name in df.columns)
+    copy_sql = (
+        f"COPY {preparer.format_table(table)} ({columns}) FROM STDIN WITH (FORMAT csv)"
+    )
+
+    # quote all non-numeric values; unquoted empty fields are read as NULL
+    def csv_batches() -> Any:
+        for batch in df.iter_slices(batch_size):
+            yield batch.write_csv(include_header=False, quote_style="non_numeric")
+
+    cursor = conn.connection.cursor()
+    try:
+        if dialect.driver == "psycopg":
+            with cursor.copy(copy_sql) as copy:
+                for data in csv_batches():
+                    copy.write(data)
+        else:
+            for data in csv_batches():
+                cursor.copy_expert(copy_sql, StringIO(data))
+    finally:
+        cursor.close()
+    return True
+
+
+def _write_sqlalchemy(
+    df: DataFrame,
+    conn: Connection,
+    *,
+    table_name: str,
+    db_schema: str | None,
+    if_table_exists: DbWriteMode,
+    batch_size: int | None,
+) -> int:
+    """
+    Write frame data to a database table using a SQLAlchemy connection.
+
+    The data is sent in batches of `batch_size` rows, so only one batch is ever
+    converted to driver-native values at a time. PostgreSQL connections using
+    a psycopg driver stream the batches through `COPY ... FROM STDIN`; all other
+    databases receive a batched (multi-row) insert. Transaction handling is left
+    to the caller.
+    """
+    from sqlalchemy import Column, MetaData, Table, inspect
+
+    if batch_size is None:
+        batch_size = _DEFAULT_WRITE_BATCH_SIZE
+
+    table = Table(
+        table_name,
+        MetaData(),
+        *(Column(name, _sqlalchemy_type(dtype)) for name, dtype in df.schema.items()),
+        schema=db_schema,
+    )
+    table_exists = inspect(conn).has_table(table_name, schema=db_schema)
+    if table_exists:
+        if if_table_exists == "fail":
+            msg = f"table {table_name!r} already exists"
+            raise ValueError(msg)
+        elif if_table_exists == "replace":
+            table.drop(conn)
+            table_exists = False
+    if not table_exists:
+        table.create(conn)
+
+    if df.is_empty():
+        return 0
+    if not _copy_from_stdin(conn, table, df, batch_size):
+        insert = table.insert()
+        for batch in df.iter_slices(batch_size):
+            conn.execute(insert, batch.rows(named=True))
+    return df.height
@@ -1,72 +1,99 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, Literal, overload
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
+from polars._utils.unstable import unstable
 from polars._utils.various import qualified_type_name
 from polars.datatypes import N_INFER_DEFAULT
 from polars.dependencies import import_optional
 from polars.io.database._cursor_proxies import ODBCCursorProxy
 from polars.io.database._executor import ConnectionExecutor
+from polars.io.database._pushdown import (
+    _identifier_quoter,
+    _predicate_to_sql,
+    _supports_limit_clause,
+)
+from polars.io.database._utils import _read_sql_partitioned
+from polars.io.plugins import register_io_source
+from polars.schema import Schema
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Callable, Iterator
 
     from sqlalchemy.sql.elements import TextClause
     from sqlalchemy.sql.expression import Selectable
 
-    from polars import DataFrame
-    from polars._typing import ConnectionOrCursor, DbReadEngine, SchemaDict
+    from polars import DataFrame, Expr, LazyFrame
+    from polars._typing import (
+        AsyncAlchemyConnection,
+        ConnectionOrCursor,
+        DbReadEngine,
+        SchemaDict,
+    )
 
 
 @overload
 def read_database(
     query: str | TextClause | Selectable,
-    connection: ConnectionOrCursor | str,
+    connection: ConnectionOrCursor | Callable[[], ConnectionOrCursor] | str,
     *,
     iter_batches: Literal[False] = ...,
     batch_size: int | None = ...,
     schema_overrides: SchemaDict | None = ...,
     infer_schema_length: int | None = ...,
     execute_options: dict[str, Any] | None = ...,
+    partition_on: str | None = ...,
+    partition_range: tuple[int, int] | None = ...,
+    partition_num: int | None = ...,
 ) -> DataFrame: ...
 
 
 @overload
 def read_database(
     query: str | TextClause | Selectable,
-    connection: ConnectionOrCursor | str,
+    connection: ConnectionOrCursor | Callable[[], ConnectionOrCursor] | str,
     *,
     iter_batches: Literal[True],
     batch_size: int | None = ...,
     schema_overrides: SchemaDict | None = ...,
     infer_schema_length: int | None = ...,
     execute_options: dict[str, Any] | None = ...,
+    partition_on: str | None = ...,
+    partition_range: tuple[int, int] | None = ...,
+    partition_num: int | None = ...,
 ) -> Iterator[DataFrame]: ...
 
 
 @overload
 def read_database(
     query: str | TextClause | Selectable,
-    connection: ConnectionOrCursor | str,
+    connection: ConnectionOrCursor | Callable[[], ConnectionOrCursor] | str,
     *,
     iter_batches: bool,
     batch_size: int | None = ...,
     schema_overrides: SchemaDict | None = ...,
     infer_schema_length: int | None = ...,
     execute_options: dict[str, Any] | None = ...,
+    partition_on: str | None = ...,
+    partition_range: tuple[int, int] | None = ...,
+    partition_num: int | None = ...,
 ) -> DataFrame | Iterator[DataFrame]: ...
 
 
 def read_database(
     query: str | TextClause | Selectable,
-    connection: ConnectionOrCursor | str,
+    connection: ConnectionOrCursor | Callable[[], ConnectionOrCursor] | str,
     *,
     iter_batches: bool = False,
     batch_size: int | None = None,
     schema_overrides: SchemaDict | None = None,
     infer_schema_length: int | None = N_INFER_DEFAULT,
     execute_options: dict[str, Any] | None = None,
+    partition_on: str | None = None,
+    partition_range: tuple[int, int] | None = None,
+    partition_num: int | None = None,
 ) -> DataFrame | Iterator[DataFrame]:
     """
     Read the results of a SQL query into a DataFrame, given a connection object.
@@ -84,6 +111,10 @@ def read_database(
         to Polars. Async driver connections are also supported, though this is currently
         considered unstable.
 
+        When reading with `partition_on`, this should instead be a SQLAlchemy Engine
+        or a callable that returns a new connection each time it is called, as every
+        partition is read on its own connection.
+
         .. warning::
             Use of asynchronous connections is currently considered **unstable**, and
             unexpected issues may arise; if this happens, please report them.
@@ -119,6 +150,18 @@ def read_database(
         as kwargs. In the case of connections made using an ODBC string (which use
         `arrow-odbc`) these options are passed to the `read_arrow_batches_from_odbc`
         method.
+    partition_on
+        The (integer) column on which to partition the query. If set, the query is
+        split into `partition_num` queries on ranges of this column, which are read
+        in parallel (each using its own connection) and then concatenated.
+    partition_range
+        The value range of the partition column; if not set, this is determined by
+        querying the minimum and maximum value. Rows outside of this range are still
+        read (by the first or last partition).
+    partition_num
+        How many partitions to generate.
+
+        .. versionadded:: 1.30.0
 
     Notes
     -----
@@ -193,6 +236,16 @@ def read_database(
     ... ):
     ...     do_something(df)  # doctest: +SKIP
 
+    Read a large table in parallel, with 8 concurrent queries (and connections) that
+    each return a range of "id" values; note that a connection factory is required:
+
+    >>> df = pl.read_database(
+    ...     query="SELECT * FROM test_data",
+    ...     connection=lambda: psycopg2.connect(dsn),
+    ...     partition_on="id",
+    ...     partition_num=8,
+    ... )  # doctest: +SKIP
+
     Load graph database results from a `KùzuDB` connection and a Cypher query:
 
     >>> df = pl.read_database(
@@ -227,6 +280,372 @@ def read_database(
     ... )  # doctest: +SKIP
 
     """  # noqa: W505
+    connection = _resolve_connection_string(connection)
+
+    if partition_on is not None or partition_num is not None:
+        return _read_database_partitioned(
+            query=query,
+            connection=connection,
+            iter_batches=iter_batches,
+            batch_size=batch_size,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+            execute_options=execute_options,
+            partition_on=partition_on,
+            partition_range=partition_range,
+            partition_num=partition_num,
+        )
+
+    # return frame from arbitrary connections using the executor abstraction
+    with ConnectionExecutor(connection) as cx:  # type: ignore[arg-type]
+        return cx.execute(
+            query=query,
+            options=execute_options,
+        ).to_polars(
+            batch_size=batch_size,
+            iter_batches=iter_batches,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+        )
+
+
+@overload
+async def read_database_async(
+    query: str | TextClause | Selectable,
+    connection: ConnectionOrCursor | AsyncAlchemyConnection | str,
+    *,
+    iter_batches: Literal[False] = ...,
+    batch_size: int | None = ...,
+    schema_overrides: SchemaDict | None = ...,
+    infer_schema_length: int | None = ...,
+    execute_options: dict[str, Any] | None = ...,
+) -> DataFrame: ...
+
+
+@overload
+async def read_database_async(
+    query: str | TextClause | Selectable,
+    connection: ConnectionOrCursor | AsyncAlchemyConnection | str,
+    *,
+    iter_batches: Literal[True],
+    batch_size: int | None = ...,
+    schema_overrides: SchemaDict | None = ...,
+    infer_schema_length: int | None = ...,
+    execute_options: dict[str, Any] | None = ...,
+) -> AsyncIterator[DataFrame]: ...
+
+
+@overload
+async def read_database_async(
+    query: str | TextClause | Selectable,
+    connection: ConnectionOrCursor | AsyncAlchemyConnection | str,
+    *,
+    iter_batches: bool,
+    batch_size: int | None = ...,
+    schema_overrides: SchemaDict | None = ...,
+    infer_schema_length: int | None = ...,
+    execute_options: dict[str, Any] | None = ...,
+) -> DataFrame | AsyncIterator[DataFrame]: ...
+
+
+async def read_database_async(
+    query: str | TextClause | Selectable,
+    connection: ConnectionOrCursor | AsyncAlchemyConnection | str,
+    *,
+    iter_batches: bool = False,
+    batch_size: int | None = None,
+    schema_overrides: SchemaDict | None = None,
+    infer_schema_length: int | None = N_INFER_DEFAULT,
+    execute_options: dict[str, Any] | None = None,
+) -> DataFrame | AsyncIterator[DataFrame]:
+    """
+    Read the results of a SQL query into a DataFrame, without blocking the event loop.
+
+    This is the coroutine equivalent of :func:`read_database`, allowing many queries
+    to be executed concurrently (for example, with `asyncio.gather`).
+
+    Parameters
+    ----------
+    query
+        SQL query to execute (if using a SQLAlchemy connection object this can
+        be a suitable "Selectable", otherwise it is expected to be a string).
+    connection
+        An instantiated connection (or cursor/client object) that the query can be
+        executed against; see :func:`read_database`. Async SQLAlchemy connections,
+        engines and sessions are awaited directly. Any other connection is used from
+        a worker thread, so it must support being used from a thread other than the
+        one that created it.
+    iter_batches
+        Return an async iterator of DataFrames, where each DataFrame represents a
+        batch of data returned by the query. Async SQLAlchemy results are streamed
+        from the server, so only a single batch is held in memory at a time.
+    batch_size
+        Indicate the size of each batch when `iter_batches` is True.
+    schema_overrides
+        A dictionary mapping column names to dtypes, used to override the schema
+        inferred from the query cursor or given by the incoming Arrow data.
+    infer_schema_length
+        The maximum number of rows to scan for schema inference. If set to `None`, the
+        full data may be scanned *(this can be slow)*. This parameter only applies if
+        the data is read as a sequence of rows and the `schema_overrides` parameter
+        is not set for the given column; Arrow-aware drivers also ignore this value.
+    execute_options
+        These options will be passed through into the underlying query execution method
+        as kwargs.
+
+    See Also
+    --------
+    read_database : Read the results of a SQL query into a DataFrame.
+
+    Examples
+    --------
+    Run several queries concurrently against an async SQLAlchemy engine:
+
+    >>> from sqlalchemy.ext.asyncio import create_async_engine
+    >>> async_engine = create_async_engine("postgresql+asyncpg://usr@localhost/db")
+    >>> async def load_frames(tables: list[str]) -> list[pl.DataFrame]:
+    ...     return await asyncio.gather(
+    ...         *(
+    ...             pl.read_database_async(f"SELECT * FROM {tbl}", async_engine)
+    ...             for tbl in tables
+    ...         )
+    ...     )
+    >>> frames = asyncio.run(load_frames(["orders", "customers"]))  # doctest: +SKIP
+
+    Stream the result set of a large query in batches:
+
+    >>> async def process(query: str) -> None:
+    ...     async for df in await pl.read_database_async(
+    ...         query, async_engine, iter_batches=True, batch_size=10_000
+    ...     ):
+    ...         await do_something(df)
+    >>> asyncio.run(process("SELECT * FROM events"))  # doctest: +SKIP
+
+    .. versionadded:: 1.30.0
+    """
+    import asyncio
+
+    if (
+        not isinstance(connection, str)
+        and ConnectionExecutor._is_alchemy_object(connection)
+        and (
+            ConnectionExecutor._is_alchemy_async(connection)
+            or (
+                ConnectionExecutor._is_alchemy_engine(connection)
+                and hasattr(connection, "sync_engine")
+            )
+        )
+    ):
+        return await ConnectionExecutor(connection).to_polars_async(
+            query,
+            options=execute_options,
+            iter_batches=iter_batches,
+            batch_size=batch_size,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+        )
+
+    # other connections block while executing, so we use them from a worker thread
+    result = await asyncio.to_thread(
+        read_database,
+        query,
+        cast("ConnectionOrCursor | str", connection),
+        iter_batches=iter_batches,
+        batch_size=batch_size,
+        schema_overrides=schema_overrides,
+        infer_schema_length=infer_schema_length,
+        execute_options=execute_options,
+    )
+    return _iter_frames_in_thread(result) if iter_batches else result  # type: ignore[arg-type,return-value]
+
+
+async def _iter_frames_in_thread(
+    frames: Iterator[DataFrame],
+) -> AsyncIterator[DataFrame]:
+    """Iterate over a (blocking) iterator of frames from a worker thread."""
+    import asyncio
+
+    frames = iter(frames)
+    while (df := await asyncio.to_thread(next, frames, None)) is not None:
+        yield df
+
+
+@unstable()
+def scan_database(
+    query: str,
+    connection: ConnectionOrCursor | str,
+    *,
+    batch_size: int | None = None,
+    schema_overrides: SchemaDict | None = None,
+    infer_schema_length: int | None = N_INFER_DEFAULT,
+    execute_options: dict[str, Any] | None = None,
+) -> LazyFrame:
+    """
+    Lazily read from a database table or the results of a SQL query.
+
+    Unlike deferring a call to :func:`read_database`, the projected columns, simple
+    predicates and any row limit of the resulting LazyFrame query are translated
+    into SQL, so that only the required data is transferred from the database.
+
+    .. warning::
+        This functionality is considered **unstable**. It may be changed
+        at any point without it being considered a breaking change.
+
+    Parameters
+    ----------
+    query
+        Name of a table (or view) to read, or a SQL query to read the results of.
+        A query is wrapped in a subquery, so it should be valid as such.
+    connection
+        An instantiated connection (or cursor/client object) that the query can be
+        executed against, or a valid ODBC connection string; see :func:`read_database`.
+        The connection is used each time the LazyFrame is collected, so it must
+        remain open until then.
+    batch_size
+        The number of rows to fetch from the database at a time; if not set, the
+        batch size requested by the query engine is used.
+    schema_overrides
+        A dictionary mapping column names to dtypes, used to override the schema
+        inferred from the query.
+    infer_schema_length
+        The maximum number of rows to read when inferring the schema of the query
+        (which happens when it is first needed, not when calling this function).
+    execute_options
+        These options will be passed through into the underlying query execution
+        method as kwargs; see :func:`read_database`.
+
+    Notes
+    -----
+    * Comparisons between columns and literals, `is_null`, `is_in`, `is_between`,
+      boolean combinations of these and basic arithmetic are pushed down into the
+      SQL `WHERE` clause. Any other (part of a) predicate is applied by Polars
+      after the data was read.
+
+    * Comparisons of strings are not pushed down, as databases may compare those
+      case-insensitively or according to a collation, which could select different
+      rows than the Polars predicate does.
+
+    * The generated SQL uses the ANSI quoting of identifiers (or the quoting rules
+      of the dialect in case of a SQLAlchemy connection) and a `LIMIT` clause, which
+      is omitted for databases that are known to not support it.
+
+    See Also
+    --------
+    read_database : Read the results of a SQL query into a DataFrame.
+
+    Examples
+    --------
+    Only the "id" and "name" columns of rows with a "value" larger than 100 are
+    read from the "test_data" table:
+
+    >>> lf = pl.scan_database("test_data", connection=user_conn)  # doctest: +SKIP
+    >>> lf.filter(pl.col("value") > 100).select(
+    ...     "id", "name"
+    ... ).collect()  # doctest: +SKIP
+    """
+    if not isinstance(query, str):
+        msg = f"`scan_database` requires a string query or table name; found {qualified_type_name(query)!r}"
+        raise TypeError(msg)
+
+    connection = _resolve_connection_string(connection)
+    driver_name = (
+        "arrow_odbc_proxy"
+        if isinstance(connection, ODBCCursorProxy)
+        else type(connection).__module__.split(".", 1)[0].lower()
+    )
+    quote = _identifier_quoter(connection, driver_name)
+    supports_limit = _supports_limit_clause(connection, driver_name)
+    source = (
+        f"({query}) pl_scan" if re.match(r"\s*(SELECT|WITH)\b", query, re.I) else query
+    )
+
+    def read_batches(sql: str, batch_size: int, schema: SchemaDict | None) -> Any:
+        with ConnectionExecutor(connection) as cx:
+            yield from cx.execute(query=sql, options=execute_options).to_polars(
+                iter_batches=True,
+                batch_size=batch_size,
+                schema_overrides=schema,
+                infer_schema_length=infer_schema_length,
+            )
+
+    def read_frame(sql: str) -> DataFrame:
+        with ConnectionExecutor(connection) as cx:
+            return cx.execute(query=sql, options=execute_options).to_polars(  # type: ignore[return-value]
+                schema_overrides=schema_overrides,
+                infer_schema_length=infer_schema_length,
+            )
+
+    @lru_cache(maxsize=1)
+    def schema() -> SchemaDict:
+        sql = f"SELECT * FROM {source}"
+        n_rows = infer_schema_length or N_INFER_DEFAULT
+        if supports_limit:
+            sql += f" LIMIT {n_rows}"
+        batch = next(iter(read_batches(sql, n_rows, schema_overrides)), None)
+        if batch is None:
+            # empty result; read it as a frame to get the columns (and any dtypes
+            # that can be inferred) from the cursor description
+            batch = read_frame(sql)
+        return Schema({**batch.schema, **(schema_overrides or {})})
+
+    def source_generator(
+        with_columns: list[str] | None,
+        predicate: Expr | None,
+        n_rows: int | None,
+        engine_batch_size: int | None,
+    ) -> Iterator[DataFrame]:
+        columns = with_columns
+        condition, fully_pushed = None, True
+        if predicate is not None:
+            condition, fully_pushed = _predicate_to_sql(predicate, quote, schema())
+            if not fully_pushed and columns is not None:
+                # we need the predicate columns to apply the rest of it ourselves
+                columns = list(dict.fromkeys(columns + predicate.meta.root_names()))
+
+        sql = "SELECT {} FROM {}".format(
+            "*" if columns is None else ", ".join(quote(c) for c in columns),
+            source,
+        )
+        if condition is not None:
+            sql += f" WHERE {condition}"
+        if n_rows is not None and fully_pushed and supports_limit:
+            sql += f" LIMIT {n_rows}"
+
+        for batch in read_batches(
+            sql,
+            batch_size or engine_batch_size or N_INFER_DEFAULT * 1000,
+            schema(),
+        ):
+            if not fully_pushed:
+                batch = batch.filter(predicate)
+            if with_columns is not None:
+                batch = batch.select(with_columns)
+            if n_rows is not None:
+                batch = batch.head(n_rows)
+                n_rows -= batch.height
+            yield batch
+            if n_rows == 0:
+                break
+
+    return register_io_source(source_generator, schema=schema)
+
+
+@overload
+def _resolve_connection_string(
+    connection: ConnectionOrCursor | str,
+) -> ConnectionOrCursor: ...
+
+
+@overload
+def _resolve_connection_string(
+    connection: ConnectionOrCursor | Callable[[], ConnectionOrCursor] | str,
+) -> ConnectionOrCursor | Callable[[], ConnectionOrCursor]: ...
+
+
+def _resolve_connection_string(
+    connection: ConnectionOrCursor | Callable[[], ConnectionOrCursor] | str,
+) -> ConnectionOrCursor | Callable[[], ConnectionOrCursor]:
+    """Return an ODBC cursor proxy if given a valid ODBC connection string."""
     if isinstance(connection, str):
         # check for odbc connection string
         if re.search(r"\bdriver\s*=\s*{[^}]+?}", connection, re.IGNORECASE):
@@ -243,18 +662,63 @@ def read_database(
         else:
             msg = "unable to identify string connection as valid ODBC (no driver)"
             raise ValueError(msg)
+    return connection
 
-    # return frame from arbitrary connections using the executor abstraction
-    with ConnectionExecutor(connection) as cx:
-        return cx.execute(
-            query=query,
-            options=execute_options,
-        ).to_polars(
-            batch_size=batch_size,
-            iter_batches=iter_batches,
-            schema_overrides=schema_overrides,
-            infer_schema_length=infer_schema_length,
-        )
+
+def _read_database_partitioned(
+    query: str | TextClause | Selectable,
+    connection: ConnectionOrCursor | Callable[[], ConnectionOrCursor],
+    *,
+    iter_batches: bool,
+    batch_size: int | None,
+    schema_overrides: SchemaDict | None,
+    infer_schema_length: int | None,
+    execute_options: dict[str, Any] | None,
+    partition_on: str | None,
+    partition_range: tuple[int, int] | None,
+    partition_num: int | None,
+) -> DataFrame:
+    """Validate the partitioning options, and read the partitioned query."""
+    if partition_on is None or partition_num is None:
+        msg = "`partition_on` and `partition_num` must be set together"
+        raise ValueError(msg)
+    elif partition_num < 1:
+        msg = f"`partition_num` must be a positive integer; found {partition_num!r}"
+        raise ValueError(msg)
+    elif iter_batches:
+        msg = "cannot set `iter_batches` when reading with `partition_on`"
+        raise ValueError(msg)
+    elif not isinstance(query, str):
+        msg = f"reading with `partition_on` requires a string query; found {qualified_type_name(query)!r}"
+        raise TypeError(msg)
+
+    connection_factory: Callable[[], ConnectionOrCursor]
+    if isinstance(connection, ODBCCursorProxy):
+        connection_factory = partial(ODBCCursorProxy, connection.connection_string)
+    elif ConnectionExecutor._is_alchemy_object(connection):
+        if not ConnectionExecutor._is_alchemy_engine(connection) or (
+            ConnectionExecutor._is_alchemy_async(connection)
+        ):
+            msg = f"reading with `partition_on` requires a SQLAlchemy Engine (not {qualified_type_name(connection)!r}), as each partition uses its own connection"
+            raise TypeError(msg)
+        connection_factory = connection.connect  # type: ignore[union-attr]
+    elif callable(connection) and not hasattr(connection, "cursor"):
+        connection_factory = connection
+    else:
+        msg = f"reading with `partition_on` requires a connection factory (not {qualified_type_name(connection)!r}), as each partition uses its own connection"
+        raise TypeError(msg)
+
+    return _read_sql_partitioned(
+        query,
+        connection_factory,
+        partition_on=partition_on,
+        partition_range=partition_range,
+        partition_num=partition_num,
+        batch_size=batch_size,
+        schema_overrides=schema_overrides,
+        infer_schema_length=infer_schema_length,
+        execute_options=execute_options,
+    )
 
 
 @overload
@@ -1,6 +1,7 @@
-from polars.io.spreadsheet.functions import read_excel, read_ods
+from polars.io.spreadsheet.functions import read_excel, read_ods, scan_excel
 
 __all__ = [
     "read_excel",
     "read_ods",
+    "scan_excel",
 ]
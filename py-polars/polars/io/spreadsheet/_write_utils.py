@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Sequence
+from functools import lru_cache
 from io import BytesIO
 from os import PathLike
 from pathlib import Path
@@ -9,15 +11,19 @@ from typing import TYPE_CHECKING, Any, overload
 from polars import functions as F
 from polars._utils.various import qualified_type_name
 from polars.datatypes import (
+    Boolean,
+    Categorical,
     Date,
     Datetime,
+    Enum,
     Float64,
     Int64,
+    String,
     Time,
 )
 from polars.datatypes.group import FLOAT_DTYPES, INTEGER_DTYPES
 from polars.dependencies import json
-from polars.exceptions import DuplicateError
+from polars.exceptions import DuplicateError, ModuleUpgradeRequiredError
 from polars.selectors import _expand_selector_dicts, _expand_selectors, numeric
 
 if TYPE_CHECKING:
@@ -44,6 +50,8 @@ def _cluster(iterable: Iterable[Any], n: int = 2) -> Iterable[Any]:
     return zip(*[iter(iterable)] * n)
 
 
+_XL_DEFAULT_CHAR_WIDTH_ = 8
+_XL_MAX_AUTOFIT_WIDTH_ = 1790
 _XL_DEFAULT_FLOAT_FORMAT_ = "#,##0.000;[Red]-#,##0.000"
 _XL_DEFAULT_INTEGER_FORMAT_ = "#,##0;[Red]-#,##0"
 _XL_DEFAULT_DTYPE_FORMATS_: dict[PolarsDataType, str] = {
@@ -158,6 +166,83 @@ def _xl_apply_conditional_formats(
             ws.conditional_format(col_range, fmt)
 
 
+@lru_cache(maxsize=1)
+def _xl_char_width_classes() -> dict[int, str]:
+    """Return regex character classes for chars with a non-default pixel width."""
+    from xlsxwriter.utility import CHAR_WIDTHS
+
+    classes: dict[int, list[str]] = {}
+    for char, width in CHAR_WIDTHS.items():
+        if width != _XL_DEFAULT_CHAR_WIDTH_:
+            classes.setdefault(width, []).append(re.escape(char))
+    return {width: f"[{''.join(chars)}]" for width, chars in classes.items()}
+
+
+def _xl_pixel_width(expr: Expr, char_width_classes: dict[int, str]) -> Expr:
+    """Vectorised equivalent of xlsxwriter's `xl_pixel_width` for string data."""
+    width = expr.str.len_chars() * _XL_DEFAULT_CHAR_WIDTH_
+    for char_width, char_class in char_width_classes.items():
+        width += expr.str.count_matches(char_class) * (
+            char_width - _XL_DEFAULT_CHAR_WIDTH_
+        )
+    return width
+
+
+def _xl_autofit_column_widths(
+    df: DataFrame,
+    ws: Worksheet,
+    *,
+    include_header: bool,
+    autofilter: bool,
+) -> dict[str, int]:
+    """
+    Calculate column widths (in pixels) that fit the frame data.
+
+    Applies the same heuristics as `Worksheet.autofit`, but evaluates them as
+    frame expressions instead of visiting every worksheet cell (which is also
+    not possible for worksheets written in "constant_memory" mode).
+    """
+    try:
+        from xlsxwriter.utility import xl_pixel_width
+
+        char_width_classes = _xl_char_width_classes()
+    except ImportError:
+        import xlsxwriter
+
+        xlv = xlsxwriter.__version__
+        msg = f"`autofit=True` requires xlsxwriter 3.0.8 or higher, found {xlv}"
+        raise ModuleUpgradeRequiredError(msg) from None
+
+    widths = []
+    for col, tp in df.schema.items():
+        if tp == Boolean:
+            width = F.when(F.col(col)).then(31).when(~F.col(col)).then(36).max()
+        elif tp.is_temporal():
+            width = F.col(col).is_not_null().any() * ws.default_date_pixels
+        elif tp.is_numeric():
+            width = F.col(col).cast(String).str.len_chars().max() * 7
+        elif tp in (String, Categorical, Enum):
+            lines = F.col(col).cast(String).str.split("\n").explode()
+            width = _xl_pixel_width(lines, char_width_classes).max()
+        else:
+            width = F.lit(0)
+        widths.append(width.fill_null(0).cast(Int64).alias(col))
+
+    pixel_widths = df.select(widths).row(0, named=True) if widths else {}
+    if include_header:
+        for col in df.columns:
+            if header_width := xl_pixel_width(col):
+                header_width += 16 if autofilter else 0  # dropdown arrow
+                pixel_widths[col] = max(pixel_widths[col], header_width)
+
+    # note: excel adds 7 pixels of padding (and has a maximum column width)
+    return {
+        col: min(width + 7, _XL_MAX_AUTOFIT_WIDTH_)
+        for col, width in pixel_widths.items()
+        if width > 0
+    }
+
+
 @overload
 def _xl_column_range(
     df: DataFrame,
@@ -568,12 +653,17 @@ def _xl_worksheet_in_workbook(
 def _xl_setup_workbook(
     workbook: Workbook | BytesIO | Path | str | None,
     worksheet: str | Worksheet | None = None,
+    *,
+    constant_memory: bool = False,
 ) -> tuple[Workbook, Worksheet, bool]:
     """Establish the target Excel workbook and worksheet."""
     from xlsxwriter import Workbook
     from xlsxwriter.worksheet import Worksheet
 
     if isinstance(workbook, Workbook):
+        if constant_memory and not workbook.constant_memory:
+            msg = 'the given workbook object was not created with `{"constant_memory": True}`'
+            raise ValueError(msg)
         wb, can_close = workbook, False
         ws = (
             worksheet
@@ -591,6 +681,7 @@ def _xl_setup_workbook(
             "nan_inf_to_errors": True,
             "strings_to_formulas": False,
             "default_date_format": _XL_DEFAULT_DTYPE_FORMATS_[Date],
+            "constant_memory": constant_memory,
         }
         if isinstance(workbook, BytesIO):
             wb, ws, can_close = Workbook(workbook, workbook_options), None, True
@@ -645,3 +736,34 @@ def _xl_unique_table_name(wb: Workbook) -> str:
         n += 1
         table_name = f"{table_prefix}{n}"
     return table_name
+
+
+def _xl_write_rows(
+    ws: Worksheet,
+    df: DataFrame,
+    *,
+    first_row: int,
+    first_col: int,
+    formats: Sequence[Format | None],
+    skip_columns: Iterable[str] = (),
+    batch_size: int = 10_000,
+) -> None:
+    """
+    Write frame data into the worksheet one row at a time.
+
+    Rows are materialised in batches (rather than all at once) and written in
+    ascending order, which is what worksheets in "constant_memory" mode require.
+    """
+    skip = set(skip_columns)
+    columns = [
+        (first_col + idx, fmt)
+        for idx, (col, fmt) in enumerate(zip(df.columns, formats))
+        if col not in skip
+    ]
+    if skip:
+        df = df.select(col for col in df.columns if col not in skip)
+
+    write = ws.write
+    for row_idx, row in enumerate(df.iter_rows(buffer_size=batch_size), first_row):
+        for (col_idx, fmt), value in zip(columns, row):
+            write(row_idx, col_idx, value, fmt)
@@ -5,7 +5,11 @@ import re
 import warnings
 from collections import defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
 from datetime import time
+from functools import lru_cache, partial
 from glob import glob
 from io import BufferedReader, BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
@@ -18,6 +22,7 @@ from polars._utils.deprecation import (
     deprecate_renamed_parameter,
     issue_deprecation_warning,
 )
+from polars._utils.unstable import unstable
 from polars._utils.various import deduplicate_names, normalize_filepath, parse_version
 from polars.datatypes import (
     N_INFER_DEFAULT,
@@ -41,11 +46,14 @@ from polars.exceptions import (
 from polars.functions import concat
 from polars.io._utils import looks_like_url, process_file_url
 from polars.io.csv.functions import read_csv
+from polars.meta import thread_pool_size
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from typing import Literal
 
     from polars._typing import ExcelSpreadsheetEngine, FileSource, SchemaDict
+    from polars.schema import Schema
 
 
 def _sources(source: FileSource) -> tuple[Any, bool]:
@@ -399,26 +407,23 @@ def read_excel(
     ... )  # doctest: +SKIP
     """
     sources, read_multiple_workbooks = _sources(source)
-    frames: list[pl.DataFrame] | list[dict[str, pl.DataFrame]] = [  # type: ignore[assignment]
-        _read_spreadsheet(
-            src,
-            sheet_id=sheet_id,
-            sheet_name=sheet_name,
-            table_name=table_name,
-            engine=engine,
-            engine_options=engine_options,
-            read_options=read_options,
-            schema_overrides=schema_overrides,
-            infer_schema_length=infer_schema_length,
-            include_file_paths=include_file_paths,
-            raise_if_empty=raise_if_empty,
-            has_header=has_header,
-            columns=columns,
-            drop_empty_rows=drop_empty_rows,
-            drop_empty_cols=drop_empty_cols,
-        )
-        for src in sources
-    ]
+    frames = _read_workbooks(
+        sources,
+        sheet_id=sheet_id,
+        sheet_name=sheet_name,
+        table_name=table_name,
+        engine=engine,
+        engine_options=engine_options,
+        read_options=read_options,
+        schema_overrides=schema_overrides,
+        infer_schema_length=infer_schema_length,
+        include_file_paths=include_file_paths,
+        raise_if_empty=raise_if_empty,
+        has_header=has_header,
+        columns=columns,
+        drop_empty_rows=drop_empty_rows,
+        drop_empty_cols=drop_empty_cols,
+    )
     return _unpack_read_results(
         frames=frames,
         read_multiple_workbooks=read_multiple_workbooks,
@@ -612,32 +617,207 @@ def read_ods(
     ... )  # doctest: +SKIP
     """
     sources, read_multiple_workbooks = _sources(source)
-    frames: list[pl.DataFrame] | list[dict[str, pl.DataFrame]] = [  # type: ignore[assignment]
-        _read_spreadsheet(
-            src,
-            sheet_id=sheet_id,
-            sheet_name=sheet_name,
-            table_name=None,
-            engine="calamine",
-            engine_options={},
-            read_options=None,
-            schema_overrides=schema_overrides,
-            infer_schema_length=infer_schema_length,
-            include_file_paths=include_file_paths,
-            raise_if_empty=raise_if_empty,
-            drop_empty_rows=drop_empty_rows,
-            drop_empty_cols=drop_empty_cols,
-            has_header=has_header,
-            columns=columns,
-        )
-        for src in sources
-    ]
+    frames = _read_workbooks(
+        sources,
+        sheet_id=sheet_id,
+        sheet_name=sheet_name,
+        table_name=None,
+        engine="calamine",
+        engine_options={},
+        read_options=None,
+        schema_overrides=schema_overrides,
+        infer_schema_length=infer_schema_length,
+        include_file_paths=include_file_paths,
+        raise_if_empty=raise_if_empty,
+        drop_empty_rows=drop_empty_rows,
+        drop_empty_cols=drop_empty_cols,
+        has_header=has_header,
+        columns=columns,
+    )
     return _unpack_read_results(
         frames=frames,
         read_multiple_workbooks=read_multiple_workbooks,
     )
 
 
+@unstable()
+def scan_excel(
+    source: str | Path | IO[bytes] | bytes,
+    *,
+    sheet_id: int | None = None,
+    sheet_name: str | None = None,
+    has_header: bool = True,
+    schema_overrides: SchemaDict | None = None,
+    infer_schema_length: int | None = N_INFER_DEFAULT,
+    drop_empty_rows: bool = True,
+) -> pl.LazyFrame:
+    """
+    Lazily read data from an Excel (or OpenOffice) spreadsheet.
+
+    The sheet is parsed with the "calamine" engine each time the LazyFrame is
+    collected, only converting the columns (and rows) required by the query.
+
+    .. warning::
+        This functionality is considered **unstable**. It may be changed
+        at any point without it being considered a breaking change.
+
+    Parameters
+    ----------
+    source
+        Path to a file or a file-like object (by "file-like object" we refer to
+        objects that have a `read()` method, such as a file handler like the builtin
+        `open` function, or a `BytesIO` instance).
+    sheet_id
+        Sheet number to read, starting from 1 (defaults to `1` if neither this nor
+        `sheet_name` are specified).
+    sheet_name
+        Sheet name to read; cannot be used in conjunction with `sheet_id`.
+    has_header
+        Indicate if the first row of the table data is a header or not. If False,
+        column names will be autogenerated in the following format: `column_x`, with
+        `x` being an enumeration over every column in the dataset, starting at 1.
+    schema_overrides
+        Support type specification or override of one or more columns.
+    infer_schema_length
+        The maximum number of rows to scan for schema inference (which happens when
+        the schema is first needed, not when calling this function). If set to
+        `None`, the entire sheet is scanned to determine the dtypes.
+    drop_empty_rows
+        Indicate whether to omit empty rows when reading data into the DataFrame.
+        As this requires all columns to be read, set to False in order to only
+        read the projected columns (and rows) of a query from the sheet.
+
+    Notes
+    -----
+    Unlike :func:`read_excel`, the dtypes of the resulting LazyFrame only depend on
+    the first `infer_schema_length` rows; float columns that only contain integer
+    values (or datetime columns that only contain dates) are not downcast, and
+    unnamed columns that are empty are not dropped.
+
+    See Also
+    --------
+    read_excel
+
+    Examples
+    --------
+    >>> pl.scan_excel("test.xlsx", sheet_name="data").select("id", "value").head(
+    ...     100
+    ... ).collect()  # doctest: +SKIP
+    """
+    from polars.io.plugins import register_io_source
+
+    if isinstance(source, (str, os.PathLike)):
+        source = normalize_filepath(source)
+        if looks_like_url(source):
+            source = process_file_url(source)
+    calamine_source = _calamine_source(source)
+
+    with _open_spreadsheet_parser("calamine", calamine_source, {}) as (
+        _,
+        _,
+        worksheets,
+    ):
+        sheet_names, return_multiple_sheets = _get_sheet_names(
+            sheet_id, sheet_name, None, worksheets
+        )
+    if return_multiple_sheets:
+        msg = f"`scan_excel` reads a single sheet; found `sheet_id` {sheet_id!r}"
+        raise ValueError(msg)
+
+    read_options = _get_read_options(
+        None,
+        engine="calamine",
+        columns=None,
+        has_header=has_header,
+        infer_schema_length=infer_schema_length,
+    )
+    all_overrides = dict(schema_overrides or {})
+
+    def read_sheet(columns: list[str] | None, n_rows: int | None) -> pl.DataFrame:
+        # note: calamine parsers can't be shared between threads, so we open
+        # a new one each time (this is cheap compared to parsing the sheet)
+        options = deepcopy(read_options)
+        if n_rows is not None:
+            options["n_rows"] = n_rows
+
+        overrides, use_columns = all_overrides, columns
+        if columns is not None:
+            overrides = {k: v for k, v in overrides.items() if k in columns}
+            if not has_header:
+                # the parser generates its own names for headerless columns, and
+                # `column_x` names are assigned by position after reading (so
+                # overrides are left to the cast applied by the scan)
+                positions = sorted(int(c.removeprefix("column_")) for c in columns)
+                columns = [f"column_{n}" for n in positions]
+                use_columns = [f"__UNNAMED__{n - 1}" for n in positions]
+                overrides = {}
+
+        with _open_spreadsheet_parser("calamine", calamine_source, {}) as (
+            _,
+            parser,
+            _,
+        ):
+            df = _read_spreadsheet_calamine(
+                parser,
+                sheet_name=sheet_names[0],
+                read_options=options,
+                schema_overrides=overrides,
+                columns=use_columns,
+                drop_empty_rows=False,
+                drop_empty_cols=False,
+                raise_if_empty=False,
+                refine_dtypes=False,
+            )
+        if columns and not has_header:
+            df.columns = columns
+        return df
+
+    @lru_cache(maxsize=1)
+    def schema() -> Schema:
+        return read_sheet(None, n_rows=infer_schema_length).collect_schema()
+
+    def source_generator(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,
+    ) -> Iterator[pl.DataFrame]:
+        # empty rows are identified from all columns; row limits can only be
+        # applied by the engine if no rows are removed after reading them
+        pushdown = not drop_empty_rows
+        df = read_sheet(
+            with_columns if pushdown else None,
+            n_rows if (pushdown and predicate is None) else None,
+        )
+        df = df.cast({name: dtype for name, dtype in schema().items() if name in df})
+        if drop_empty_rows:
+            df = df.filter(~F.all_horizontal(F.all().is_null()))
+        if predicate is not None:
+            df = df.filter(predicate)
+        if with_columns is not None:
+            df = df.select(with_columns)
+        if n_rows is not None:
+            df = df.head(n_rows)
+        yield df
+
+    return register_io_source(source_generator, schema=schema)
+
+
+def _read_workbooks(
+    sources: list[Any], *, engine: ExcelSpreadsheetEngine, **kwargs: Any
+) -> list[pl.DataFrame] | list[dict[str, pl.DataFrame]]:
+    """Read data from the given workbooks (concurrently, if using calamine)."""
+
+    def read_workbook(src: Any) -> Any:
+        return _read_spreadsheet(src, engine=engine, **kwargs)
+
+    if engine == "calamine" and len(sources) > 1:
+        n_threads = min(len(sources), thread_pool_size())
+        with ThreadPoolExecutor(max_workers=n_threads) as pool:
+            return list(pool.map(read_workbook, sources))
+    return [read_workbook(src) for src in sources]
+
+
 def _read_spreadsheet(
     source: str | IO[bytes] | bytes,
     *,
@@ -671,6 +851,10 @@ def _read_spreadsheet(
     engine_options = (engine_options or {}).copy()
     schema_overrides = dict(schema_overrides or {})
 
+    if engine == "calamine":
+        # note: ensure that we can open the source more than once (see below)
+        source = _calamine_source(source)
+
     # establish the reading function, parser, and available worksheets
     reader_fn, parser, worksheets = _initialise_spreadsheet_parser(
         engine, source, engine_options
@@ -680,20 +864,44 @@ def _read_spreadsheet(
         sheet_names, return_multiple_sheets = _get_sheet_names(
             sheet_id, sheet_name, table_name, worksheets
         )
-        parsed_sheets = {
-            name: reader_fn(
-                parser=parser,
-                sheet_name=name,
-                schema_overrides=schema_overrides,
-                read_options=read_options,
-                raise_if_empty=raise_if_empty,
-                columns=columns,
-                table_name=table_name,
-                drop_empty_rows=drop_empty_rows,
-                drop_empty_cols=drop_empty_cols,
-            )
-            for name in sheet_names
-        }
+        read_sheet = partial(
+            reader_fn,
+            schema_overrides=schema_overrides,
+            raise_if_empty=raise_if_empty,
+            columns=columns,
+            table_name=table_name,
+            drop_empty_rows=drop_empty_rows,
+            drop_empty_cols=drop_empty_cols,
+        )
+        if engine == "calamine" and len(sheet_names) > 1:
+            # calamine parsers can't be shared between threads, but each sheet
+            # can be parsed concurrently by a parser of its own
+            parser_options = engine_options
+
+            def read_sheet_in_thread(name: str) -> pl.DataFrame:
+                with _open_spreadsheet_parser(engine, source, parser_options) as (
+                    _,
+                    sheet_parser,
+                    _,
+                ):
+                    return read_sheet(
+                        parser=sheet_parser,
+                        sheet_name=name,
+                        read_options=deepcopy(read_options),
+                    )
+
+            n_threads = min(len(sheet_names), thread_pool_size())
+            with ThreadPoolExecutor(max_workers=n_threads) as pool:
+                parsed_sheets = dict(
+                    zip(sheet_names, pool.map(read_sheet_in_thread, sheet_names))
+                )
+        else:
+            parsed_sheets = {
+                name: read_sheet(
+                    parser=parser, sheet_name=name, read_options=read_options
+                )
+                for name in sheet_names
+            }
     finally:
         if hasattr(parser, "close"):
             parser.close()
@@ -857,28 +1065,7 @@ def _initialise_spreadsheet_parser(
 
     elif engine == "calamine":
         fastexcel = import_optional("fastexcel", min_version="0.7.0")
-        reading_bytesio, reading_bytes = (
-            isinstance(source, BytesIO),
-            isinstance(source, bytes),
-        )
-        if (reading_bytesio or reading_bytes) and parse_version(
-            module_version := fastexcel.__version__
-        ) < (0, 10):
-            msg = f"`fastexcel` >= 0.10 is required to read bytes; found {module_version})"
-            raise ModuleUpgradeRequiredError(msg)
-
-        if reading_bytesio:
-            source = source.getvalue()  # type: ignore[union-attr]
-        elif isinstance(source, (BufferedReader, TextIOWrapper)):
-            if "b" not in source.mode:
-                msg = f"file {source.name!r} must be opened in binary mode"
-                raise OSError(msg)
-            elif (filename := source.name) and Path(filename).exists():
-                source = filename
-            else:
-                source = source.read()
-
-        parser = fastexcel.read_excel(source, **engine_options)
+        parser = fastexcel.read_excel(_calamine_source(source), **engine_options)
         sheets = [
             {"index": i + 1, "name": nm} for i, nm in enumerate(parser.sheet_names)
         ]
@@ -888,6 +1075,50 @@ def _initialise_spreadsheet_parser(
     raise NotImplementedError(msg)
 
 
+@contextmanager
+def _open_spreadsheet_parser(
+    engine: str | None,
+    source: str | IO[bytes] | bytes,
+    engine_options: dict[str, Any],
+) -> Iterator[tuple[Callable[..., pl.DataFrame], Any, list[dict[str, Any]]]]:
+    """Instantiate a spreadsheet parser, releasing it (and its file) on exit."""
+    reader_fn, parser, worksheets = _initialise_spreadsheet_parser(
+        engine, source, engine_options
+    )
+    try:
+        yield reader_fn, parser, worksheets
+    finally:
+        if hasattr(parser, "close"):
+            parser.close()
+        del parser
+
+
+def _calamine_source(source: str | IO[bytes] | bytes) -> str | bytes:
+    """Normalise the source to a file path or bytes (that can be read repeatedly)."""
+    fastexcel = import_optional("fastexcel", min_version="0.7.0")
+    reading_bytesio, reading_bytes = (
+        isinstance(source, BytesIO),
+        isinstance(source, bytes),
+    )
+    if (reading_bytesio or reading_bytes) and parse_version(
+        module_version := fastexcel.__version__
+    ) < (0, 10):
+        msg = f"`fastexcel` >= 0.10 is required to read bytes; found {module_version})"
+        raise ModuleUpgradeRequiredError(msg)
+
+    if reading_bytesio:
+        source = source.getvalue()  # type: ignore[union-attr]
+    elif isinstance(source, (BufferedReader, TextIOWrapper)):
+        if "b" not in source.mode:
+            msg = f"file {source.name!r} must be opened in binary mode"
+            raise OSError(msg)
+        elif (filename := source.name) and Path(filename).exists():
+            source = filename
+        else:
+            source = source.read()
+    return source  # type: ignore[return-value]
+
+
 def _csv_buffer_to_frame(
     csv: StringIO,
     *,
@@ -1022,6 +1253,7 @@ def _read_spreadsheet_calamine(
     drop_empty_rows: bool,
     drop_empty_cols: bool,
     raise_if_empty: bool,
+    refine_dtypes: bool = True,
 ) -> pl.DataFrame:
     # if we have 'schema_overrides' and a more recent version of `fastexcel`
     # we can pass translated dtypes to the engine to refine the initial parse
@@ -1126,9 +1358,9 @@ def _read_spreadsheet_calamine(
     if df.is_empty():
         df = df.cast({Null: String})
 
-    # further refine dtypes
+    # further refine dtypes (unless they must not depend on the data)
     type_checks = []
-    for c, dtype in df.schema.items():
+    for c, dtype in df.schema.items() if refine_dtypes else ():
         if c not in schema_overrides:
             # may read integer data as float; cast back to int where possible.
             if dtype in FLOAT_DTYPES:
@@ -1,9 +1,13 @@
 from polars.lazyframe.engine_config import GPUEngine
 from polars.lazyframe.frame import LazyFrame
 from polars.lazyframe.opt_flags import QueryOptFlags
+from polars.lazyframe.query_metrics import QueryMetrics
+from polars.lazyframe.result_cache import ResultCache
 
 __all__ = [
     "GPUEngine",
     "LazyFrame",
+    "QueryMetrics",
     "QueryOptFlags",
+    "ResultCache",
 ]
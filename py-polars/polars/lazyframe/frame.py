@@ -10,6 +10,7 @@ from functools import lru_cache, partial, reduce
 from io import BytesIO, StringIO
 from operator import and_
 from pathlib import Path
+from time import perf_counter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -97,6 +98,7 @@ from polars.lazyframe.engine_config import GPUEngine
 from polars.lazyframe.group_by import LazyGroupBy
 from polars.lazyframe.in_process import InProcessQuery
 from polars.lazyframe.opt_flags import DEFAULT_QUERY_OPT_FLAGS, forward_old_opt_flags
+from polars.lazyframe.query_metrics import get_query_callback, report_query
 from polars.schema import Schema
 from polars.selectors import by_dtype, expand_selector
 
@@ -110,9 +112,10 @@ if TYPE_CHECKING:
     from typing import IO, Literal
 
     from polars.lazyframe.opt_flags import QueryOptFlags
+    from polars.lazyframe.result_cache import ResultCache
 
     with contextlib.suppress(ImportError):  # Module not available when building docs
-        from polars.polars import PyPartitioning
+        from polars.polars import PyDataFrame, PyPartitioning
 
     from polars import DataFrame, DataType, Expr
     from polars._typing import (
@@ -172,7 +175,12 @@ def _select_engine(engine: EngineType) -> EngineType:
 
 
 def _to_sink_target(
-    path: str | Path | IO[bytes] | IO[str] | PartitioningScheme,
+    path: str
+    | Path
+    | IO[bytes]
+    | IO[str]
+    | Callable[[bytes], Any]
+    | PartitioningScheme,
 ) -> str | Path | IO[bytes] | IO[str] | PyPartitioning:
     if isinstance(path, (str, Path)):
         return normalize_filepath(path)
@@ -180,6 +188,10 @@ def _to_sink_target(
         return path
     elif isinstance(path, PartitioningScheme):
         return path._py_partitioning
+    elif callable(path) or hasattr(path, "write"):
+        from polars.io._utils import writer_from_callback
+
+        return writer_from_callback(path)
     else:
         msg = f"`path` argument has invalid type {qualified_type_name(path)!r}, and cannot be turned into a sink target"
         raise TypeError(msg)
@@ -2060,6 +2072,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         engine: EngineType = "auto",
         background: Literal[False] = False,
         optimizations: QueryOptFlags = DEFAULT_QUERY_OPT_FLAGS,
+        cache: ResultCache | None = None,
     ) -> DataFrame: ...
 
     @deprecate_streaming_parameter()
@@ -2080,6 +2093,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         engine: EngineType = "auto",
         background: bool = False,
         optimizations: QueryOptFlags = DEFAULT_QUERY_OPT_FLAGS,
+        cache: ResultCache | None = None,
         **_kwargs: Any,
     ) -> DataFrame | InProcessQuery:
         """
@@ -2176,6 +2190,17 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
             .. warning::
                 This functionality is considered **unstable**. It may be changed
                 at any point without it being considered a breaking change.
+        cache
+            A :class:`ResultCache` in which to look up the result of this query
+            before running it, and to store the result after running it. Cached
+            results are memory-mapped, so repeat runs of the same query (on unchanged
+            source files) are served without executing it.
+
+            .. warning::
+                This functionality is considered **unstable**. It may be changed
+                at any point without it being considered a breaking change.
+
+            .. versionadded:: 1.30.0
 
         Returns
         -------
@@ -2259,6 +2284,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
             if k not in (  # except "private" kwargs
                 "new_streaming",
                 "post_opt_callback",
+                "query_kind",
             ):
                 error_msg = f"collect() got an unexpected keyword argument '{k}'"
                 raise TypeError(error_msg)
@@ -2288,12 +2314,40 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
 
         ldf = self._ldf.with_optimizations(optimizations._pyoptflags)
         if background:
+            if cache is not None:
+                msg = "cannot use a result `cache` in background mode"
+                raise ValueError(msg)
             issue_unstable_warning("background mode is considered unstable.")
             return InProcessQuery(ldf.collect_concurrently())
 
+        cache_key = None
+        if cache is not None:
+            issue_unstable_warning("the result cache is considered unstable.")
+            cache_key = cache._query_key(self._ldf)
+            if cache_key is not None and (df := cache._load(cache_key)) is not None:
+                return df
+
         # Only for testing purposes
         callback = _kwargs.get("post_opt_callback", callback)
-        return wrap_df(ldf.collect(engine, callback))
+
+        query_callback = get_query_callback()
+        if query_callback is None or optimizations._pyoptflags.eager:
+            df = wrap_df(ldf.collect(engine, callback))
+        else:
+            start_counter = perf_counter()
+            df = wrap_df(ldf.collect(engine, callback))
+            report_query(
+                query_callback,
+                ldf,
+                kind=_kwargs.get("query_kind", "collect"),
+                engine=engine,
+                start_counter=start_counter,
+                n_rows=df.height,
+            )
+
+        if cache is not None and cache_key is not None:
+            cache._store(cache_key, df)
+        return df
 
     @overload
     def collect_async(
@@ -2413,7 +2467,25 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         result: _GeventDataFrameResult[DataFrame] | _AioDataFrameResult[DataFrame] = (
             _GeventDataFrameResult() if gevent else _AioDataFrameResult()
         )
-        ldf.collect_with_callback(engine, result._callback)
+        on_result = result._callback
+        if (query_callback := get_query_callback()) is not None:
+            start_counter = perf_counter()
+
+            def on_result(obj: PyDataFrame | Exception) -> None:
+                try:
+                    if not isinstance(obj, Exception):
+                        report_query(
+                            query_callback,
+                            ldf,
+                            kind="collect_async",
+                            engine="gpu" if isinstance(engine, GPUEngine) else engine,
+                            start_counter=start_counter,
+                            n_rows=obj.height(),
+                        )
+                finally:
+                    result._callback(obj)
+
+        ldf.collect_with_callback(engine, on_result)
         return result
 
     def collect_schema(self) -> Schema:
@@ -2451,7 +2523,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
     @overload
     def sink_parquet(
         self,
-        path: str | Path | IO[bytes] | PartitioningScheme,
+        path: str | Path | IO[bytes] | Callable[[bytes], Any] | PartitioningScheme,
         *,
         compression: str = "zstd",
         compression_level: int | None = None,
@@ -2479,7 +2551,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
     @overload
     def sink_parquet(
         self,
-        path: str | Path | IO[bytes] | PartitioningScheme,
+        path: str | Path | IO[bytes] | Callable[[bytes], Any] | PartitioningScheme,
         *,
         compression: str = "zstd",
         compression_level: int | None = None,
@@ -2506,7 +2578,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
 
     def sink_parquet(
         self,
-        path: str | Path | IO[bytes] | PartitioningScheme,
+        path: str | Path | IO[bytes] | Callable[[bytes], Any] | PartitioningScheme,
         *,
         compression: str = "zstd",
         compression_level: int | None = None,
@@ -2538,7 +2610,15 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         Parameters
         ----------
         path
-            File path to which the file should be written.
+            File path or writable file-like object to which the file should be
+            written. The output can also be streamed to a callback, or to any other
+            object with a `write` method, which is sent successive blocks of `bytes`
+            as the query runs; small writes are buffered (up to 1 MB), and while a
+            callback blocks the streaming engine is held back, so memory use stays
+            bounded.
+
+            .. versionchanged:: 1.30.0
+                Callbacks and objects with a `write` method are accepted.
         compression : {'lz4', 'uncompressed', 'snappy', 'gzip', 'lzo', 'brotli', 'zstd'}
             Choose "zstd" for good compression performance.
             Choose "lz4" for fast compression/decompression.
@@ -2771,14 +2851,14 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         if not lazy:
             ldf = ldf.with_optimizations(optimizations._pyoptflags)
             ldf = LazyFrame._from_pyldf(ldf)
-            ldf.collect(engine=engine)
+            ldf.collect(engine=engine, query_kind="sink")
             return None
         return LazyFrame._from_pyldf(ldf)
 
     @overload
     def sink_ipc(
         self,
-        path: str | Path | IO[bytes] | PartitioningScheme,
+        path: str | Path | IO[bytes] | Callable[[bytes], Any] | PartitioningScheme,
         *,
         compression: IpcCompression | None = "zstd",
         compat_level: CompatLevel | None = None,
@@ -2798,7 +2878,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
     @overload
     def sink_ipc(
         self,
-        path: str | Path | IO[bytes] | PartitioningScheme,
+        path: str | Path | IO[bytes] | Callable[[bytes], Any] | PartitioningScheme,
         *,
         compression: IpcCompression | None = "zstd",
         compat_level: CompatLevel | None = None,
@@ -2817,7 +2897,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
 
     def sink_ipc(
         self,
-        path: str | Path | IO[bytes] | PartitioningScheme,
+        path: str | Path | IO[bytes] | Callable[[bytes], Any] | PartitioningScheme,
         *,
         compression: IpcCompression | None = "uncompressed",
         compat_level: CompatLevel | None = None,
@@ -2841,7 +2921,15 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         Parameters
         ----------
         path
-            File path to which the file should be written.
+            File path or writable file-like object to which the file should be
+            written. The output can also be streamed to a callback, or to any other
+            object with a `write` method, which is sent successive blocks of `bytes`
+            as the query runs; small writes are buffered (up to 1 MB), and while a
+            callback blocks the streaming engine is held back, so memory use stays
+            bounded.
+
+            .. versionchanged:: 1.30.0
+                Callbacks and objects with a `write` method are accepted.
         compression : {'uncompressed', 'lz4', 'zstd'}
             Choose "zstd" for good compression performance.
             Choose "lz4" for fast compression/decompression.
@@ -2975,14 +3063,19 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         if not lazy:
             ldf = ldf.with_optimizations(optimizations._pyoptflags)
             ldf = LazyFrame._from_pyldf(ldf)
-            ldf.collect(engine=engine)
+            ldf.collect(engine=engine, query_kind="sink")
             return None
         return LazyFrame._from_pyldf(ldf)
 
     @overload
     def sink_csv(
         self,
-        path: str | Path | IO[bytes] | IO[str] | PartitioningScheme,
+        path: str
+        | Path
+        | IO[bytes]
+        | IO[str]
+        | Callable[[bytes], Any]
+        | PartitioningScheme,
         *,
         include_bom: bool = False,
         include_header: bool = True,
@@ -3013,7 +3106,12 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
     @overload
     def sink_csv(
         self,
-        path: str | Path | IO[bytes] | IO[str] | PartitioningScheme,
+        path: str
+        | Path
+        | IO[bytes]
+        | IO[str]
+        | Callable[[bytes], Any]
+        | PartitioningScheme,
         *,
         include_bom: bool = False,
         include_header: bool = True,
@@ -3043,7 +3141,12 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
 
     def sink_csv(
         self,
-        path: str | Path | IO[bytes] | IO[str] | PartitioningScheme,
+        path: str
+        | Path
+        | IO[bytes]
+        | IO[str]
+        | Callable[[bytes], Any]
+        | PartitioningScheme,
         *,
         include_bom: bool = False,
         include_header: bool = True,
@@ -3078,7 +3181,15 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         Parameters
         ----------
         path
-            File path to which the file should be written.
+            File path or writable file-like object to which the file should be
+            written. The output can also be streamed to a callback, or to any other
+            object with a `write` method, which is sent successive blocks of `bytes`
+            as the query runs; small writes are buffered (up to 1 MB), and while a
+            callback blocks the streaming engine is held back, so memory use stays
+            bounded.
+
+            .. versionchanged:: 1.30.0
+                Callbacks and objects with a `write` method are accepted.
         include_bom
             Whether to include UTF-8 BOM in the CSV output.
         include_header
@@ -3263,14 +3374,19 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         if not lazy:
             ldf = ldf.with_optimizations(optimizations._pyoptflags)
             ldf = LazyFrame._from_pyldf(ldf)
-            ldf.collect(engine=engine)
+            ldf.collect(engine=engine, query_kind="sink")
             return None
         return LazyFrame._from_pyldf(ldf)
 
     @overload
     def sink_ndjson(
         self,
-        path: str | Path | IO[bytes] | IO[str] | PartitioningScheme,
+        path: str
+        | Path
+        | IO[bytes]
+        | IO[str]
+        | Callable[[bytes], Any]
+        | PartitioningScheme,
         *,
         maintain_order: bool = True,
         storage_options: dict[str, Any] | None = None,
@@ -3288,7 +3404,12 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
     @overload
     def sink_ndjson(
         self,
-        path: str | Path | IO[bytes] | IO[str] | PartitioningScheme,
+        path: str
+        | Path
+        | IO[bytes]
+        | IO[str]
+        | Callable[[bytes], Any]
+        | PartitioningScheme,
         *,
         maintain_order: bool = True,
         storage_options: dict[str, Any] | None = None,
@@ -3305,7 +3426,12 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
 
     def sink_ndjson(
         self,
-        path: str | Path | IO[bytes] | IO[str] | PartitioningScheme,
+        path: str
+        | Path
+        | IO[bytes]
+        | IO[str]
+        | Callable[[bytes], Any]
+        | PartitioningScheme,
         *,
         maintain_order: bool = True,
         storage_options: dict[str, Any] | None = None,
@@ -3327,7 +3453,15 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         Parameters
         ----------
         path
-            File path to which the file should be written.
+            File path or writable file-like object to which the file should be
+            written. The output can also be streamed to a callback, or to any other
+            object with a `write` method, which is sent successive blocks of `bytes`
+            as the query runs; small writes are buffered (up to 1 MB), and while a
+            callback blocks the streaming engine is held back, so memory use stays
+            bounded.
+
+            .. versionchanged:: 1.30.0
+                Callbacks and objects with a `write` method are accepted.
         maintain_order
             Maintain the order in which data is processed.
             Setting this to `False` will be slightly faster.
@@ -3442,7 +3576,7 @@ naive plan: (run LazyFrame.explain(optimized=True) to see the optimized plan)
         if not lazy:
             ldf = ldf.with_optimizations(optimizations._pyoptflags)
             ldf = LazyFrame._from_pyldf(ldf)
-            ldf.collect(engine=engine)
+            ldf.collect(engine=engine, query_kind="sink")
             return None
         return LazyFrame._from_pyldf(ldf)
 
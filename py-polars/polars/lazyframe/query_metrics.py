@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+from polars._utils.various import issue_warning
+
+if TYPE_CHECKING:
+    from polars.polars import PyLazyFrame
+
+__all__ = ["QueryMetrics"]
+
+# function registered with `Config.set_query_callback` (if any)
+_query_callback: Callable[[QueryMetrics], Any] | None = None
+
+
+@dataclass(frozen=True)
+class QueryMetrics:
+    """
+    Metrics describing a completed query, as passed to the query callback.
+
+    .. warning::
+        This functionality is considered **unstable**. It may be changed
+        at any point without it being considered a breaking change.
+
+    .. versionadded:: 1.30.0
+
+    See Also
+    --------
+    Config.set_query_callback
+    """
+
+    kind: Literal["collect", "collect_async", "sink"]
+    """How the query was executed."""
+
+    engine: str
+    """The engine the query was submitted to."""
+
+    start_time: float
+    """The time at which the query started, in seconds since the epoch."""
+
+    wall_time: float
+    """The time taken to run the query, in seconds."""
+
+    n_rows: int
+    """The number of rows in the query result (zero for sinks)."""
+
+    _ldf: PyLazyFrame = field(repr=False, compare=False)
+
+    @cached_property
+    def plan(self) -> str:
+        """
+        The optimized query plan.
+
+        The plan is only optimized (again) and described when first accessed.
+        """
+        return self._ldf.describe_optimized_plan()
+
+    @cached_property
+    def plan_hash(self) -> str:
+        """A stable hash of the optimized query plan, for grouping identical queries."""
+        return hashlib.sha256(self.plan.encode()).hexdigest()[:16]
+
+
+def get_query_callback() -> Callable[[QueryMetrics], Any] | None:
+    """Return the registered query callback, if any."""
+    return _query_callback
+
+
+def set_query_callback(callback: Callable[[QueryMetrics], Any] | None) -> None:
+    """Register (or, if `None`, unregister) the query callback."""
+    global _query_callback
+    _query_callback = callback
+
+
+def report_query(
+    callback: Callable[[QueryMetrics], Any],
+    ldf: PyLazyFrame,
+    *,
+    kind: Literal["collect", "collect_async", "sink"],
+    engine: str,
+    start_counter: float,
+    n_rows: int,
+) -> None:
+    """
+    Pass the metrics of a completed query to the given callback.
+
+    The query has already completed successfully, so an exception raised by the
+    callback is turned into a warning.
+    """
+    wall_time = time.perf_counter() - start_counter
+    start_time = time.time() - wall_time
+    metrics = QueryMetrics(
+        kind=kind,
+        engine=engine,
+        start_time=start_time,
+        wall_time=wall_time,
+        n_rows=n_rows,
+        _ldf=ldf,
+    )
+    try:
+        callback(metrics)
+    except Exception as exc:
+        msg = f"the query callback raised an exception: {exc!r}"
+        issue_warning(msg, UserWarning)
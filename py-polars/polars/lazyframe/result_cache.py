@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import tempfile
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from polars._utils.polars_version import get_polars_version
+from polars._utils.various import normalize_filepath
+from polars.exceptions import PolarsError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from polars import DataFrame
+    from polars.polars import PyLazyFrame
+
+__all__ = ["ResultCache"]
+
+_CACHE_FILE_SUFFIX = ".arrow"
+
+
+class ResultCache:
+    """
+    A persistent, size-bounded cache of query results.
+
+    Pass a `ResultCache` to :meth:`LazyFrame.collect` to store the result of the
+    query in the cache directory (as an Arrow IPC file), and to serve subsequent
+    runs of the same query by memory-mapping that file instead of executing it.
+
+    .. warning::
+        This functionality is considered **unstable**. It may be changed
+        at any point without it being considered a breaking change.
+
+    .. versionadded:: 1.30.0
+
+    Parameters
+    ----------
+    directory
+        The directory in which cached results are stored; it is created if it
+        does not exist. The directory can be shared by several processes.
+    max_bytes
+        The maximum total size of the cached results. When it is exceeded, the
+        least recently used results are evicted. By default the size of the cache
+        is unbounded.
+
+    Notes
+    -----
+    Results are keyed by a hash of the serialized query plan, the Polars version,
+    and the path, size and modification time of every file that the query reads,
+    so a query is re-executed if any of its source files change. Queries that
+    cannot be cached (eg: those that read from file objects, non-local paths, or
+    Python functions that cannot be serialized) are always executed.
+
+    The cache is only correct for deterministic queries; results of queries that
+    use random sampling, or the current date/time, are also served from the cache.
+
+    Examples
+    --------
+    >>> cache = pl.ResultCache("~/.cache/polars-results", max_bytes=2**30)
+    >>> lf = pl.scan_parquet("data/*.parquet").group_by("id").len()  # doctest: +SKIP
+    >>> df = lf.collect(cache=cache)  # runs the query  # doctest: +SKIP
+    >>> df = lf.collect(cache=cache)  # memory-maps the cached result  # doctest: +SKIP
+    """
+
+    def __init__(self, directory: str | Path, *, max_bytes: int | None = None) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            msg = f"`max_bytes` must be a positive integer, got {max_bytes}"
+            raise ValueError(msg)
+        self._directory = Path(normalize_filepath(directory, check_not_directory=False))
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+
+    def __repr__(self) -> str:
+        return f"ResultCache({str(self._directory)!r}, max_bytes={self._max_bytes})"
+
+    def __len__(self) -> int:
+        """Return the number of cached results."""
+        return sum(1 for _ in self._iter_files())
+
+    @property
+    def directory(self) -> Path:
+        """The directory in which cached results are stored."""
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int | None:
+        """The maximum total size of the cached results."""
+        return self._max_bytes
+
+    def size(self) -> int:
+        """Return the total size of the cached results, in bytes."""
+        return sum(st.st_size for _, st in self._iter_files())
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        for path, _ in self._iter_files():
+            path.unlink(missing_ok=True)
+
+    def _iter_files(self) -> Iterator[tuple[Path, os.stat_result]]:
+        for path in self._directory.glob(f"*{_CACHE_FILE_SUFFIX}"):
+            with contextlib.suppress(FileNotFoundError):
+                yield path, path.stat()
+
+    def _query_key(self, ldf: PyLazyFrame) -> str | None:
+        """
+        Return the cache key for the given query, or None if it cannot be cached.
+
+        The key is a hash of the serialized plan (which includes the data of any
+        in-memory frames) together with fingerprints of all source files.
+        """
+        with BytesIO() as buf:
+            try:
+                ldf.serialize_json(buf)
+            except (PolarsError, TypeError):
+                # eg: in-memory data that cannot be serialized (such as Object)
+                return None
+            plan = buf.getvalue().decode("utf8")
+
+        if (fingerprints := _source_fingerprints(plan)) is None:
+            return None
+
+        h = hashlib.sha256()
+        h.update(get_polars_version().encode())
+        h.update(plan.encode())
+        h.update(json.dumps(fingerprints).encode())
+        return h.hexdigest()
+
+    def _load(self, key: str) -> DataFrame | None:
+        """Load a cached result (marking it as recently used) if it exists."""
+        from polars.io.ipc import read_ipc
+
+        path = self._directory / f"{key}{_CACHE_FILE_SUFFIX}"
+        try:
+            os.utime(path)
+            return read_ipc(path, memory_map=True, rechunk=False)
+        except OSError:
+            return None
+
+    def _store(self, key: str, df: DataFrame) -> None:
+        """Store a result, then evict the least recently used results if needed."""
+        fd, tmp_name = tempfile.mkstemp(suffix=".tmp", dir=self._directory)
+        os.close(fd)
+        tmp = Path(tmp_name)
+        try:
+            df.write_ipc(tmp)
+            if self._max_bytes is not None and tmp.stat().st_size > self._max_bytes:
+                return
+            tmp.replace(self._directory / f"{key}{_CACHE_FILE_SUFFIX}")
+        finally:
+            tmp.unlink(missing_ok=True)
+
+        if self._max_bytes is not None:
+            self._evict(self._max_bytes)
+
+    def _evict(self, max_bytes: int) -> None:
+        files = sorted(self._iter_files(), key=lambda f: f[1].st_mtime_ns)
+        total = sum(st.st_size for _, st in files)
+        for path, st in files:
+            if total <= max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+
+
+def _source_fingerprints(plan: str) -> list[tuple[str, int, int]] | None:
+    """
+    Return the (path, size, mtime) of every file read by the serialized plan.
+
+    Returns None if the plan reads from anything other than local files.
+    """
+    decoder = json.JSONDecoder()
+    fingerprints = []
+    idx = plan.find('"sources":')
+    while idx >= 0:
+        sources, idx = decoder.raw_decode(plan, idx + len('"sources":'))
+        if not isinstance(sources, dict) or set(sources) != {"Paths"}:
+            return None
+        for source in sources["Paths"]:
+            if (files := _local_files(source)) is None:
+                return None
+            for file in files:
+                st = file.stat()
+                fingerprints.append((str(file), st.st_size, st.st_mtime_ns))
+        idx = plan.find('"sources":', idx)
+    return sorted(fingerprints)
+
+
+def _local_files(source: str) -> list[Path] | None:
+    """Expand a scan source into local file paths (None if it is not local)."""
+    if "://" in source:
+        return None
+    if any(char in source for char in "*?["):
+        return [Path(f) for f in glob.iglob(source, recursive=True)]  # noqa: PTH207
+    path = Path(source)
+    if path.is_dir():
+        return [f for f in path.rglob("*") if f.is_file()]
+    return [path] if path.exists() else None
@@ -1,26 +1,35 @@
 # mypy: disable-error-code="unused-ignore"
 from __future__ import annotations
 
+import random
 from typing import TYPE_CHECKING
 
+from polars import functions as F
 from polars._utils.unstable import issue_unstable_warning
 from polars.dataframe import DataFrame
+from polars.datatypes import Int32, Int64, UInt16, UInt32, UInt64
+from polars.dependencies import numpy as np
 from polars.expr import Expr
+from polars.ml.utilities import column_layout, frame_to_numpy, write_frame_to_numpy
+from polars.schema import Schema
 from polars.selectors import exclude
 
 if TYPE_CHECKING:
     import sys
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from torch import Tensor, memory_format
 
+    from polars import LazyFrame, Series
+    from polars._typing import PolarsDataType, SchemaDict
+
     if sys.version_info >= (3, 11):
         from typing import Self
     else:
         from typing_extensions import Self
 try:
     import torch
-    from torch.utils.data import TensorDataset
+    from torch.utils.data import IterableDataset, TensorDataset, get_worker_info
 except ImportError:
     msg = (
         "Required package 'torch' not installed.\n"
@@ -29,7 +38,13 @@ except ImportError:
     raise ImportError(msg) from None
 
 
-__all__ = ["PolarsDataset"]
+__all__ = ["PolarsDataset", "PolarsIterableDataset", "TensorConverter"]
+
+# default number of rows converted to Tensors per block
+_DEFAULT_BLOCK_SIZE = 512**2
+
+# name of the (temporary) struct column holding the label data of a block
+_LABEL_COLUMN = "__POLARS_ML_LABEL"
 
 
 class PolarsDataset(TensorDataset):  # type: ignore[misc]
@@ -211,3 +226,326 @@ class PolarsDataset(TensorDataset):  # type: ignore[misc]
             "features": self.features.dtype,
             "labels": self.labels.dtype if self.labels is not None else None,
         }
+
+
+class PolarsIterableDataset(IterableDataset):  # type: ignore[misc,type-arg]
+    """
+    IterableDataset class that streams batches of Tensors from a Polars LazyFrame.
+
+    Unlike :class:`PolarsDataset`, the source is not collected up front; the query
+    is executed with the streaming engine at the start of each iteration, and its
+    result is converted one block of rows at a time to feature/label Tensors that
+    the batches are (zero-copy) views of.
+
+    .. warning::
+        This functionality is considered **unstable**. It may be changed
+        at any point without it being considered a breaking change.
+
+    .. versionadded:: 1.30.0
+
+    Parameters
+    ----------
+    source
+        LazyFrame (such as the result of `scan_parquet`) or DataFrame containing
+        the data that will be retrieved as Tensors.
+    label
+        One or more column names or expressions that label the feature data; results
+        in `(features,label)` batches, where all non-label columns are considered
+        to be features. If no label is designated then each batch is a simple
+        `(features,)` tuple containing all row elements.
+    features
+        One or more column names or expressions that represent the feature data.
+        If not provided, all columns not designated as labels are considered to be
+        features.
+    batch_size
+        Number of rows in each batch.
+    dtype
+        Unify the dtype of all returned tensors; this casts any column that is
+        not of the required dtype before converting to Tensor. This includes
+        the label column *unless* the label is an expression (such as
+        `pl.col("label_column").cast(pl.Int16)`).
+    block_size
+        Number of rows of the query result that are converted to Tensors at a time.
+    shuffle_buffer_size
+        If set, shuffle the order of the blocks, and shuffle the rows using a
+        buffer holding (at least) this many rows; larger buffers give better
+        randomisation at the cost of additional memory.
+    seed
+        Seed for the random number generator used to shuffle the data; if not
+        set, the data is shuffled differently on each iteration.
+    drop_last
+        Drop the last batch if it contains fewer than `batch_size` rows.
+
+    Notes
+    -----
+    * Batches are returned by the dataset itself, so it should be used with a
+      DataLoader that has automatic batching disabled (`batch_size=None`).
+    * When loaded with multiple DataLoader workers, each worker executes the query
+      and keeps a distinct share of the rows (based on their hashed values, as the
+      row order of queries such as `group_by` is not deterministic), so that each
+      row is returned exactly once per epoch. The order in which the batches are
+      returned then depends on the workers.
+
+    Examples
+    --------
+    >>> from torch.utils.data import DataLoader
+    >>> from polars.ml.torch import PolarsIterableDataset
+    >>> lf = pl.LazyFrame(
+    ...     data=[
+    ...         (0, 1, 1.5),
+    ...         (1, 0, -0.5),
+    ...         (2, 0, 0.0),
+    ...         (3, 1, -2.25),
+    ...         (4, 0, 0.75),
+    ...     ],
+    ...     schema=["lbl", "feat1", "feat2"],
+    ...     orient="row",
+    ... )
+    >>> ds = PolarsIterableDataset(lf, label="lbl", batch_size=2, dtype=pl.Float32)
+    >>> dl = DataLoader(ds, batch_size=None)
+    >>> for features, label in dl:
+    ...     print(features.shape, label)
+    torch.Size([2, 2]) tensor([0., 1.])
+    torch.Size([2, 2]) tensor([2., 3.])
+    torch.Size([1, 2]) tensor([4.])
+    """
+
+    def __init__(
+        self,
+        source: LazyFrame | DataFrame,
+        *,
+        label: str | Expr | Sequence[str | Expr] | None = None,
+        features: str | Expr | Sequence[str | Expr] | None = None,
+        batch_size: int = 1024,
+        dtype: PolarsDataType | None = None,
+        block_size: int = _DEFAULT_BLOCK_SIZE,
+        shuffle_buffer_size: int | None = None,
+        seed: int | None = None,
+        drop_last: bool = False,
+    ) -> None:
+        issue_unstable_warning("`PolarsIterableDataset` is considered unstable.")
+        if batch_size < 1 or block_size < 1:
+            msg = "`batch_size` and `block_size` must be positive integers"
+            raise ValueError(msg)
+        elif dtype in (UInt16, UInt32, UInt64):
+            msg = f"PyTorch does not support u16, u32, or u64 dtypes; given {dtype}"
+            raise ValueError(msg)
+
+        if isinstance(label, (str, Expr)):
+            label = [label]
+        lf = source.lazy().cast(
+            dtype or {UInt16: Int32, UInt32: Int64, UInt64: Int64}  # type: ignore[arg-type]
+        )
+        if not label:
+            self._query = lf.select(features) if features else lf
+            self._n_labels = 0
+        else:
+            label_names = lf.select(*label).collect_schema().names()
+            if isinstance(features, (str, Expr)):
+                features = [features]
+            self._query = lf.select(
+                *(features or [exclude(label_names)]),
+                F.struct(*label).alias(_LABEL_COLUMN),
+            )
+            self._n_labels = len(label_names)
+
+        self._n_features = self._query.collect_schema().len() - bool(self._n_labels)
+        self.batch_size = batch_size
+        self.block_size = block_size
+        self.shuffle_buffer_size = shuffle_buffer_size
+        self.seed = seed
+        self.drop_last = drop_last
+
+    def __iter__(self) -> Iterator[tuple[Tensor, ...]]:
+        """Iterate over batches of `(features,label)` or `(features,)` Tensors."""
+        batch_size = self.batch_size
+        for frame in self._iter_frames():
+            tensors = self._to_tensors(frame)
+            for offset in range(0, frame.height, batch_size):
+                if self.drop_last and frame.height - offset < batch_size:
+                    break
+                yield tuple(t[offset : offset + batch_size] for t in tensors)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the PolarsIterableDataset."""
+        return (
+            f"<{type(self).__name__} "
+            f"[batch_size:{self.batch_size},"
+            f" features:{self._n_features},"
+            f" labels:{self._n_labels}"
+            f"] at 0x{id(self):X}>"
+        )
+
+    def _iter_frames(self) -> Iterator[DataFrame]:
+        """
+        Execute the query for this worker's rows, yielding frames to batch.
+
+        All frames except the last contain a multiple of `batch_size` rows; rows
+        that are left over from a block are carried over to the next one.
+        """
+        worker = get_worker_info()
+        worker_id, num_workers = (
+            (0, 1) if worker is None else (worker.id, worker.num_workers)
+        )
+
+        # torch seeds each worker with `base_seed + worker_id`
+        seed = self.seed
+        if seed is not None:
+            seed += worker_id
+        elif worker is not None:
+            seed = worker.seed
+        rng = random.Random(seed)
+
+        query = self._query
+        if num_workers > 1:
+            query = query.filter(
+                F.struct(F.all().hash()).hash() % num_workers == worker_id
+            )
+        result = query.collect(engine="streaming")
+
+        offsets = list(range(0, result.height, self.block_size))
+        if shuffle := self.shuffle_buffer_size is not None:
+            rng.shuffle(offsets)
+
+        buffer: DataFrame | None = None
+        n_keep = self.shuffle_buffer_size or 0
+        for offset in offsets:
+            block = result.slice(offset, self.block_size)
+            buffer = block if buffer is None else buffer.vstack(block)
+            if shuffle:
+                buffer = buffer.sample(
+                    fraction=1.0, shuffle=True, seed=rng.getrandbits(64)
+                )
+            n_ready = (
+                max(buffer.height - n_keep, 0) // self.batch_size * self.batch_size
+            )
+            if n_ready:
+                yield buffer.head(n_ready)
+                buffer = buffer.slice(n_ready)
+
+        if buffer is not None and buffer.height:
+            yield buffer
+
+    def _to_tensors(self, frame: DataFrame) -> tuple[Tensor, ...]:
+        """Convert a frame to feature (and label) Tensors."""
+        if not self._n_labels:
+            return (self._frame_to_tensor(frame),)
+
+        labels = frame[_LABEL_COLUMN].struct.unnest()
+        return (
+            self._frame_to_tensor(frame.drop(_LABEL_COLUMN)),
+            self._frame_to_tensor(labels if labels.width > 1 else labels.to_series()),
+        )
+
+    @staticmethod
+    def _frame_to_tensor(data: DataFrame | Series) -> Tensor:
+        if isinstance(data, DataFrame):
+            arr = frame_to_numpy(data, writable=True, target="Tensor")
+        else:
+            arr = data.to_numpy(writable=True)
+        return torch.from_numpy(arr)
+
+
+class TensorConverter:
+    """
+    Convert DataFrames with a given schema into a reusable, pre-allocated Tensor.
+
+    The mapping of frame columns to Tensor columns is determined once (for the
+    given schema), and each conversion copies the frame data straight into a
+    buffer that is allocated up front; this avoids allocating a new Tensor for
+    every batch of a training loop, and allows the buffer to live in pinned
+    (page-locked) memory for fast asynchronous transfer to the GPU.
+
+    .. warning::
+        This functionality is considered **unstable**. It may be changed
+        at any point without it being considered a breaking change.
+
+    .. versionadded:: 1.30.0
+
+    Parameters
+    ----------
+    schema
+        Schema of the frames that will be converted; Array columns contribute one
+        Tensor column per (flattened) array element.
+    batch_size
+        Maximum number of rows of the frames that will be converted.
+    dtype
+        Dtype of the Tensor; if not set, this is the supertype of the (NumPy
+        equivalent) column dtypes.
+    pin_memory
+        Allocate the buffer in pinned memory (requires an accelerator).
+    share_memory
+        Allocate the buffer in shared memory, so that it can be shared with
+        other processes (such as DataLoader workers).
+
+    Notes
+    -----
+    * The returned Tensor is a view of the buffer, so it is overwritten by the next
+      conversion; clone it (or move it to another device) if it needs to be kept.
+    * As with `DataFrame.to_torch`, the buffer is column-major (Fortran-ordered);
+      call `.contiguous()` on the result if a row-major Tensor is required.
+
+    Examples
+    --------
+    >>> from polars.ml.torch import TensorConverter
+    >>> df = pl.DataFrame(
+    ...     {"a": [1, 2, 3], "b": [0.5, -1.0, 2.5]},
+    ...     schema_overrides={"a": pl.Int16},
+    ... )
+    >>> convert = TensorConverter(df.schema, batch_size=4, dtype=pl.Float32)
+    >>> convert(df)
+    tensor([[ 1.0000,  0.5000],
+            [ 2.0000, -1.0000],
+            [ 3.0000,  2.5000]])
+    >>> convert(df.tail(1)).data_ptr() == convert.buffer.data_ptr()
+    True
+    """
+
+    buffer: Tensor
+
+    def __init__(
+        self,
+        schema: Schema | SchemaDict,
+        *,
+        batch_size: int,
+        dtype: PolarsDataType | None = None,
+        pin_memory: bool = False,
+        share_memory: bool = False,
+    ) -> None:
+        issue_unstable_warning("`TensorConverter` is considered unstable.")
+        self.schema = Schema(schema)
+        self._layout = column_layout(self.schema, target="Tensor")
+        self._columns, self._dtypes = self.schema.names(), self.schema.dtypes()
+
+        # the (empty) column arrays give the numpy dtype each column converts to
+        empty = DataFrame(schema=self.schema).cast(
+            dtype or {UInt16: Int32, UInt32: Int64, UInt64: Int64}  # type: ignore[arg-type]
+        )
+        np_dtype = np.result_type(*(col.to_numpy().dtype for col in empty))
+        if np_dtype.kind == "O":
+            msg = f"cannot convert DataFrame to Tensor (mixed type columns result in `object` dtype)\n{self.schema!r}"
+            raise TypeError(msg)
+
+        n_values = self._layout[-1][2] if self._layout else 0
+        # note: the buffer is column-major, so each frame column is copied into
+        # a contiguous region (much faster than a strided row-major write)
+        self.buffer = torch.empty(
+            (n_values, batch_size),
+            dtype=torch.from_numpy(np.empty(0, dtype=np_dtype)).dtype,
+            pin_memory=pin_memory,
+        ).T
+        if share_memory:
+            self.buffer.share_memory_()  # type: ignore[no-untyped-call]
+        self._array = self.buffer.numpy()
+
+    def __call__(self, df: DataFrame) -> Tensor:
+        """Convert the frame, returning a view of the first `df.height` buffer rows."""
+        if df.columns != self._columns or df.dtypes != self._dtypes:
+            msg = f"frame schema does not match the converter schema\n{df.schema!r}"
+            raise ValueError(msg)
+        elif df.height > self._array.shape[0]:
+            msg = f"frame has {df.height} rows; the buffer only has {self._array.shape[0]}"
+            raise ValueError(msg)
+
+        write_frame_to_numpy(df, self._array[: df.height], self._layout)
+        return self.buffer[: df.height]
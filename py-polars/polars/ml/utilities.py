@@ -1,10 +1,15 @@
-from typing import Any
+from __future__ import annotations
+
+from math import prod
+from typing import TYPE_CHECKING, Any
 
-from polars import DataFrame
-from polars._typing import IndexOrder
 from polars.datatypes import Array, List
 from polars.dependencies import numpy as np
 
+if TYPE_CHECKING:
+    from polars import DataFrame, Schema
+    from polars._typing import IndexOrder
+
 
 def frame_to_numpy(
     df: DataFrame,
@@ -12,12 +17,18 @@ def frame_to_numpy(
     writable: bool,
     target: str,
     order: IndexOrder = "fortran",
+    out: np.ndarray[Any, Any] | None = None,
 ) -> np.ndarray[Any, Any]:
-    """Convert a DataFrame to a NumPy array for use with Jax or PyTorch."""
-    for nm, tp in df.schema.items():
-        if tp == List:
-            msg = f"cannot convert List column {nm!r} to {target} (use Array dtype instead)"
-            raise TypeError(msg) from None
+    """
+    Convert a DataFrame to a NumPy array for use with Jax or PyTorch.
+
+    If `out` is given, the frame data is written into that (pre-allocated) array
+    instead of a new one; it must have one row per frame row and one value per
+    (flattened) frame column element.
+    """
+    layout = column_layout(df.schema, target=target)
+    if out is not None:
+        return write_frame_to_numpy(df, out, layout)
 
     if df.width == 1 and df.schema.dtypes()[0] == Array:
         arr = df[df.columns[0]].to_numpy(writable=writable)
@@ -28,3 +39,60 @@ def frame_to_numpy(
         msg = f"cannot convert DataFrame to {target} (mixed type columns result in `object` dtype)\n{df.schema!r}"
         raise TypeError(msg)
     return arr
+
+
+def column_layout(schema: Schema, *, target: str) -> list[tuple[str, int, int]]:
+    """
+    Map each column to the range of array columns it occupies in the 2D result.
+
+    Scalar columns occupy a single array column; Array columns occupy one array
+    column for each (flattened) element of their shape.
+    """
+    layout, offset = [], 0
+    for nm, tp in schema.items():
+        if tp == List:
+            msg = f"cannot convert List column {nm!r} to {target} (use Array dtype instead)"
+            raise TypeError(msg) from None
+        width = prod(tp.shape) if isinstance(tp, Array) else 1
+        layout.append((nm, offset, offset + width))
+        offset += width
+    return layout
+
+
+def write_frame_to_numpy(
+    df: DataFrame,
+    out: np.ndarray[Any, Any],
+    layout: list[tuple[str, int, int]],
+) -> np.ndarray[Any, Any]:
+    """
+    Write the frame columns into the given array, according to the layout.
+
+    The layout must have been determined from the frame schema (columns are
+    written in frame order).
+    """
+    n_values = layout[-1][2] if layout else 0
+    if out.ndim < 2 or out.shape[0] != df.height or prod(out.shape[1:]) != n_values:
+        msg = (
+            f"`out` array of shape {out.shape} does not match the frame data"
+            f" (expected {df.height} rows of {n_values} values)"
+        )
+        raise ValueError(msg)
+
+    values = out if out.ndim == 2 else out.reshape(out.shape[0], n_values)
+    if out.size and not np.shares_memory(values, out):
+        msg = "`out` array must be contiguous when writing Array columns"
+        raise ValueError(msg)
+
+    # note: numeric columns without nulls are zero-copy views here, so each
+    # column is copied exactly once (straight into its place in the result)
+    for s, (_, start, stop) in zip(df.get_columns(), layout):
+        arr = s.to_numpy()
+        if arr.ndim == 1:
+            np.copyto(values[:, start], arr, casting="same_kind")
+        else:
+            np.copyto(
+                values[:, start:stop],
+                arr.reshape(df.height, stop - start),
+                casting="same_kind",
+            )
+    return out
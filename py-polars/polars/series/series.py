@@ -5485,6 +5485,7 @@ class Series:
         return_dtype: PolarsDataType | None = None,
         *,
         skip_nulls: bool = True,
+        rewrite: bool | None = None,
     ) -> Self:
         """
         Map a custom/user-defined function (UDF) over elements in this Series.
@@ -5528,6 +5529,14 @@ class Series:
             Nulls will be skipped and not passed to the python function.
             This is faster because python can be skipped and because we call
             more specialized functions.
+        rewrite
+            If the function can be translated to an equivalent native expression
+            (this is the expression suggested by the `PolarsInefficientMapWarning`),
+            evaluate that expression instead of calling the function. If not set,
+            this follows :meth:`Config.set_rewrite_map_elements`. Only applies when
+            `skip_nulls=True`.
+
+            .. versionadded:: 1.30.0
 
         Warnings
         --------
@@ -5556,13 +5565,31 @@ class Series:
         -------
         Series
         """
-        from polars._utils.udfs import warn_on_inefficient_map
+        from polars._utils.udfs import rewrite_inefficient_map, warn_on_inefficient_map
 
         if return_dtype is None:
             pl_return_dtype = None
         else:
             pl_return_dtype = parse_into_dtype(return_dtype)
 
+        if rewrite is None:
+            rewrite = bool(int(os.environ.get("POLARS_REWRITE_MAP_ELEMENTS", 0)))
+        if (
+            rewrite
+            and skip_nulls
+            and (
+                native_expr := rewrite_inefficient_map(
+                    function, columns=[self.name], input_expr=F.col(self.name)
+                )
+            )
+            is not None
+        ):
+            if pl_return_dtype is not None:
+                native_expr = native_expr.cast(pl_return_dtype)
+            return self._from_pyseries(
+                self.to_frame().select(native_expr.alias(self.name)).to_series()._s
+            )
+
         warn_on_inefficient_map(function, columns=[self.name], map_target="series")
         return self._from_pyseries(
             self._s.map_elements(
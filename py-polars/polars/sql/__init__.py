@@ -1,7 +1,8 @@
-from polars.sql.context import SQLContext
+from polars.sql.context import PreparedStatement, SQLContext
 from polars.sql.functions import sql
 
 __all__ = [
+    "PreparedStatement",
     "SQLContext",
     "sql",
 ]
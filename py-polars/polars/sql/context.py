@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import contextlib
 import re
+import secrets
+from collections import Counter, OrderedDict
+from datetime import date, datetime, time
+from io import BytesIO
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -10,7 +14,9 @@ from typing import (
     overload,
 )
 
+from polars import functions as F
 from polars._typing import FrameType
+from polars._utils.convert import datetime_to_int
 from polars._utils.deprecation import deprecate_renamed_parameter
 from polars._utils.pycapsule import is_pycapsule
 from polars._utils.unstable import issue_unstable_warning
@@ -18,21 +24,25 @@ from polars._utils.various import _get_stack_locals, qualified_type_name
 from polars._utils.wrap import wrap_ldf
 from polars.convert import from_arrow, from_pandas
 from polars.dataframe import DataFrame
+from polars.datatypes import Datetime
 from polars.dependencies import _check_for_pandas, _check_for_pyarrow
 from polars.dependencies import pandas as pd
 from polars.dependencies import pyarrow as pa
+from polars.exceptions import PolarsError
 from polars.lazyframe import LazyFrame
 from polars.series import Series
 
 with contextlib.suppress(ImportError):  # Module not available when building docs
-    from polars.polars import PySQLContext
+    from polars.polars import PyLazyFrame, PySQLContext
 
 if TYPE_CHECKING:
     import sys
-    from collections.abc import Collection, Mapping
+    from collections.abc import Collection, Mapping, Sequence
     from types import TracebackType
     from typing import Any, Final, Literal
 
+    from polars import Expr
+
     if sys.version_info >= (3, 10):
         from typing import TypeAlias
     else:
@@ -53,7 +63,39 @@ if TYPE_CHECKING:
         pa.RecordBatch,
     ]
 
-__all__ = ["SQLContext"]
+__all__ = ["PreparedStatement", "SQLContext"]
+
+# maximum number of prepared statements that a `SQLContext` keeps for reuse
+_PREPARED_CACHE_SIZE = 128
+
+# maximum size (in bytes) of a serialized plan that values are bound into; binding
+# deserializes the whole plan, including any in-memory data that it holds, so
+# larger plans are cheaper to build again from the query
+_PREPARED_PLAN_MAX_SIZE = 16 * 1024
+
+# positional parameters ("$1", "$2", ...) outside of quoted strings/identifiers
+# and comments (which are matched first, so that they can be skipped over)
+_SQL_PARAM_PATTERN = re.compile(
+    r"""('(?:[^']|'')*'|"(?:[^"]|"")*"|--[^\n]*|/\*.*?\*/)|\$(\d+)""",
+    re.DOTALL,
+)
+
+# python types of the values that can be bound to query parameters
+_SQL_PARAM_TYPES = (bool, int, float, str, date, time)
+
+# statements that cannot change the registered tables
+_SQL_READ_ONLY_PATTERN = re.compile(
+    r"^\s*\(*\s*(SELECT|WITH|VALUES|SHOW|EXPLAIN)\b", re.IGNORECASE
+)
+
+# parameter placeholders are string literals that cannot clash with user values
+# (the "%" ensures that they are not treated as plain strings in SQL LIKE patterns)
+_PARAM_PREFIX = f"\x1f%polars.sql.param.{secrets.token_hex(8)}:"
+_PARAM_SUFFIX = "\x1f"
+_PARAM_PATTERN = re.compile(
+    re.escape(_PARAM_PREFIX.encode()) + rb"(.*?)" + re.escape(_PARAM_SUFFIX.encode()),
+    re.DOTALL,
+)
 
 
 def _compatible_frame(obj: Any) -> bool:
@@ -96,6 +138,255 @@ def _get_frame_locals(
     return _get_stack_locals(of_type=of_type, n_objects=n_objects, named=named)  # type: ignore[arg-type]
 
 
+def _substitute_params(
+    query: str, replace: Callable[[int], str]
+) -> tuple[str, set[int]]:
+    """Replace the positional parameters of a SQL query; also return their indexes."""
+    params: set[int] = set()
+
+    def replace_param(m: re.Match[str]) -> str:
+        if (idx := m.group(2)) is None:
+            return m.group(0)
+        if (n := int(idx)) < 1:
+            msg = f"invalid query parameter: ${idx}"
+            raise ValueError(msg)
+        params.add(n)
+        return replace(n)
+
+    return _SQL_PARAM_PATTERN.sub(replace_param, query), params
+
+
+def _sql_placeholder(n: int) -> str:
+    """Return a string literal that stands in for the given parameter."""
+    return _sql_literal(_placeholder_value(f"${n}"))
+
+
+def _check_param_value(value: Any) -> None:
+    if (value is not None and not isinstance(value, _SQL_PARAM_TYPES)) or (
+        isinstance(value, datetime) and value.tzinfo is not None
+    ):
+        msg = f"unsupported query parameter value: {value!r}"
+        raise TypeError(msg)
+
+
+def _sql_literal(value: Any) -> str:
+    """Return the SQL literal for the given (supported) parameter value."""
+    if value is None:
+        return "NULL"
+    elif isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    elif isinstance(value, int):
+        return str(value)
+    elif isinstance(value, float):
+        s = repr(value)
+        return s if s.replace(".", "").lstrip("-").isdigit() else f"'{s}'::float8"
+    elif isinstance(value, str):
+        return "'{}'".format(value.replace("'", "''"))
+    elif isinstance(value, datetime):
+        return f"TIMESTAMP '{value.isoformat()}'"
+    elif isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    else:
+        return f"TIME '{value.isoformat()}'"
+
+
+def _placeholder_value(name: str) -> str:
+    return f"{_PARAM_PREFIX}{name}{_PARAM_SUFFIX}"
+
+
+def _placeholder(name: str) -> Expr:
+    return F.lit(_placeholder_value(name))
+
+
+def _value_expr(value: Any) -> Expr:
+    if isinstance(value, datetime) and value.tzinfo is None:
+        # naive datetime literals do not survive a serialization round-trip of
+        # the plan, so bind them as (equivalent) integer timestamps instead
+        return F.lit(datetime_to_int(value, "us")).cast(Datetime("us"))
+    return F.lit(value)
+
+
+def _serialize_expr(expr: Expr) -> bytes:
+    with BytesIO() as buf:
+        expr._pyexpr.serialize_binary(buf)
+        return buf.getvalue()
+
+
+class _PreparedPlan:
+    """
+    A serialized query plan containing named parameter placeholders.
+
+    Binding values substitutes them directly into the serialized plan, so that
+    the query itself does not have to be built again; the plan is deserialized
+    (along with any in-memory data that it holds) every time values are bound.
+    """
+
+    def __init__(self, lf: LazyFrame) -> None:
+        with BytesIO() as buf:
+            lf._ldf.serialize_binary(buf)
+            self._plan = buf.getvalue()
+
+        names = Counter(m.decode("utf8") for m in _PARAM_PATTERN.findall(self._plan))
+        self._placeholders = {
+            name: _serialize_expr(_placeholder(name)) for name in names
+        }
+        for name, placeholder in self._placeholders.items():
+            # every occurrence of the parameter must be a standalone literal value
+            if self._plan.count(placeholder) != names[name]:
+                msg = (
+                    f"parameter {name!r} is used where it cannot be bound to a value"
+                    " (eg: as an element of a list of values)"
+                )
+                raise ValueError(msg)
+
+    @property
+    def params(self) -> list[str]:
+        """The names of the query parameters (in order of appearance)."""
+        return list(self._placeholders)
+
+    @property
+    def size(self) -> int:
+        """The size of the serialized plan, in bytes."""
+        return len(self._plan)
+
+    def bind(self, **params: Any) -> LazyFrame:
+        """Return the query as a LazyFrame, with the given parameter values."""
+        plan = self._plan
+        for name, placeholder in self._placeholders.items():
+            plan = plan.replace(placeholder, _serialize_expr(_value_expr(params[name])))
+        return wrap_ldf(PyLazyFrame.deserialize_binary(BytesIO(plan)))
+
+
+class PreparedStatement(Generic[FrameType]):
+    """
+    A SQL query with positional parameters, for repeated execution.
+
+    Created by :meth:`SQLContext.prepare`.
+
+    .. versionadded:: 1.30.0
+    """
+
+    _ctx: SQLContext[FrameType]
+    _prepared: _PreparedPlan | None
+
+    def __init__(self, ctx: SQLContext[FrameType], query: str) -> None:
+        self._ctx = ctx
+        self._query = query
+        self._params = _substitute_params(query, str)[1]
+        self._read_only = _SQL_READ_ONLY_PATTERN.match(query) is not None
+        self._generation = ctx._generation
+        self._prepared = self._prepare_plan() if self._read_only else None
+
+    def __repr__(self) -> str:
+        return f"<PreparedStatement [params:{self.n_params}] at 0x{id(self):x}>"
+
+    @property
+    def query(self) -> str:
+        """The SQL query."""
+        return self._query
+
+    @property
+    def n_params(self) -> int:
+        """The number of positional parameters in the query."""
+        return max(self._params, default=0)
+
+    def _prepare_plan(self) -> _PreparedPlan | None:
+        """
+        Plan the query with placeholder parameters, for binding values into.
+
+        Binding values into a plan saves parsing and planning the query, but it
+        deserializes the whole plan (including any in-memory data that it holds),
+        so the plan is only returned if its serialized size is small.
+        """
+        sql = _substitute_params(self._query, _sql_placeholder)[0]
+        try:
+            lf = wrap_ldf(self._ctx._ctxt.execute(sql))
+            prepared = _PreparedPlan(lf)
+        except (PolarsError, ValueError):
+            # the query cannot be planned with placeholders (eg: parameters are
+            # used in LIKE patterns or LIMIT clauses), or serialized
+            return None
+
+        if prepared.size > _PREPARED_PLAN_MAX_SIZE or set(prepared.params) != {
+            f"${n}" for n in self._params
+        }:
+            return None
+        return prepared
+
+    @overload
+    def execute(
+        self: PreparedStatement[DataFrame],
+        params: Sequence[Any] = ...,
+        *,
+        eager: None = ...,
+    ) -> DataFrame: ...
+
+    @overload
+    def execute(
+        self: PreparedStatement[LazyFrame],
+        params: Sequence[Any] = ...,
+        *,
+        eager: None = ...,
+    ) -> LazyFrame: ...
+
+    @overload
+    def execute(
+        self, params: Sequence[Any] = ..., *, eager: Literal[False]
+    ) -> LazyFrame: ...
+
+    @overload
+    def execute(
+        self, params: Sequence[Any] = ..., *, eager: Literal[True]
+    ) -> DataFrame: ...
+
+    @overload
+    def execute(
+        self, params: Sequence[Any] = ..., *, eager: bool | None = ...
+    ) -> LazyFrame | DataFrame: ...
+
+    def execute(
+        self, params: Sequence[Any] = (), *, eager: bool | None = None
+    ) -> LazyFrame | DataFrame:
+        """
+        Execute the statement with the given parameter values.
+
+        Parameters
+        ----------
+        params
+            A sequence of parameter values; the first value is bound to `$1`, the
+            second to `$2`, and so on. Supported values are `None`, and `bool`,
+            `int`, `float`, `str`, `date`, `datetime` (without a timezone) and
+            `time` objects.
+        eager
+            Apply the query eagerly, returning `DataFrame` instead of `LazyFrame`.
+            If unset, the value of the init-time "eager" parameter of the
+            `SQLContext` will be used.
+        """
+        if len(params) != self.n_params:
+            msg = f"expected {self.n_params} parameter value(s), got {len(params)}"
+            raise ValueError(msg)
+        for value in params:
+            _check_param_value(value)
+
+        if self._read_only and self._generation != self._ctx._generation:
+            # the registered tables have changed since the query was planned
+            self._generation = self._ctx._generation
+            self._prepared = self._prepare_plan()
+
+        if self._prepared is not None:
+            res = self._prepared.bind(
+                **{name: params[int(name[1:]) - 1] for name in self._prepared.params}
+            )
+        else:
+            sql, _ = _substitute_params(
+                self._query, lambda n: _sql_literal(params[n - 1])
+            )
+            if not self._read_only:
+                self._ctx._invalidate_prepared()
+            res = wrap_ldf(self._ctx._ctxt.execute(sql))
+        return res.collect() if (eager or self._ctx._eager_execution) else res
+
+
 class SQLContext(Generic[FrameType]):
     """
     Run SQL queries against DataFrame, LazyFrame, and Series data.
@@ -108,6 +399,8 @@ class SQLContext(Generic[FrameType]):
 
     _ctxt: PySQLContext
     _eager_execution: Final[bool]
+    _generation: int
+    _prepared_statements: OrderedDict[str, PreparedStatement[FrameType]]
     _tables_scope_stack: list[set[str]]
 
     # note: the type-overloaded methods are required to support accurate typing
@@ -204,6 +497,8 @@ class SQLContext(Generic[FrameType]):
         )
         self._ctxt = PySQLContext.new()
         self._eager_execution = eager
+        self._generation = 0
+        self._prepared_statements = OrderedDict()
 
         frames = dict(frames or {})
         if register_globals:
@@ -321,6 +616,11 @@ class SQLContext(Generic[FrameType]):
         n_tables = len(self.tables())
         return f"<SQLContext [tables:{n_tables}] at 0x{id(self):x}>"
 
+    def _invalidate_prepared(self) -> None:
+        """Discard cached prepared statements, and the plans of existing ones."""
+        self._prepared_statements.clear()
+        self._generation += 1
+
     # these overloads are necessary to cover the possible permutations
     # of the init-time "eager" param, and the local "eager" param.
 
@@ -440,9 +740,85 @@ class SQLContext(Generic[FrameType]):
         │ 1970   ┆ 134821952   ┆ 1       │
         └────────┴─────────────┴─────────┘
         """
+        if not _SQL_READ_ONLY_PATTERN.match(query):
+            self._invalidate_prepared()
         res = wrap_ldf(self._ctxt.execute(query))
         return res.collect() if (eager or self._eager_execution) else res
 
+    def prepare(self, query: str) -> PreparedStatement[FrameType]:
+        """
+        Prepare a SQL query with positional parameters, for repeated execution.
+
+        Parameters are written as `$1`, `$2`, etc, and can be used wherever the
+        query takes a literal value. Where possible, the query is parsed and planned
+        once, and executing the returned statement binds the parameter values
+        directly into that plan.
+
+        .. versionadded:: 1.30.0
+
+        Parameters
+        ----------
+        query
+            A valid string SQL query.
+
+        Notes
+        -----
+        Binding values into a plan deserializes the whole plan (including any
+        in-memory data that it holds), so the plan is only kept if it is small;
+        otherwise, and for queries that use parameters where the SQL interface
+        needs their value in order to plan the query (such as in `LIKE` patterns,
+        `IN` lists, or `LIMIT` clauses), the parameter values are formatted into
+        the query as SQL literals, and the query is executed as normal.
+
+        Prepared statements are cached (by query string) and reused if the same
+        query is prepared again; the cache is cleared when tables are registered
+        or unregistered, and existing statements are planned again on their next
+        execution.
+
+        Examples
+        --------
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "id": [1, 2, 3, 4],
+        ...         "name": ["aa", "bb", "cc", "dd"],
+        ...         "value": [5, 6, 7, 8],
+        ...     }
+        ... )
+        >>> ctx = pl.SQLContext(frame=df, eager=True)
+        >>> stmt = ctx.prepare(
+        ...     "SELECT name, value * $2 AS value FROM frame WHERE id > $1"
+        ... )
+        >>> stmt.execute([2, 10])
+        shape: (2, 2)
+        ┌──────┬───────┐
+        │ name ┆ value │
+        │ ---  ┆ ---   │
+        │ str  ┆ i64   │
+        ╞══════╪═══════╡
+        │ cc   ┆ 70    │
+        │ dd   ┆ 80    │
+        └──────┴───────┘
+        >>> stmt.execute([3, -1])
+        shape: (1, 2)
+        ┌──────┬───────┐
+        │ name ┆ value │
+        │ ---  ┆ ---   │
+        │ str  ┆ i64   │
+        ╞══════╪═══════╡
+        │ dd   ┆ -8    │
+        └──────┴───────┘
+        """
+        if (stmt := self._prepared_statements.get(query)) is not None:
+            self._prepared_statements.move_to_end(query)
+            return stmt
+
+        stmt = PreparedStatement(self, query)
+        if _SQL_READ_ONLY_PATTERN.match(query):
+            self._prepared_statements[query] = stmt
+            if len(self._prepared_statements) > _PREPARED_CACHE_SIZE:
+                self._prepared_statements.popitem(last=False)
+        return stmt
+
     def register(self, name: str, frame: CompatibleFrameType | None) -> Self:
         """
         Register a single frame as a table, using the given name.
@@ -476,6 +852,7 @@ class SQLContext(Generic[FrameType]):
         """
         frame = LazyFrame() if frame is None else _ensure_lazyframe(frame)
         self._ctxt.register(name, frame._ldf)
+        self._invalidate_prepared()
         return self
 
     def register_globals(
@@ -636,6 +1013,7 @@ class SQLContext(Generic[FrameType]):
             names = [names]
         for nm in names:
             self._ctxt.unregister(nm)
+        self._invalidate_prepared()
         return self
 
     def tables(self) -> list[str]:
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+import polars as pl
+from polars.exceptions import ComputeError
+from polars.testing import assert_frame_equal
+
+
+def test_builder_append_rows() -> None:
+    schema = {"a": pl.Int16, "b": pl.String, "c": pl.Boolean}
+    builder = pl.DataFrameBuilder(schema, chunk_size=2)
+    assert builder.schema == pl.Schema(schema)
+    assert len(builder) == 0
+
+    builder.append_row((1, "x", True))
+    builder.append_rows((n, str(n), None) for n in range(2, 5))
+    builder.append_row({"a": 5, "b": None, "c": False})
+    assert len(builder) == 5
+
+    df = builder.finish()
+    assert df.n_chunks() == 3
+    assert_frame_equal(
+        df,
+        pl.DataFrame(
+            {
+                "a": [1, 2, 3, 4, 5],
+                "b": ["x", "2", "3", "4", None],
+                "c": [True, None, None, None, False],
+            },
+            schema=schema,
+        ),
+    )
+
+
+def test_builder_infer_schema() -> None:
+    builder = pl.DataFrameBuilder(["x", "y"], chunk_size=2, infer_schema_length=2)
+    assert builder.schema is None
+
+    builder.append_rows([(1, 1.5), (2, None)])
+    assert builder.schema == pl.Schema({"x": pl.Int64, "y": pl.Float64})
+
+    # subsequent rows are loaded with the dtypes inferred from the first chunk
+    builder.append_rows([(3, 2), (4, 0)])
+    df = builder.finish(rechunk=True)
+    assert df.n_chunks() == 1
+    assert df.schema == pl.Schema({"x": pl.Int64, "y": pl.Float64})
+    assert df.rows() == [(1, 1.5), (2, None), (3, 2.0), (4, 0.0)]
+
+
+def test_builder_schema_overrides() -> None:
+    builder = pl.DataFrameBuilder(
+        ["id", "cat"],
+        schema_overrides={"id": pl.UInt8, "cat": pl.Categorical},
+    )
+    builder.append_rows([(1, "a"), (2, "b"), (3, "a")])
+    df = builder.finish()
+    assert df.schema == pl.Schema({"id": pl.UInt8, "cat": pl.Categorical()})
+    assert df["cat"].to_list() == ["a", "b", "a"]
+
+
+def test_builder_finish_resets() -> None:
+    builder = pl.DataFrameBuilder({"n": pl.Int32})
+    assert_frame_equal(builder.finish(), pl.DataFrame(schema={"n": pl.Int32}))
+
+    builder.append_rows([[1], [2]])
+    assert builder.finish().rows() == [(1,), (2,)]
+    assert len(builder) == 0
+
+    builder.append_row([3])
+    assert builder.finish().rows() == [(3,)]
+    assert builder.schema == pl.Schema({"n": pl.Int32})
+
+
+def test_builder_invalid_values() -> None:
+    builder = pl.DataFrameBuilder({"n": pl.Int8}, chunk_size=2)
+    builder.append_row([1])
+    with pytest.raises(ComputeError, match="could not append value"):
+        builder.append_row([1000])
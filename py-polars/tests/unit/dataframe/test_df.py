@@ -1299,6 +1299,44 @@ def test_from_generator_or_iterable() -> None:
     )
 
 
+@pytest.mark.parametrize("chunk_size", [None, 1, 2])
+def test_from_generator_with_schema(chunk_size: int | None) -> None:
+    # with a complete schema, rows are loaded without any inference
+    schema = {
+        "key": pl.Categorical,
+        "n": pl.Int16,
+        "x": pl.Float32,
+        "y": pl.List(pl.Int8),
+    }
+    rows = [("a", None, 1, [1]), ("b", 2, None, None), ("a", 3, 4.5, [])]
+    expected = pl.DataFrame(rows, schema=schema, orient="row")
+
+    for data in (
+        iter(rows),
+        (dict(zip(schema, row)) for row in rows),
+    ):
+        pydf = iterable_to_pydf(data, schema=schema, chunk_size=chunk_size)
+        assert_frame_equal(pl.DataFrame._from_pydf(pydf), expected)
+
+    # overrides are applied to generated rows
+    df = pl.DataFrame(
+        (row[1:3] for row in rows),
+        schema=["n", "x"],
+        schema_overrides={"n": pl.UInt8},
+        orient="row",
+    )
+    assert df.schema == pl.Schema({"n": pl.UInt8, "x": pl.Float64})
+
+    # the dtypes inferred from the first chunk are used for subsequent chunks
+    pydf = iterable_to_pydf(
+        iter([(1, "x"), (None, None), (2, "y")]),
+        chunk_size=chunk_size or 3,
+        infer_schema_length=1,
+    )
+    assert pydf.dtypes() == [pl.Int64, pl.String]
+    assert pydf.row_tuples() == [(1, "x"), (None, None), (2, "y")]
+
+
 def test_from_rows() -> None:
     df = pl.from_records([[1, 2, "foo"], [2, 3, "bar"]], orient="row")
     assert_frame_equal(
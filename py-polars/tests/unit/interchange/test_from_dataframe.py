@@ -597,6 +597,34 @@ def test_construct_validity_buffer_from_bytemask_zero_copy_fails(
         )
 
 
+def test_construct_validity_buffer_from_bytemask_sliced() -> None:
+    bytemask = PolarsBuffer(pl.Series([1, 0, 0, 1, 1], dtype=pl.UInt8))
+
+    result = _construct_validity_buffer_from_bytemask(
+        bytemask, null_value=0, length=3, offset=1, allow_copy=True
+    )
+    assert_series_equal(result, pl.Series([False, False, True]))
+
+
+def test_construct_validity_buffer_skips_null_count() -> None:
+    class NullCountColumn(PatchableColumn):
+        @property
+        def null_count(self) -> int:
+            msg = "the validity mask should be constructed without `null_count`"
+            raise AssertionError(msg)
+
+    s = pl.Series([1.0, 2.0, 3.0])
+    col = NullCountColumn(s)
+    col.describe_null = (ColumnNullType.USE_NAN, None)
+    assert _construct_validity_buffer(None, col, s.dtype, s, allow_copy=True) is None
+
+    s = pl.Series([1.0, float("nan")])
+    col = NullCountColumn(s)
+    col.describe_null = (ColumnNullType.USE_NAN, None)
+    result = _construct_validity_buffer(None, col, s.dtype, s, allow_copy=True)
+    assert_series_equal(result, pl.Series([True, False]))  # type: ignore[arg-type]
+
+
 def test_interchange_protocol_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
     df_pd = pd.DataFrame({"a": [1, 2, 3]})
     monkeypatch.setattr(df_pd, "__arrow_c_stream__", lambda *args, **kwargs: 1 / 0)
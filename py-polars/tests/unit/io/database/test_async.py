@@ -122,10 +122,13 @@ def test_read_async(tmp_sqlite_db: Path) -> None:
 
 async def _nested_async_test(tmp_sqlite_db: Path) -> pl.DataFrame:
     async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_sqlite_db}")
-    return pl.read_database(
-        query="SELECT id, name FROM test_data ORDER BY id",
-        connection=async_engine.connect(),
-    )
+    try:
+        return pl.read_database(
+            query="SELECT id, name FROM test_data ORDER BY id",
+            connection=async_engine.connect(),
+        )
+    finally:
+        await async_engine.dispose()
 
 
 @pytest.mark.skipif(
@@ -199,3 +202,146 @@ def test_async_nested_captured_loop_21263() -> None:
         await task
 
     asyncio.run(test_impl())
+
+
+@pytest.mark.skipif(
+    parse_version(sqlalchemy.__version__) < (2, 0),
+    reason="SQLAlchemy 2.0+ required for async tests",
+)
+def test_read_database_async(tmp_sqlite_db: Path) -> None:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_sqlite_db}")
+    query = "SELECT id, name, value FROM test_data WHERE value > :n ORDER BY id DESC"
+    expected_frame = pl.DataFrame(
+        {"id": [2, 1], "name": ["other", "misc"], "value": [-99.5, 100.0]}
+    )
+
+    async def read_all() -> list[pl.DataFrame]:
+        # fan out concurrent queries over different async connection types
+        frames = await asyncio.gather(
+            pl.read_database_async(
+                query,
+                connection=async_engine,
+                execute_options={"parameters": {"n": -1000}},
+            ),
+            pl.read_database_async(
+                query,
+                connection=async_engine.connect(),
+                execute_options={"parameters": {"n": -1000}},
+            ),
+            pl.read_database_async(
+                query,
+                connection=async_sessionmaker(async_engine),
+                execute_options={"parameters": {"n": -1000}},
+            ),
+        )
+        await async_engine.dispose()
+        return list(frames)
+
+    for df in asyncio.run(read_all()):
+        assert_frame_equal(expected_frame, df)
+
+
+@pytest.mark.skipif(
+    parse_version(sqlalchemy.__version__) < (2, 0),
+    reason="SQLAlchemy 2.0+ required for async tests",
+)
+def test_read_database_async_iter_batches(tmp_sqlite_db: Path) -> None:
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_sqlite_db}")
+
+    async def read_batches() -> list[pl.DataFrame]:
+        frames = await pl.read_database_async(
+            "SELECT id, name FROM test_data ORDER BY id",
+            connection=async_engine,
+            iter_batches=True,
+            batch_size=1,
+            schema_overrides={"id": pl.UInt8},
+        )
+        batches = [df async for df in frames]
+        await async_engine.dispose()
+        return batches
+
+    frames = asyncio.run(read_batches())
+    assert len(frames) == 2
+    assert_frame_equal(
+        pl.concat(frames),
+        pl.DataFrame(
+            {"id": [1, 2], "name": ["misc", "other"]},
+            schema_overrides={"id": pl.UInt8},
+        ),
+    )
+
+    with pytest.raises(
+        ValueError, match="without also setting a non-zero `batch_size`"
+    ):
+        asyncio.run(
+            pl.read_database_async(
+                "SELECT * FROM test_data",
+                connection=async_engine,
+                iter_batches=True,
+            )
+        )
+
+
+@pytest.mark.skipif(
+    parse_version(sqlalchemy.__version__) < (2, 0),
+    reason="SQLAlchemy 2.0+ required for async tests",
+)
+@pytest.mark.parametrize("iter_batches", [False, True])
+def test_read_database_async_cursor_description(
+    tmp_sqlite_db: Path, iter_batches: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # dtypes are inferred from the driver's cursor description, as in `read_database`
+    descriptions: dict[str, tuple[Any, ...]] = {}
+
+    def dtype_from_description(cursor: Any, desc: tuple[Any, ...]) -> Any:
+        name = "id" if not descriptions else "name"
+        descriptions[name] = desc
+        return pl.Int16 if name == "id" else None
+
+    monkeypatch.setattr(
+        "polars.io.database._executor.dtype_from_cursor_description",
+        dtype_from_description,
+    )
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_sqlite_db}")
+
+    async def read_frame() -> pl.DataFrame:
+        res = await pl.read_database_async(
+            "SELECT id, name FROM test_data ORDER BY id",
+            connection=async_engine,
+            iter_batches=iter_batches,
+            batch_size=10,
+        )
+        if not isinstance(res, pl.DataFrame):
+            res = pl.concat([df async for df in res])
+        await async_engine.dispose()
+        return res
+
+    df = asyncio.run(read_frame())
+    assert df.schema == pl.Schema({"id": pl.Int16, "name": pl.String})
+    assert list(descriptions) == ["id", "name"]
+    assert all(len(desc) == 6 for desc in descriptions.values())
+
+
+def test_read_database_async_sync_connection(tmp_sqlite_db: Path) -> None:
+    # blocking connections are used from a worker thread
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_sqlite_db}")
+
+    async def read_all() -> tuple[pl.DataFrame, list[pl.DataFrame]]:
+        df = await pl.read_database_async(
+            "SELECT id, name FROM test_data ORDER BY id", connection=engine
+        )
+        frames = await pl.read_database_async(
+            "SELECT id, name FROM test_data ORDER BY id",
+            connection=engine,
+            iter_batches=True,
+            batch_size=1,
+        )
+        return df, [df async for df in frames]
+
+    df, frames = asyncio.run(read_all())
+    expected_frame = pl.DataFrame({"id": [1, 2], "name": ["misc", "other"]})
+    assert_frame_equal(expected_frame, df)
+    assert len(frames) == 2
+    assert_frame_equal(expected_frame, pl.concat(frames))
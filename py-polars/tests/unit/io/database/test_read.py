@@ -670,11 +670,60 @@ def test_read_database_mocked(
                 query="SELECT * FROM test_data",
                 protocol=sqlite3.connect(":memory:"),
                 errclass=TypeError,
-                errmsg=r"unexpected keyword argument 'partition_on'",
-                kwargs={"partition_on": "id"},
+                errmsg=r"unexpected keyword argument 'partition_col'",
+                kwargs={"partition_col": "id"},
             ),
             id="Invalid kwargs",
         ),
+        pytest.param(
+            *ExceptionTestParams(
+                read_method="read_database",
+                query="SELECT * FROM test_data",
+                protocol=sqlite3.connect(":memory:"),
+                errclass=TypeError,
+                errmsg=r"reading with `partition_on` requires a connection factory",
+                kwargs={"partition_on": "id", "partition_num": 2},
+            ),
+            id="Partitioned read without connection factory",
+        ),
+        pytest.param(
+            *ExceptionTestParams(
+                read_method="read_database",
+                query="SELECT * FROM test_data",
+                protocol=lambda: sqlite3.connect(":memory:"),
+                errclass=ValueError,
+                errmsg=r"`partition_on` and `partition_num` must be set together",
+                kwargs={"partition_on": "id"},
+            ),
+            id="Partitioned read without partition_num",
+        ),
+        pytest.param(
+            *ExceptionTestParams(
+                read_method="read_database",
+                query="SELECT * FROM test_data",
+                protocol=lambda: sqlite3.connect(":memory:"),
+                errclass=ValueError,
+                errmsg=r"`partition_num` must be a positive integer",
+                kwargs={"partition_on": "id", "partition_num": 0},
+            ),
+            id="Invalid partition_num",
+        ),
+        pytest.param(
+            *ExceptionTestParams(
+                read_method="read_database",
+                query="SELECT * FROM test_data",
+                protocol=lambda: sqlite3.connect(":memory:"),
+                errclass=ValueError,
+                errmsg=r"cannot set `iter_batches` when reading with `partition_on`",
+                kwargs={
+                    "partition_on": "id",
+                    "partition_num": 2,
+                    "iter_batches": True,
+                    "batch_size": 10,
+                },
+            ),
+            id="Partitioned read with iter_batches",
+        ),
         pytest.param(
             *ExceptionTestParams(
                 read_method="read_database",
@@ -713,6 +762,68 @@ def test_read_database_exceptions(
         read_database(**params)
 
 
+@pytest.mark.write_disk
+@pytest.mark.parametrize("partition_num", [1, 2, 3, 10])
+@pytest.mark.parametrize("partition_range", [None, (1, 2), (5, 10)])
+def test_read_database_partitioned(
+    tmp_sqlite_db: Path,
+    partition_num: int,
+    partition_range: tuple[int, int] | None,
+) -> None:
+    with sqlite3.connect(tmp_sqlite_db) as conn:
+        conn.executemany(
+            "INSERT INTO test_data (id, name, value, date) VALUES (?, ?, ?, ?)",
+            [(n, f"name_{n}", n / 2, "2022-01-01") for n in range(3, 101)],
+        )
+    expected = pl.read_database(
+        "SELECT * FROM test_data ORDER BY id",
+        connection=sqlite3.connect(tmp_sqlite_db),
+    )
+
+    connection_factories: list[Any] = [
+        lambda: sqlite3.connect(tmp_sqlite_db),
+        create_engine(f"sqlite:///{tmp_sqlite_db}"),
+    ]
+    if sys.platform != "win32":
+        connection_factories.append(lambda: adbc_sqlite_connect(str(tmp_sqlite_db)))
+
+    for connection in connection_factories:
+        df = pl.read_database(
+            "SELECT * FROM test_data",
+            connection=connection,
+            partition_on="id",
+            partition_range=partition_range,
+            partition_num=partition_num,
+        )
+        assert_frame_equal(df.sort("id"), expected, check_dtypes=False)
+
+
+@pytest.mark.write_disk
+def test_read_database_partitioned_parameterised(tmp_sqlite_db: Path) -> None:
+    df = pl.read_database(
+        "SELECT id, name FROM test_data WHERE value > :value",
+        connection=create_engine(f"sqlite:///{tmp_sqlite_db}"),
+        partition_on="id",
+        partition_num=2,
+        execute_options={"parameters": {"value": 0}},
+    )
+    assert_frame_equal(df, pl.DataFrame({"id": [1], "name": ["misc"]}))
+
+
+@pytest.mark.write_disk
+def test_read_database_partitioned_non_integer_column(tmp_sqlite_db: Path) -> None:
+    with pytest.raises(
+        TypeError,
+        match=r"`partition_on` column 'name' must be an integer column; found String",
+    ):
+        pl.read_database(
+            "SELECT * FROM test_data",
+            connection=lambda: sqlite3.connect(tmp_sqlite_db),
+            partition_on="name",
+            partition_num=2,
+        )
+
+
 @pytest.mark.parametrize(
     "query",
     [
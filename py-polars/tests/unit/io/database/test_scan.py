@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import create_engine
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def scan_conn(tmp_sqlite_db: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(tmp_sqlite_db)
+    conn.executemany(
+        "INSERT INTO test_data (id, name, value, date) VALUES (?, ?, ?, ?)",
+        [(n, f"name_{n}", n * 10.0, "2022-01-01") for n in range(3, 21)],
+    )
+    conn.execute("INSERT INTO test_data (id, name) VALUES (21, 'name_21')")
+    conn.commit()
+    return conn
+
+
+def trace_queries(conn: sqlite3.Connection) -> list[str]:
+    queries: list[str] = []
+    conn.set_trace_callback(queries.append)
+    return queries
+
+
+@pytest.mark.write_disk
+@pytest.mark.parametrize(
+    ("query", "expected_sql"),
+    [
+        (
+            lambda lf: lf.select("name"),
+            'SELECT "name" FROM test_data',
+        ),
+        (
+            lambda lf: lf.filter(pl.col("id") != 17),
+            'SELECT * FROM test_data WHERE ("id" <> 17)',
+        ),
+        (
+            lambda lf: lf.filter(
+                pl.col("id").is_in([1, 5]) | pl.col("value").is_null()
+            ),
+            'SELECT * FROM test_data WHERE (("id" IN (1, 5)) OR ("value" IS NULL))',
+        ),
+        (
+            lambda lf: lf.filter(pl.col("id").is_between(4, 6, closed="right")),
+            'SELECT * FROM test_data WHERE ("id" > 4 AND "id" <= 6)',
+        ),
+        (
+            lambda lf: lf.filter((pl.col("value") * 2) >= pl.lit(100) + 20),
+            'SELECT * FROM test_data WHERE (("value" * 2.0) >= 120.0)',
+        ),
+        (
+            lambda lf: lf.head(3),
+            "SELECT * FROM test_data LIMIT 3",
+        ),
+    ],
+)
+def test_scan_database_pushdown(
+    scan_conn: sqlite3.Connection, query: Any, expected_sql: str
+) -> None:
+    expected = query(pl.read_database("SELECT * FROM test_data", scan_conn).lazy())
+
+    lf = pl.scan_database("test_data", scan_conn)
+    lf.collect_schema()
+    queries = trace_queries(scan_conn)
+    assert_frame_equal(query(lf).collect(), expected.collect())
+    assert queries == [expected_sql]
+
+
+@pytest.mark.write_disk
+def test_scan_database_partial_pushdown(scan_conn: sqlite3.Connection) -> None:
+    lf = pl.scan_database(
+        "SELECT id, name FROM test_data WHERE id < 10",
+        scan_conn,
+        batch_size=2,
+    )
+    lf.collect_schema()
+    queries = trace_queries(scan_conn)
+
+    # `str.starts_with` can't be translated, so polars applies that part (and
+    # the limit) after reading the rows that match the rest of the predicate
+    df = (
+        lf.filter(pl.col("id") > 4, pl.col("name").str.starts_with("name_"))
+        .select("id")
+        .head(3)
+        .collect()
+    )
+    assert_frame_equal(df, pl.DataFrame({"id": [5, 6, 7]}))
+    assert queries == [
+        'SELECT "id", "name" FROM (SELECT id, name FROM test_data WHERE id < 10) '
+        'pl_scan WHERE ("id" > 4)'
+    ]
+
+    # bitwise operations on integers are never translated
+    queries.clear()
+    df = lf.filter((pl.col("id") & 1) == 1).select("id").collect()
+    assert_frame_equal(df, pl.DataFrame({"id": [1, 3, 5, 7, 9]}))
+    assert queries == [
+        'SELECT "id" FROM (SELECT id, name FROM test_data WHERE id < 10) pl_scan'
+    ]
+
+    # nor are comparisons of strings (which databases may compare differently)
+    for predicate in (
+        pl.col("name") != "name_5",
+        pl.col("name") > "name_5",
+        pl.col("name").is_in(["name_5", "NAME_6"]),
+        pl.col("name").is_between(pl.lit("name_2"), pl.lit("name_4")),
+    ):
+        expected = lf.collect().filter(predicate).select("id")
+        queries.clear()
+        assert_frame_equal(lf.filter(predicate).select("id").collect(), expected)
+        assert queries == [
+            'SELECT "id", "name" FROM (SELECT id, name FROM test_data WHERE id < 10) '
+            "pl_scan"
+        ]
+
+    # nor is `+` on strings (which concatenates them)
+    queries.clear()
+    df = lf.filter((pl.col("name") + "_x") == "name_5_x").select("id").collect()
+    assert_frame_equal(df, pl.DataFrame({"id": [5]}))
+    assert queries == [
+        'SELECT "id", "name" FROM (SELECT id, name FROM test_data WHERE id < 10) '
+        "pl_scan"
+    ]
+
+
+@pytest.mark.write_disk
+def test_scan_database_alchemy(
+    scan_conn: sqlite3.Connection, tmp_sqlite_db: Path
+) -> None:
+    lf = pl.scan_database(
+        "test_data",
+        create_engine(f"sqlite:///{tmp_sqlite_db}"),
+        schema_overrides={"id": pl.Int32},
+    )
+    assert lf.collect_schema() == pl.Schema(
+        {"id": pl.Int32, "name": pl.String, "value": pl.Float64, "date": pl.String}
+    )
+    df = lf.filter(pl.col("date") > "2021-01-01").select("id", "value").collect()
+    assert df.schema == pl.Schema({"id": pl.Int32, "value": pl.Float64})
+    assert df["id"].to_list() == [2, *range(3, 21)]
+    assert lf.select(pl.len()).collect().item() == 21
+
+
+def test_scan_database_empty_result() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE empty_data (id INTEGER, name TEXT)")
+
+    lf = pl.scan_database("empty_data", conn, schema_overrides={"id": pl.Int64})
+    assert lf.collect_schema() == pl.Schema({"id": pl.Int64, "name": pl.Null})
+    assert_frame_equal(
+        lf.filter(pl.col("id") > 1).collect(),
+        pl.DataFrame(schema={"id": pl.Int64, "name": pl.Null}),
+    )
+
+
+def test_scan_database_invalid_query() -> None:
+    from sqlalchemy import select, table
+
+    with pytest.raises(TypeError, match="requires a string query or table name"):
+        pl.scan_database(
+            select(table("test_data")),  # type: ignore[arg-type]
+            sqlite3.connect(":memory:"),
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
 import pytest
@@ -351,3 +352,51 @@ def test_write_database_adbc_temporary_table() -> None:
 
     if hasattr(conn, "close"):
         conn.close()
+
+
+@pytest.mark.write_disk
+@pytest.mark.parametrize("batch_size", [None, 1, 7])
+def test_write_database_sa_batched(tmp_path: Path, batch_size: int | None) -> None:
+    df = pl.DataFrame(
+        {
+            "id": range(25),
+            "name": [None, "", "x,y", 'say "hi"', "misc"] * 5,
+            "flag": [True, False, None, True, False] * 5,
+            "dt": pl.datetime_range(
+                datetime(2020, 1, 1), datetime(2020, 1, 25), eager=True
+            ),
+            "d": pl.date_range(date(2020, 1, 1), date(2020, 1, 25), eager=True),
+        }
+    )
+    test_db_uri = f"sqlite:///{tmp_path}/test_sa_batched.db"
+    engine = create_engine(test_db_uri, poolclass=NullPool)
+
+    assert df.write_database("test_batched", engine, batch_size=batch_size) == 25
+    with pytest.raises(ValueError, match="already exists"):
+        df.write_database("test_batched", engine, batch_size=batch_size)
+    assert (
+        df.write_database(
+            "test_batched",
+            engine,
+            if_table_exists="append",
+            batch_size=batch_size,
+        )
+        == 25
+    )
+
+    # sqlite has no native boolean/temporal types
+    result = pl.read_database(
+        query="SELECT * FROM test_batched",
+        connection=engine,
+    ).with_columns(
+        pl.col("flag").cast(pl.Boolean),
+        pl.col("dt").str.to_datetime(),
+        pl.col("d").str.to_date(),
+    )
+    assert_frame_equal(result, pl.concat([df, df]))
+
+
+def test_write_database_invalid_batch_size() -> None:
+    df = pl.DataFrame({"colx": [1, 2, 3]})
+    with pytest.raises(ValueError, match="`batch_size` must be a positive integer"):
+        df.write_database("misc", "sqlite:///:memory:", batch_size=0)
@@ -5,10 +5,10 @@ import io
 import json
 import zlib
 from collections import OrderedDict
-from datetime import datetime
+from datetime import date, datetime, time
 from decimal import Decimal as D
 from io import BytesIO
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 import zstandard
 
@@ -86,6 +86,85 @@ def test_write_json_decimal() -> None:
     assert value == """[{"a":"1.00"},{"a":"2.00"},{"a":null}]"""
 
 
+def test_write_json_orient_columns() -> None:
+    df = pl.DataFrame({"a": [1, 2, None], "b": ["x", "y", "z"]})
+    assert df.write_json(orient="columns") == '{"a":[1,2,null],"b":["x","y","z"]}'
+    assert df.clear().write_json(orient="columns") == '{"a":[],"b":[]}'
+    assert pl.DataFrame().write_json(orient="columns") == "{}"
+
+    with pytest.raises(ValueError, match="`orient` must be one of"):
+        df.write_json(orient="rows")  # type: ignore[call-overload]
+
+
+def test_write_json_formatting() -> None:
+    df = pl.DataFrame(
+        {
+            "dtm": [datetime(2025, 3, 4, 5, 6, 7)],
+            "dt": [date(2025, 3, 4)],
+            "tm": [time(5, 6, 7)],
+            "f32": pl.Series([1.23456], dtype=pl.Float32),
+            "f64": [-2 / 3],
+            "lst": [[1 / 3]],
+        }
+    )
+    out = df.write_json(
+        datetime_format="%Y-%m-%dT%H:%M:%SZ",
+        date_format="%d/%m/%Y",
+        time_format="%H:%M",
+        float_precision=2,
+    )
+    assert json.loads(out) == [
+        {
+            "dtm": "2025-03-04T05:06:07Z",
+            "dt": "04/03/2025",
+            "tm": "05:06",
+            "f32": 1.23,
+            "f64": -0.67,
+            "lst": [1 / 3],
+        }
+    ]
+
+
+@pytest.mark.parametrize("orient", ["records", "columns"])
+@pytest.mark.parametrize("batch_size", [None, 1, 2, 10])
+def test_write_json_batched(
+    orient: Literal["records", "columns"], batch_size: int | None
+) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["v", "w", "x", "y", "z"]})
+    expected = df.write_json(orient=orient)
+
+    class FlushCounter(io.BytesIO):
+        flushes = 0
+
+        def flush(self) -> None:
+            self.flushes += 1
+
+    f = FlushCounter()
+    df.write_json(f, orient=orient, batch_size=batch_size)
+    assert f.getvalue().decode() == expected
+    if batch_size == 1:
+        assert f.flushes == (df.width if orient == "columns" else df.height) + 1
+
+    s = io.StringIO()
+    df.write_json(s, orient=orient, batch_size=batch_size)
+    assert s.getvalue() == expected
+
+    empty = io.BytesIO()
+    df.clear().write_json(empty, orient=orient, batch_size=batch_size)
+    assert empty.getvalue().decode() == df.clear().write_json(orient=orient)
+
+    with pytest.raises(ValueError, match="`batch_size` must be a positive integer"):
+        df.write_json(f, batch_size=0)
+
+
+@pytest.mark.write_disk
+def test_write_json_batched_to_file(tmp_path: Path) -> None:
+    df = pl.DataFrame({"a": range(100), "b": [n / 4 for n in range(100)]})
+    file_path = tmp_path / "test.json"
+    df.write_json(file_path, batch_size=7)
+    assert_frame_equal(pl.read_json(file_path), df)
+
+
 def test_json_infer_schema_length_11148() -> None:
     response = [{"col1": 1}] * 2 + [{"col1": 1, "col2": 2}] * 1
     with pytest.raises(
@@ -106,3 +106,46 @@ def test_sink_to_file(tmp_path: Path, sink: Any, scan: Any) -> None:
             scan(f).collect(),
             df,
         )
+
+
+@pytest.mark.parametrize(("scan", "sink"), SINKS)
+def test_sink_to_callback(sink: Any, scan: Any) -> None:
+    df = pl.DataFrame({"a": range(50_000), "b": "xyz"})
+
+    chunks: list[bytes] = []
+    sink(df.lazy(), chunks.append)
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert_frame_equal(scan(io.BytesIO(b"".join(chunks))).collect(), df)
+
+    # the callback is only invoked once the (lazy) sink query is collected
+    chunks.clear()
+    lf = sink(df.lazy(), chunks.append, lazy=True)
+    assert chunks == []
+    lf.collect()
+    assert_frame_equal(scan(io.BytesIO(b"".join(chunks))).collect(), df)
+
+
+@pytest.mark.parametrize(("scan", "sink"), SINKS)
+def test_sink_to_writer_object(sink: Any, scan: Any) -> None:
+    class Writer:
+        def __init__(self) -> None:
+            self.data = bytearray()
+            self.n_flushes = 0
+
+        def write(self, b: bytes) -> None:
+            self.data += b
+
+        def flush(self) -> None:
+            self.n_flushes += 1
+
+    df = pl.DataFrame({"a": [5, 10, 1996]})
+    writer = Writer()
+    sink(df.lazy(), writer)
+
+    assert writer.n_flushes > 0
+    assert_frame_equal(scan(io.BytesIO(writer.data)).collect(), df)
+
+
+def test_sink_invalid_target() -> None:
+    with pytest.raises(TypeError, match="cannot be turned into a sink target"):
+        pl.LazyFrame({"a": [1]}).sink_csv(123)  # type: ignore[call-overload]
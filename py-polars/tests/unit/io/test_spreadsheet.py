@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import warnings
 from collections import OrderedDict
 from datetime import date, datetime, time
@@ -13,6 +14,7 @@ import pytest
 import polars as pl
 import polars.selectors as cs
 from polars.exceptions import (
+    ModuleUpgradeRequiredError,
     NoDataError,
     ParameterCollisionError,
 )
@@ -291,6 +293,99 @@ def test_read_excel_all_sheets(
         assert_frame_equal(frames["test4"].drop_nulls(), expected3)
 
 
+@pytest.mark.parametrize("source", ["path_xlsx", "path_xlsb", "path_ods"])
+def test_read_excel_all_sheets_concurrent(
+    source: str, request: pytest.FixtureRequest
+) -> None:
+    spreadsheet_path = request.getfixturevalue(source)
+    read_spreadsheet = pl.read_ods if source == "path_ods" else pl.read_excel
+
+    # worksheets are loaded concurrently (each thread opening its own parser);
+    # results should be identical to reading the worksheets one by one
+    frames = read_spreadsheet(spreadsheet_path, sheet_id=0)  # type: ignore[operator]
+    assert len(frames) == (4 if source == "path_ods" else 6)
+    for name, df in frames.items():
+        expected = read_spreadsheet(spreadsheet_path, sheet_name=name)  # type: ignore[operator]
+        assert_frame_equal(df, expected)
+
+
+@pytest.mark.skipif(not Path("/proc/self/fd").is_dir(), reason="requires /proc/self/fd")
+def test_read_excel_concurrent_releases_files(path_xlsx: Path) -> None:
+    # the parsers opened for each worksheet (and by the scan) are released
+    def n_open_files() -> int:
+        return len(os.listdir("/proc/self/fd"))
+
+    pl.read_excel(path_xlsx, sheet_id=0)
+    n_files = n_open_files()
+    for _ in range(5):
+        pl.read_excel(path_xlsx, sheet_id=0)
+        pl.scan_excel(path_xlsx, sheet_name="test1").collect()
+    assert n_open_files() == n_files
+
+
+def test_scan_excel(path_xlsx: Path) -> None:
+    lf = pl.scan_excel(path_xlsx, sheet_name="test3")
+    expected = pl.read_excel(path_xlsx, sheet_name="test3").with_columns(
+        pl.col("cardinality").cast(pl.String)
+    )
+    assert lf.collect_schema() == expected.schema
+    assert_frame_equal(lf.collect(), expected)
+    assert lf.select(pl.len()).collect().item() == 10
+
+    assert_frame_equal(
+        lf.filter(pl.col("rows_by_key") > 0.05).select("iter_groups").collect(),
+        expected.filter(pl.col("rows_by_key") > 0.05).select("iter_groups"),
+    )
+    assert_frame_equal(
+        lf.select("rows_by_key", "cardinality").head(2).collect(),
+        expected.select("rows_by_key", "cardinality").head(2),
+    )
+
+
+@pytest.mark.parametrize("drop_empty_rows", [True, False])
+def test_scan_excel_pushdown(path_xlsx: Path, drop_empty_rows: bool) -> None:
+    lf = pl.scan_excel(
+        path_xlsx,
+        sheet_name="test4",
+        schema_overrides={"cardinality": pl.Int32},
+        drop_empty_rows=drop_empty_rows,
+    )
+    df = lf.select("iter_groups", "cardinality").head(3).collect()
+    assert df.schema == pl.Schema({"iter_groups": pl.Float64, "cardinality": pl.Int32})
+    assert df.rows() == [(0.04806, 1), (0.04223, 3), (0.04774, 15)]
+
+    # without a header, generated column names refer to the column position
+    lf = pl.scan_excel(
+        path_xlsx,
+        sheet_name="test4",
+        has_header=False,
+        schema_overrides={"column_2": pl.String},
+        drop_empty_rows=drop_empty_rows,
+    )
+    df = lf.select("column_3", "column_2").head(2).collect()
+    assert df.rows() == [("iter_groups", "rows_by_key"), ("0.04806", "0.05059")]
+    assert lf.select(pl.len()).collect().item() == 7
+
+
+def test_scan_excel_empty_rows(path_empty_rows_excel: Path) -> None:
+    # dtypes are not refined from the data (integral floats stay floats)
+    expected = pl.read_excel(path_empty_rows_excel, drop_empty_rows=False)
+    expected = expected.with_columns(cs.integer().cast(pl.Float64))
+
+    lf = pl.scan_excel(path_empty_rows_excel)
+    assert_frame_equal(lf.collect(), expected.filter(pl.col("d").is_not_null()))
+    assert lf.select(pl.len()).collect().item() == 8
+
+    lf = pl.scan_excel(path_empty_rows_excel, drop_empty_rows=False)
+    assert_frame_equal(lf.select("a").collect(), expected.select("a"))
+    assert lf.head(7).select(pl.len()).collect().item() == 7
+
+
+def test_scan_excel_invalid_sheet(path_xlsx: Path) -> None:
+    with pytest.raises(ValueError, match="reads a single sheet"):
+        pl.scan_excel(path_xlsx, sheet_id=0)
+
+
 @pytest.mark.parametrize(
     "engine",
     ["calamine", "openpyxl", "xlsx2csv"],
@@ -1444,3 +1539,108 @@ def test_excel_write_select_col_dtype() -> None:
         df.write_excel(wb, hidden_columns=cs.by_dtype(pl.String))
 
     assert get_col_widths(check) == {"B": 0}
+
+
+@pytest.mark.parametrize("engine", ["calamine", "openpyxl"])
+def test_excel_write_constant_memory(engine: ExcelSpreadsheetEngine) -> None:
+    from xlsxwriter import Workbook
+
+    df = pl.DataFrame(
+        {
+            "id": ["aaa", "bbb", None, "ddd"],
+            "dt": [date(2023, 1, 1), None, date(2024, 2, 29), date(2025, 12, 31)],
+            "val": [1.5, -2.25, None, 1000.0],
+            "n": [1, 2, 3, 4],
+        }
+    )
+    xls = BytesIO()
+    df.write_excel(
+        xls,
+        position="B2",
+        constant_memory=True,
+        conditional_formats={"val": "data_bar"},
+        column_formats={"n": "0.00"},
+        header_format={"bold": True},
+        row_heights=20,
+        autofit=True,
+    )
+    read_df = pl.read_excel(xls, engine=engine, read_options={"header_row": 1})
+    if engine == "calamine":
+        read_df = read_df.drop(cs.starts_with("__UNNAMED__"))
+    else:
+        read_df = read_df.select(df.columns)
+    assert_frame_equal(df, read_df, check_dtypes=False)
+
+    with pytest.raises(ValueError, match="cannot set 'column_totals'"):
+        df.write_excel(BytesIO(), constant_memory=True, column_totals=True)
+    with pytest.raises(ValueError, match="not created with"):
+        df.write_excel(Workbook(BytesIO()), constant_memory=True)
+
+    # workbooks already in constant_memory mode are written without a table
+    with Workbook(xls := BytesIO(), {"constant_memory": True}) as wb:
+        df.write_excel(wb, worksheet="data")
+        assert wb.get_worksheet_by_name("data").tables == []
+    assert_frame_equal(df, pl.read_excel(xls, engine=engine), check_dtypes=False)
+
+
+def test_excel_write_autofit_widths() -> None:
+    from xlsxwriter import Workbook
+
+    df = pl.DataFrame(
+        {
+            "id": [1, 22, 333_000, None],
+            "val": [1.5, -20.25, None, 0.001],
+            "txt": ["ab", "WWWW\nii", "ÄÖ é", None],
+            "flag": [True, False, None, True],
+            "dt": [date(2020, 1, 1), None, None, None],
+            "cat": pl.Series(["x", "yy", "zzz", None], dtype=pl.Categorical),
+            "lst": [[1, 2], [3], None, []],
+            "null": [None, None, None, None],
+        }
+    )
+
+    # column widths are calculated from the frame data (rather than by visiting
+    # the worksheet cells); they should be identical to xlsxwriter's autofit
+    def col_widths(autofit: bool, **params: Any) -> dict[int, float]:
+        with Workbook(BytesIO()) as wb:
+            ws = wb.add_worksheet()
+            df.write_excel(wb, ws, autofit=autofit, **params)
+            if not autofit:
+                ws.autofit()
+            return {col: info[0] for col, info in ws.col_info.items()}
+
+    for params in ({}, {"include_header": False}, {"autofilter": False}):
+        assert col_widths(True, **params) == col_widths(False, **params)
+
+    # explicit column widths take precedence
+    assert (
+        col_widths(True, column_widths={"txt": 100})[2]
+        == col_widths(False, column_widths={"txt": 100})[2]
+    )
+
+
+def test_excel_write_autofit_requires_xlsxwriter_308(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import xlsxwriter
+    import xlsxwriter.utility
+
+    df = pl.DataFrame({"txt": ["ab", "cd"]})
+    df.write_excel(BytesIO(), autofit=True)
+
+    monkeypatch.setattr(xlsxwriter, "__version__", "3.0.7")
+    with pytest.raises(
+        ModuleUpgradeRequiredError, match=r"requires xlsxwriter 3\.0\.8"
+    ):
+        df.write_excel(BytesIO(), autofit=True)
+
+    # versions that don't provide the character widths fail the same way
+    monkeypatch.setattr(xlsxwriter, "__version__", "3.0.8")
+    monkeypatch.delattr(xlsxwriter.utility, "xl_pixel_width")
+    with pytest.raises(
+        ModuleUpgradeRequiredError, match=r"requires xlsxwriter 3\.0\.8"
+    ):
+        df.write_excel(BytesIO(), autofit=True)
+
+    # (autofit is only needed for non-empty frames)
+    df.clear().write_excel(BytesIO(), autofit=True)
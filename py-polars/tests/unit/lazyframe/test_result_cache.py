@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import io
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.filterwarnings("ignore::polars.exceptions.UnstableWarning")
+
+
+@pytest.mark.write_disk
+def test_result_cache_scan(tmp_path: Path) -> None:
+    data_path = tmp_path / "data.csv"
+    pl.LazyFrame({"g": [1, 2, 1, 3], "v": [1, 2, 3, 4]}).sink_csv(data_path)
+
+    cache = pl.ResultCache(tmp_path / "cache")
+    assert len(cache) == 0
+
+    lf = pl.scan_csv(data_path).group_by("g").agg(pl.col("v").sum()).sort("g")
+    expected = lf.collect()
+    assert_frame_equal(lf.collect(cache=cache), expected)
+    assert len(cache) == 1
+    assert cache.size() > 0
+
+    # a repeat query is served from the cache
+    query_runs: list[pl.QueryMetrics] = []
+    with pl.Config(query_callback=query_runs.append):
+        assert_frame_equal(lf.collect(cache=cache), expected)
+    assert query_runs == []
+
+    # a different query gets a separate entry
+    lf.head(1).collect(cache=cache)
+    assert len(cache) == 2
+
+    # changing a source file invalidates the cached result
+    pl.LazyFrame({"g": [5], "v": [5]}).sink_csv(data_path)
+    assert lf.collect(cache=cache).rows() == [(5, 5)]
+    assert len(cache) == 3
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.write_disk
+def test_result_cache_glob(tmp_path: Path) -> None:
+    for n in range(2):
+        pl.LazyFrame({"n": [n]}).sink_csv(tmp_path / f"data_{n}.csv")
+
+    cache = pl.ResultCache(tmp_path / "cache")
+    lf = pl.scan_csv(tmp_path / "data_*.csv").sort("n")
+    assert lf.collect(cache=cache)["n"].to_list() == [0, 1]
+
+    # adding a file that matches the glob pattern changes the result
+    pl.LazyFrame({"n": [2]}).sink_csv(tmp_path / "data_2.csv")
+    lf = pl.scan_csv(tmp_path / "data_*.csv").sort("n")
+    assert lf.collect(cache=cache)["n"].to_list() == [0, 1, 2]
+    assert len(cache) == 2
+
+
+@pytest.mark.write_disk
+def test_result_cache_eviction(tmp_path: Path) -> None:
+    frames = [pl.LazyFrame({"n": range(n, n + 1000)}) for n in range(3)]
+
+    probe = pl.ResultCache(tmp_path / "probe")
+    frames[0].collect(cache=probe)
+    entry_size = probe.size()
+
+    # room for two (equally sized) results
+    cache = pl.ResultCache(tmp_path / "cache", max_bytes=entry_size * 5 // 2)
+    paths: list[Path] = []
+    for lf in frames[:2]:
+        lf.collect(cache=cache)
+        (new_path,) = set(cache.directory.iterdir()).difference(paths)
+        paths.append(new_path)
+
+    # mark the second result as the least recently used one
+    os.utime(paths[1], ns=(0, 0))
+    frames[2].collect(cache=cache)
+    assert len(cache) == 2
+    assert paths[0].exists()
+    assert not paths[1].exists()
+
+    # results larger than the cache are not stored
+    small = pl.ResultCache(tmp_path / "small", max_bytes=entry_size // 2)
+    assert frames[0].collect(cache=small).height == 1000
+    assert len(small) == 0
+
+
+@pytest.mark.write_disk
+def test_result_cache_uncacheable(tmp_path: Path) -> None:
+    cache = pl.ResultCache(tmp_path)
+
+    lf = pl.scan_csv(io.BytesIO(b"a\n1\n2\n"))
+    assert lf.collect(cache=cache).height == 2
+    assert len(cache) == 0
+
+    # plans that cannot be serialized are not cached
+    lf = pl.LazyFrame({"a": [object()]}, schema={"a": pl.Object})
+    assert lf.collect(cache=cache).height == 1
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match="background mode"):
+        lf.collect(cache=cache, background=True)  # type: ignore[call-overload]
+
+    with pytest.raises(ValueError, match="`max_bytes` must be a positive integer"):
+        pl.ResultCache(tmp_path, max_bytes=0)
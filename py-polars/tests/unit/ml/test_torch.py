@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -10,6 +10,9 @@ import polars.selectors as cs
 from polars.dependencies import _lazy_import
 from polars.testing import assert_frame_equal, assert_series_equal
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # don't import torch until an actual test is triggered (the decorator already
 # ensures the tests aren't run locally; this avoids premature local import)
 torch, _ = _lazy_import("torch")
@@ -421,3 +424,199 @@ def test_from_torch() -> None:
     )
     s = pl.Series(name="tensor", values=t)
     assert_series_equal(expected_series, s)
+
+
+@pytest.mark.write_disk
+def test_iterable_dataset(tmp_path: Path) -> None:
+    from torch.utils.data import DataLoader
+
+    from polars.ml.torch import PolarsIterableDataset
+
+    path = tmp_path / "data.parquet"
+    pl.DataFrame(
+        {
+            "lbl": range(100),
+            "x": pl.int_range(100, eager=True).cast(pl.UInt16),
+            "y": [n / 2 for n in range(100)],
+        }
+    ).write_parquet(path, row_group_size=20)
+
+    ds = PolarsIterableDataset(
+        pl.scan_parquet(path),
+        label="lbl",
+        batch_size=8,
+        block_size=20,
+    )
+    batches = list(DataLoader(ds, batch_size=None))
+    assert len(batches) == 13
+    assert [len(lbl) for _, lbl in batches] == [8] * 12 + [4]
+
+    features, labels = batches[3]
+    assert_tensor_equal(labels, torch.arange(24, 32))
+    assert_tensor_equal(
+        features,
+        torch.tensor([[n, n / 2] for n in range(24, 32)], dtype=torch.float64),
+    )
+
+    # explicit features, with a multi-column label expression and a common dtype
+    ds = PolarsIterableDataset(
+        pl.scan_parquet(path),
+        label=[pl.col("lbl") % 2, "y"],
+        features="x",
+        batch_size=30,
+        dtype=pl.Float32,
+        drop_last=True,
+    )
+    batches = list(ds)
+    assert len(batches) == 3
+    features, labels = batches[0]
+    assert features.shape == (30, 1)
+    assert features.dtype == torch.float32
+    assert labels.shape == (30, 2)
+
+
+def test_iterable_dataset_shuffle_and_shard(monkeypatch: pytest.MonkeyPatch) -> None:
+    from types import SimpleNamespace
+
+    import polars.ml.torch
+    from polars.ml.torch import PolarsIterableDataset
+
+    df = pl.DataFrame({"n": range(250)})
+    ds = PolarsIterableDataset(
+        df,
+        batch_size=16,
+        block_size=32,
+        shuffle_buffer_size=40,
+        seed=42,
+    )
+    values = torch.cat([features for (features,) in ds]).flatten().tolist()
+    assert sorted(values) == list(range(250))
+    assert values != list(range(250))
+
+    # the same seed gives the same order
+    values_again = torch.cat([features for (features,) in ds]).flatten().tolist()
+    assert values == values_again
+
+    # each worker reads a distinct subset of the blocks
+    worker_values = []
+    for worker_id in range(3):
+        monkeypatch.setattr(
+            polars.ml.torch,
+            "get_worker_info",
+            lambda worker_id=worker_id: SimpleNamespace(
+                id=worker_id, num_workers=3, seed=1000 + worker_id
+            ),
+        )
+        ds = PolarsIterableDataset(df, batch_size=16, block_size=32, seed=None)
+        worker_values.append(
+            torch.cat([features for (features,) in ds]).flatten().tolist()
+        )
+    assert sorted(n for values in worker_values for n in values) == list(range(250))
+    assert all(values for values in worker_values)
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_iterable_dataset_group_by(
+    num_workers: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from types import SimpleNamespace
+
+    import polars.ml.torch
+    from polars.ml.torch import PolarsIterableDataset
+
+    # the row order of the result differs between executions of the query
+    lf = (
+        pl.LazyFrame({"key": pl.int_range(20_000, eager=True) % 5_000})
+        .group_by("key")
+        .agg(pl.len().alias("n"))
+    )
+    labels = []
+    for worker_id in range(num_workers):
+        monkeypatch.setattr(
+            polars.ml.torch,
+            "get_worker_info",
+            lambda worker_id=worker_id: SimpleNamespace(
+                id=worker_id, num_workers=num_workers, seed=worker_id
+            ),
+        )
+        ds = PolarsIterableDataset(lf, label="key", batch_size=64, block_size=500)
+        labels.extend(torch.cat([lbl for _, lbl in ds]).tolist())
+
+    assert sorted(labels) == list(range(5_000))
+
+
+def test_iterable_dataset_errors() -> None:
+    from polars.ml.torch import PolarsIterableDataset
+
+    with pytest.raises(ValueError, match="must be positive integers"):
+        PolarsIterableDataset(pl.LazyFrame({"x": [1]}), batch_size=0)
+
+    with pytest.raises(ValueError, match="does not support u16, u32, or u64"):
+        PolarsIterableDataset(pl.LazyFrame({"x": [1]}), dtype=pl.UInt32)
+
+
+def test_to_torch_out(df: pl.DataFrame) -> None:
+    out = torch.empty((3, 4), dtype=torch.float64).T
+    res = df.to_torch(out=out)
+    assert res is out
+    assert_tensor_equal(res, df.to_torch(dtype=pl.Float64))
+
+    # row-major buffers are supported too, as are Array columns
+    df = df.select(
+        pl.concat_arr("x", "x").alias("xx"),
+        pl.col("z"),
+    )
+    out = torch.zeros((4, 3), dtype=torch.float32)
+    df.to_torch(out=out)
+    assert_tensor_equal(
+        out,
+        torch.tensor(
+            [[1, 1, 1.5], [2, 2, -0.5], [2, 2, 0.0], [3, 3, -2.0]],
+            dtype=torch.float32,
+        ),
+    )
+
+    with pytest.raises(ValueError, match="does not match the frame data"):
+        df.to_torch(out=torch.empty((4, 2)))
+    with pytest.raises(ValueError, match="only applies when `return_type` is 'tensor'"):
+        df.to_torch("dict", out=out)
+    with pytest.raises(TypeError, match="Cannot cast"):
+        df.to_torch(out=torch.empty((4, 3), dtype=torch.int32))
+
+
+def test_tensor_converter(df: pl.DataFrame) -> None:
+    from polars.ml.torch import TensorConverter
+
+    convert = TensorConverter(df.schema, batch_size=4)
+    assert convert.buffer.shape == (4, 3)
+    assert convert.buffer.dtype == torch.float32
+
+    for frame in (df, df.head(2), df.tail(1)):
+        res = convert(frame)
+        assert res.data_ptr() == convert.buffer.data_ptr()
+        assert_tensor_equal(res, frame.to_torch(dtype=pl.Float32))
+    assert convert(df.clear()).shape == (0, 3)
+
+    convert = TensorConverter(
+        {"x": pl.UInt32, "y": pl.Array(pl.Int16, (2, 2))},
+        batch_size=2,
+        share_memory=True,
+    )
+    assert convert.buffer.dtype == torch.int64
+    assert convert.buffer.is_shared()
+    res = convert(
+        pl.DataFrame(
+            {"x": [7, 8], "y": [[[1, 2], [3, 4]], [[5, 6], [7, 8]]]},
+            schema=convert.schema,
+        )
+    )
+    assert_tensor_equal(res, torch.tensor([[7, 1, 2, 3, 4], [8, 5, 6, 7, 8]]))
+
+    with pytest.raises(ValueError, match="does not match the converter schema"):
+        convert(df)
+    with pytest.raises(ValueError, match="the buffer only has 2"):
+        convert(
+            pl.DataFrame(
+                {"x": [1, 2, 3], "y": [[[0] * 2] * 2] * 3}, schema=convert.schema
+            )
+        )
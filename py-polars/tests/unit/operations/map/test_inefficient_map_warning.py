@@ -57,6 +57,19 @@ TEST_CASES = [
         '(10 - pl.col("a")) / (((pl.col("a") * 4) - pl.col("a")) // (2 + (pl.col("a") * (pl.col("a") - 1))))',
     ),
     ("a", "lambda x: x in (2, 3, 4)", 'pl.col("a").is_in((2, 3, 4))'),
+    # ---------------------------------------------
+    # conditional expressions
+    # ---------------------------------------------
+    (
+        "a",
+        'lambda x: "first" if x == 1 else "not first"',
+        """pl.when(pl.col("a") == 1).then(pl.lit('first')).otherwise(pl.lit('not first'))""",
+    ),
+    (
+        "a",
+        "lambda x: x * 2 if x not in MY_LIST else -x",
+        'pl.when(~pl.col("a").is_in(MY_LIST)).then(pl.col("a") * 2).otherwise(-pl.col("a"))',
+    ),
     ("a", "lambda x: x not in (2, 3, 4)", '~pl.col("a").is_in((2, 3, 4))'),
     (
         "a",
@@ -196,6 +209,16 @@ TEST_CASES = [
         "lambda x: x.zfill(8)",
         """pl.col("b").str.zfill(8)""",
     ),
+    (
+        "b",
+        "lambda x: x.ljust(4, '*') + x.rjust(3)",
+        """pl.col("b").str.pad_end(4,'*') + pl.col("b").str.pad_start(3)""",
+    ),
+    (
+        "b",
+        "lambda x: 'B' if x.startswith('A') else x.upper()",
+        """pl.when(pl.col("b").str.starts_with('A')).then(pl.lit('B')).otherwise(pl.col("b").str.to_uppercase())""",
+    ),
     # ---------------------------------------------
     # json expr: load/extract
     # ---------------------------------------------
@@ -204,6 +227,16 @@ TEST_CASES = [
     # replace
     # ---------------------------------------------
     ("a", "lambda x: MY_DICT[x]", 'pl.col("a").replace_strict(MY_DICT)'),
+    (
+        "a",
+        "lambda x: MY_DICT.get(x)",
+        'pl.col("a").replace_strict(MY_DICT, default=None)',
+    ),
+    (
+        "a",
+        "lambda x: MY_DICT.get(x, 'z') + MY_DICT.get(x)",
+        """pl.col("a").replace_strict(MY_DICT, default='z') + pl.col("a").replace_strict(MY_DICT, default=None)""",
+    ),
     (
         "a",
         "lambda x: MY_DICT[x - 1] + MY_DICT[1 + x]",
@@ -230,6 +263,16 @@ TEST_CASES = [
         "lambda x: x.isoweekday()",
         'pl.col("f").dt.weekday()',
     ),
+    (
+        "f",
+        "lambda x: x.weekday()",
+        'pl.col("f").dt.weekday().sub(1)',
+    ),
+    (
+        "f",
+        "lambda x: x.strftime('%Y/%m')",
+        """pl.col("f").dt.strftime('%Y/%m')""",
+    ),
     (
         "f",
         "lambda x: x.hour + x.minute + x.second",
@@ -266,7 +309,8 @@ NOOP_TEST_CASES = [
     "lambda x: x[0] + 1",
     "lambda x: MY_LIST[x]",
     "lambda x: MY_DICT[1]",
-    'lambda x: "first" if x == 1 else "not first"',
+    'lambda x: "yes" if x else "no"',
+    "lambda x: x.get(1)",
     'lambda x: np.sign(x, casting="unsafe")',
 ]
 
@@ -526,3 +570,107 @@ def test_partial_functions_13523() -> None:
     df = pl.DataFrame(data)
     # should not warn
     _ = df["a"].map_elements(partial(plus, amount=1))
+
+
+@pytest.mark.parametrize(
+    ("col", "func", "expr_repr"),
+    TEST_CASES,
+)
+@pytest.mark.filterwarnings(
+    "ignore:invalid value encountered:RuntimeWarning",
+    "ignore:.*without specifying `return_dtype`:polars.exceptions.MapWithoutReturnDtypeWarning",
+    "ignore::polars.exceptions.PolarsInefficientMapWarning",
+)
+def test_map_elements_rewrite(col: str, func: str, expr_repr: str) -> None:
+    df = pl.DataFrame(
+        {
+            "a": [1, None, 2, 3],
+            "b": ["AB", None, "cd", "eF"],
+            "c": ['{"a": 1}', None, '{"b": 2}', '{"c": 3}'],
+            "d": ["2020-01-01", None, "2020-01-02", "2020-01-03"],
+            "e": [0.5, None, 0.4, 0.1],
+            "f": [
+                datetime(1969, 12, 31),
+                None,
+                datetime(2024, 5, 6),
+                datetime(2077, 10, 20),
+            ],
+        }
+    )
+    # null values must map to null, even if the native expression doesn't
+    # propagate them (eg: conditional expressions or default lookup values)
+    assert_frame_equal(
+        df.select(pl.col(col).map_elements(eval(func), rewrite=True)),
+        df.select(pl.col(col).map_elements(eval(func))),
+        check_dtypes=(".dt." not in expr_repr),
+    )
+
+
+@pytest.mark.filterwarnings("error")
+def test_map_elements_rewrite_applied() -> None:
+    def not_called(x: Any) -> Any:
+        raise AssertionError
+
+    mapping = {1: "one", 2: "two"}
+    df = pl.DataFrame({"a": [1, 2, None, 3]})
+
+    # the function is translated (and not called), keeping the output name
+    # and the requested return dtype
+    result = df.select(
+        (pl.col("a") * 10)
+        .alias("b")
+        .map_elements(lambda x: x + 1, return_dtype=pl.Int32, rewrite=True),
+        pl.col("a").map_elements(lambda x: mapping.get(x, "many"), rewrite=True),
+    )
+    expected = pl.DataFrame(
+        {
+            "b": pl.Series([11, 21, None, 31], dtype=pl.Int32),
+            "a": ["one", "two", None, "many"],
+        }
+    )
+    assert_frame_equal(result, expected)
+
+    s = pl.Series("s", ["x", None, "yy"])
+    assert_series_equal(
+        s.map_elements(lambda x: x.upper() if x.startswith("y") else x, rewrite=True),
+        pl.Series("s", ["x", None, "YY"]),
+    )
+
+    with pl.Config(rewrite_map_elements=True):
+        assert_series_equal(
+            df["a"].map_elements(lambda x: x > 1 and x < 3),
+            pl.Series("a", [False, True, None, False]),
+        )
+        # functions that can't be translated are still called
+        with pytest.raises(AssertionError):
+            df["a"].map_elements(not_called)
+
+    # (and rewriting is opt-in)
+    with pytest.warns(PolarsInefficientMapWarning):
+        df.select(pl.col("a").map_elements(lambda x: x + 1, return_dtype=pl.Int64))
+
+
+def test_map_elements_rewrite_scope() -> None:
+    # a function from another module, whose "mapping" global is not the same as
+    # the caller's "mapping"
+    module_globals: dict[str, Any] = {"mapping": {1: "one", 2: "two"}}
+    exec("lookup = lambda x: mapping.get(x, 'many')", module_globals)
+    mapping = {1: "uno", 2: "dos"}  # noqa: F841
+
+    df = pl.DataFrame({"a": [1, 2, None, 3], "b": [1, 1, 1, 1]})
+    with pytest.warns(PolarsInefficientMapWarning):
+        result = df.select(
+            pl.col("a").map_elements(
+                module_globals["lookup"], return_dtype=pl.String, rewrite=True
+            )
+        )
+    assert result["a"].to_list() == ["one", "two", None, "many"]
+
+    # expressions with multiple root columns are not rewritten
+    with pytest.warns(PolarsInefficientMapWarning):
+        result = df.select(
+            (pl.col("a") + pl.col("b")).map_elements(
+                lambda x: x * 2, return_dtype=pl.Int64, rewrite=True
+            )
+        )
+    assert result["a"].to_list() == [4, 6, None, 8]
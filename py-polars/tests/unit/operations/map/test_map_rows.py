@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
 import pytest
 
 import polars as pl
-from polars.exceptions import ComputeError
-from polars.testing import assert_frame_equal
+from polars.exceptions import ComputeError, ShapeError
+from polars.testing import assert_frame_equal, assert_series_equal
 
 
 def test_map_rows() -> None:
@@ -67,3 +68,93 @@ def test_map_rows_shifted_chunks() -> None:
         }
     )
     assert_frame_equal(result, expected)
+
+
+def _scale_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
+    return (row[0] * 10, row[1].upper())
+
+
+def _scale_columns(columns: tuple[Any, ...]) -> Any:
+    return columns[0] * 10
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 2, 5])
+def test_map_rows_batched(batch_size: int | None) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["v", "w", "x", "y", "z"]})
+
+    result = df.map_rows(_scale_row, batch_size=batch_size)
+    expected = pl.DataFrame(
+        {"column_0": [10, 20, 30, 40, 50], "column_1": ["V", "W", "X", "Y", "Z"]}
+    )
+    assert_frame_equal(result, expected)
+
+    result = df.map_rows(
+        lambda t: (t[0] * 2, t[0] + 0.5), vectorized=True, batch_size=batch_size
+    )
+    expected = pl.DataFrame(
+        {"column_0": [2, 4, 6, 8, 10], "column_1": [1.5, 2.5, 3.5, 4.5, 5.5]}
+    )
+    assert_frame_equal(result, expected)
+
+    result = df.map_rows(
+        lambda t: t[0] * 2, pl.Int8, vectorized=True, batch_size=batch_size
+    )
+    assert_frame_equal(
+        result, pl.DataFrame({"map": [2, 4, 6, 8, 10]}, schema={"map": pl.Int8})
+    )
+
+
+def test_map_rows_batched_dtype_inference() -> None:
+    # each batch infers its own dtype; the results are combined to the supertype
+    df = pl.DataFrame({"a": [1, 2, 3, 4]})
+    result = df.map_rows(lambda t: t[0] if t[0] < 3 else t[0] / 2, batch_size=2)
+    assert_frame_equal(result, pl.DataFrame({"map": [1.0, 2.0, 1.5, 2.0]}))
+
+
+def test_map_rows_vectorized_receives_arrays() -> None:
+    df = pl.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]})
+    batch_sizes: list[int] = []
+
+    def udf(columns: tuple[np.ndarray[Any, Any], ...]) -> np.ndarray[Any, Any]:
+        assert all(isinstance(c, np.ndarray) for c in columns)
+        batch_sizes.append(len(columns[0]))
+        return np.hypot(columns[0], columns[1])
+
+    result = df.map_rows(udf, vectorized=True, batch_size=2)
+    assert batch_sizes == [2, 1]
+    assert_series_equal(
+        result.to_series(), pl.Series("map", np.hypot([1, 2, 3], [4.0, 5.0, 6.0]))
+    )
+
+
+def test_map_rows_vectorized_wrong_length() -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    with pytest.raises(ShapeError, match="returned 1 values for a batch of 3 rows"):
+        df.map_rows(lambda t: t[0][:1], vectorized=True)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_map_rows_processes(vectorized: bool) -> None:
+    df = pl.DataFrame({"a": range(100), "b": [str(n) for n in range(100)]})
+    result = df.map_rows(
+        _scale_columns if vectorized else _scale_row,
+        vectorized=vectorized,
+        processes=2,
+    )
+    assert_series_equal(
+        result.to_series(0),
+        pl.Series("map" if vectorized else "column_0", range(0, 1000, 10)),
+    )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "msg"),
+    [
+        ({"batch_size": 0}, "`batch_size` must be a positive integer"),
+        ({"processes": 0}, "`processes` must be a positive integer"),
+    ],
+)
+def test_map_rows_invalid_batching(kwargs: dict[str, Any], msg: str) -> None:
+    with pytest.raises(ValueError, match=msg):
+        pl.DataFrame({"a": [1]}).map_rows(lambda t: t, **kwargs)
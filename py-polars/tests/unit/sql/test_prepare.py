@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import polars as pl
+from polars.sql import context as sql_context
+from polars.testing import assert_frame_equal
+
+
+@pytest.fixture
+def foods_ipc_path() -> Path:
+    return Path(__file__).parent.parent / "io" / "files" / "foods1.ipc"
+
+
+@pytest.fixture(params=["plan", "text"])
+def execution(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    # plans of the (small) test queries are bound into, unless no plan is small
+    # enough, in which case the values are formatted into the query text
+    if request.param == "text":
+        monkeypatch.setattr(sql_context, "_PREPARED_PLAN_MAX_SIZE", -1)
+    return str(request.param)
+
+
+def test_prepare_execute(foods_ipc_path: Path, execution: str) -> None:
+    ctx = pl.SQLContext(foods=pl.scan_ipc(foods_ipc_path))
+    query = """
+        SELECT category, COUNT(*) AS n, SUM(calories) AS total
+        FROM foods
+        WHERE fats_g > $1 AND calories < $2 AND category <> '$3' -- $4
+        GROUP BY category
+        ORDER BY category
+    """
+    stmt = ctx.prepare(query)
+    assert stmt.n_params == 2
+    assert (stmt._prepared is not None) is (execution == "plan")
+
+    for fats_g, calories in [(0.5, 100), (5, 1000), (0, 0)]:
+        expected = ctx.execute(
+            query.replace("$1", str(fats_g)).replace("$2", str(calories))
+        )
+        assert_frame_equal(stmt.execute([fats_g, calories]), expected)
+        assert_frame_equal(
+            stmt.execute((fats_g, calories), eager=True), expected.collect()
+        )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        -10,
+        1.5e-10,
+        float("inf"),
+        "it's",
+        date(2020, 1, 5),
+        datetime(2020, 1, 5, 10, 30, 45, 123456),
+        time(23, 59, 59, 999),
+    ],
+)
+def test_prepare_param_values(value: Any, execution: str) -> None:
+    ctx = pl.SQLContext(frame=pl.LazyFrame({"n": [1, 2]}), eager=True)
+    stmt = ctx.prepare("SELECT n, $1 AS value FROM frame")
+    assert (stmt._prepared is not None) is (execution == "plan")
+    assert stmt.execute([value]).to_dict(as_series=False) == {
+        "n": [1, 2],
+        "value": [value, value],
+    }
+
+
+def test_prepare_params_requiring_values() -> None:
+    df = pl.DataFrame({"id": [1, 2, 3], "txt": ["aa", "ab", "ba"]})
+    ctx = pl.SQLContext(df=df, eager=True)
+
+    # the values of these parameters are needed in order to plan the query
+    for query, params, expected in (
+        ("SELECT id FROM df WHERE txt LIKE $1", ["a%"], [1, 2]),
+        ("SELECT id FROM df WHERE txt IN ($1, $2)", ["ab", "ba"], [2, 3]),
+        ("SELECT id FROM df ORDER BY id DESC LIMIT $1", [1], [3]),
+    ):
+        stmt = ctx.prepare(query)
+        assert stmt._prepared is None
+        assert stmt.execute(params)["id"].to_list() == expected
+
+
+def test_prepare_large_plan() -> None:
+    # binding into a plan that holds a lot of in-memory data would copy that
+    # data on every execution, so the values are formatted into the query text
+    ctx = pl.SQLContext(small=pl.DataFrame({"a": [1, 2, 3]}), eager=True)
+    ctx.register("large", pl.DataFrame({"a": range(100_000)}))
+
+    assert ctx.prepare("SELECT a FROM small WHERE a > $1")._prepared is not None
+    stmt = ctx.prepare("SELECT a FROM large WHERE a > $1")
+    assert stmt._prepared is None
+    assert stmt.execute([99_997])["a"].to_list() == [99_998, 99_999]
+
+
+def test_prepare_cache() -> None:
+    ctx = pl.SQLContext(df=pl.DataFrame({"a": [1, 2, 3]}), eager=True)
+
+    stmt = ctx.prepare("SELECT a FROM df WHERE a > $1")
+    assert ctx.prepare("SELECT a FROM df WHERE a > $1") is stmt
+    assert ctx.prepare("SELECT a FROM df WHERE a < $1") is not stmt
+
+    # registering tables invalidates the cache
+    ctx.register("df", pl.DataFrame({"a": [4, 5, 6]}))
+    new_stmt = ctx.prepare("SELECT a FROM df WHERE a > $1")
+    assert new_stmt is not stmt
+    assert new_stmt.execute([4])["a"].to_list() == [5, 6]
+
+    # as does a statement that can change the tables
+    ctx.execute("CREATE TABLE df2 AS SELECT * FROM df")
+    assert ctx.prepare("SELECT a FROM df WHERE a > $1") is not new_stmt
+
+
+def test_prepare_errors() -> None:
+    ctx = pl.SQLContext(df=pl.DataFrame({"a": [1, 2, 3]}))
+    stmt = ctx.prepare("SELECT a FROM df WHERE a BETWEEN $1 AND $2")
+
+    with pytest.raises(ValueError, match="expected 2 parameter value"):
+        stmt.execute([1])
+    with pytest.raises(TypeError, match="unsupported query parameter value"):
+        stmt.execute([1, [2, 3]])
+    with pytest.raises(TypeError, match="unsupported query parameter value"):
+        stmt.execute([1, pl.lit(2)])
+    with pytest.raises(ValueError, match=r"invalid query parameter: \$0"):
+        ctx.prepare("SELECT a FROM df WHERE a > $0")
+
+
+def test_prepare_register_invalidates_plan(execution: str) -> None:
+    ctx = pl.SQLContext(df=pl.DataFrame({"a": [1, 2, 3]}), eager=True)
+    stmt = ctx.prepare("SELECT a FROM df WHERE a > $1")
+    assert stmt.execute([1])["a"].to_list() == [2, 3]
+
+    # existing statements see the newly registered data
+    ctx.register("df", pl.DataFrame({"a": [4, 5, 6]}))
+    assert stmt.execute([4])["a"].to_list() == [5, 6]
+    assert (stmt._prepared is not None) is (execution == "plan")
+
+    ctx.execute("CREATE TABLE df AS SELECT a * 10 AS a FROM df")
+    assert stmt.execute([50])["a"].to_list() == [60]
+
+    ctx.unregister("df")
+    with pytest.raises(pl.exceptions.SQLInterfaceError, match="df"):
+        stmt.execute([1])
@@ -531,3 +531,39 @@ def test_streaming_group_by_all_null_21593() -> None:
 
     out = df.lazy().group_by(pl.all()).min().collect(engine="streaming")
     assert_frame_equal(df, out, check_row_order=False)
+
+
+@pytest.mark.write_disk
+def test_streaming_group_by_spill_to_disk(
+    tmp_path: Path, monkeypatch: Any, capfd: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("POLARS_TEMP_DIR", str(tmp_path))
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+    monkeypatch.setenv("POLARS_STREAMING_MEMORY_LIMIT", "1000")
+
+    np.random.seed(0)
+    n = 20_000
+    df = pl.DataFrame(
+        {
+            "a": np.random.randint(0, 5_000, n),
+            "b": pl.Series(np.random.randint(0, 5, n)).cast(pl.String),
+            "c": np.arange(n),
+        }
+    )
+    q = (
+        df.lazy()
+        .group_by("a", "b")
+        .agg(
+            pl.col("c").sum().alias("sum"),
+            pl.col("c").min().alias("min"),
+            pl.col("b").max().alias("max"),
+            pl.len(),
+        )
+    )
+    capfd.readouterr()
+    assert_frame_equal(
+        q.collect(engine="streaming"),
+        q.collect(engine="in-memory"),
+        check_row_order=False,
+    )
+    assert "[group-by]: spilling to" in capfd.readouterr().err
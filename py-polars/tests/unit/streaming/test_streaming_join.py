@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import pandas as pd
@@ -358,3 +358,242 @@ def test_invert_order_full_join_22295() -> None:
     lf.join(lf, on=["value", "value_at"], how="full", coalesce=True).collect(
         engine="streaming"
     )
+
+
+@pytest.mark.parametrize("strategy", ["backward", "forward", "nearest"])
+@pytest.mark.parametrize("by", [None, "sym"])
+@pytest.mark.parametrize("tolerance", [None, 3])
+def test_streaming_join_asof(
+    strategy: Literal["backward", "forward", "nearest"],
+    by: str | None,
+    tolerance: int | None,
+) -> None:
+    rng = np.random.default_rng(0)
+    n = 1_000
+
+    def chunked(df: pl.DataFrame) -> pl.LazyFrame:
+        return pl.concat(
+            [df.slice(i, 97) for i in range(0, df.height, 97)], rechunk=False
+        ).lazy()
+
+    trades = pl.DataFrame(
+        {
+            "time": np.sort(rng.integers(0, 5 * n, n)),
+            "sym": rng.choice(["a", "b", "c"], n),
+            "price": np.arange(n),
+        }
+    )
+    quotes = pl.DataFrame(
+        {
+            "time": np.sort(rng.integers(0, 5 * n, 2 * n)),
+            "sym": rng.choice(["a", "b", "c"], 2 * n),
+            "quote": np.arange(2 * n),
+        }
+    )
+
+    # Split the inputs into many chunks so the join runs over multiple morsels.
+    q = chunked(trades).join_asof(
+        chunked(quotes),
+        on="time",
+        by=by,
+        strategy=strategy,
+        tolerance=tolerance,
+    )
+    assert_frame_equal(q.collect(engine="streaming"), q.collect(engine="in-memory"))
+    if by is None:
+        dot = q.show_graph(raw_output=True, plan_stage="physical", engine="streaming")
+        assert 'label="asof-join' in dot  # type: ignore[operator]
+        assert_frame_equal(
+            q.slice(10, 100).collect(engine="streaming"),
+            q.collect(engine="in-memory").slice(10, 100),
+        )
+
+
+def test_streaming_join_asof_by_sorted_within_groups() -> None:
+    # The keys are only sorted within each group, which is all the in-memory
+    # engine requires when joining with `by`.
+    left = pl.LazyFrame({"sym": ["a", "a", "b", "b"], "time": [1, 5, 2, 3]})
+    right = pl.LazyFrame(
+        {"sym": ["a", "a", "b", "b"], "time": [0, 4, 1, 2], "quote": [1, 2, 3, 4]}
+    )
+
+    q = left.join_asof(right, on="time", by="sym")
+    assert_frame_equal(q.collect(engine="streaming"), q.collect(engine="in-memory"))
+    dot = q.show_graph(raw_output=True, plan_stage="physical", engine="streaming")
+    assert 'label="asof-join' not in dot  # type: ignore[operator]
+
+    # If both inputs are known to be sorted on the key we can stream the join.
+    q = left.sort("time").join_asof(right.sort("time"), on="time", by="sym")
+    assert_frame_equal(
+        q.collect(engine="streaming"),
+        q.collect(engine="in-memory"),
+        check_row_order=False,
+    )
+    dot = q.show_graph(raw_output=True, plan_stage="physical", engine="streaming")
+    assert 'label="asof-join' in dot  # type: ignore[operator]
+
+
+def test_streaming_join_asof_check_sortedness() -> None:
+    left = pl.LazyFrame({"time": [3, 1, 2]})
+    right = pl.LazyFrame({"time": [0, 2], "quote": [1, 2]})
+
+    q = left.join_asof(right, on="time")
+    with pytest.raises(pl.exceptions.InvalidOperationError, match="not sorted"):
+        q.collect(engine="streaming")
+
+    q = left.join_asof(right, on="time", check_sortedness=False)
+    assert q.collect(engine="streaming").height == 3
+
+
+@pytest.mark.parametrize(
+    "predicates",
+    [
+        [pl.col("start") <= pl.col("time"), pl.col("end") > pl.col("time")],
+        [pl.col("start") > pl.col("time"), pl.col("end") < pl.col("value") * 10],
+        [pl.col("end") >= pl.col("time")],
+    ],
+)
+@pytest.mark.parametrize("memory_limit", [None, "1000"])
+@pytest.mark.write_disk
+def test_streaming_join_where(
+    predicates: list[pl.Expr],
+    memory_limit: str | None,
+    tmp_path: Path,
+    monkeypatch: Any,
+    capfd: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setenv("POLARS_TEMP_DIR", str(tmp_path))
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+    if memory_limit is not None:
+        # Spills the build side in many small range-partitioned blocks.
+        monkeypatch.setenv("POLARS_STREAMING_MEMORY_LIMIT", memory_limit)
+
+    rng = np.random.default_rng(0)
+    start = rng.integers(0, 1_000, 300)
+    windows = pl.DataFrame(
+        {
+            "start": start,
+            "end": pl.Series(start + rng.integers(0, 50, 300)).scatter([3, 7], None),
+        }
+    )
+    events = pl.DataFrame(
+        {
+            "time": pl.Series(rng.integers(0, 1_100, 500)).scatter([0, 10], None),
+            "value": rng.integers(0, 100, 500),
+        }
+    )
+
+    q = windows.lazy().join_where(events.lazy(), *predicates)
+    if len(predicates) > 1:
+        # The streaming inequality join is only used if it may have to spill.
+        dot = q.show_graph(raw_output=True, plan_stage="physical", engine="streaming")
+        assert ('label="iejoin' in dot) is (memory_limit is not None)  # type: ignore[operator]
+
+    capfd.readouterr()
+    assert_frame_equal(
+        q.collect(engine="streaming"),
+        q.collect(engine="in-memory"),
+        check_row_order=False,
+    )
+    if len(predicates) > 1 and memory_limit is not None:
+        assert "[iejoin]: spilling to" in capfd.readouterr().err
+
+
+@pytest.mark.write_disk
+def test_streaming_join_where_non_elementwise_keys(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setenv("POLARS_TEMP_DIR", str(tmp_path))
+    monkeypatch.setenv("POLARS_STREAMING_MEMORY_LIMIT", "1000")
+
+    rng = np.random.default_rng(0)
+    a = pl.LazyFrame({"a": rng.integers(0, 1_000, 300)})
+    b = pl.LazyFrame(
+        {"b": rng.integers(0, 1_000, 500), "c": rng.integers(0, 1_000, 500)}
+    )
+
+    # Keys that aggregate over their input can't be evaluated per morsel.
+    q = a.join_where(
+        b,
+        (pl.col("a") - pl.col("a").min()) < pl.col("b"),
+        pl.col("a") > pl.col("c") - pl.col("c").min(),
+    )
+    dot = q.show_graph(raw_output=True, plan_stage="physical", engine="streaming")
+    assert 'label="iejoin' not in dot  # type: ignore[operator]
+    assert_frame_equal(
+        q.collect(engine="streaming"),
+        q.collect(engine="in-memory"),
+        check_row_order=False,
+    )
+
+
+@pytest.mark.write_disk
+def test_streaming_join_where_nan_keys(tmp_path: Path, monkeypatch: Any) -> None:
+    monkeypatch.setenv("POLARS_TEMP_DIR", str(tmp_path))
+    monkeypatch.setenv("POLARS_STREAMING_MEMORY_LIMIT", "1000")
+
+    rng = np.random.default_rng(0)
+    left = pl.DataFrame(
+        {
+            "x": pl.Series(rng.random(300)).scatter([0, 150], float("nan")),
+            "y": rng.random(300),
+        }
+    )
+    right = pl.DataFrame(
+        {
+            "lo": pl.Series(rng.random(500)).scatter([1, 200, 400], float("nan")),
+            "hi": rng.random(500) + 0.5,
+        }
+    )
+
+    for predicates in (
+        [pl.col("x") > pl.col("lo"), pl.col("y") < pl.col("hi")],
+        [pl.col("x") <= pl.col("lo"), pl.col("y") < pl.col("hi")],
+    ):
+        q = left.lazy().join_where(right.lazy(), *predicates)
+        assert_frame_equal(
+            q.collect(engine="streaming"),
+            q.collect(engine="in-memory"),
+            check_row_order=False,
+        )
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "full"])
+@pytest.mark.parametrize("nulls_equal", [False, True])
+@pytest.mark.write_disk
+def test_streaming_join_spill_to_disk(
+    how: JoinStrategy,
+    nulls_equal: bool,
+    tmp_path: Path,
+    monkeypatch: Any,
+    capfd: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setenv("POLARS_TEMP_DIR", str(tmp_path))
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+    monkeypatch.setenv("POLARS_STREAMING_MEMORY_LIMIT", "1000")
+
+    rng = np.random.default_rng(0)
+    n = 10_000
+    left = pl.DataFrame(
+        {
+            "a": pl.Series(rng.integers(0, 2_000, n)).scatter([1, 5], None),
+            "b": rng.integers(0, 3, n),
+            "x": np.arange(n),
+        }
+    )
+    right = pl.DataFrame(
+        {
+            "a": pl.Series(rng.integers(0, 2_000, n)).scatter([2, 8], None),
+            "b": rng.integers(0, 3, n),
+            "y": pl.Series(np.arange(n)).cast(pl.String),
+        }
+    )
+
+    q = left.lazy().join(right.lazy(), on=["a", "b"], how=how, nulls_equal=nulls_equal)
+    capfd.readouterr()
+    assert_frame_equal(
+        q.collect(engine="streaming"),
+        q.collect(engine="in-memory"),
+        check_row_order=False,
+    )
+    assert "[equi-join]: spilling to" in capfd.readouterr().err
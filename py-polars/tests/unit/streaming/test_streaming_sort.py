@@ -296,3 +296,52 @@ def test_sort_descending_nulls_last(descending: bool, nulls_last: bool) -> None:
         .collect(engine="streaming"),
         pl.DataFrame({"x": ref_x, "y": ref_y}),
     )
+
+
+@pytest.mark.write_disk
+@pytest.mark.parametrize("descending", [True, False])
+@pytest.mark.parametrize("nulls_last", [True, False])
+def test_streaming_sort_spill_to_disk(
+    tmp_path: Path,
+    monkeypatch: Any,
+    capfd: pytest.CaptureFixture[str],
+    descending: bool,
+    nulls_last: bool,
+) -> None:
+    monkeypatch.setenv("POLARS_TEMP_DIR", str(tmp_path))
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+    # Such a small limit spills (nearly) every morsel as a separate sorted run.
+    monkeypatch.setenv("POLARS_STREAMING_MEMORY_LIMIT", "1000")
+
+    np.random.seed(0)
+    n = 10_000
+    df = pl.DataFrame(
+        {
+            "a": np.random.randint(0, 50, n),
+            "b": pl.Series(np.random.randint(0, 5, n)).replace(0, None),
+            "c": np.arange(n),
+        }
+    )
+    q = df.lazy().sort(
+        ["a", "b"], descending=descending, nulls_last=nulls_last, maintain_order=True
+    )
+    dot = q.show_graph(raw_output=True, plan_stage="physical", engine="streaming")
+    assert 'label="sort\\n' in dot  # type: ignore[operator]
+
+    capfd.readouterr()
+    assert_frame_equal(q.collect(engine="streaming"), q.collect(engine="in-memory"))
+    assert "[sort]: spilling to" in capfd.readouterr().err
+
+    q = df.lazy().sort(
+        pl.col("a") * 2 - pl.col("c"), descending=descending, maintain_order=True
+    )
+    assert_frame_equal(q.collect(engine="streaming"), q.collect(engine="in-memory"))
+
+
+def test_streaming_memory_limit_invalid(monkeypatch: Any) -> None:
+    monkeypatch.setenv("POLARS_STREAMING_MEMORY_LIMIT", "1GB")
+    q = pl.LazyFrame({"a": [3, 1, 2]}).sort("a")
+    with pytest.raises(
+        pl.exceptions.InvalidOperationError, match="POLARS_STREAMING_MEMORY_LIMIT"
+    ):
+        q.collect(engine="streaming")
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import io
 import os
+import time
 from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any
@@ -11,6 +14,7 @@ import polars as pl
 import polars.polars as plr
 from polars._utils.unstable import issue_unstable_warning
 from polars.config import _POLARS_CFG_ENV_VARS
+from polars.lazyframe import query_metrics
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -838,6 +842,16 @@ def test_set_streaming_chunk_size() -> None:
         cfg.set_streaming_chunk_size(0)
 
 
+def test_set_streaming_memory_limit() -> None:
+    with pl.Config() as cfg:
+        cfg.set_streaming_memory_limit(1024)
+        assert os.environ.get("POLARS_STREAMING_MEMORY_LIMIT") == "1024"
+    assert "POLARS_STREAMING_MEMORY_LIMIT" not in os.environ
+
+    with pytest.raises(ValueError), pl.Config() as cfg:
+        cfg.set_streaming_memory_limit(0)
+
+
 def test_set_fmt_str_lengths_invalid_length() -> None:
     with pl.Config() as cfg:
         with pytest.raises(ValueError):
@@ -993,6 +1007,12 @@ def test_warn_unstable(recwarn: pytest.WarningsRecorder) -> None:
             "1",
         ),
         ("POLARS_STREAMING_CHUNK_SIZE", "set_streaming_chunk_size", 100, "100"),
+        (
+            "POLARS_STREAMING_MEMORY_LIMIT",
+            "set_streaming_memory_limit",
+            1000,
+            "1000",
+        ),
         ("POLARS_TABLE_WIDTH", "set_tbl_width_chars", 80, "80"),
         ("POLARS_VERBOSE", "set_verbose", True, "1"),
         ("POLARS_WARN_UNSTABLE", "warn_unstable", True, "1"),
@@ -1008,3 +1028,68 @@ def test_unset_config_env_vars(
 
     with pl.Config(**{config_setting: None}):  # type: ignore[arg-type]
         assert environment_variable not in os.environ
+
+
+def test_set_query_callback() -> None:
+    reported: list[pl.QueryMetrics] = []
+    lf = pl.LazyFrame({"a": [1, 2, 3]}).filter(pl.col("a") > 1)
+
+    with pl.Config(query_callback=reported.append):
+        assert lf.collect().height == 2
+        lf.sink_ndjson(io.BytesIO())
+        # eager methods are not reported
+        pl.DataFrame({"a": [1.0, None]}).drop_nulls()
+
+    # the callback is removed on scope exit
+    lf.collect()
+
+    assert [m.kind for m in reported] == ["collect", "sink"]
+    collected, sunk = reported
+    assert collected.n_rows == 2
+    assert sunk.n_rows == 0
+
+    # the plan is only described when accessed
+    assert "plan" not in vars(collected)
+    assert collected.plan == lf.explain()
+    assert len(collected.plan_hash) == 16
+    assert collected.plan_hash != sunk.plan_hash
+    assert collected.wall_time >= 0.0
+    assert collected.start_time <= time.time()
+
+
+def test_set_query_callback_error() -> None:
+    def callback(metrics: pl.QueryMetrics) -> None:
+        msg = "oops"
+        raise RuntimeError(msg)
+
+    # the query succeeded, so the exception is turned into a warning
+    lf = pl.LazyFrame({"a": [1, 2, 3]})
+    with (
+        pl.Config(query_callback=callback),
+        pytest.warns(UserWarning, match="query callback raised an exception"),
+    ):
+        assert lf.collect().height == 3
+
+
+def test_set_query_callback_scope() -> None:
+    def callback(metrics: pl.QueryMetrics) -> None:
+        pass
+
+    pl.Config.set_query_callback(callback)
+    with pl.Config(restore_defaults=True):
+        assert query_metrics.get_query_callback() is None
+    assert query_metrics.get_query_callback() is callback
+
+    pl.Config.restore_defaults()
+    assert query_metrics.get_query_callback() is None
+
+
+def test_set_query_callback_async() -> None:
+    reported: list[pl.QueryMetrics] = []
+    pl.Config.set_query_callback(reported.append)
+
+    async def collect() -> pl.DataFrame:
+        return await pl.LazyFrame({"a": [1, 2, 3]}).collect_async()
+
+    assert asyncio.run(collect()).height == 3
+    assert [(m.kind, m.n_rows) for m in reported] == [("collect_async", 3)]
@@ -1,4 +1,8 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
 from datetime import date
+from typing import NamedTuple
 
 import pytest
 
@@ -223,6 +227,90 @@ def test_iter_rows() -> None:
     ]
 
 
+def test_rows_row_type() -> None:
+    class Point(NamedTuple):
+        y: float
+        x: int
+
+    @dataclass
+    class Record:
+        x: int
+        label: str | None
+        tags: list[str] = field(default_factory=list)
+
+    df = pl.DataFrame(
+        {"x": [1, 2, 3], "y": [0.5, None, -1.5], "label": ["a", "b", None]}
+    )
+    assert df.rows(row_type=Point) == [Point(0.5, 1), Point(None, 2), Point(-1.5, 3)]  # type: ignore[arg-type]
+    assert df.rows(row_type=Point) == list(df.iter_rows(row_type=Point))
+
+    with pytest.raises(pl.exceptions.ColumnNotFoundError):
+        df.rows(row_type=Record)
+    with pytest.raises(pl.exceptions.ColumnNotFoundError):
+        next(df.iter_rows(row_type=Record, buffer_size=0))
+
+    df = df.with_columns(tags=pl.lit(["t"]))
+    expected = [Record(1, "a", ["t"]), Record(2, "b", ["t"]), Record(3, None, ["t"])]
+    assert df.rows(row_type=Record) == expected
+    for buffer_size in (0, 2):
+        assert list(df.iter_rows(row_type=Record, buffer_size=buffer_size)) == expected
+
+    # mapping types are instantiated with keyword arguments
+    assert df.select("x", "y").rows(row_type=dict) == df.select("x", "y").to_dicts()
+
+
+def test_rows_row_type_tuple_and_invalid() -> None:
+    class Pair(tuple):  # type: ignore[type-arg]
+        pass
+
+    df = pl.DataFrame({"x": [1, 2], "y": ["a", None]})
+    for row_type in (tuple, Pair):
+        rows = df.rows(row_type=row_type)
+        assert rows == [(1, "a"), (2, None)]
+        assert all(type(row) is row_type for row in rows)
+        for buffer_size in (0, 1):
+            assert (
+                list(df.iter_rows(row_type=row_type, buffer_size=buffer_size)) == rows
+            )
+
+    class Plain:
+        def __init__(self, x: int, y: str | None) -> None:
+            self.x, self.y = x, y
+
+    for invalid in (Plain, list):
+        with pytest.raises(TypeError, match="`row_type` must be"):
+            df.rows(row_type=invalid)
+        with pytest.raises(TypeError, match="`row_type` must be"):
+            next(df.iter_rows(row_type=invalid, buffer_size=0))
+        with pytest.raises(TypeError, match="`row_type` must be"):
+            df.clear().rows(row_type=invalid)
+
+
+def test_iter_rows_batched() -> None:
+    df = pl.DataFrame({"a": range(5), "b": ["v", "w", "x", "y", "z"]})
+    for buffer_size in (2, 5, 10):
+        batches = list(df.iter_rows(batched=True, buffer_size=buffer_size))
+        assert [len(b) for b in batches] == [
+            min(buffer_size, 5 - n) for n in range(0, 5, buffer_size)
+        ]
+        assert [row for b in batches for row in b] == df.rows()
+
+        named_batches = df.iter_rows(named=True, batched=True, buffer_size=buffer_size)
+        assert [row for b in named_batches for row in b] == df.to_dicts()
+
+    # object columns are converted row by row
+    df = df.with_columns(pl.Series("o", [{1}, {2}, {3}, {4}, {5}], dtype=pl.Object))
+    named_batches = df.iter_rows(named=True, batched=True, buffer_size=2)
+    assert list(named_batches) == [
+        [{"a": 0, "b": "v", "o": {1}}, {"a": 1, "b": "w", "o": {2}}],
+        [{"a": 2, "b": "x", "o": {3}}, {"a": 3, "b": "y", "o": {4}}],
+        [{"a": 4, "b": "z", "o": {5}}],
+    ]
+
+    with pytest.raises(ValueError, match="`buffer_size` must be a positive integer"):
+        next(df.iter_rows(batched=True, buffer_size=0))
+
+
 @pytest.mark.parametrize("primitive", INTEGER_DTYPES)
 def test_row_constructor_schema(primitive: pl.DataType) -> None:
     result = pl.DataFrame(data=[[1], [2], [3]], schema={"d": primitive}, orient="row")